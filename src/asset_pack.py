@@ -0,0 +1,236 @@
+"""
+Baked, memory-mapped asset pack for Zombie Survival
+Sprites are stored as pre-scaled raw pixels in the display's pixel layout and sounds
+as raw PCM in the mixer's format, so loading needs no PNG/OGG decoding.
+
+Bake with: uv run python src/asset_pack.py
+Custom output: uv run python src/asset_pack.py --output build/assets.pack
+
+Pack layout (little-endian):
+    magic b"ZSPK" | version u32 | index length u32 | reserved u32
+    JSON index: name -> {offset, length, source, ...} | blobs (16-byte aligned)
+
+Entry names: "sprite:<path>@<size>", "image:<path>", "sound:<name>".
+Entries whose loose source file changed since baking are treated as missing, so
+editing an asset during development takes effect without re-baking.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Final
+
+import pygame
+
+from assets import BACKGROUND_TILE_PATH, sprite_manifest
+from config import game_config, sound_config
+from logger import get_logger
+from sound import SOUND_FILES
+
+logger = get_logger(__name__)
+
+PACK_MAGIC = b"ZSPK"
+PACK_VERSION = 1
+HEADER = struct.Struct("<4sIII")
+ALIGN = 16  # Blob alignment in bytes
+
+# Byte order matching SDL's ARGB8888 surfaces (convert_alpha() on little-endian displays)
+PIXEL_FORMAT: Final = "BGRA"
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _source_stamp(path: str | Path) -> dict[str, int]:
+    """Modification time and size of a source file (detects stale pack entries)."""
+    stat = Path(path).stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def bake_pack(
+    output: str | Path,
+    sprites: list[tuple[str, int]],
+    images: list[str],
+    sounds: dict[str, str],
+) -> dict[str, int]:
+    """Decode assets once and write them to a pack file.
+
+    Missing source files are skipped. Sounds are only baked if pygame.mixer can
+    be initialized (the SDL dummy driver is enough).
+
+    Args:
+        output: Pack file path
+        sprites: (path, size) sprites, stored pre-scaled
+        images: Paths of images stored at native size (e.g. background tile)
+        sounds: Sound name -> audio file path
+
+    Returns:
+        Stats: entries written and pack size in bytes
+    """
+    index: dict[str, dict[str, Any]] = {}
+    data = bytearray()  # Blob section; offsets are relative to its start
+
+    def add(name: str, source: str, blob: bytes, **fields: Any) -> None:
+        data.extend(bytes(_align(len(data)) - len(data)))
+        index[name] = {"offset": len(data), "length": len(blob), "source": _source_stamp(source)}
+        index[name].update(fields)
+        data.extend(blob)
+
+    for path, size in sprites:
+        if Path(path).exists():
+            # Same scaling as the loose-file path (utils.load_sprite)
+            sprite = pygame.transform.scale(pygame.image.load(path), (size, size))
+            pixels = pygame.image.tobytes(sprite, PIXEL_FORMAT)
+            add(f"sprite:{path}@{size}", path, pixels, width=size, height=size)
+
+    for path in images:
+        if Path(path).exists():
+            image = pygame.image.load(path)
+            width, height = image.get_size()
+            pixels = pygame.image.tobytes(image, PIXEL_FORMAT)
+            add(f"image:{path}", path, pixels, width=width, height=height)
+
+    existing_sounds = {name: path for name, path in sounds.items() if Path(path).exists()}
+    if existing_sounds:
+        if not pygame.mixer.get_init():
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+            pygame.mixer.init()
+        mixer_format = list(pygame.mixer.get_init())
+        for name, path in existing_sounds.items():
+            add(f"sound:{name}", path, pygame.mixer.Sound(path).get_raw(), mixer=mixer_format)
+
+    index_bytes = json.dumps(index).encode()
+    data_start = _align(HEADER.size + len(index_bytes))
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "wb") as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes), 0))
+        f.write(index_bytes)
+        f.write(bytes(data_start - HEADER.size - len(index_bytes)))
+        f.write(data)
+        total = f.tell()
+
+    entries = len(index)
+    logger.info("Baked %d assets into %s (%d bytes)", entries, output, total)
+    return {"entries": entries, "bytes": total}
+
+
+class AssetPack:
+    """Read-only view of a baked pack, backed by one memory map.
+
+    Images are wrapped in place (pygame.image.frombuffer) when their pixel
+    layout matches the display, so they cost no decode and no copy. The pack
+    must stay open while those surfaces are alive.
+    """
+
+    def __init__(self, path: str | Path):
+        """Map a pack file.
+
+        Raises:
+            ValueError: If the file is not a pack of a supported version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_length, _ = HEADER.unpack_from(self._map, 0)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError(f"Not a v{PACK_VERSION} asset pack: {self.path}")
+            index_end = HEADER.size + index_length
+            self.index: dict[str, dict[str, Any]] = json.loads(self._map[HEADER.size : index_end])
+        except (ValueError, struct.error):
+            self._map.close()
+            raise
+        self._data_start = _align(index_end)
+        self._view = memoryview(self._map)
+        self._alpha_masks: tuple | None = None  # Display's per-pixel-alpha layout
+
+    @classmethod
+    def open(cls, path: str | Path) -> "AssetPack | None":
+        """Open a pack, or return None if it is missing or invalid (use loose files)."""
+        if not Path(path).exists():
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring asset pack %s: %s", path, e)
+            return None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._map)
+
+    def _entry(self, name: str, source: str) -> dict[str, Any] | None:
+        """Index entry for name, or None if missing or its loose source has changed."""
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        if Path(source).exists() and _source_stamp(source) != entry["source"]:
+            logger.debug("Asset pack entry %s is stale, using loose file", name)
+            return None
+        return entry
+
+    def _blob(self, entry: dict[str, Any]) -> memoryview:
+        start = self._data_start + entry["offset"]
+        return self._view[start : start + entry["length"]]
+
+    def _image(self, name: str, source: str) -> pygame.Surface | None:
+        entry = self._entry(name, source)
+        if entry is None:
+            return None
+        size = (entry["width"], entry["height"])
+        image = pygame.image.frombuffer(self._blob(entry), size, PIXEL_FORMAT)
+
+        # Zero-copy only if the display uses the same layout; otherwise convert once
+        if self._alpha_masks is None and pygame.display.get_surface() is not None:
+            probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            self._alpha_masks = probe.get_masks()
+        if self._alpha_masks is not None and image.get_masks() != self._alpha_masks:
+            image = image.convert_alpha()
+        return image
+
+    def sprite(self, path: str, size: int) -> pygame.Surface | None:
+        """Pre-scaled sprite (zero-copy view into the pack), or None."""
+        return self._image(f"sprite:{path}@{int(size)}", path)
+
+    def image(self, path: str) -> pygame.Surface | None:
+        """Native-size image (zero-copy view into the pack), or None."""
+        return self._image(f"image:{path}", path)
+
+    def sound(self, name: str) -> pygame.mixer.Sound | None:
+        """Sound built from baked PCM, or None if absent or baked for another mixer format."""
+        source = str(Path(sound_config.sounds_dir) / SOUND_FILES.get(name, ""))
+        entry = self._entry(f"sound:{name}", source)
+        if entry is None or tuple(entry["mixer"]) != pygame.mixer.get_init():
+            return None
+        return pygame.mixer.Sound(buffer=self._blob(entry))
+
+    def close(self) -> None:
+        """Unmap the pack (surfaces created from it must be released first)."""
+        if hasattr(self, "_view"):
+            self._view.release()
+        self._map.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Bake every game asset into a pack file."""
+    parser = argparse.ArgumentParser(description="Bake sprites and sounds into an asset pack")
+    parser.add_argument("--output", default=game_config.asset_pack_path, help="Pack file path")
+    args = parser.parse_args(argv)
+
+    # Pixel conversion needs a display; a hidden dummy one is enough
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    sounds = {name: str(Path(sound_config.sounds_dir) / f) for name, f in SOUND_FILES.items()}
+    stats = bake_pack(args.output, sprite_manifest(), [BACKGROUND_TILE_PATH], sounds)
+    print(f"Baked {stats['entries']} assets into {args.output} ({stats['bytes']:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
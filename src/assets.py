@@ -0,0 +1,150 @@
+"""
+Parallel asset preloading for Zombie Survival
+Decodes sounds, sprites and fonts on a thread pool while the game renders a loading screen
+
+Usage:
+    loader = AssetLoader(max_workers=4)
+    loader.add("sound:fire", decode_sound, "fire")
+    loader.add("sprite:assets/sprites/player.png", decode_image, "assets/sprites/player.png")
+    loader.start()
+    while not loader.done:
+        draw_progress(loader.progress)  # Main thread stays responsive
+    results = loader.results()          # name -> decoded asset (None if it failed)
+    logger.info(loader.report())        # Per-asset load times
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+from config import (
+    fast_zombie_config,
+    player_config,
+    powerup_config,
+    projectile_config,
+    tank_zombie_config,
+    zombie_config,
+)
+from entities.powerup import SPRITE_PATHS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+BACKGROUND_TILE_PATH = "assets/sprites/tile_background.png"
+
+
+def sprite_manifest() -> list[tuple[str, int]]:
+    """List every (sprite path, size) the game draws, for preloading."""
+    sprites = [
+        (player_config.sprite_path, player_config.radius * 2),
+        (zombie_config.sprite_path, zombie_config.radius * 2),
+        (fast_zombie_config.sprite_path, fast_zombie_config.radius * 2),
+        (tank_zombie_config.sprite_path, tank_zombie_config.radius * 2),
+        (projectile_config.sprite_path, projectile_config.radius * 2),
+    ]
+    sprites += [(path, powerup_config.radius * 2) for path in SPRITE_PATHS.values()]
+    return sprites
+
+
+def decode_image(path: str) -> pygame.Surface | None:
+    """Decode an image file (thread-safe; convert on the main thread afterwards).
+
+    Returns:
+        Decoded surface, or None if the file does not exist
+    """
+    if not Path(path).exists():
+        return None
+    return pygame.image.load(path)
+
+
+class AssetLoader:
+    """Runs asset decode jobs on a thread pool and tracks per-asset timings.
+
+    Jobs must only decode (file I/O, image/audio decoding). Work that needs the
+    display, such as convert_alpha(), belongs on the main thread once done.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """Create an idle loader.
+
+        Args:
+            max_workers: Decode threads
+        """
+        self.max_workers = max_workers
+        self._jobs: list[tuple[str, Callable[..., Any], tuple]] = []
+        self._futures: dict[str, Future] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self.timings: dict[str, float] = {}  # Asset name -> decode ms
+        self.started_at = 0.0
+        self.elapsed = 0.0  # Wall-clock seconds from start() to finished
+
+    def add(self, name: str, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue a decode job (call before start()).
+
+        Args:
+            name: Unique asset name, e.g. "sound:fire"
+            fn: Decode function run on a worker thread
+            *args: Arguments for fn
+        """
+        self._jobs.append((name, fn, args))
+
+    def _run(self, name: str, fn: Callable[..., Any], args: tuple) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            end = time.perf_counter()
+            self.timings[name] = (end - start) * 1000
+            self.elapsed = max(self.elapsed, end - self.started_at)
+
+    def start(self) -> None:
+        """Submit all queued jobs to the thread pool."""
+        self.started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="asset-loader"
+        )
+        for name, fn, args in self._jobs:
+            self._futures[name] = self._executor.submit(self._run, name, fn, args)
+        self._executor.shutdown(wait=False)
+
+    @property
+    def total(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for future in self._futures.values() if future.done())
+
+    @property
+    def progress(self) -> float:
+        """Fraction of jobs finished (0.0 to 1.0)."""
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return self.completed == self.total
+
+    def results(self) -> dict[str, Any]:
+        """Wait for all jobs and return decoded assets (None for failures)."""
+        results: dict[str, Any] = {}
+        for name, future in self._futures.items():
+            try:
+                results[name] = future.result()
+            except (pygame.error, OSError) as e:
+                logger.warning("Failed to load asset %s: %s", name, e)
+                results[name] = None
+        return results
+
+    def report(self, slowest: int = 5) -> str:
+        """Summarize load times: wall clock, summed decode time, slowest assets."""
+        decode_total = sum(self.timings.values())
+        ranked = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        top = " ".join(f"{name}={ms:.1f}ms" for name, ms in ranked[:slowest])
+        return (
+            f"{self.total} assets in {self.elapsed * 1000:.1f}ms "
+            f"({decode_total:.1f}ms decode on {self.max_workers} threads) slowest: {top}"
+        )
@@ -0,0 +1,274 @@
+"""
+Monte Carlo balance sweeps for Zombie Survival
+Plays many headless games with a bot player (bot.py) for every combination of config
+overrides, spread over a process pool, and prints one results row per combination.
+
+Run with: uv run python src/balance.py --games 200 --set wave.spawn_interval=0.5,1.0,1.5
+Grid: uv run python src/balance.py --set zombie.speed=60,70,80 --set weapon.fire_rate=0.2,0.3
+
+Override keys are <config>.<field>, where <config> is one of CONFIGS below. Each game
+runs at a fixed timestep with its own seed, so a (combination, seed) pair always
+replays the same game.
+"""
+
+import argparse
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+from bot import BOT_POLICIES
+from config import (
+    fast_zombie_config,
+    player_config,
+    powerup_config,
+    projectile_config,
+    score_config,
+    tank_zombie_config,
+    wave_config,
+    weapon_config,
+    zombie_config,
+)
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Config instances a sweep may override (global instances shared by Game and entities)
+CONFIGS = {
+    "wave": wave_config,
+    "powerup": powerup_config,
+    "weapon": weapon_config,
+    "player": player_config,
+    "zombie": zombie_config,
+    "fast_zombie": fast_zombie_config,
+    "tank_zombie": tank_zombie_config,
+    "projectile": projectile_config,
+    "score": score_config,
+}
+
+# Per-process Game reused across games (start_new_game() resets it)
+_game: Any = None
+
+
+def parse_override(text: str) -> tuple[str, list]:
+    """Parse "config.field=v1,v2,..." into the key and typed values.
+
+    Raises:
+        ValueError: Unknown config or field, or a value of the wrong type
+    """
+    key, sep, values = text.partition("=")
+    name, _, field = key.partition(".")
+    if not sep or name not in CONFIGS or not hasattr(CONFIGS[name], field):
+        raise ValueError(f"Unknown override {text!r} (expected config.field=v1,v2)")
+    kind = type(getattr(CONFIGS[name], field))
+    return key, [kind(value) for value in values.split(",")]
+
+
+def sweep_grid(overrides: list[tuple[str, list]]) -> list[dict[str, Any]]:
+    """Every combination of override values (one empty combination for no overrides)."""
+    keys = [key for key, _ in overrides]
+    return [
+        dict(zip(keys, combo, strict=True))
+        for combo in itertools.product(*(v for _, v in overrides))
+    ]
+
+
+@contextmanager
+def applied(overrides: dict[str, Any]) -> Iterator[None]:
+    """Set config fields for the duration of a game, then restore them."""
+    saved = []
+    try:
+        for key, value in overrides.items():
+            name, field = key.split(".", 1)
+            config = CONFIGS[name]
+            saved.append((config, field, getattr(config, field)))
+            setattr(config, field, value)
+        yield
+    finally:
+        for config, field, value in reversed(saved):
+            setattr(config, field, value)
+
+
+def _headless_game() -> Any:
+    """This process's Game, created on first use without a window or audio."""
+    global _game
+    if _game is None:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        os.environ["GAME_SIM_PROCESS"] = "0"
+        os.environ["GAME_RENDER_THREAD"] = "0"
+        from game import Game
+
+        _game = Game()
+        _game.LEADERBOARD_FILE = None  # Sweeps never touch the real leaderboard
+    return _game
+
+
+def play_game(
+    overrides: dict[str, Any], seed: int, dt: float, max_time: float, policy: str = "kite"
+) -> dict:
+    """Play one bot game to death or max_time.
+
+    Returns:
+        Result row: overrides, seed, wave, kills, shots, hits, damage_taken, time, died
+    """
+    from bot import make_bot
+    from game_state import GameState
+
+    game = _headless_game()
+    with applied(overrides):
+        random.seed(seed)
+        game.start_new_game()
+        game.state = GameState.PLAYING
+        game.controller = make_bot(policy)
+        while game.state == GameState.PLAYING and game.stats.time < max_time:
+            game.update(dt)
+
+    stats = game.stats
+    return {
+        "overrides": overrides,
+        "seed": seed,
+        "wave": game.current_wave,
+        "kills": stats.kills,
+        "shots": stats.shots,
+        "hits": stats.hits,
+        "damage_taken": stats.damage_taken,
+        "time": stats.time,
+        "died": game.state == GameState.GAME_OVER,
+    }
+
+
+def _play(task: tuple) -> dict:
+    return play_game(*task)
+
+
+def _quiet_worker() -> None:
+    """Pool initializer: workers only report results (no missing-asset warnings)."""
+    logging.disable(logging.WARNING)
+
+
+def run_sweep(
+    grid: list[dict[str, Any]],
+    games: int,
+    workers: int,
+    dt: float = 1 / 60,
+    max_time: float = 600.0,
+    seed: int = 0,
+    policy: str = "kite",
+) -> list[dict]:
+    """Play `games` seeds per combination on a process pool.
+
+    Returns:
+        Result rows (see play_game) in grid-then-seed order
+    """
+    tasks = [
+        (combo, seed + index, dt, max_time, policy) for combo in grid for index in range(games)
+    ]
+    if workers <= 1:
+        _quiet_worker()
+        try:
+            return [_play(task) for task in tasks]
+        finally:
+            logging.disable(logging.NOTSET)
+
+    # Spawned workers import the game fresh (no forked pygame state)
+    context = multiprocessing.get_context("spawn")
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_quiet_worker) as pool:
+        return list(pool.map(_play, tasks, chunksize=chunksize))
+
+
+def aggregate(rows: list[dict]) -> list[dict]:
+    """Summarize result rows per combination (grid order).
+
+    Returns:
+        Dicts with overrides, games, wave (mean), max_wave, kills (mean),
+        accuracy (total hits / total shots), damage (mean taken) and deaths (fraction)
+    """
+    groups: dict[tuple, list[dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row["overrides"].items()), []).append(row)
+
+    summary = []
+    for group in groups.values():
+        count = len(group)
+        shots = sum(row["shots"] for row in group)
+        summary.append(
+            {
+                "overrides": group[0]["overrides"],
+                "games": count,
+                "wave": sum(row["wave"] for row in group) / count,
+                "max_wave": max(row["wave"] for row in group),
+                "kills": sum(row["kills"] for row in group) / count,
+                "accuracy": sum(row["hits"] for row in group) / shots if shots else 0.0,
+                "damage": sum(row["damage_taken"] for row in group) / count,
+                "deaths": sum(row["died"] for row in group) / count,
+            }
+        )
+    return summary
+
+
+def format_table(summary: list[dict]) -> str:
+    """Results table, one row per combination."""
+    keys = list(summary[0]["overrides"]) if summary else []
+    widths = [max(len(key), 8) for key in keys]
+    header = [f"{key:>{width}}" for key, width in zip(keys, widths, strict=True)]
+    header += [f"{'games':>6}", f"{'wave':>6}", f"{'max':>4}", f"{'kills':>7}"]
+    header += [f"{'acc':>6}", f"{'damage':>7}", f"{'deaths':>7}"]
+    lines = [" ".join(header)]
+    for row in summary:
+        cells = [
+            f"{row['overrides'][key]!s:>{width}}" for key, width in zip(keys, widths, strict=True)
+        ]
+        cells += [
+            f"{row['games']:>6}",
+            f"{row['wave']:>6.1f}",
+            f"{row['max_wave']:>4}",
+            f"{row['kills']:>7.1f}",
+            f"{row['accuracy']:>6.1%}",
+            f"{row['damage']:>7.1f}",
+            f"{row['deaths']:>7.1%}",
+        ]
+        lines.append(" ".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a balance sweep and print the results table."""
+    parser = argparse.ArgumentParser(description="Monte Carlo balance sweep with a bot player")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="CONFIG.FIELD=V1,V2",
+        help="Values to sweep (repeat for a grid)",
+    )
+    parser.add_argument("--games", type=int, default=100, help="Games per combination")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-time", type=float, default=600.0, help="Game seconds per run")
+    parser.add_argument("--dt", type=float, default=1 / 60, help="Fixed timestep (seconds)")
+    parser.add_argument("--seed", type=int, default=0, help="First seed")
+    parser.add_argument("--policy", choices=list(BOT_POLICIES), default="kite", help="Bot policy")
+    args = parser.parse_args(argv)
+
+    try:
+        grid = sweep_grid([parse_override(text) for text in args.overrides])
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    rows = run_sweep(grid, args.games, args.workers, args.dt, args.max_time, args.seed, args.policy)
+    elapsed = time.perf_counter() - start
+    print(format_table(aggregate(rows)))
+    print(f"{len(rows)} games on {args.workers} workers in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
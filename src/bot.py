@@ -0,0 +1,269 @@
+"""
+Scripted bot players for Zombie Survival
+Bots are Controllers (see controls.py): each frame they look at the game and return
+the Controls a human would press, so they drive the same Player code as the keyboard.
+
+The player only faces its movement direction (8 ways, turning at a limited rate), so
+bots aim by turning toward the target and firing once the facing lines up.
+
+Play as a bot: GAME_BOT=kite uv run python src/main.py (policies: kite, melee, idle)
+Soak/benchmark run: uv run python src/bot.py --policy kite --minutes 15
+"""
+
+import argparse
+import math
+import os
+import time
+from collections.abc import Callable
+
+from config import projectile_config
+from controls import Controller, Controls
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Minimum |component| of a unit vector that presses that axis key (sin 22.5°)
+AXIS_THRESHOLD = 0.383
+
+
+def press_toward(controls: Controls, dx: float, dy: float) -> None:
+    """Press the movement keys closest to direction (dx, dy) (screen coordinates)."""
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return
+    dx /= length
+    dy /= length
+    controls.right = dx > AXIS_THRESHOLD
+    controls.left = dx < -AXIS_THRESHOLD
+    controls.down = dy > AXIS_THRESHOLD
+    controls.up = dy < -AXIS_THRESHOLD
+
+
+def angle_to(x: float, y: float, target_x: float, target_y: float) -> float:
+    """Facing angle (degrees, Player convention: 0° right, 90° up) toward a target."""
+    return math.degrees(math.atan2(-(target_y - y), target_x - x)) % 360
+
+
+def angle_diff(target: float, current: float) -> float:
+    """Shortest signed rotation from current to target (-180..180 degrees)."""
+    return (target - current + 180) % 360 - 180
+
+
+class KiteBot:
+    """Kite-and-shoot: melee what comes close, back off while recovering, shoot at range.
+
+    Ammo is scarce, so melee does most of the killing: with the attack ready the bot
+    holds still and lets zombies walk into reach, and it retreats while on cooldown.
+    With nothing close it shoots the nearest zombie or collects power-ups.
+    """
+
+    def __init__(self, danger_distance: float = 110.0, wall_margin: float = 80.0):
+        """Create the bot.
+
+        Args:
+            danger_distance: Zombies closer than this are melee targets or threats (pixels)
+            wall_margin: Steer back toward the middle within this distance of an edge
+        """
+        self.danger_distance = danger_distance
+        self.wall_margin = wall_margin
+
+    def read(self, game) -> Controls:
+        """Controls for this frame."""
+        player = game.player
+        controls = Controls()
+        zombies = [zombie for table in game.world.query("chase") for zombie in table.rows]
+
+        # Reload when empty, or top up while the arena is clear
+        if player.magazine == 0 or (not zombies and player.magazine < player.magazine_size):
+            controls.reload = True
+
+        nearest = None
+        distance = math.inf
+        if zombies:
+            nearest = min(zombies, key=lambda z: (z.x - player.x) ** 2 + (z.y - player.y) ** 2)
+            distance = math.hypot(nearest.x - player.x, nearest.y - player.y)
+
+        attack_ready = player.attack_cooldown <= 0
+        if distance <= player.attack_range and attack_ready:
+            controls.attack = True  # Hits every zombie in range
+
+        if distance < self.danger_distance:
+            if not attack_ready:
+                press_toward(controls, *self._retreat(game, zombies))
+            return controls  # Attack ready: hold still and let them walk into reach
+
+        # Nothing close: engage the nearest zombie, otherwise pick up power-ups
+        if nearest is None or not self._engage(controls, player, nearest, distance):
+            self._collect(controls, game)
+        return controls
+
+    def _engage(self, controls: Controls, player, target, distance: float) -> bool:
+        """Act on the nearest zombie while it is out of reach.
+
+        Returns:
+            False if there is nothing to do (out of ammo)
+        """
+        if player.magazine == 0 and player.stash == 0:
+            return False
+        self._aim(controls, player, target, distance)
+        return True
+
+    def _collect(self, controls: Controls, game) -> None:
+        """Walk to the nearest power-up, if any."""
+        player = game.player
+        powerups = [powerup for table in game.world.query("pickup") for powerup in table.rows]
+        if powerups:
+            target = min(powerups, key=lambda p: (p.x - player.x) ** 2 + (p.y - player.y) ** 2)
+            press_toward(controls, target.x - player.x, target.y - player.y)
+
+    def _aim(self, controls: Controls, player, target, distance: float) -> None:
+        """Turn toward a target and fire once the shot would connect."""
+        desired = angle_to(player.x, player.y, target.x, target.y)
+        diff = angle_diff(desired, player.angle)
+        reach = target.radius + projectile_config.radius
+        tolerance = math.degrees(math.asin(min(1.0, reach / distance)))
+        if abs(diff) <= tolerance:
+            controls.fire = True
+            return
+        # Steer at the 8-way heading just past the target angle; turning stops on it
+        step = math.ceil(desired / 45) if diff > 0 else math.floor(desired / 45)
+        heading = math.radians(step * 45)
+        press_toward(controls, math.cos(heading), -math.sin(heading))
+
+    def _retreat(self, game, zombies) -> tuple[float, float]:
+        """Escape direction: away from close zombies (inverse-square), off the walls."""
+        player = game.player
+        reach = (self.danger_distance * 2) ** 2
+        fx = fy = 0.0
+        for zombie in zombies:
+            dx = player.x - zombie.x
+            dy = player.y - zombie.y
+            d2 = dx * dx + dy * dy
+            if d2 < reach:
+                weight = 1.0 / max(d2, 1.0)
+                fx += dx * weight
+                fy += dy * weight
+        length = math.hypot(fx, fy)
+        if length > 0:
+            fx /= length
+            fy /= length
+
+        # Walls push back toward the middle (0 at the margin, 1 at the edge)
+        margin = self.wall_margin
+        fx += max(0.0, margin - player.x) / margin
+        fx -= max(0.0, player.x - (game.SCREEN_WIDTH - margin)) / margin
+        fy += max(0.0, margin - player.y) / margin
+        fy -= max(0.0, player.y - (game.SCREEN_HEIGHT - margin)) / margin
+        return fx, fy
+
+
+class MeleeBot(KiteBot):
+    """Melee-only: walk up to the nearest zombie and strike, never shoot."""
+
+    def _engage(self, controls: Controls, player, target, distance: float) -> bool:
+        press_toward(controls, target.x - player.x, target.y - player.y)
+        return True
+
+
+class IdleBot:
+    """Presses nothing (baseline: the waves play out around a still player)."""
+
+    def read(self, game) -> Controls:
+        return Controls()
+
+
+# Built-in policies by name (GAME_BOT / GameConfig.bot, balance.py --policy)
+BOT_POLICIES: dict[str, Callable[[], Controller]] = {
+    "kite": KiteBot,
+    "melee": MeleeBot,
+    "idle": IdleBot,
+}
+
+
+def make_bot(policy: str) -> Controller:
+    """Create a bot controller by policy name.
+
+    Raises:
+        ValueError: Unknown policy
+    """
+    factory = BOT_POLICIES.get(policy)
+    if factory is None:
+        raise ValueError(f"Unknown bot policy {policy!r} (choose from {', '.join(BOT_POLICIES)})")
+    logger.info("Bot player: %s", policy)
+    return factory()
+
+
+def soak(policy: str, duration: float, dt: float, render: bool = True) -> list[dict]:
+    """Play a headless bot game and time every frame, summarized per wave.
+
+    Args:
+        policy: Bot policy name
+        duration: Game seconds to play (stops early if the bot dies)
+        dt: Fixed timestep (seconds)
+        render: Also draw every frame (off-screen)
+
+    Returns:
+        One dict per wave reached: wave, start (game seconds), frames, peak entities,
+        update_ms and render_ms (means)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from game import Game
+    from game_state import GameState
+
+    game = Game()
+    game.LEADERBOARD_FILE = None  # Never record bot scores
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    game.controller = make_bot(policy)
+
+    waves: list[dict] = []
+    while game.state == GameState.PLAYING and game.stats.time < duration:
+        if not waves or waves[-1]["wave"] != game.current_wave:
+            waves.append(
+                {
+                    "wave": game.current_wave,
+                    "start": game.stats.time,
+                    "frames": 0,
+                    "entities": 0,
+                    "update_ms": 0.0,
+                    "render_ms": 0.0,
+                }
+            )
+        row = waves[-1]
+        start = time.perf_counter()
+        game.update(dt)
+        middle = time.perf_counter()
+        if render:
+            game.draw_frame()
+        row["frames"] += 1
+        row["update_ms"] += (middle - start) * 1000
+        row["render_ms"] += (time.perf_counter() - middle) * 1000
+        row["entities"] = max(row["entities"], game.world.count())
+
+    for row in waves:
+        row["update_ms"] /= row["frames"]
+        row["render_ms"] /= row["frames"]
+    return waves
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a soak test and print per-wave frame costs."""
+    parser = argparse.ArgumentParser(description="Headless bot soak/benchmark run")
+    parser.add_argument("--policy", choices=list(BOT_POLICIES), default="kite")
+    parser.add_argument("--minutes", type=float, default=10.0, help="Game minutes to play")
+    parser.add_argument("--dt", type=float, default=1 / 60, help="Fixed timestep (seconds)")
+    parser.add_argument("--no-render", action="store_true", help="Skip drawing frames")
+    args = parser.parse_args(argv)
+
+    waves = soak(args.policy, args.minutes * 60, args.dt, render=not args.no_render)
+    print(f"{'wave':>5} {'start':>8} {'frames':>7} {'entities':>9} {'update':>8} {'render':>8}")
+    for row in waves:
+        print(
+            f"{row['wave']:>5} {row['start']:>7.1f}s {row['frames']:>7} {row['entities']:>9}"
+            f" {row['update_ms']:>6.2f}ms {row['render_ms']:>6.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
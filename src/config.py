@@ -17,6 +17,31 @@ class GameConfig:
     fps: int = 60
     background_color: tuple = (50, 50, 50)  # Dark gray
     spawn_offscreen_buffer: int = 50  # Distance off-screen for spawning
+    rotation_cache_step: float = 5.0  # Degrees between cached sprite rotations
+    profile_report_interval: float = 5.0  # Seconds between system timing logs (GAME_PROFILE=1)
+    asset_workers: int = 4  # Threads decoding sounds/sprites/fonts at startup
+    asset_pack_path: str = "assets/assets.pack"  # Baked assets (src/asset_pack.py)
+    idle_wait_ms: int = 500  # Menu/pause/game-over: max time to block waiting for input
+    # Dynamic render resolution: the world is drawn at this fraction of the window and
+    # upscaled once per frame; the HUD stays native. Quality tiers may lower it further.
+    render_scale: float = 1.0
+    min_render_scale: float = 0.5
+    render_scale_step: float = 0.125  # Quantization (keeps scaled sprite sizes cached)
+    render_thread: bool = False  # Pipelined drawing on a render thread (GAME_RENDER_THREAD=1)
+    bot: str = ""  # Bot policy driving the player instead of the keyboard (GAME_BOT=kite)
+    # Chunked zombie updates on worker threads (free-threaded builds; GAME_UPDATE_WORKERS)
+    update_workers: int = 1
+    # Simulation in a separate process, state shared with the window (GAME_SIM_PROCESS=1)
+    sim_process: bool = False
+    sim_tick_rate: int = 60  # Fixed simulation ticks per second
+    sim_max_entities: int = 2048  # Entity rows per shared-memory slot
+    sim_ring_slots: int = 4  # Published ticks kept in the ring
+    # Stream live state to spectator viewers over TCP (GAME_SPECTATE=1, NetConfig.spectator_*)
+    spectate: bool = False
+    # Run seed: fixed runs replay their spawns and rank on that seed's leaderboard (GAME_SEED)
+    seed: int | None = None  # None: a new seed every run
+    # Per-run gameplay event telemetry, written when a run ends (GAME_TELEMETRY=1)
+    telemetry: bool = False
 
 
 @dataclass
@@ -106,6 +131,7 @@ class UIConfig:
 
     # Font
     font_size: int = 36
+    small_font_size: int = 24  # Menu leaderboard rows
     text_color: tuple = (255, 255, 255)  # White
 
     # Wave notifications
@@ -115,6 +141,12 @@ class UIConfig:
     # Visual effects
     kill_flash_duration: float = 0.2  # Seconds to show kill flash effect
     damage_popup_duration: float = 1.0  # Seconds to show damage popup
+    damage_popup_rise_speed: float = 30.0  # Pixels per second popups float upward
+
+    # Effect pool caps (records are preallocated; extra effects are dropped)
+    max_kill_flashes: int = 64
+    max_damage_popups: int = 64
+    max_pickup_flashes: int = 16
 
 
 @dataclass
@@ -166,34 +198,150 @@ class PowerupConfig:
 
 
 @dataclass
-class KillFlash:
-    """Visual effect for zombie kills"""
+class ParticleConfig:
+    """Particle system settings (kill bursts, blood, sparks)"""
+
+    # Capacity (particles are preallocated, extra emissions are dropped)
+    max_particles: int = 10000
+
+    # Motion
+    drag: float = 0.05  # Fraction of velocity left after 1 second
 
-    x: float
-    y: float
-    radius: int
-    timer: float
+    # Stamp cache quantization
+    alpha_levels: int = 8  # Distinct fade steps per color/size
+    max_size: int = 8  # Largest particle diameter in pixels
+
+    # Burst presets: count, color, speed/lifetime/size ranges as (min, max)
+    presets: dict = field(
+        default_factory=lambda: {
+            "blood": {
+                "count": 24,
+                "color": (140, 10, 10),  # Dark red
+                "speed": (40.0, 160.0),
+                "lifetime": (0.3, 0.8),
+                "size": (2, 5),
+            },
+            "spark": {
+                "count": 8,
+                "color": (255, 220, 120),  # Warm yellow
+                "speed": (120.0, 300.0),
+                "lifetime": (0.1, 0.3),
+                "size": (1, 3),
+            },
+            "pickup": {
+                "count": 16,
+                "color": (255, 255, 255),  # Overridden by power-up color
+                "speed": (30.0, 120.0),
+                "lifetime": (0.3, 0.6),
+                "size": (2, 4),
+            },
+        }
+    )
 
 
 @dataclass
+class QualityConfig:
+    """Adaptive quality governor settings (frame budget = 1 / GameConfig.fps)"""
+
+    enabled: bool = True
+    smoothing: float = 0.1  # EMA weight of each new frame time sample
+
+    # Hysteresis: step down quickly when over budget, step up slowly with headroom
+    downgrade_ratio: float = 1.0  # Smoothed frame time above budget * ratio -> lower tier
+    upgrade_ratio: float = 0.6  # Smoothed frame time below budget * ratio -> higher tier
+    downgrade_after: float = 0.5  # Seconds over budget before stepping down
+    upgrade_after: float = 3.0  # Seconds with headroom before stepping up
+    cooldown: float = 1.0  # Seconds after a change before the next one
+
+    # Tiers from best to cheapest. Scales apply to ParticleConfig/UIConfig caps;
+    # render_scale caps GameConfig.render_scale (only halving: fractional upscales cost
+    # more than they save at typical window sizes).
+    tiers: list = field(
+        default_factory=lambda: [
+            {
+                "name": "high",
+                "rotation_step": 5.0,
+                "particle_scale": 1.0,
+                "effect_scale": 1.0,
+                "popups": True,
+                "flashes": True,
+                "tiled_background": True,
+                "render_scale": 1.0,
+            },
+            {
+                "name": "medium",
+                "rotation_step": 10.0,
+                "particle_scale": 0.5,
+                "effect_scale": 0.5,
+                "popups": True,
+                "flashes": True,
+                "tiled_background": True,
+                "render_scale": 1.0,
+            },
+            {
+                "name": "low",
+                "rotation_step": 15.0,
+                "particle_scale": 0.2,
+                "effect_scale": 0.25,
+                "popups": False,
+                "flashes": True,
+                "tiled_background": False,
+                "render_scale": 1.0,
+            },
+            {
+                "name": "minimal",
+                "rotation_step": 30.0,
+                "particle_scale": 0.05,
+                "effect_scale": 0.25,
+                "popups": False,
+                "flashes": False,
+                "tiled_background": False,
+                "render_scale": 0.5,
+            },
+        ]
+    )
+
+
+@dataclass(slots=True)
+class KillFlash:
+    """Visual effect for zombie kills (pooled record, mutated in place)"""
+
+    x: float = 0.0
+    y: float = 0.0
+    radius: int = 0
+    timer: float = 0.0
+
+
+@dataclass(slots=True)
 class PickupFlash:
-    """Visual effect for power-up pickups"""
+    """Visual effect for power-up pickups (pooled record, mutated in place)"""
 
-    x: float
-    y: float
-    radius: int
-    color: tuple  # Matches power-up type color
-    timer: float
+    x: float = 0.0
+    y: float = 0.0
+    radius: int = 0
+    color: tuple = (255, 255, 255)  # Matches power-up type color
+    timer: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DamagePopup:
-    """Visual effect for damage numbers"""
+    """Visual effect for damage numbers (pooled record, mutated in place)"""
+
+    x: float = 0.0
+    y: float = 0.0
+    text: str = ""
+    timer: float = 0.0
 
-    x: float
-    y: float
-    text: str
-    timer: float
+
+@dataclass(slots=True)
+class RunStats:
+    """Per-run counters (reset by each new game, read by balance sweeps)"""
+
+    time: float = 0.0  # Seconds survived
+    kills: int = 0
+    shots: int = 0
+    hits: int = 0  # Projectile hits (accuracy = hits / shots)
+    damage_taken: float = 0.0  # Health lost (shield blocks excluded)
 
 
 @dataclass
@@ -250,6 +398,148 @@ class SoundConfig:
     wave_complete_volume: float = 0.9
     game_over_volume: float = 1.0
 
+    # Voice manager: mixer channels reserved per category
+    channel_groups: dict = field(
+        default_factory=lambda: {
+            "critical": 2,  # Player damage, game over, wave cues
+            "weapon": 3,  # Fire, reload, shield block
+            "combat": 4,  # Zombie deaths
+            "pickup": 2,  # Power-up collection
+        }
+    )
+
+    # Cues at or above this priority may steal voices from other categories
+    steal_priority: int = 80
+
+    # Per-sound voice settings: category, priority (higher wins steals),
+    # max concurrent instances and minimum seconds between retriggers
+    voices: dict = field(
+        default_factory=lambda: {
+            "game_over": {
+                "group": "critical",
+                "priority": 100,
+                "max_instances": 1,
+                "retrigger": 1.0,
+            },
+            "player_damage": {
+                "group": "critical",
+                "priority": 90,
+                "max_instances": 1,
+                "retrigger": 0.1,
+            },
+            "wave_start": {
+                "group": "critical",
+                "priority": 80,
+                "max_instances": 1,
+                "retrigger": 0.5,
+            },
+            "wave_complete": {
+                "group": "critical",
+                "priority": 80,
+                "max_instances": 1,
+                "retrigger": 0.5,
+            },
+            "shield_block": {
+                "group": "weapon",
+                "priority": 70,
+                "max_instances": 1,
+                "retrigger": 0.1,
+            },
+            "fire": {"group": "weapon", "priority": 50, "max_instances": 2, "retrigger": 0.05},
+            "reload_start": {
+                "group": "weapon",
+                "priority": 40,
+                "max_instances": 1,
+                "retrigger": 0.1,
+            },
+            "reload_complete": {
+                "group": "weapon",
+                "priority": 40,
+                "max_instances": 1,
+                "retrigger": 0.1,
+            },
+            "powerup_collect": {
+                "group": "pickup",
+                "priority": 40,
+                "max_instances": 2,
+                "retrigger": 0.05,
+            },
+            "zombie_death": {
+                "group": "combat",
+                "priority": 10,
+                "max_instances": 3,
+                "retrigger": 0.06,
+            },
+        }
+    )
+
+
+@dataclass
+class NetConfig:
+    """Co-op and spectator networking settings (src/coop.py, src/spectator.py)"""
+
+    port: int = 47800  # Host UDP port
+    max_players: int = 4  # Host included
+    snapshot_rate: int = 30  # State snapshots sent to each client per second
+    history: int = 64  # Snapshots kept as delta baselines (host and client)
+    interpolation_delay: float = 0.1  # Clients draw this many seconds behind the host
+    hello_interval: float = 0.5  # Seconds between join attempts while connecting
+    client_timeout: float = 5.0  # Seconds without input before a client is dropped
+    report_interval: float = 5.0  # Seconds between bandwidth log lines
+    # Circle fallback and ring colors for players 2-4 (player 1 keeps PlayerConfig.color)
+    ally_colors: tuple = ((80, 160, 255), (255, 200, 60), (200, 90, 255))
+
+    # Spectator stream (TCP): frames encoded once per publish and shared by every viewer
+    spectator_host: str = "0.0.0.0"
+    spectator_port: int = 47801
+    spectator_rate: int = 30  # Frames published per second
+    # Kernel send buffer per viewer (SO_SNDBUF): once a slow viewer has this much unread,
+    # it skips to the newest frame. Larger absorbs hiccups; smaller keeps viewers current.
+    spectator_buffer: int = 32 * 1024
+
+
+@dataclass
+class LeaderboardConfig:
+    """Run leaderboard settings (src/leaderboard.py)"""
+
+    path: str = "leaderboard.db"  # SQLite database (WAL mode)
+    top_count: int = 5  # Runs listed on the menu
+    # Background writer queue (runs are dropped, not blocked on, when full)
+    queue_size: int = 256
+    busy_timeout: float = 5.0  # Seconds to wait for another connection's write lock
+
+
+@dataclass
+class TelemetryConfig:
+    """Per-run event telemetry settings (src/telemetry.py)"""
+
+    directory: str = "telemetry"  # One compressed .npz per finished run
+    capacity: int = 65536  # Preallocated event rows (doubled if a run outgrows them)
+    heatmap_cell: int = 40  # Analyzer heatmap cell size in pixels
+
+
+@dataclass
+class LoggingConfig:
+    """Logging pipeline configuration"""
+
+    log_dir: str = "logs"
+
+    # Levels (GAME_DEBUG=1 lowers console to DEBUG, GAME_LOG_LEVEL overrides file)
+    console_level: str = "WARNING"
+    file_level: str = "DEBUG"
+
+    # Size-based rotation (rotated files are gzip-compressed)
+    max_bytes: int = 5 * 1024 * 1024  # 5 MiB per file
+    backup_count: int = 5
+    compress_backups: bool = True
+
+    # Background writer queue (records are dropped, not blocked on, when full)
+    queue_size: int = 10000
+
+    # Rate limit for repeated DEBUG messages (same logger + format string)
+    rate_limit_count: int = 20  # Records allowed per window
+    rate_limit_window: float = 1.0  # Seconds
+
 
 # Global config instances
 game_config = GameConfig()
@@ -261,6 +551,12 @@ wave_config = WaveConfig()
 score_config = ScoreConfig()
 ui_config = UIConfig()
 powerup_config = PowerupConfig()
+particle_config = ParticleConfig()
+quality_config = QualityConfig()
 projectile_config = ProjectileConfig()
 weapon_config = WeaponConfig()
 sound_config = SoundConfig()
+net_config = NetConfig()
+leaderboard_config = LeaderboardConfig()
+telemetry_config = TelemetryConfig()
+logging_config = LoggingConfig()
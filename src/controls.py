@@ -0,0 +1,75 @@
+"""
+Player input layer for Zombie Survival
+Player.update and the fire/reload checks in Game read a Controls snapshot each frame
+instead of polling the keyboard themselves, so input can come from other sources.
+
+Controllers provide read(game) -> Controls. KeyboardController is the default;
+the simulation server (sim_server.py) feeds input forwarded from the window process.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Protocol
+
+import pygame
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class Controls:
+    """Player commands for one frame."""
+
+    up: bool = False
+    down: bool = False
+    left: bool = False
+    right: bool = False
+    attack: bool = False  # Melee (SPACE)
+    fire: bool = False  # Shoot (F)
+    reload: bool = False  # Reload (R)
+
+    def pack(self) -> int:
+        """Encode as a bitmask (field order), e.g. for shared memory or the network."""
+        bits = 0
+        for index, field in enumerate(fields(self)):
+            if getattr(self, field.name):
+                bits |= 1 << index
+        return bits
+
+    @classmethod
+    def unpack(cls, bits: int) -> "Controls":
+        """Decode a bitmask produced by pack()."""
+        return cls(*(bool(bits >> index & 1) for index in range(len(fields(cls)))))
+
+
+class Controller(Protocol):
+    """Anything that can produce a frame's Controls."""
+
+    def read(self, game: object) -> Controls: ...
+
+
+# Keyboard bindings per Controls field
+KEY_BINDINGS = {
+    "up": pygame.K_w,
+    "down": pygame.K_s,
+    "left": pygame.K_a,
+    "right": pygame.K_d,
+    "attack": pygame.K_SPACE,
+    "fire": pygame.K_f,
+    "reload": pygame.K_r,
+}
+
+
+def read_keyboard() -> Controls:
+    """Read Controls from pygame's current keyboard state."""
+    keys = pygame.key.get_pressed()
+    return Controls(**{name: bool(keys[key]) for name, key in KEY_BINDINGS.items()})
+
+
+class KeyboardController:
+    """Default controller: the local keyboard."""
+
+    def read(self, game: object) -> Controls:
+        """Controls for this frame (game is unused; bots use it to see the world)."""
+        return read_keyboard()
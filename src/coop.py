@@ -0,0 +1,1091 @@
+"""
+Local co-op over UDP for Zombie Survival
+An authoritative host runs Game.update() for 2-4 players; clients only send input and
+draw the state the host replicates to them.
+
+Host: uv run python src/coop.py host [--port 47800]
+Join: uv run python src/coop.py join 192.168.1.20[:47800]
+Test: uv run python src/coop.py loopback --clients 3 --latency 0.05 --loss 0.05 --zombies 200
+
+Protocol (UDP, little-endian, one message per datagram, first byte = message type):
+    HELLO     client -> host   join request (resent until WELCOME)
+    WELCOME   host -> client   assigned player slot (FULL: no free slot)
+    INPUT     client -> host   held Controls bits + newest snapshot received (ack)
+    SNAPSHOT  host -> client   game scalars, all players, delta-encoded entities
+    BYE       client -> host   leaving
+
+Snapshots are quantized (positions in 1/8 px, angles in 1/256 turn) and delta-encoded
+against the newest snapshot the client acknowledged: removed ids, new entities, and a
+change mask plus the changed fields of every other entity (moves as one-byte steps).
+Lost snapshots are never resent: the next one is encoded against whatever the client
+last acknowledged (or sent whole once that baseline has left the history). Inputs are
+held-key states, so the next input covers a lost one.
+
+Clients keep a short snapshot buffer and draw `interpolation_delay` seconds behind the
+host, interpolating positions between the two snapshots around that time. There is no
+client-side prediction: a client's own moves show up after RTT + the delay.
+LinkSimulator adds latency, jitter and loss to outgoing datagrams for loopback tests.
+"""
+
+import argparse
+import contextlib
+import heapq
+import os
+import random
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pygame
+
+from config import NetConfig, net_config
+from controls import Controls
+from entities.player import Player
+from entities.powerup import Powerup
+from entities.projectile import Projectile
+from game_state import GameState
+from logger import get_logger
+from sim_server import (
+    KIND_INDEX,
+    KINDS,
+    POWERUP_INDEX,
+    POWERUP_KIND,
+    POWERUP_TYPES,
+    PROJECTILE_KIND,
+)
+
+logger = get_logger(__name__)
+
+# Message types (first byte of every datagram)
+MSG_HELLO = 1
+MSG_WELCOME = 2
+MSG_FULL = 3
+MSG_INPUT = 4
+MSG_SNAPSHOT = 5
+MSG_BYE = 6
+NO_TICK = 0xFFFFFFFF  # INPUT ack before any snapshot arrived / SNAPSHOT sent whole
+
+# Quantization: positions as u2 steps of 1/8 px from -256 px (covers off-screen spawns)
+POSITION_SCALE = 8.0
+POSITION_OFFSET = 256.0
+ANGLE_STEPS = 256  # u1 angles
+
+WELCOME = np.dtype([("type", "u1"), ("slot", "u1")])
+INPUT = np.dtype([("type", "u1"), ("controls", "u1"), ("ack", "<u4")])
+SNAPSHOT = np.dtype(
+    [
+        ("type", "u1"),
+        ("tick", "<u4"),
+        ("base", "<u4"),  # Baseline tick of the entity delta (NO_TICK: sent whole)
+        ("time_ms", "<u4"),  # Host clock (interpolation timeline)
+        ("slot", "u1"),  # The receiving client's player slot
+        ("state", "u1"),
+        ("wave", "<u2"),
+        ("score", "<u4"),
+        ("zombies_to_spawn", "<u2"),
+        ("wave_notification_ms", "<u2"),
+        ("players", "u1"),
+        ("removed", "<u2"),
+        ("added", "<u2"),
+    ]
+)
+# Every player, every snapshot (a handful of rows; HUD fields for the receiving client)
+PLAYER_STATE = np.dtype(
+    [
+        ("slot", "u1"),
+        ("x", "<u2"),
+        ("y", "<u2"),
+        ("angle", "u1"),
+        ("health", "u1"),
+        ("max_health", "u1"),
+        ("magazine", "u1"),
+        ("magazine_size", "u1"),
+        ("stash", "<u2"),
+        ("flags", "u1"),  # FLAG_* bits
+        ("attack_cooldown_ms", "<u2"),
+        ("speed_boost_ms", "<u2"),
+        ("shield_hits_remaining", "u1"),
+    ]
+)
+FLAG_RELOADING = 1
+FLAG_ATTACKING = 2
+
+# Entity rows, sorted by id. aux: zombie health (0: one-hit) or power-up type | visible << 7
+ENTITY = np.dtype(
+    [
+        ("id", "<u2"),
+        ("kind", "u1"),  # Index into sim_server.KINDS
+        ("x", "<u2"),
+        ("y", "<u2"),
+        ("angle", "u1"),
+        ("aux", "u1"),
+    ]
+)
+# Delta columns: bit i of a row's change mask = the row has a value in column i
+DELTA_FIELDS = ("kind", "angle", "aux", "x", "y", "dx", "dy")
+DELTA_BITS = {name: bit for bit, name in enumerate(DELTA_FIELDS)}
+DELTA_DTYPES = {
+    **{name: ENTITY[name] for name in ("kind", "angle", "aux", "x", "y")},
+    "dx": np.dtype("i1"),  # Small moves: signed steps from the baseline
+    "dy": np.dtype("i1"),
+}
+EMPTY = np.zeros(0, ENTITY)
+STATES = list(GameState)
+
+
+def quantize_position(values: np.ndarray) -> np.ndarray:
+    """Pixels to u2 position steps (clamped)."""
+    steps = np.rint((values + POSITION_OFFSET) * POSITION_SCALE)
+    return np.clip(steps, 0, 0xFFFF).astype(np.uint16)
+
+
+def dequantize_position(steps: np.ndarray) -> np.ndarray:
+    """u2 position steps to pixels."""
+    return steps / POSITION_SCALE - POSITION_OFFSET
+
+
+def quantize_angle(degrees: np.ndarray) -> np.ndarray:
+    """Degrees to u1 angle steps."""
+    steps = np.rint(degrees * (ANGLE_STEPS / 360)).astype(np.int64)
+    return (steps % ANGLE_STEPS).astype(np.uint8)
+
+
+def _ms(seconds: float) -> int:
+    """Seconds as clamped u2 milliseconds."""
+    return min(0xFFFF, max(0, round(seconds * 1000)))
+
+
+class EntityIds:
+    """Stable u2 network ids for live entities (host side).
+
+    The map holds each tracked entity, so an id() stays unique for as long as its
+    network id is in use; entities gone from the world are forgotten on the next call.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[int, tuple[Any, int]] = {}
+        self._next = 0
+
+    def assign(self, entities: list[Any]) -> list[int]:
+        """Network ids for this tick's entities (new ones get the next free number)."""
+        current: dict[int, tuple[Any, int]] = {}
+        ids = []
+        for entity in entities:
+            entry = self._ids.get(id(entity))
+            if entry is None:
+                entry = (entity, self._next)
+                self._next = (self._next + 1) & 0xFFFF
+            current[id(entity)] = entry
+            ids.append(entry[1])
+        self._ids = current
+        return ids
+
+
+def capture_entities(game: Any, ids: EntityIds) -> np.ndarray:
+    """Quantize the game's drawn entities into ENTITY rows sorted by id."""
+    entities = []
+    values = []
+    for table in game.world.query("sprite"):
+        for entity in table.rows:
+            kind = KIND_INDEX[type(entity)]
+            if kind == POWERUP_KIND:
+                aux = POWERUP_INDEX[entity.powerup_type] | (entity.is_visible << 7)
+                values.append((kind, entity.x, entity.y, entity.rotation_angle, aux))
+            elif kind == PROJECTILE_KIND:
+                if not entity.is_alive():
+                    continue
+                values.append((kind, entity.x, entity.y, 0.0, 0))
+            else:
+                values.append((kind, entity.x, entity.y, entity.angle, entity.health or 0))
+            entities.append(entity)
+
+    rows = np.zeros(len(values), ENTITY)
+    if values:
+        data = np.array(values, np.float64)
+        rows["id"] = ids.assign(entities)
+        rows["kind"] = data[:, 0]
+        rows["x"] = quantize_position(data[:, 1])
+        rows["y"] = quantize_position(data[:, 2])
+        rows["angle"] = quantize_angle(data[:, 3])
+        rows["aux"] = np.clip(data[:, 4], 0, 255)
+        rows = rows[np.argsort(rows["id"], kind="stable")]
+    else:
+        ids.assign([])
+    return rows
+
+
+def capture_players(game: Any) -> np.ndarray:
+    """PLAYER_STATE rows for every player (slot = position in game.players)."""
+    players = game.players
+    rows = np.zeros(len(players), PLAYER_STATE)
+    for slot, player in enumerate(players):
+        rows[slot] = (
+            slot,
+            0,
+            0,
+            0,
+            min(255, max(0, round(player.health))),
+            min(255, player.max_health),
+            min(255, player.magazine),
+            min(255, player.magazine_size),
+            min(0xFFFF, player.stash),
+            player.is_reloading * FLAG_RELOADING | player.is_attacking * FLAG_ATTACKING,
+            _ms(player.attack_cooldown),
+            _ms(player.speed_boost_timer),
+            min(255, player.shield_hits_remaining),
+        )
+    rows["x"] = quantize_position(np.array([player.x for player in players]))
+    rows["y"] = quantize_position(np.array([player.y for player in players]))
+    rows["angle"] = quantize_angle(np.array([player.angle for player in players]))
+    return rows
+
+
+def encode_delta(current: np.ndarray, base: np.ndarray | None) -> tuple[tuple[int, int], bytes]:
+    """Encode entity rows against a baseline (both sorted by id).
+
+    Layout: removed ids (u2), added rows (ENTITY), one change mask (u1) per row kept
+    from the baseline (id order), then one column per DELTA_FIELDS bit holding the
+    values of the kept rows with that bit set. Moves of up to 127 steps (~16 px) go
+    in the one-byte dx/dy columns, larger ones as full u2 positions.
+
+    Returns:
+        ((removed, added) counts, encoded bytes)
+    """
+    if base is None:
+        base = EMPTY
+    in_base = np.isin(current["id"], base["id"], assume_unique=True)
+    removed = base["id"][~np.isin(base["id"], current["id"], assume_unique=True)]
+    added = current[~in_base]
+    kept = current[in_base]
+    previous = base[np.isin(base["id"], kept["id"], assume_unique=True)]  # Aligned by id
+
+    columns = {}
+    mask = np.zeros(len(kept), np.uint8)
+    for name in ("kind", "angle", "aux"):
+        changed = kept[name] != previous[name]
+        mask |= changed.astype(np.uint8) << DELTA_BITS[name]
+        columns[name] = kept[name][changed]
+    for name in ("x", "y"):
+        diff = kept[name].astype(np.int32) - previous[name]
+        small = (diff != 0) & (np.abs(diff) <= 127)
+        large = np.abs(diff) > 127
+        mask |= large.astype(np.uint8) << DELTA_BITS[name]
+        mask |= small.astype(np.uint8) << DELTA_BITS["d" + name]
+        columns[name] = kept[name][large]
+        columns["d" + name] = diff[small].astype(np.int8)
+
+    parts = [removed.tobytes(), added.tobytes(), mask.tobytes()]
+    parts += [columns[name].tobytes() for name in DELTA_FIELDS]
+    return (len(removed), len(added)), b"".join(parts)
+
+
+def decode_delta(
+    data: bytes, offset: int, counts: tuple[int, int], base: np.ndarray | None
+) -> np.ndarray:
+    """Rebuild entity rows from encode_delta() output and the same baseline.
+
+    Returns:
+        Rows sorted by id
+    """
+    removed_count, added_count = counts
+    removed = np.frombuffer(data, "<u2", removed_count, offset)
+    offset += removed.nbytes
+    added = np.frombuffer(data, ENTITY, added_count, offset)
+    offset += added.nbytes
+
+    if base is None:
+        base = EMPTY
+    state = base[~np.isin(base["id"], removed, assume_unique=True)]  # A copy
+    mask = np.frombuffer(data, np.uint8, len(state), offset)
+    offset += mask.nbytes
+    for name in DELTA_FIELDS:
+        selected = (mask >> DELTA_BITS[name]) & 1 == 1
+        dtype = DELTA_DTYPES[name]
+        values = np.frombuffer(data, dtype, int(selected.sum()), offset)
+        offset += values.nbytes
+        if name in ("dx", "dy"):
+            column = name[1]
+            state[column][selected] = state[column][selected].astype(np.int32) + values
+        else:
+            state[name][selected] = values
+
+    if added_count:
+        state = np.concatenate([state, added])
+        state = state[np.argsort(state["id"], kind="stable")]
+    return state
+
+
+def interpolate(
+    a: np.ndarray, b: np.ndarray, t: float, key: str = "id"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Positions and angles of a's rows moved t of the way toward their rows in b.
+
+    Rows missing from b stay where they are; angles take the short way round.
+
+    Returns:
+        (x, y, angle) in pixels and degrees, one entry per row of a
+    """
+    x = dequantize_position(a["x"].astype(np.float64))
+    y = dequantize_position(a["y"].astype(np.float64))
+    angle = a["angle"].astype(np.float64)
+    if t > 0 and len(a) and len(b):
+        _, ia, ib = np.intersect1d(a[key], b[key], assume_unique=True, return_indices=True)
+        x[ia] += (dequantize_position(b["x"][ib].astype(np.float64)) - x[ia]) * t
+        y[ia] += (dequantize_position(b["y"][ib].astype(np.float64)) - y[ia]) * t
+        turn = (b["angle"][ib].astype(np.int64) - a["angle"][ia] + 128) % ANGLE_STEPS - 128
+        angle[ia] += turn * t
+    return x, y, (angle * (360 / ANGLE_STEPS)) % 360
+
+
+class LinkSimulator:
+    """Delays and drops outgoing datagrams to simulate a network on loopback.
+
+    Uses its own random stream, so simulated loss never perturbs the game's RNG.
+    """
+
+    def __init__(
+        self, latency: float = 0.0, jitter: float = 0.0, loss: float = 0.0, seed: int | None = None
+    ):
+        """Create a link.
+
+        Args:
+            latency: One-way delay in seconds
+            jitter: Extra uniform random delay in seconds (0..jitter; may reorder)
+            loss: Probability of dropping each datagram
+            seed: Seed for the loss/jitter stream
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.sent = 0
+        self.dropped = 0
+        self._queue: list[tuple[float, int, bytes, tuple]] = []
+
+    def send(self, sock: socket.socket, data: bytes, address: tuple) -> None:
+        """Queue a datagram (or drop it)."""
+        self.sent += 1
+        if self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        due = time.perf_counter() + self.latency + self.rng.uniform(0.0, self.jitter)
+        heapq.heappush(self._queue, (due, self.sent, data, address))
+        self.flush(sock)
+
+    def flush(self, sock: socket.socket) -> None:
+        """Send every queued datagram whose delay has passed."""
+        now = time.perf_counter()
+        queue = self._queue
+        while queue and queue[0][0] <= now:
+            _, _, data, address = heapq.heappop(queue)
+            with contextlib.suppress(OSError):  # Peer gone: datagrams are fire-and-forget
+                sock.sendto(data, address)
+
+
+class NetworkController:
+    """Controller for a remote player: the Controls from its latest INPUT."""
+
+    def __init__(self) -> None:
+        self.controls = Controls()
+
+    def read(self, game: object) -> Controls:
+        return self.controls
+
+
+class RemoteClient:
+    """Host-side record of one connected client."""
+
+    def __init__(self, address: tuple, controller: NetworkController):
+        self.address = address
+        self.controller = controller
+        self.ack: int | None = None  # Newest snapshot tick the client has
+        self.last_seen = time.perf_counter()
+        self.snapshots = 0
+        self.bytes_sent = 0
+        self.full_bytes = 0  # What the same snapshots would have cost sent whole
+        self._reported = (time.perf_counter(), 0, 0, 0)  # (time, snapshots, bytes, full)
+
+
+class CoopHost:
+    """Authoritative side: runs the game, applies client input, replicates state."""
+
+    def __init__(
+        self,
+        game: Any,
+        port: int | None = None,
+        config: NetConfig = net_config,
+        link: LinkSimulator | None = None,
+        bind: str = "0.0.0.0",
+    ):
+        """Open the host socket.
+
+        Args:
+            game: Game to host (its own player is slot 0)
+            port: UDP port (None: config.port; 0: any free port)
+            config: Networking settings
+            link: Simulated network for outgoing datagrams (None: send directly)
+            bind: Interface to listen on
+        """
+        self.game = game
+        self.config = config
+        self.link = link
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.bind((bind, config.port if port is None else port))
+        self.address = self.sock.getsockname()
+
+        self.clients: dict[tuple, RemoteClient] = {}
+        self.ids = EntityIds()
+        self.history: dict[int, np.ndarray] = {}  # Sent entity states by tick (baselines)
+        self.tick = 0
+        self._snapshot_timer = 0.0
+        self._report_timer = 0.0
+        self._start = time.perf_counter()
+        logger.info("Co-op host listening on %s:%d", *self.address)
+
+    def slot_of(self, client: RemoteClient) -> int:
+        """Current player slot of a client (allies follow the host in game.players)."""
+        return int(self.game.ally_controllers.index(client.controller)) + 1
+
+    def poll(self) -> None:
+        """Handle every pending datagram and drop silent clients."""
+        if self.link is not None:
+            self.link.flush(self.sock)
+        while True:
+            try:
+                data, address = self.sock.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            if data:
+                self._handle(data, address)
+
+        now = time.perf_counter()
+        for client in list(self.clients.values()):
+            if now - client.last_seen > self.config.client_timeout:
+                logger.warning("Co-op client %s:%d timed out", *client.address)
+                self._drop(client)
+
+    def update(self, delta_time: float) -> None:
+        """Send a snapshot when one is due (call once per frame, after game.update)."""
+        self._snapshot_timer -= delta_time
+        if self._snapshot_timer <= 0:
+            self._snapshot_timer = max(0.0, self._snapshot_timer + 1 / self.config.snapshot_rate)
+            self.broadcast()
+
+        self._report_timer += delta_time
+        if self.clients and self._report_timer >= self.config.report_interval:
+            self._report_timer = 0.0
+            for row in self.report():
+                logger.info(
+                    "Co-op slot %d: %.1f kB/s, %.0f B/snapshot (%.0f B whole, %.0f%% saved)",
+                    row["slot"],
+                    row["kbps"],
+                    row["bytes"],
+                    row["full_bytes"],
+                    row["saved"] * 100,
+                )
+
+    def broadcast(self) -> None:
+        """Capture the game and send each client a snapshot against its baseline."""
+        game = self.game
+        self.tick = (self.tick + 1) & 0xFFFFFFFF
+        if self.tick == NO_TICK:
+            self.tick = 0
+        entities = capture_entities(game, self.ids)
+        self.history[self.tick] = entities
+        self.history.pop((self.tick - self.config.history) & 0xFFFFFFFF, None)
+        if not self.clients:
+            return
+
+        players = capture_players(game)
+        header = np.zeros((), SNAPSHOT)
+        header["type"] = MSG_SNAPSHOT
+        header["tick"] = self.tick
+        header["time_ms"] = round((time.perf_counter() - self._start) * 1000) & 0xFFFFFFFF
+        header["state"] = STATES.index(game.state)
+        header["wave"] = game.current_wave
+        header["score"] = game.score
+        header["zombies_to_spawn"] = game.zombies_to_spawn
+        header["wave_notification_ms"] = _ms(game.wave_notification_timer)
+        header["players"] = len(players)
+        player_bytes = players.tobytes()
+        full_size = SNAPSHOT.itemsize + len(player_bytes) + entities.nbytes
+
+        for client in self.clients.values():
+            base = None if client.ack is None else self.history.get(client.ack)
+            counts, body = encode_delta(entities, base)
+            header["base"] = NO_TICK if base is None else client.ack
+            header["slot"] = self.slot_of(client)
+            header["removed"], header["added"] = counts
+            packet = header.tobytes() + player_bytes + body
+            self._send(packet, client.address)
+            client.snapshots += 1
+            client.bytes_sent += len(packet)
+            client.full_bytes += full_size
+
+    def report(self) -> list[dict]:
+        """Bandwidth per client since the previous report.
+
+        Returns:
+            Dicts with slot, address, snapshots (sent), kbps (kB/s sent), bytes (mean
+            per snapshot), full_bytes (mean had they been sent whole), saved (fraction)
+        """
+        now = time.perf_counter()
+        rows = []
+        for client in self.clients.values():
+            then, snapshots, sent, full = client._reported
+            client._reported = (now, client.snapshots, client.bytes_sent, client.full_bytes)
+            count = max(1, client.snapshots - snapshots)
+            sent = client.bytes_sent - sent
+            full = client.full_bytes - full
+            rows.append(
+                {
+                    "slot": self.slot_of(client),
+                    "address": client.address,
+                    "snapshots": client.snapshots - snapshots,
+                    "kbps": sent / 1024 / max(now - then, 1e-9),
+                    "bytes": sent / count,
+                    "full_bytes": full / count,
+                    "saved": 1 - sent / full if full else 0.0,
+                }
+            )
+        return rows
+
+    def close(self) -> None:
+        """Remove every client's player and close the socket."""
+        for client in list(self.clients.values()):
+            self._drop(client)
+        self.sock.close()
+
+    def _send(self, data: bytes, address: tuple) -> None:
+        if self.link is not None:
+            self.link.send(self.sock, data, address)
+            return
+        with contextlib.suppress(OSError):  # Client gone; it times out
+            self.sock.sendto(data, address)
+
+    def _handle(self, data: bytes, address: tuple) -> None:
+        """Dispatch one client datagram."""
+        kind = data[0]
+        client = self.clients.get(address)
+        if kind == MSG_HELLO:
+            if client is None:
+                if len(self.clients) + 1 >= self.config.max_players:
+                    self._send(bytes((MSG_FULL, 0)), address)
+                    return
+                client = RemoteClient(address, NetworkController())
+                self.clients[address] = client
+                self.game.add_ally(client.controller)
+                logger.info("Co-op client %s:%d joined", *address)
+            client.last_seen = time.perf_counter()
+            self._send(bytes((MSG_WELCOME, self.slot_of(client))), address)
+        elif client is None:
+            return  # Not joined (or already dropped)
+        elif kind == MSG_INPUT and len(data) >= INPUT.itemsize:
+            message = np.frombuffer(data, INPUT, 1)[0]
+            client.controller.controls = Controls.unpack(int(message["controls"]))
+            ack = int(message["ack"])
+            client.ack = None if ack == NO_TICK else ack
+            client.last_seen = time.perf_counter()
+        elif kind == MSG_BYE:
+            logger.info("Co-op client %s:%d left", *address)
+            self._drop(client)
+
+    def _drop(self, client: RemoteClient) -> None:
+        del self.clients[client.address]
+        self.game.remove_ally(client.controller)
+
+
+@dataclass(slots=True)
+class Snapshot:
+    """A decoded snapshot (client side)."""
+
+    tick: int
+    time: float  # Host clock in seconds
+    header: np.void
+    players: np.ndarray
+    entities: np.ndarray
+
+
+class CoopClient:
+    """Remote player: sends input, buffers snapshots and mirrors them into a Game."""
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        config: NetConfig = net_config,
+        link: LinkSimulator | None = None,
+    ):
+        """Open a socket and start joining.
+
+        Args:
+            address: Host (name or ip, port)
+            config: Networking settings
+            link: Simulated network for outgoing datagrams (None: send directly)
+
+        Raises:
+            OSError: If the host name cannot be resolved
+        """
+        # Resolved once: datagrams are only accepted from this exact address
+        self.host = (socket.gethostbyname(address[0]), address[1])
+        self.config = config
+        self.link = link
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.bind(("", 0))
+        self.port = self.sock.getsockname()[1]
+
+        self.slot: int | None = None  # Set by WELCOME
+        self.full = False  # Host refused: no free slot
+        self.states: dict[int, Snapshot] = {}  # Decoded snapshots by tick (baselines)
+        self.newest: int | None = None
+        self.offset: float | None = None  # Local clock minus host clock (seconds)
+        self.bytes_received = 0
+        self.snapshots = 0
+        self.undecodable = 0  # Snapshots whose baseline was no longer kept, or malformed
+        self.ignored = 0  # Datagrams from other senders or too short to read
+
+        # Reused mirror objects (filled from rows, never constructed per frame)
+        self._pools: dict[type, list] = {cls: [] for cls in KINDS}
+        self._players: dict[int, Player] = {}
+        self._hello_timer = 0.0
+        self._start = time.perf_counter()
+        self._send(bytes((MSG_HELLO,)))
+
+    @property
+    def connected(self) -> bool:
+        return self.slot is not None
+
+    def poll(self) -> None:
+        """Receive pending datagrams (and keep asking to join until welcomed)."""
+        if self.link is not None:
+            self.link.flush(self.sock)
+        if self.slot is None and not self.full:
+            now = time.perf_counter()
+            if now - self._hello_timer >= self.config.hello_interval:
+                self._hello_timer = now
+                self._send(bytes((MSG_HELLO,)))
+
+        while True:
+            try:
+                data, sender = self.sock.recvfrom(65536)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            if not data or sender != self.host:
+                self.ignored += 1
+                continue
+            self.bytes_received += len(data)
+            if data[0] == MSG_SNAPSHOT:
+                self._receive_snapshot(data)
+            elif data[0] == MSG_WELCOME and self.slot is None:
+                if len(data) < WELCOME.itemsize:
+                    self.ignored += 1
+                    continue
+                self.slot = data[1]
+                logger.info("Joined co-op game as player %d", self.slot + 1)
+            elif data[0] == MSG_FULL:
+                self.full = True
+                logger.warning("Co-op game is full")
+
+    def send_input(self, controls: Controls) -> None:
+        """Send this frame's held controls and the newest snapshot tick received."""
+        message = np.zeros((), INPUT)
+        message["type"] = MSG_INPUT
+        message["controls"] = controls.pack()
+        message["ack"] = NO_TICK if self.newest is None else self.newest
+        self._send(message.tobytes())
+
+    def apply(self, game: Any) -> bool:
+        """Mirror the interpolated state `interpolation_delay` behind the host into game.
+
+        Returns:
+            False if no snapshot has arrived yet
+        """
+        if self.newest is None or self.offset is None:
+            return False
+        newest = self.states[self.newest]
+        render_time = time.perf_counter() - self.offset - self.config.interpolation_delay
+
+        # Snapshots around the render time (clamped to the buffer, no extrapolation)
+        older = newer = None
+        for snapshot in self.states.values():
+            if snapshot.time <= render_time:
+                if older is None or snapshot.time > older.time:
+                    older = snapshot
+            elif newer is None or snapshot.time < newer.time:
+                newer = snapshot
+        if older is None:
+            older, newer = newer, None
+        assert older is not None
+        t = 0.0
+        if newer is not None:
+            t = (render_time - older.time) / (newer.time - older.time)
+        target = older if newer is None else newer
+
+        # Game scalars from the newest snapshot (HUD stays current)
+        header = newest.header
+        game.state = STATES[int(header["state"])]
+        game.current_wave = int(header["wave"])
+        game.score = int(header["score"])
+        game.zombies_to_spawn = int(header["zombies_to_spawn"])
+        game.wave_notification_timer = int(header["wave_notification_ms"]) / 1000
+        self._apply_players(game, newest, older, target.players, t, int(header["slot"]))
+        self._apply_entities(game, older.entities, target.entities, t, render_time)
+        return True
+
+    def close(self) -> None:
+        """Tell the host we are leaving and close the socket."""
+        with contextlib.suppress(OSError):
+            self.sock.sendto(bytes((MSG_BYE,)), self.host)
+        self.sock.close()
+
+    def _send(self, data: bytes) -> None:
+        if self.link is not None:
+            self.link.send(self.sock, data, self.host)
+            return
+        with contextlib.suppress(OSError):  # Host not up yet; HELLO is retried
+            self.sock.sendto(data, self.host)
+
+    def _receive_snapshot(self, data: bytes) -> None:
+        """Decode a snapshot against its baseline and buffer it."""
+        if len(data) < SNAPSHOT.itemsize:
+            self.ignored += 1
+            return
+        header = np.frombuffer(data, SNAPSHOT, 1)[0]
+        # Fixed-size parts the header declares (the delta mask and fields follow)
+        declared = (
+            SNAPSHOT.itemsize
+            + int(header["players"]) * PLAYER_STATE.itemsize
+            + int(header["removed"]) * 2
+            + int(header["added"]) * ENTITY.itemsize
+        )
+        if len(data) < declared:
+            self.ignored += 1
+            return
+        tick = int(header["tick"])
+        base_tick = int(header["base"])
+        base = None
+        if base_tick != NO_TICK:
+            baseline = self.states.get(base_tick)
+            if baseline is None:
+                self.undecodable += 1
+                return
+            base = baseline.entities
+
+        offset = SNAPSHOT.itemsize
+        players = np.frombuffer(data, PLAYER_STATE, int(header["players"]), offset)
+        offset += players.nbytes
+        counts = (int(header["removed"]), int(header["added"]))
+        try:
+            entities = decode_delta(data, offset, counts, base)
+        except ValueError:  # Truncated delta fields
+            self.undecodable += 1
+            return
+
+        host_time = int(header["time_ms"]) / 1000
+        self.states[tick] = Snapshot(tick, host_time, header, players, entities)
+        self.snapshots += 1
+        if self.newest is None or host_time > self.states[self.newest].time:
+            self.newest = tick
+        # Keep the newest `history` snapshots (older ones can no longer be baselines)
+        while len(self.states) > self.config.history:
+            del self.states[min(self.states, key=lambda key: self.states[key].time)]
+
+        # Clock offset tracks the fastest delivery (jitter only ever makes packets late)
+        estimate = time.perf_counter() - host_time
+        if self.offset is None or estimate < self.offset:
+            self.offset = estimate
+        else:
+            self.offset += (estimate - self.offset) * 0.01
+
+    def _apply_players(
+        self, game: Any, newest: Snapshot, older: Snapshot, target: np.ndarray, t: float, slot: int
+    ) -> None:
+        """Own player becomes game.player, the others game.allies."""
+        positions = interpolate(older.players, target, t, key="slot")
+        placed = dict(
+            zip(older.players["slot"].tolist(), zip(*positions, strict=True), strict=True)
+        )
+        allies = []
+        for row in newest.players:
+            row_slot = int(row["slot"])
+            player = self._players.get(row_slot)
+            if player is None:
+                player = self._players[row_slot] = game.spawn_player(row_slot)
+            if row_slot in placed:
+                player.x, player.y, player.angle = (float(v) for v in placed[row_slot])
+            else:
+                player.x = float(dequantize_position(row["x"]))
+                player.y = float(dequantize_position(row["y"]))
+                player.angle = float(row["angle"]) * 360 / ANGLE_STEPS
+            player.health = float(row["health"])
+            player.max_health = int(row["max_health"])
+            player.magazine = int(row["magazine"])
+            player.magazine_size = int(row["magazine_size"])
+            player.stash = int(row["stash"])
+            player.is_reloading = bool(row["flags"] & FLAG_RELOADING)
+            player.is_attacking = bool(row["flags"] & FLAG_ATTACKING)
+            player.attack_cooldown = int(row["attack_cooldown_ms"]) / 1000
+            player.speed_boost_timer = int(row["speed_boost_ms"]) / 1000
+            player.shield_hits_remaining = int(row["shield_hits_remaining"])
+            if row_slot == slot:
+                game.player = player
+            else:
+                allies.append(player)
+        game.allies = allies
+
+    def _apply_entities(
+        self, game: Any, older: np.ndarray, target: np.ndarray, t: float, render_time: float
+    ) -> None:
+        """Refill the world from interpolated entity rows."""
+        x, y, angle = interpolate(older, target, t)
+        game.world.clear()
+        used = dict.fromkeys(KINDS, 0)
+        for kind, aux, ex, ey, ea in zip(
+            older["kind"].tolist(),
+            older["aux"].tolist(),
+            x.tolist(),
+            y.tolist(),
+            angle.tolist(),
+            strict=True,
+        ):
+            cls = KINDS[kind]
+            pool = self._pools[cls]
+            index = used[cls]
+            used[cls] += 1
+            if index == len(pool):
+                pool.append(object.__new__(cls))
+            entity = pool[index]
+            entity.x = ex
+            entity.y = ey
+            if cls is Powerup:
+                entity.powerup_type = POWERUP_TYPES[aux & 0x7F]
+                entity.is_visible = bool(aux >> 7)
+                entity.rotation_angle = ea
+                entity.bob_timer = render_time  # Bobbing is presentation only
+            elif cls is Projectile:
+                entity.prev_x = ex
+                entity.prev_y = ey
+                entity.age = 0.0
+                entity.alive = True
+            else:
+                entity.angle = ea
+                entity.health = aux or None
+            game.world.spawn(entity)
+
+
+def _headless_game() -> Any:
+    """A Game without window or audio that never records runs."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["GAME_SIM_PROCESS"] = "0"
+    os.environ["GAME_RENDER_THREAD"] = "0"
+    from game import Game
+
+    game = Game()
+    game.LEADERBOARD_FILE = None
+    return game
+
+
+def loopback(
+    clients: int = 3,
+    seconds: float = 10.0,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    loss: float = 0.0,
+    zombies: int = 0,
+    seed: int = 0,
+    policy: str = "kite",
+) -> tuple[list[dict], list[CoopClient]]:
+    """Host and bot clients in one process over loopback UDP, in real time.
+
+    Every side's outgoing datagrams pass through its own LinkSimulator. Clients' bots
+    play from their interpolated mirror of the game, like a remote player would.
+
+    Args:
+        clients: Joining players (1-3)
+        seconds: Wall-clock seconds to run after everyone joined
+        latency: One-way delay (seconds)
+        jitter: Extra random delay (seconds)
+        loss: Datagram loss probability (each direction)
+        zombies: Extra zombies spawned at the start (horde bandwidth)
+        seed: Game and link seed
+        policy: Bot policy for every player
+
+    Returns:
+        (host.report() rows for the whole run, the clients)
+    """
+    from bot import make_bot
+    from controls import Controller
+
+    random.seed(seed)
+    host_game = _headless_game()
+    host_game.controller = make_bot(policy)
+    host = CoopHost(
+        host_game, port=0, link=LinkSimulator(latency, jitter, loss, seed), bind="127.0.0.1"
+    )
+    remotes = []
+    for index in range(clients):
+        link = LinkSimulator(latency, jitter, loss, seed + index + 1)
+        client = CoopClient(("127.0.0.1", host.address[1]), link=link)
+        mirror = _headless_game()
+        controller: Controller = make_bot(policy)
+        remotes.append((client, mirror, controller))
+
+    dt = 1 / host_game.FPS
+    deadline = time.perf_counter() + 5.0
+    while not all(client.connected for client, _, _ in remotes):
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Co-op clients did not join over loopback")
+        host.poll()
+        for client, _, _ in remotes:
+            client.poll()
+        time.sleep(0.005)
+
+    host_game.start_new_game()
+    host_game.state = GameState.PLAYING
+    for _ in range(zombies):
+        host_game.spawn_zombie()
+    for remote in host.clients.values():
+        remote._reported = (time.perf_counter(), 0, 0, 0)
+
+    next_frame = time.perf_counter()
+    end = next_frame + seconds
+    try:
+        while time.perf_counter() < end:
+            host.poll()
+            if host_game.state == GameState.PLAYING:
+                host_game.update(dt)
+            host.update(dt)
+            for client, mirror, controller in remotes:
+                client.poll()
+                if client.apply(mirror):
+                    client.send_input(controller.read(mirror))
+                else:
+                    client.send_input(Controls())
+            next_frame += dt
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        rows = host.report()
+    finally:
+        for client, mirror, _ in remotes:
+            client.close()
+            mirror.entity_workers.close()
+        host.close()
+        host_game.entity_workers.close()
+    return rows, [client for client, _, _ in remotes]
+
+
+def host_main(port: int) -> None:
+    """Host a co-op game in a window (this player is player 1)."""
+    from game import Game
+    from sound import flush_sounds
+
+    game = Game()
+    host = CoopHost(game, port)
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    try:
+        while game.running:
+            delta_time = game.clock.tick(game.FPS) / 1000.0
+            host.poll()
+            if game.state == GameState.PLAYING:
+                game.handle_events()
+                game.update(delta_time)
+                game.render()
+            elif game.state == GameState.PAUSED:
+                game.render_paused()
+                game.handle_pause_events()
+            elif game.state == GameState.GAME_OVER:
+                game.render_game_over()
+                game.handle_game_over_events()
+            else:
+                game.render_menu()
+                game.handle_menu_events()
+            host.update(delta_time)
+            flush_sounds()
+    finally:
+        host.close()
+        game.entity_workers.close()
+        pygame.quit()
+
+
+def join_main(address: tuple[str, int]) -> None:
+    """Join a co-op game in a window."""
+    os.environ["GAME_SIM_PROCESS"] = "0"
+    from game import Game
+
+    game = Game()
+    client = CoopClient(address)
+    try:
+        while game.running and not client.full:
+            game.clock.tick(game.FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                    event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_q)
+                ):
+                    game.running = False
+            client.poll()
+            client.send_input(game.controller.read(game))
+            if not client.apply(game):
+                game.screen.fill(game.BACKGROUND_COLOR)  # Connecting
+                pygame.display.flip()
+            elif game.state == GameState.GAME_OVER:
+                game.render_game_over()
+            else:
+                game.render()
+    finally:
+        client.close()
+        game.entity_workers.close()
+        pygame.quit()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Host, join, or run a loopback bandwidth test."""
+    parser = argparse.ArgumentParser(description="Co-op over UDP")
+    commands = parser.add_subparsers(dest="command", required=True)
+    host_parser = commands.add_parser("host", help="Host a game (player 1)")
+    host_parser.add_argument("--port", type=int, default=net_config.port)
+    join_parser = commands.add_parser("join", help="Join a hosted game")
+    join_parser.add_argument("address", help="HOST[:PORT]")
+    test = commands.add_parser("loopback", help="Bot players over simulated network")
+    test.add_argument("--clients", type=int, default=3, choices=range(1, net_config.max_players))
+    test.add_argument("--seconds", type=float, default=10.0)
+    test.add_argument("--latency", type=float, default=0.05, help="One-way delay (s)")
+    test.add_argument("--jitter", type=float, default=0.01, help="Extra random delay (s)")
+    test.add_argument("--loss", type=float, default=0.05, help="Datagram loss probability")
+    test.add_argument("--zombies", type=int, default=0, help="Extra zombies at the start")
+    test.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "host":
+        host_main(args.port)
+    elif args.command == "join":
+        name, _, port = args.address.partition(":")
+        join_main((name, int(port) if port else net_config.port))
+    else:
+        rows, clients = loopback(
+            args.clients,
+            args.seconds,
+            args.latency,
+            args.jitter,
+            args.loss,
+            args.zombies,
+            args.seed,
+        )
+        received = {client.port: client for client in clients}
+        print(f"{'slot':>4} {'kB/s':>7} {'B/snap':>7} {'whole':>7} {'saved':>6} {'lost':>6}")
+        for row in rows:
+            client = received[row["address"][1]]
+            lost = 1 - client.snapshots / max(1, row["snapshots"])
+            print(
+                f"{row['slot']:>4} {row['kbps']:>7.1f} {row['bytes']:>7.0f}"
+                f" {row['full_bytes']:>7.0f} {row['saved']:>6.0%} {lost:>6.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
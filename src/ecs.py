@@ -0,0 +1,263 @@
+"""
+Entity-component storage for Zombie Survival
+Archetype tables group entities by component set; systems run in a timed, reorderable schedule
+
+Usage:
+    world = World()
+    world.spawn(zombie)  # Stored in the table for type(zombie).COMPONENTS
+
+    for table in world.query("chase"):
+        for zombie in table:
+            zombie.update(delta_time, player_x, player_y)
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Archetype:
+    """Table of entities that share exactly the same component set.
+
+    Rows live in one contiguous list so systems iterate a flat array instead of
+    dispatching on entity type. Removal uses swap-remove (O(1), order not kept).
+    """
+
+    __slots__ = ("components", "rows")
+
+    def __init__(self, components: frozenset[str]):
+        """Create an empty table.
+
+        Args:
+            components: Component names every row in this table provides
+        """
+        self.components = components
+        self.rows: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.rows)
+
+    def add(self, entity: Any) -> None:
+        """Append an entity as a new row."""
+        self.rows.append(entity)
+
+    def swap_remove(self, row: int) -> None:
+        """Remove a row by moving the last row into its slot.
+
+        Args:
+            row: Index of the row to remove
+        """
+        last = self.rows.pop()
+        if row < len(self.rows):
+            self.rows[row] = last
+
+    def remove(self, entity: Any) -> None:
+        """Remove a single entity (identity match) with swap-remove."""
+        for row, candidate in enumerate(self.rows):
+            if candidate is entity:
+                self.swap_remove(row)
+                return
+
+    def discard_many(self, entities: Iterable[Any]) -> None:
+        """Remove every entity in the given collection in a single pass."""
+        doomed = {id(entity) for entity in entities}
+        if doomed:
+            self.rows[:] = [entity for entity in self.rows if id(entity) not in doomed]
+
+    def retain(self, predicate: Callable[[Any], bool]) -> None:
+        """Keep only rows for which predicate(entity) is True (order preserved)."""
+        self.rows[:] = [entity for entity in self.rows if predicate(entity)]
+
+    def replace(self, entities: Iterable[Any]) -> None:
+        """Replace the table contents in place (keeps external references valid)."""
+        self.rows[:] = list(entities)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.rows.clear()
+
+
+class World:
+    """Container of archetype tables with cached component queries.
+
+    Entities declare their component set through a ``COMPONENTS`` class attribute,
+    so all instances of a kind (and all kinds with the same components) share one
+    table. Adding a new entity kind adds at most one table - systems pick it up via
+    queries with no extra per-frame dispatch.
+    """
+
+    def __init__(self):
+        """Create an empty world."""
+        self._archetypes: dict[frozenset[str], Archetype] = {}
+        self._query_cache: dict[frozenset[str], list[Archetype]] = {}
+
+    def archetype(self, components: Iterable[str]) -> Archetype:
+        """Get (or create) the table for an exact component set.
+
+        Tables are iterated in creation order, so registering archetypes up front
+        fixes the draw order for render systems.
+
+        Args:
+            components: Component names of the archetype
+
+        Returns:
+            The archetype table
+        """
+        key = frozenset(components)
+        table = self._archetypes.get(key)
+        if table is None:
+            table = Archetype(key)
+            self._archetypes[key] = table
+            self._query_cache.clear()  # New table may match existing queries
+            logger.debug("Archetype created: %s", sorted(key))
+        return table
+
+    def spawn(self, entity: Any) -> Any:
+        """Add an entity to the table matching its COMPONENTS.
+
+        Args:
+            entity: Object with a COMPONENTS class attribute
+
+        Returns:
+            The entity (for chaining)
+        """
+        self.archetype(type(entity).COMPONENTS).add(entity)
+        return entity
+
+    def query(self, *components: str) -> list[Archetype]:
+        """Get all tables that provide every requested component.
+
+        Results are cached until a new archetype is created, so calling this every
+        frame costs a single dict lookup.
+        """
+        key = frozenset(components)
+        tables = self._query_cache.get(key)
+        if tables is None:
+            tables = [table for table in self._archetypes.values() if key <= table.components]
+            self._query_cache[key] = tables
+        return tables
+
+    def entities(self, *components: str) -> Iterator[Any]:
+        """Iterate all entities that provide every requested component."""
+        for table in self.query(*components):
+            yield from table.rows
+
+    def count(self, *components: str) -> int:
+        """Count entities that provide every requested component."""
+        return sum(len(table) for table in self.query(*components))
+
+    def clear(self) -> None:
+        """Remove all entities (tables are kept for reuse)."""
+        for table in self._archetypes.values():
+            table.clear()
+
+
+class SystemSchedule:
+    """Ordered list of named systems, each individually timed.
+
+    Systems are plain callables. Returning ``False`` halts the rest of the
+    schedule for this run (e.g. the player died mid-frame).
+    """
+
+    def __init__(self, smoothing: float = 0.1):
+        """Create an empty schedule.
+
+        Args:
+            smoothing: Weight of the newest sample in the moving-average timings
+        """
+        self.smoothing = smoothing
+        self._systems: list[tuple[str, Callable[..., bool | None]]] = []
+        self._timings: dict[str, float] = {}  # Smoothed milliseconds per system
+
+    @property
+    def names(self) -> list[str]:
+        """System names in execution order."""
+        return [name for name, _ in self._systems]
+
+    def _index(self, name: str) -> int:
+        for index, (system_name, _) in enumerate(self._systems):
+            if system_name == name:
+                return index
+        raise KeyError(f"Unknown system: {name}")
+
+    def add(
+        self,
+        name: str,
+        system: Callable[..., bool | None],
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> None:
+        """Register a system (appended unless before/after is given).
+
+        Args:
+            name: Unique system name (used for timings and reordering)
+            system: Callable run with the schedule's arguments
+            before: Insert before this system
+            after: Insert after this system
+        """
+        if name in self.names:
+            raise ValueError(f"System already registered: {name}")
+
+        if before is not None:
+            index = self._index(before)
+        elif after is not None:
+            index = self._index(after) + 1
+        else:
+            index = len(self._systems)
+        self._systems.insert(index, (name, system))
+
+    def remove(self, name: str) -> None:
+        """Unregister a system."""
+        del self._systems[self._index(name)]
+        self._timings.pop(name, None)
+
+    def reorder(self, names: list[str]) -> None:
+        """Set a new execution order.
+
+        Args:
+            names: Every registered system name, in the desired order
+        """
+        if sorted(names) != sorted(self.names):
+            raise ValueError(f"Reorder must list exactly: {self.names}")
+        systems = dict(self._systems)
+        self._systems = [(name, systems[name]) for name in names]
+
+    def run(self, *args: Any) -> bool:
+        """Run all systems in order, timing each one.
+
+        Returns:
+            False if a system halted the schedule, True otherwise
+        """
+        for name, system in self._systems:
+            start = time.perf_counter()
+            result = system(*args)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+            previous = self._timings.get(name)
+            if previous is None:
+                self._timings[name] = elapsed_ms
+            else:
+                self._timings[name] = previous + (elapsed_ms - previous) * self.smoothing
+
+            if result is False:
+                return False
+        return True
+
+    def timings(self) -> dict[str, float]:
+        """Smoothed milliseconds per system, in execution order."""
+        return {name: self._timings[name] for name in self.names if name in self._timings}
+
+    def report(self) -> str:
+        """Format timings as a single line for profiler logs."""
+        timings = self.timings()
+        total = sum(timings.values())
+        parts = [f"{name}={ms:.3f}ms" for name, ms in timings.items()]
+        return f"total={total:.3f}ms " + " ".join(parts)
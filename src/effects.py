@@ -0,0 +1,120 @@
+"""
+Pooled visual effect timers for Zombie Survival
+Kill flashes, pickup flashes and damage popups are updated in place with no per-frame allocation
+
+Usage:
+    kill_flashes = EffectPool(KillFlash, capacity=64)
+    kill_flashes.spawn(x=zombie.x, y=zombie.y, radius=zombie.radius, timer=0.2)
+    kill_flashes.update(delta_time)  # Tick timers, swap-remove expired records
+    for flash in kill_flashes: ...   # Live records only
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from typing import Any
+
+import pygame
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EffectPool:
+    """Fixed-capacity pool of preallocated effect records.
+
+    Live records occupy slots [0, count). Expired records are swap-removed to the
+    free tail and reused by later spawns, so steady-state updates create no garbage.
+    Spawns beyond capacity are dropped (oldest effects are already fading out).
+    """
+
+    def __init__(self, record_factory: Callable[[], Any], capacity: int):
+        """Preallocate the pool.
+
+        Args:
+            record_factory: Zero-argument constructor for a record (e.g. KillFlash)
+            capacity: Maximum number of live effects
+        """
+        self.capacity = capacity
+        self.records = [record_factory() for _ in range(capacity)]
+        self.count = 0
+        self.limit = capacity  # Live-record cap (lowered by the quality governor)
+        self.dropped = 0  # Spawns rejected because the pool was full
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Any]:
+        records = self.records
+        for index in range(self.count):
+            yield records[index]
+
+    def spawn(self, **fields: Any) -> Any | None:
+        """Activate a free record with the given field values.
+
+        Returns:
+            The record, or None if the pool is full (or at its limit)
+        """
+        if self.count >= self.limit:
+            self.dropped += 1
+            return None
+
+        record = self.records[self.count]
+        for name, value in fields.items():
+            setattr(record, name, value)
+        self.count += 1
+        return record
+
+    def update(self, delta_time: float, rise: float = 0.0) -> None:
+        """Tick timers in place and swap-remove expired records.
+
+        Records whose timer was already <= 0 are removed before ticking, so each
+        effect is drawn once with its final (possibly negative) timer.
+
+        Args:
+            delta_time: Time since last frame in seconds
+            rise: Upward drift in pixels per second (floating popups)
+        """
+        records = self.records
+        index = 0
+        while index < self.count:
+            record = records[index]
+            if record.timer <= 0:
+                # Swap with the last live record; re-check the swapped-in one
+                last = self.count - 1
+                records[index] = records[last]
+                records[last] = record
+                self.count = last
+                continue
+
+            record.timer -= delta_time
+            if rise:
+                record.y -= rise * delta_time
+            index += 1
+
+    def reset(self, records: Iterable[Any]) -> None:
+        """Replace live effects with copies of the given records' fields."""
+        self.clear()
+        for record in records:
+            self.spawn(**{name: getattr(record, name) for name in record.__slots__})
+
+    def clear(self) -> None:
+        """Remove all live effects (records stay allocated)."""
+        self.count = 0
+
+
+@lru_cache(maxsize=512)
+def circle_stamp(radius: int, color: tuple) -> pygame.Surface:
+    """Get a cached SRCALPHA surface with a filled circle.
+
+    Args:
+        radius: Circle radius in pixels
+        color: RGBA color (quantize alpha before calling to keep the cache small)
+
+    Returns:
+        Surface of size (2 * radius, 2 * radius)
+    """
+    size = max(1, radius * 2)
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(stamp, color, (radius, radius), radius)
+    return stamp
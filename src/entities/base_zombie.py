@@ -4,63 +4,85 @@ import math
 
 import pygame
 
+from config import FastZombieConfig, TankZombieConfig, ZombieConfig, zombie_config
 from logger import get_logger
-from utils import load_sprite
+from utils import get_rotated_sprite, get_sprite
 
 logger = get_logger(__name__)
 
 
 class BaseZombie:
-    """Base class for all zombie variants with shared movement and rendering logic."""
+    """Base class for all zombie variants with shared movement and rendering logic.
 
-    def __init__(self, x: float, y: float, config, rotation_speed: float = 540.0):
+    Instances are slotted and hold only per-zombie state (position, angle, health).
+    Stats come from the variant's shared config and sprites from the shared sprite
+    cache, so each zombie costs a fixed, small number of bytes.
+    """
+
+    # Component set shared by every variant, so all zombies live in one world table
+    COMPONENTS = frozenset({"position", "chase", "hurtbox", "contact_damage", "sprite"})
+
+    # Per-variant shared data (overridden by subclasses)
+    config: ZombieConfig | FastZombieConfig | TankZombieConfig = zombie_config
+    rotation_speed = 540.0  # Degrees per second
+
+    __slots__ = ("x", "y", "angle", "health")
+
+    def __init__(self, x: float, y: float):
         """Initialize zombie at given position.
 
         Args:
             x: Starting x coordinate
             y: Starting y coordinate
-            config: Zombie configuration (ZombieConfig, FastZombieConfig, etc.)
-            rotation_speed: Degrees per second for rotation (default: 540)
         """
-        # Configuration
-        self.config = config
-
         # Position
         self.x = x
         self.y = y
 
-        # Zombie properties from config
-        self.radius = self.config.radius
-        self.color = self.config.color
-        self.speed = self.config.speed
-        self.damage = self.config.damage
-
-        # Health system (if config has health attribute)
-        if hasattr(self.config, "health"):
-            self.max_health = self.config.health
-            self.health = self.max_health
-        else:
-            self.max_health = None
-            self.health = None
-
-        # Sprite loading (fallback to circle if sprite fails)
-        sprite_size = self.radius * 2
-        self.sprite_image = load_sprite(self.config.sprite_path, sprite_size)
-
         # Rotation state
         self.angle = 0.0  # Start facing RIGHT (sprite default orientation)
-        self.rotation_speed = rotation_speed
-        self.original_sprite = None
-        if self.sprite_image:
-            self.original_sprite = self.sprite_image.copy()
+
+        # Health system (only variants whose config has a health attribute)
+        self.health = self.max_health
 
         # Log spawn with health if applicable
         if self.health is not None:
             logger.debug(
-                f"{self.__class__.__name__} spawned at ({int(x)}, {int(y)}) - HP: {self.health}/{self.max_health}"
+                "%s spawned at (%d, %d) - HP: %s/%s",
+                self.__class__.__name__,
+                x,
+                y,
+                self.health,
+                self.max_health,
             )
         else:
-            logger.debug(f"{self.__class__.__name__} spawned at ({int(x)}, {int(y)})")
+            logger.debug("%s spawned at (%d, %d)", self.__class__.__name__, x, y)
+
+    # Stats are read from the shared variant config (no per-instance copies)
+    @property
+    def radius(self) -> int:
+        return self.config.radius
+
+    @property
+    def color(self) -> tuple:
+        return self.config.color
+
+    @property
+    def speed(self) -> int:
+        return self.config.speed
+
+    @property
+    def damage(self) -> int:
+        return self.config.damage
+
+    @property
+    def max_health(self) -> int | None:
+        return getattr(self.config, "health", None)
+
+    @property
+    def sprite_image(self) -> pygame.Surface | None:
+        """Shared unrotated sprite for this variant (None if unavailable)."""
+        return get_sprite(self.config.sprite_path, self.radius * 2)
 
     def take_damage(self, amount: int) -> bool:
         """Take damage and return True if still alive.
@@ -73,16 +95,20 @@ class BaseZombie:
         """
         if self.health is None:
             # Zombies without health system die in one hit
-            logger.debug(f"{self.__class__.__name__} died at ({int(self.x)}, {int(self.y)})")
+            logger.debug("%s died at (%d, %d)", self.__class__.__name__, self.x, self.y)
             return False
 
         self.health -= amount
         logger.debug(
-            f"{self.__class__.__name__} took {amount} damage, health: {self.health}/{self.max_health}"
+            "%s took %s damage, health: %s/%s",
+            self.__class__.__name__,
+            amount,
+            self.health,
+            self.max_health,
         )
 
         if self.health <= 0:
-            logger.debug(f"{self.__class__.__name__} died at ({int(self.x)}, {int(self.y)})")
+            logger.debug("%s died at (%d, %d)", self.__class__.__name__, self.x, self.y)
             return False
         return True
 
@@ -108,8 +134,9 @@ class BaseZombie:
             dy /= distance
 
             # Move toward player
-            self.x += dx * self.speed * delta_time
-            self.y += dy * self.speed * delta_time
+            speed = self.config.speed
+            self.x += dx * speed * delta_time
+            self.y += dy * speed * delta_time
 
             # Calculate target rotation from chase direction
             target_angle = math.degrees(math.atan2(-dy, dx))
@@ -132,21 +159,25 @@ class BaseZombie:
 
             self.angle = self.angle % 360
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(
+        self, screen: pygame.Surface, scale: float = 1.0, rotation_step: float | None = None
+    ) -> None:
         """Draw the zombie with rotation.
 
         Args:
             screen: Pygame surface to draw on
+            scale: World-to-surface scale (dynamic render resolution)
+            rotation_step: Degrees between cached rotations (None: the config default)
         """
-        if self.original_sprite:
-            # Rotate from original (avoid degradation)
-            rotated_sprite = pygame.transform.rotate(self.original_sprite, self.angle)
-            rect = rotated_sprite.get_rect(center=(int(self.x), int(self.y)))
+        radius = self.config.radius
+        center = (int(self.x * scale), int(self.y * scale))
+        rotated_sprite = get_rotated_sprite(
+            self.config.sprite_path, round(radius * 2 * scale), self.angle, rotation_step
+        )
+        if rotated_sprite:
+            # Shared rotation cache (quantized angle)
+            rect = rotated_sprite.get_rect(center=center)
             screen.blit(rotated_sprite, rect)
-        elif self.sprite_image:
-            # Fallback without rotation
-            rect = self.sprite_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.sprite_image, rect)
         else:
             # Circle fallback
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+            pygame.draw.circle(screen, self.config.color, center, round(radius * scale))
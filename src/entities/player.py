@@ -3,20 +3,56 @@ Player entity for Zombie Survival game
 Handles player movement, rendering, and collision
 """
 
+import math
+
 import pygame
 
 from config import player_config, weapon_config
+from controls import read_keyboard
 from entities.projectile import Projectile
 from logger import get_logger
 from sound import play_sound
-from utils import load_sprite
+from utils import get_rotated_sprite, get_sprite
 
 logger = get_logger(__name__)
 
 
-class Player(pygame.sprite.Sprite):
+class Player:
     """Player character with WASD movement"""
 
+    # Shared configuration (no per-instance copies)
+    config = player_config
+    weapon_config = weapon_config
+
+    __slots__ = (
+        "radius",
+        "color",
+        "speed",
+        "x",
+        "y",
+        "screen_width",
+        "screen_height",
+        "max_health",
+        "health",
+        "damage_cooldown",
+        "damage_cooldown_time",
+        "attack_range",
+        "attack_cooldown",
+        "attack_cooldown_time",
+        "is_attacking",
+        "fire_cooldown",
+        "magazine",
+        "magazine_size",
+        "stash",
+        "max_stash",
+        "is_reloading",
+        "reload_timer",
+        "speed_multiplier",
+        "speed_boost_timer",
+        "shield_hits_remaining",
+        "angle",
+    )
+
     def __init__(self, x, y, screen_width, screen_height):
         """Initialize the player
 
@@ -26,11 +62,6 @@ class Player(pygame.sprite.Sprite):
             screen_width: Width of the game screen
             screen_height: Height of the game screen
         """
-        super().__init__()
-
-        # Configuration
-        self.config = player_config
-
         # Player properties
         self.radius = self.config.radius
         self.color = self.config.color
@@ -57,7 +88,6 @@ class Player(pygame.sprite.Sprite):
         self.is_attacking = False  # True during attack frame
 
         # Weapon system (ranged)
-        self.weapon_config = weapon_config
         self.fire_cooldown = 0.0  # Seconds until can fire again
 
         # Magazine/stash ammo system
@@ -73,21 +103,20 @@ class Player(pygame.sprite.Sprite):
         self.speed_boost_timer = 0.0  # Seconds remaining for speed boost
         self.shield_hits_remaining = 0  # Number of hits shield can block
 
-        # Sprite loading (fallback to circle if sprite fails)
-        sprite_size = self.radius * 2
-        self.sprite_image = load_sprite(self.config.sprite_path, sprite_size)
-
         # Rotation state
         self.angle = 0.0  # Start facing RIGHT (sprite default orientation)
-        self.original_sprite = None
-        if self.sprite_image:
-            self.original_sprite = self.sprite_image.copy()
 
-    def update(self, delta_time):
+    @property
+    def sprite_image(self) -> pygame.Surface | None:
+        """Shared unrotated player sprite (None if unavailable)."""
+        return get_sprite(self.config.sprite_path, self.radius * 2)
+
+    def update(self, delta_time, controls=None):
         """Update player state
 
         Args:
             delta_time: Time elapsed since last frame in seconds
+            controls: This frame's Controls (defaults to the keyboard)
         """
         # Update damage cooldown
         if self.damage_cooldown > 0:
@@ -113,24 +142,25 @@ class Player(pygame.sprite.Sprite):
         # Reset attack state
         self.is_attacking = False
 
-        # Get keyboard state
-        keys = pygame.key.get_pressed()
+        # Get input (keyboard unless a controller supplied it)
+        if controls is None:
+            controls = read_keyboard()
 
         # Handle attack
-        if keys[pygame.K_SPACE] and self.attack_cooldown <= 0:
+        if controls.attack and self.attack_cooldown <= 0:
             self.attack()
 
         # Calculate movement delta
         dx = 0.0
         dy = 0.0
 
-        if keys[pygame.K_w]:
+        if controls.up:
             dy -= 1
-        if keys[pygame.K_s]:
+        if controls.down:
             dy += 1
-        if keys[pygame.K_a]:
+        if controls.left:
             dx -= 1
-        if keys[pygame.K_d]:
+        if controls.right:
             dx += 1
 
         # Normalize diagonal movement to prevent faster diagonal speed
@@ -150,8 +180,6 @@ class Player(pygame.sprite.Sprite):
         # Calculate target rotation from movement
         if dx != 0 or dy != 0:
             # atan2(-dy, dx) accounts for inverted Y-axis in pygame
-            import math
-
             target_angle = math.degrees(math.atan2(-dy, dx))
             target_angle = target_angle % 360
 
@@ -191,7 +219,7 @@ class Player(pygame.sprite.Sprite):
                 self.shield_hits_remaining -= 1
                 self.damage_cooldown = self.damage_cooldown_time
                 play_sound("shield_block")
-                logger.debug(f"Shield blocked damage, {self.shield_hits_remaining} hits remaining")
+                logger.debug("Shield blocked damage, %s hits remaining", self.shield_hits_remaining)
                 return True  # Hit was blocked by shield
             else:
                 # No shield, apply damage
@@ -199,7 +227,7 @@ class Player(pygame.sprite.Sprite):
                 self.health = max(0.0, self.health)  # Don't go below 0
                 self.damage_cooldown = self.damage_cooldown_time
                 play_sound("player_damage")
-                logger.debug(f"Took {amount} damage, health: {int(self.health)}/{self.max_health}")
+                logger.debug("Took %s damage, health: %d/%s", amount, self.health, self.max_health)
                 return True
         return False
 
@@ -219,7 +247,7 @@ class Player(pygame.sprite.Sprite):
         """
         self.is_attacking = True
         self.attack_cooldown = self.attack_cooldown_time
-        logger.debug(f"Player attacked (range: {self.attack_range})")
+        logger.debug("Player attacked (range: %s)", self.attack_range)
 
     def fire(self) -> Projectile | None:
         """Fire a projectile in the facing direction.
@@ -248,7 +276,10 @@ class Player(pygame.sprite.Sprite):
         # Create projectile at player position, facing player's direction
         projectile = Projectile(self.x, self.y, self.angle)
         logger.debug(
-            f"Player fired projectile (mag: {self.magazine}/{self.magazine_size}, stash: {self.stash})"
+            "Player fired projectile (mag: %s/%s, stash: %s)",
+            self.magazine,
+            self.magazine_size,
+            self.stash,
         )
 
         return projectile
@@ -275,7 +306,10 @@ class Player(pygame.sprite.Sprite):
         self.reload_timer = self.weapon_config.reload_time
         play_sound("reload_start")
         logger.debug(
-            f"Player started reload (mag: {self.magazine}/{self.magazine_size}, stash: {self.stash})"
+            "Player started reload (mag: %s/%s, stash: %s)",
+            self.magazine,
+            self.magazine_size,
+            self.stash,
         )
 
     def update_reload(self, delta_time: float) -> None:
@@ -304,7 +338,10 @@ class Player(pygame.sprite.Sprite):
             self.reload_timer = 0.0
             play_sound("reload_complete")
             logger.debug(
-                f"Player reload complete (mag: {self.magazine}/{self.magazine_size}, stash: {self.stash})"
+                "Player reload complete (mag: %s/%s, stash: %s)",
+                self.magazine,
+                self.magazine_size,
+                self.stash,
             )
 
     def apply_speed_boost(self, multiplier: float, duration: float) -> None:
@@ -316,7 +353,7 @@ class Player(pygame.sprite.Sprite):
         """
         self.speed_multiplier = multiplier
         self.speed_boost_timer = duration
-        logger.debug(f"Speed boost applied: {multiplier}x for {duration}s")
+        logger.debug("Speed boost applied: %sx for %ss", multiplier, duration)
 
     def apply_shield(self, hits: int) -> None:
         """Apply a shield that blocks incoming damage.
@@ -325,7 +362,7 @@ class Player(pygame.sprite.Sprite):
             hits: Number of hits the shield can block
         """
         self.shield_hits_remaining += hits
-        logger.debug(f"Shield applied: {hits} hits, total: {self.shield_hits_remaining}")
+        logger.debug("Shield applied: %s hits, total: %s", hits, self.shield_hits_remaining)
 
     def has_shield(self) -> bool:
         """Check if player currently has an active shield.
@@ -343,21 +380,22 @@ class Player(pygame.sprite.Sprite):
         """
         return self.speed_boost_timer > 0
 
-    def render(self, screen):
+    def render(self, screen, scale=1.0, rotation_step=None):
         """Draw the player with rotation
 
         Args:
             screen: Pygame surface to draw on
+            scale: World-to-surface scale (dynamic render resolution)
+            rotation_step: Degrees between cached rotations (None: the config default)
         """
-        if self.original_sprite:
-            # Rotate from original (avoid degradation)
-            rotated_sprite = pygame.transform.rotate(self.original_sprite, self.angle)
-            rect = rotated_sprite.get_rect(center=(int(self.x), int(self.y)))
+        center = (int(self.x * scale), int(self.y * scale))
+        rotated_sprite = get_rotated_sprite(
+            self.config.sprite_path, round(self.radius * 2 * scale), self.angle, rotation_step
+        )
+        if rotated_sprite:
+            # Shared rotation cache (quantized angle)
+            rect = rotated_sprite.get_rect(center=center)
             screen.blit(rotated_sprite, rect)
-        elif self.sprite_image:
-            # Fallback without rotation
-            rect = self.sprite_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.sprite_image, rect)
         else:
             # Circle fallback
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+            pygame.draw.circle(screen, self.color, center, round(self.radius * scale))
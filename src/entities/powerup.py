@@ -8,7 +8,7 @@ import pygame
 
 from config import powerup_config
 from logger import get_logger
-from utils import load_sprite
+from utils import get_rotated_sprite, get_sprite
 
 logger = get_logger(__name__)
 
@@ -22,9 +22,34 @@ class PowerupType(Enum):
     AMMO = auto()  # Restores ammunition
 
 
+# 64x64 sprites with transparent backgrounds
+SPRITE_PATHS = {
+    PowerupType.HEALTH: "assets/sprites/powerup_health.png",  # Green health potion
+    PowerupType.SPEED: "assets/sprites/powerup_speed.png",  # Cyan lightning bolt
+    PowerupType.SHIELD: "assets/sprites/powerup_shield.png",  # Golden shield
+    PowerupType.AMMO: "assets/sprites/powerup_ammo.png",  # Orange ammo box
+}
+
+
 class Powerup:
     """A collectible power-up that spawns when zombies are killed."""
 
+    COMPONENTS = frozenset({"position", "animation", "lifetime", "pickup", "sprite"})
+
+    # Shared by every power-up (no per-instance copies)
+    config = powerup_config
+
+    __slots__ = (
+        "x",
+        "y",
+        "powerup_type",
+        "rotation_angle",
+        "bob_timer",
+        "lifetime",
+        "is_visible",
+        "blink_timer",
+    )
+
     def __init__(self, x: float, y: float, powerup_type: PowerupType | None = None):
         """Initialize a power-up at the given position.
 
@@ -33,13 +58,9 @@ class Powerup:
             y: Starting y coordinate
             powerup_type: Type of power-up (random if None)
         """
-        # Configuration
-        self.config = powerup_config
-
         # Position
         self.x = x
         self.y = y
-        self.radius = self.config.radius
 
         # Determine type (weighted random if not specified)
         if powerup_type:
@@ -50,20 +71,9 @@ class Powerup:
             weights = [self.config.powerup_weights[t.name] for t in types]
             self.powerup_type = random.choices(types, weights=weights)[0]
 
-        # Visual properties based on type
-        self.color = self._get_color()
-
-        # Sprite loading (fallback to circle if sprite fails)
-        sprite_size = self.radius * 2
-        sprite_path = self._get_sprite_path()
-        self.sprite_image = load_sprite(sprite_path, sprite_size)
-
         # Animation state
         self.rotation_angle = 0.0  # Current rotation angle (degrees)
         self.bob_timer = 0.0  # Timer for bobbing animation
-        self.original_sprite = None  # Store unrotated sprite
-        if self.sprite_image:
-            self.original_sprite = self.sprite_image.copy()
 
         # Lifetime management
         self.lifetime = self.config.lifetime
@@ -72,7 +82,21 @@ class Powerup:
         # Blink state (used during warning phase)
         self.blink_timer = 0.0
 
-        logger.debug(f"Powerup spawned: {self.powerup_type.name} at ({int(x)}, {int(y)})")
+        logger.debug("Powerup spawned: %s at (%d, %d)", self.powerup_type.name, x, y)
+
+    @property
+    def radius(self) -> int:
+        return self.config.radius
+
+    @property
+    def color(self) -> tuple:
+        """Color for this power-up type (shared config value)."""
+        return self._get_color()
+
+    @property
+    def sprite_image(self) -> pygame.Surface | None:
+        """Shared unrotated sprite for this type (None if unavailable)."""
+        return get_sprite(self._get_sprite_path(), self.radius * 2)
 
     def _get_color(self) -> tuple:
         """Get the color for this power-up type."""
@@ -87,15 +111,7 @@ class Powerup:
 
     def _get_sprite_path(self) -> str:
         """Get the sprite path for this power-up type."""
-        # 64x64 sprites with transparent backgrounds
-        if self.powerup_type == PowerupType.HEALTH:
-            return "assets/sprites/powerup_health.png"  # Green health potion
-        elif self.powerup_type == PowerupType.SPEED:
-            return "assets/sprites/powerup_speed.png"  # Cyan lightning bolt
-        elif self.powerup_type == PowerupType.SHIELD:
-            return "assets/sprites/powerup_shield.png"  # Golden shield
-        else:  # AMMO
-            return "assets/sprites/powerup_ammo.png"  # Orange ammo box
+        return SPRITE_PATHS[self.powerup_type]
 
     def update(self, delta_time: float) -> bool:
         """Update power-up state (lifetime countdown, blink animation).
@@ -111,7 +127,7 @@ class Powerup:
 
         # Check if expired
         if self.lifetime <= 0:
-            logger.debug(f"Powerup expired: {self.powerup_type.name}")
+            logger.debug("Powerup expired: %s", self.powerup_type.name)
             return False
 
         # Animate rotation (spin continuously)
@@ -132,11 +148,23 @@ class Powerup:
 
         return True
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def is_alive(self) -> bool:
+        """Check if power-up should remain in game.
+
+        Returns:
+            True while lifetime remains
+        """
+        return self.lifetime > 0
+
+    def draw(
+        self, screen: pygame.Surface, scale: float = 1.0, rotation_step: float | None = None
+    ) -> None:
         """Draw the power-up with rotation and bobbing animation.
 
         Args:
             screen: Pygame surface to draw on
+            scale: World-to-surface scale (dynamic render resolution)
+            rotation_step: Degrees between cached rotations (None: the config default)
         """
         # Skip rendering if blinking off
         if not self.is_visible:
@@ -148,20 +176,20 @@ class Powerup:
         )
 
         # Draw sprite or fallback to colored circle
-        if self.original_sprite:
-            # Rotate sprite and apply bobbing
-            rotated = pygame.transform.rotate(self.original_sprite, self.rotation_angle)
-            rect = rotated.get_rect(center=(int(self.x), int(self.y + bob_offset)))
+        center = (int(self.x * scale), int((self.y + bob_offset) * scale))
+        rotated = get_rotated_sprite(
+            self._get_sprite_path(),
+            round(self.radius * 2 * scale),
+            self.rotation_angle,
+            rotation_step,
+        )
+        if rotated:
+            # Shared rotation cache (quantized angle) with bobbing
+            rect = rotated.get_rect(center=center)
             screen.blit(rotated, rect)
-        elif self.sprite_image:
-            # Fallback without rotation (but with bobbing)
-            rect = self.sprite_image.get_rect(center=(int(self.x), int(self.y + bob_offset)))
-            screen.blit(self.sprite_image, rect)
         else:
             # Circle fallback with bobbing
-            pygame.draw.circle(
-                screen, self.color, (int(self.x), int(self.y + bob_offset)), self.radius
-            )
+            pygame.draw.circle(screen, self.color, center, round(self.radius * scale))
 
     def apply_effect(self, player) -> dict:
         """Apply this power-up's effect to the player.
@@ -182,7 +210,7 @@ class Powerup:
             player.health = min(player.max_health, player.health + restore_amount)
             actual_restored = player.health - old_health
 
-            logger.debug(f"Powerup collected: HEALTH restored {int(actual_restored)} HP")
+            logger.debug("Powerup collected: HEALTH restored %d HP", actual_restored)
             return {"type": "health", "amount": actual_restored, "color": self.color}
 
         elif self.powerup_type == PowerupType.SPEED:
@@ -192,14 +220,14 @@ class Powerup:
             )
             player.apply_speed_boost(self.config.speed_multiplier, duration)
 
-            logger.debug(f"Powerup collected: SPEED {duration:.1f}s")
+            logger.debug("Powerup collected: SPEED %.1fs", duration)
             return {"type": "speed", "duration": duration, "color": self.color}
 
         elif self.powerup_type == PowerupType.SHIELD:
             # Add shield hits
             player.apply_shield(self.config.shield_hits)
 
-            logger.debug(f"Powerup collected: SHIELD {self.config.shield_hits} hits")
+            logger.debug("Powerup collected: SHIELD %s hits", self.config.shield_hits)
             return {"type": "shield", "hits": self.config.shield_hits, "color": self.color}
 
         else:  # AMMO
@@ -211,5 +239,5 @@ class Powerup:
             player.stash = min(player.max_stash, player.stash + restore_amount)
             actual_restored = player.stash - old_stash
 
-            logger.debug(f"Powerup collected: AMMO restored {actual_restored} rounds to stash")
+            logger.debug("Powerup collected: AMMO restored %s rounds to stash", actual_restored)
             return {"type": "ammo", "amount": actual_restored, "color": self.color}
@@ -6,7 +6,7 @@ import pygame
 
 from config import projectile_config
 from logger import get_logger
-from utils import load_sprite
+from utils import get_sprite
 
 logger = get_logger(__name__)
 
@@ -14,6 +14,13 @@ logger = get_logger(__name__)
 class Projectile:
     """A projectile entity (bullet) fired by the player."""
 
+    COMPONENTS = frozenset({"position", "velocity", "lifetime", "hitbox", "sprite"})
+
+    # Shared by every projectile (no per-instance copies)
+    config = projectile_config
+
+    __slots__ = ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "age", "alive")
+
     def __init__(self, x: float, y: float, angle: float):
         """Initialize projectile at position with direction.
 
@@ -25,9 +32,8 @@ class Projectile:
         # Position
         self.x = x
         self.y = y
-
-        # Configuration
-        self.config = projectile_config
+        self.prev_x = x  # Start of the last move (swept collision segment)
+        self.prev_y = y
 
         # Convert angle to velocity (handle pygame Y-axis inversion)
         angle_rad = math.radians(angle)
@@ -38,16 +44,16 @@ class Projectile:
         self.age = 0.0  # Seconds since spawn
         self.alive = True
 
-        # Sprite loading (fallback to circle if sprite fails)
-        sprite_size = self.config.radius * 2
-        self.sprite_image = load_sprite(self.config.sprite_path, sprite_size)
+        logger.debug("Projectile spawned at (%d, %d) angle=%s°", x, y, angle)
 
-        # Store original sprite for potential rotation
-        self.original_sprite = None
-        if self.sprite_image:
-            self.original_sprite = self.sprite_image.copy()
+    @property
+    def radius(self) -> int:
+        return self.config.radius
 
-        logger.debug(f"Projectile spawned at ({int(x)}, {int(y)}) angle={angle}°")
+    @property
+    def sprite_image(self) -> pygame.Surface | None:
+        """Shared projectile sprite (None if unavailable)."""
+        return get_sprite(self.config.sprite_path, self.config.radius * 2)
 
     def update(self, delta_time: float) -> None:
         """Update projectile position and lifetime.
@@ -55,36 +61,42 @@ class Projectile:
         Args:
             delta_time: Time since last frame (seconds)
         """
-        if not self.alive:
+        if not self.is_alive():
             return
 
-        # Frame-independent movement
+        # Frame-independent movement (remember the start for swept collision)
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.velocity_x * delta_time
         self.y += self.velocity_y * delta_time
 
-        # Track lifetime
+        # Track lifetime (an expiring projectile stays hittable until this move is swept;
+        # is_alive() then reports it dead and the lifetime system removes it)
         self.age += delta_time
         if self.age >= self.config.lifetime:
-            self.alive = False
-            logger.debug(f"Projectile expired at ({int(self.x)}, {int(self.y)})")
+            logger.debug("Projectile expired at (%d, %d)", self.x, self.y)
 
-    def render(self, screen: pygame.Surface) -> None:
+    def draw(
+        self, screen: pygame.Surface, scale: float = 1.0, rotation_step: float | None = None
+    ) -> None:
         """Render projectile to screen.
 
         Args:
             screen: Pygame surface to draw on
+            scale: World-to-surface scale (dynamic render resolution)
+            rotation_step: Unused (projectiles are not rotated)
         """
-        if not self.alive:
+        if not self.is_alive():
             return
 
         # Draw sprite or fallback to circle
-        if self.sprite_image:
-            rect = self.sprite_image.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.sprite_image, rect)
+        center = (int(self.x * scale), int(self.y * scale))
+        sprite = get_sprite(self.config.sprite_path, round(self.config.radius * 2 * scale))
+        if sprite:
+            rect = sprite.get_rect(center=center)
+            screen.blit(sprite, rect)
         else:
-            pygame.draw.circle(
-                screen, self.config.color, (int(self.x), int(self.y)), self.config.radius
-            )
+            pygame.draw.circle(screen, self.config.color, center, round(self.config.radius * scale))
 
     def check_collision(self, other_x: float, other_y: float, other_radius: int) -> bool:
         """Check circle collision with another entity.
@@ -105,15 +117,51 @@ class Projectile:
         # Collision if distance < sum of radii
         return distance < (self.config.radius + other_radius)
 
+    def sweep(self, other_x: float, other_y: float, other_radius: int) -> float | None:
+        """Find when this frame's move first touched another circle.
+
+        Tests the segment from (prev_x, prev_y) to (x, y), so fast projectiles
+        cannot tunnel through small targets on long frames.
+
+        Args:
+            other_x: Other entity X position
+            other_y: Other entity Y position
+            other_radius: Other entity collision radius
+
+        Returns:
+            Fraction of the move (0.0-1.0) at first contact, or None if it missed
+        """
+        reach = self.config.radius + other_radius
+        # Start relative to the target, and the move vector
+        fx = self.prev_x - other_x
+        fy = self.prev_y - other_y
+        dx = self.x - self.prev_x
+        dy = self.y - self.prev_y
+
+        c = fx * fx + fy * fy - reach * reach
+        if c < 0:
+            return 0.0  # Already overlapping at the start of the move
+        a = dx * dx + dy * dy
+        if a == 0:
+            return None  # Did not move
+
+        # Smallest t with |f + t*d| = reach
+        b = fx * dx + fy * dy
+        discriminant = b * b - a * c
+        if discriminant < 0:
+            return None
+        t = (-b - math.sqrt(discriminant)) / a
+        return t if 0.0 <= t <= 1.0 else None
+
     def mark_for_removal(self) -> None:
-        """Mark projectile as dead (hit target or expired)."""
+        """Mark projectile as dead (hit a target)."""
         self.alive = False
-        logger.debug(f"Projectile hit target at ({int(self.x)}, {int(self.y)})")
+        logger.debug("Projectile hit target at (%d, %d)", self.x, self.y)
 
     def is_alive(self) -> bool:
         """Check if projectile should remain in game.
 
         Returns:
-            True if projectile is still active
+            True until it hits a target or outlives its lifetime
         """
-        return self.alive
+        return self.alive and self.age < self.config.lifetime
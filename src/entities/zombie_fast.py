@@ -7,12 +7,8 @@ from entities.base_zombie import BaseZombie
 class FastZombie(BaseZombie):
     """A fast zombie variant that moves quickly but has low health."""
 
-    def __init__(self, x: float, y: float):
-        """Initialize fast zombie at given position.
+    # Shared variant data: faster rotation (720°/sec = 2 rotations/sec)
+    config = fast_zombie_config
+    rotation_speed = 720.0
 
-        Args:
-            x: Starting x coordinate
-            y: Starting y coordinate
-        """
-        # Initialize with fast zombie config and faster rotation (720°/sec = 2 rotations/sec)
-        super().__init__(x, y, config=fast_zombie_config, rotation_speed=720.0)
+    __slots__ = ()
@@ -0,0 +1,335 @@
+"""
+Vectorized environment API for Zombie Survival
+Runs N headless Game instances in lock-step for automated players (training, evaluation).
+Every step goes through the real Game.update() systems, so agents play by the game's rules.
+
+Usage:
+    env = VectorEnv(num_envs=16)
+    obs = env.reset(seed=0)
+    obs, reward, terminated, truncated, info = env.step(actions)  # actions: (N,) Controls bits
+
+Actions are Controls bitmasks (Controls.pack(), 0..127) or an (N, 7) boolean array in
+ACTION_FIELDS order. Observations are NumPy arrays with a leading batch dimension; they
+are reused buffers, overwritten by the next step/reset (copy to keep them).
+
+With pixels=(w, h), every game also renders off-screen and obs["pixels"] holds the
+frames (N, h, w, 3), or (N, h, w) with grayscale=True, via framebuffer.FrameExporter.
+
+Finished games reset automatically; info["final_*"] holds their last wave/kills/score.
+Each instance keeps its own `random` state, so a seed replays the same games.
+Benchmark: uv run python src/env.py --envs 16 --steps 2000
+"""
+
+import argparse
+import os
+import random
+import time
+from dataclasses import fields
+from typing import Any
+
+import numpy as np
+import pygame
+
+from controls import Controls
+from entities.powerup import PowerupType
+from entities.zombie import Zombie
+from entities.zombie_fast import FastZombie
+from entities.zombie_tank import TankZombie
+from framebuffer import FrameExporter
+from game_state import GameState
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Action layout: one bit / column per Controls field
+ACTION_FIELDS = tuple(field.name for field in fields(Controls))
+NUM_ACTIONS = 1 << len(ACTION_FIELDS)
+
+# Observation columns
+PLAYER_OBS = (
+    "x",
+    "y",
+    "angle",
+    "health",
+    "magazine",
+    "stash",
+    "is_reloading",
+    "attack_cooldown",
+    "fire_cooldown",
+    "shield_hits_remaining",
+    "speed_multiplier",
+)
+ZOMBIE_OBS = ("x", "y", "angle", "kind", "health")  # kind indexes ZOMBIE_KINDS
+PROJECTILE_OBS = ("x", "y", "velocity_x", "velocity_y")
+POWERUP_OBS = ("x", "y", "type")  # type indexes POWERUP_TYPES
+GAME_OBS = ("wave", "score", "time", "zombies_to_spawn")
+
+ZOMBIE_KINDS = (Zombie, FastZombie, TankZombie)
+POWERUP_TYPES = tuple(PowerupType)
+_ZOMBIE_KIND = {cls: float(index) for index, cls in enumerate(ZOMBIE_KINDS)}
+_POWERUP_TYPE = {powerup_type: float(index) for index, powerup_type in enumerate(POWERUP_TYPES)}
+
+
+class ActionController:
+    """Controller returning the Controls the environment set for this step."""
+
+    def __init__(self) -> None:
+        self.controls = Controls()
+
+    def read(self, game: object) -> Controls:
+        return self.controls
+
+
+class VectorEnv:
+    """N headless games stepped together, observed as batched NumPy arrays."""
+
+    # Reward per kill and per point of health lost
+    KILL_REWARD = 1.0
+    DAMAGE_PENALTY = 0.1
+
+    def __init__(
+        self,
+        num_envs: int = 8,
+        dt: float = 1 / 30,
+        frame_skip: int = 1,
+        max_time: float = 600.0,
+        max_zombies: int = 32,
+        max_projectiles: int = 16,
+        max_powerups: int = 8,
+        pixels: tuple[int, int] | None = None,
+        grayscale: bool = False,
+    ):
+        """Create the games (no windows, no audio).
+
+        Args:
+            num_envs: Game instances (batch size)
+            dt: Fixed timestep per update (seconds)
+            frame_skip: Updates per step, repeating the step's action
+            max_time: Game seconds before an episode is truncated
+            max_zombies: Zombie rows observed per game (nearest first)
+            max_projectiles: Projectile rows observed per game
+            max_powerups: Power-up rows observed per game (nearest first)
+            pixels: Also render each game and observe it at this (width, height)
+            grayscale: Pixel observations as one luminance channel
+        """
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        os.environ["GAME_SIM_PROCESS"] = "0"
+        os.environ["GAME_RENDER_THREAD"] = "0"
+        from game import Game
+
+        self.num_envs = num_envs
+        self.dt = dt
+        self.frame_skip = max(1, frame_skip)
+        self.max_time = max_time
+
+        self.games: list[Any] = []
+        self.controllers: list[ActionController] = []
+        self.exporters: list[FrameExporter] = []
+        for _ in range(num_envs):
+            game = Game()
+            game.LEADERBOARD_FILE = None  # Agents never record runs
+            controller = ActionController()
+            game.controller = controller
+            self.games.append(game)
+            self.controllers.append(controller)
+            if pixels is not None:
+                # Own off-screen target per game (the display surface is shared)
+                game.set_screen(pygame.Surface(game.screen.get_size()).convert())
+                self.exporters.append(FrameExporter(game.screen, pixels, grayscale))
+        self._rng_states: list[Any] = [random.getstate()] * num_envs
+
+        # Reused observation buffers
+        self.obs: dict[str, np.ndarray] = {
+            "player": np.zeros((num_envs, len(PLAYER_OBS)), np.float32),
+            "zombies": np.zeros((num_envs, max_zombies, len(ZOMBIE_OBS)), np.float32),
+            "zombie_mask": np.zeros((num_envs, max_zombies), bool),
+            "projectiles": np.zeros((num_envs, max_projectiles, len(PROJECTILE_OBS)), np.float32),
+            "projectile_mask": np.zeros((num_envs, max_projectiles), bool),
+            "powerups": np.zeros((num_envs, max_powerups, len(POWERUP_OBS)), np.float32),
+            "powerup_mask": np.zeros((num_envs, max_powerups), bool),
+            "game": np.zeros((num_envs, len(GAME_OBS)), np.float32),
+        }
+        if self.exporters:
+            self.obs["pixels"] = np.zeros((num_envs, *self.exporters[0].shape), np.uint8)
+        self._kills = np.zeros(num_envs, np.int64)
+        self._damage = np.zeros(num_envs, np.float64)
+
+    def reset(self, seed: int | None = None) -> dict[str, np.ndarray]:
+        """Start a new game in every instance.
+
+        Args:
+            seed: Instance i is seeded with seed + i (None: unpredictable)
+
+        Returns:
+            Observations
+        """
+        saved = random.getstate()
+        try:
+            for index, game in enumerate(self.games):
+                rng = random.Random(None if seed is None else seed + index)
+                random.setstate(rng.getstate())
+                self._start(index, game)
+                self._rng_states[index] = random.getstate()
+        finally:
+            random.setstate(saved)
+        return self.obs
+
+    def step(
+        self, actions: Any
+    ) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """Apply one action per game and advance every game by frame_skip updates.
+
+        Args:
+            actions: (N,) Controls bitmasks or (N, 7) booleans in ACTION_FIELDS order
+
+        Returns:
+            (observations, reward, terminated, truncated, info); terminated means the
+            player died, truncated that max_time ran out. Both reset the game.
+        """
+        actions = np.asarray(actions)
+        if actions.shape not in ((self.num_envs,), (self.num_envs, len(ACTION_FIELDS))):
+            raise ValueError(f"Expected ({self.num_envs},) or ({self.num_envs}, 7) actions")
+
+        reward = np.zeros(self.num_envs, np.float32)
+        terminated = np.zeros(self.num_envs, bool)
+        truncated = np.zeros(self.num_envs, bool)
+        info = {
+            "final_wave": np.zeros(self.num_envs, np.int32),
+            "final_kills": np.zeros(self.num_envs, np.int32),
+            "final_score": np.zeros(self.num_envs, np.int32),
+        }
+
+        saved = random.getstate()
+        try:
+            for index, game in enumerate(self.games):
+                action = actions[index]
+                if action.ndim == 0:
+                    controls = Controls.unpack(int(action))
+                else:
+                    controls = Controls(*(bool(pressed) for pressed in action))
+                self.controllers[index].controls = controls
+
+                random.setstate(self._rng_states[index])
+                for _ in range(self.frame_skip):
+                    game.update(self.dt)
+                    if game.state != GameState.PLAYING:
+                        break
+
+                stats = game.stats
+                reward[index] = (stats.kills - self._kills[index]) * self.KILL_REWARD - (
+                    stats.damage_taken - self._damage[index]
+                ) * self.DAMAGE_PENALTY
+                terminated[index] = game.state == GameState.GAME_OVER
+                truncated[index] = not terminated[index] and stats.time >= self.max_time
+                if terminated[index] or truncated[index]:
+                    info["final_wave"][index] = game.current_wave
+                    info["final_kills"][index] = stats.kills
+                    info["final_score"][index] = game.score
+                    self._start(index, game)  # Autoreset (the RNG stream continues)
+                else:
+                    self._kills[index] = stats.kills
+                    self._damage[index] = stats.damage_taken
+                    self._observe(index, game)
+                self._rng_states[index] = random.getstate()
+        finally:
+            random.setstate(saved)
+        return self.obs, reward, terminated, truncated, info
+
+    def close(self) -> None:
+        """Release the games' worker threads."""
+        for game in self.games:
+            game.entity_workers.close()
+
+    def _start(self, index: int, game: Any) -> None:
+        """Start a new game in one instance and observe it."""
+        game.start_new_game()
+        game.state = GameState.PLAYING
+        self.controllers[index].controls = Controls()
+        self._kills[index] = 0
+        self._damage[index] = 0.0
+        self._observe(index, game)
+
+    def _observe(self, index: int, game: Any) -> None:
+        """Write one game's state into row `index` of the observation buffers."""
+        player = game.player
+        obs = self.obs
+        obs["player"][index] = [getattr(player, name) for name in PLAYER_OBS]
+        obs["game"][index] = (
+            game.current_wave,
+            game.score,
+            game.stats.time,
+            game.zombies_to_spawn,
+        )
+
+        px, py = player.x, player.y
+        _fill_nearest(
+            obs["zombies"][index],
+            obs["zombie_mask"][index],
+            [(z.x, z.y, z.angle, _ZOMBIE_KIND[type(z)], z.health or 1) for z in game.zombies],
+            px,
+            py,
+        )
+        _fill_nearest(
+            obs["projectiles"][index],
+            obs["projectile_mask"][index],
+            [(p.x, p.y, p.velocity_x, p.velocity_y) for p in game.projectiles if p.is_alive()],
+            px,
+            py,
+        )
+        _fill_nearest(
+            obs["powerups"][index],
+            obs["powerup_mask"][index],
+            [(p.x, p.y, _POWERUP_TYPE[p.powerup_type]) for p in game.powerups],
+            px,
+            py,
+        )
+        if self.exporters:
+            game.draw_frame()
+            self.exporters[index].copy_to(obs["pixels"][index])
+
+
+def _fill_nearest(
+    buffer: np.ndarray, mask: np.ndarray, rows: list[tuple], px: float, py: float
+) -> None:
+    """Copy rows (x, y first) into a fixed-size buffer, nearest to (px, py) first."""
+    count = 0
+    if rows:
+        data = np.array(rows, dtype=np.float32)
+        if len(data) > 1:
+            distance = (data[:, 0] - px) ** 2 + (data[:, 1] - py) ** 2
+            data = data[np.argsort(distance, kind="stable")[: len(buffer)]]
+        count = len(data)
+        buffer[:count] = data
+    buffer[count:] = 0.0
+    mask[:count] = True
+    mask[count:] = False
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Benchmark environment steps per second with random actions."""
+    parser = argparse.ArgumentParser(description="Vectorized environment throughput")
+    parser.add_argument("--envs", type=int, default=16, help="Game instances")
+    parser.add_argument("--steps", type=int, default=2000, help="Batched steps")
+    parser.add_argument("--frame-skip", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    env = VectorEnv(args.envs, frame_skip=args.frame_skip)
+    env.reset(seed=0)
+    rng = np.random.default_rng(0)
+    episodes = 0
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        _, _, terminated, truncated, _ = env.step(rng.integers(0, NUM_ACTIONS, args.envs))
+        episodes += int(terminated.sum() + truncated.sum())
+    elapsed = time.perf_counter() - start
+    env.close()
+    total = args.steps * args.envs
+    print(
+        f"{args.envs} envs x {args.steps} steps: {total / elapsed:,.0f} env steps/s "
+        f"({episodes} episodes finished)"
+    )
+
+
+if __name__ == "__main__":
+    main()
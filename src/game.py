@@ -3,31 +3,57 @@ Main game class for Zombie Survival
 Handles the game loop, rendering, and event processing
 """
 
-import dataclasses
 import math
+import os
 import random
+import sqlite3
 from pathlib import Path
+from typing import Any
 
 import pygame
 
+from asset_pack import AssetPack
+from assets import BACKGROUND_TILE_PATH, AssetLoader, decode_image, sprite_manifest
+from bot import make_bot
 from config import (
     DamagePopup,
     KillFlash,
     PickupFlash,
+    RunStats,
     game_config,
+    leaderboard_config,
+    net_config,
+    particle_config,
     powerup_config,
+    quality_config,
     score_config,
     ui_config,
     wave_config,
 )
+from controls import Controller, KeyboardController
+from ecs import SystemSchedule, World
+from effects import EffectPool, circle_stamp
+from entities.base_zombie import BaseZombie
 from entities.player import Player
 from entities.powerup import Powerup
+from entities.projectile import Projectile
 from entities.zombie import Zombie
 from entities.zombie_fast import FastZombie
 from entities.zombie_tank import TankZombie
 from game_state import GameState
+from leaderboard import Leaderboard, RunRecord
 from logger import get_logger
-from sound import init_sounds, play_sound
+from particles import ParticleSystem
+from pipeline import RenderPipeline
+from quality import QualityGovernor
+from savestate import restore, snapshot
+from sim_server import SimulationClient
+from sound import SOUND_FILES, decode_sound, flush_sounds, init_mixer, play_sound, register_sounds
+from spectator import SpectatorServer
+from startup import StartupProfiler
+from telemetry import TelemetryRecorder
+from utils import cache_sprite
+from workers import ChunkedUpdater
 
 logger = get_logger(__name__)
 
@@ -35,13 +61,20 @@ logger = get_logger(__name__)
 class Game:
     """Main game class"""
 
-    # High score persistence
-    HIGHSCORE_FILE = Path("highscore.txt")
+    # Run leaderboard (SQLite); opened by run(), so headless games never record runs
+    LEADERBOARD_FILE: Path | None = Path(leaderboard_config.path)
+    HIGHSCORE_FILE = Path("highscore.txt")  # Pre-leaderboard high score, imported once
 
-    def __init__(self):
-        """Initialize the game"""
-        pygame.init()
-        init_sounds()
+    def __init__(self, startup: StartupProfiler | None = None):
+        """Initialize the game
+
+        Only the subsystems the menu needs (display, fonts) are brought up here;
+        the mixer and sounds are initialized when a game first starts.
+
+        Args:
+            startup: Profiler recording init steps (main.py passes one timing imports too)
+        """
+        self.startup = startup or StartupProfiler()
 
         # Game configuration
         self.config = game_config
@@ -50,18 +83,22 @@ class Game:
         self.FPS = self.config.fps
         self.BACKGROUND_COLOR = self.config.background_color
 
-        # Create the game window
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        pygame.display.set_caption("Zombie Survival")
+        # Create the game window (display only, not pygame.init(): no joystick/mixer yet)
+        with self.startup.step("display"):
+            pygame.display.init()
+            self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+            pygame.display.set_caption("Zombie Survival")
 
         # Create clock for FPS control
         self.clock = pygame.time.Clock()
 
-        # Initialize font for UI
-        pygame.font.init()
+        # Decode sprites and fonts in parallel behind a loading screen
+        with self.startup.step("font init"):
+            pygame.font.init()
         self.ui_config = ui_config
-        self.font = pygame.font.Font(None, self.ui_config.font_size)
-        self.wave_font = pygame.font.Font(None, self.ui_config.wave_font_size)
+        with self.startup.step("assets"):
+            self.load_assets()
+        self.sounds_ready = False  # Mixer + sounds are loaded by ensure_sounds()
 
         # Game state management
         self.running = True
@@ -78,8 +115,11 @@ class Game:
         # Score tracking
         self.score_config = score_config
         self.score = 0
-        self.high_score = 0
-        self.load_high_score()  # Load persistent high score from file
+        self.stats = RunStats()  # Kills, shots, hits, damage taken this run
+        self.seed = 0  # Seed of the current run (recorded with it)
+        self.high_score = 0  # Best score on the menu's board
+        self.leaderboard: Leaderboard | None = None
+        self.top_runs: list[RunRecord] = []  # Menu board, kept current in memory
 
         # Power-up configuration
         self.powerup_config = powerup_config
@@ -89,50 +129,386 @@ class Game:
             self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2, self.SCREEN_WIDTH, self.SCREEN_HEIGHT
         )
 
-        # Zombie management
-        self.zombies = []
+        # Input source for the player (keyboard by default; see controls.py and bot.py)
+        self.controller: Controller = KeyboardController()
+        bot_policy = os.getenv("GAME_BOT", self.config.bot)
+        if bot_policy:
+            self.controller = make_bot(bot_policy)
+
+        # Co-op: extra players, each driven by its own controller (see coop.py)
+        self.allies: list[Player] = []
+        self.ally_controllers: list[Controller] = []
+
+        # Entity storage: one archetype table per component set.
+        # Registering tables up front fixes draw order (zombies, power-ups, projectiles).
+        self.world = World()
+        self._zombie_table = self.world.archetype(BaseZombie.COMPONENTS)
+        self._powerup_table = self.world.archetype(Powerup.COMPONENTS)
+        self._projectile_table = self.world.archetype(Projectile.COMPONENTS)
+
+        # Chasing and collision tests run in spatial chunks (threaded without a GIL)
+        workers = int(os.getenv("GAME_UPDATE_WORKERS", self.config.update_workers))
+        self.entity_workers = ChunkedUpdater(workers, world_width=self.SCREEN_WIDTH)
+
+        # Per-frame events produced by the collision system, consumed by damage/pickups
+        self._hits: list[tuple] = []  # (zombie, damage)
+        self._health_left: dict[int, float] = {}  # id(zombie) -> health after this frame's hits
+        self._contacts: list[tuple] = []  # (player, zombie touching them)
+        self._pickups: list[tuple] = []  # (player, power-up touching them)
+
+        # Update systems (run in order each PLAYING frame, individually timed)
+        self.systems = SystemSchedule()
+        self.systems.add("waves", self.update_waves)
+        self.systems.add("player", self.update_player)
+        self.systems.add("movement", self.update_movement)
+        self.systems.add("collision", self.update_collisions)
+        self.systems.add("damage", self.update_damage)
+        self.systems.add("effects", self.update_effects)
+        self.systems.add("particles", self.update_particles)
+        self.systems.add("lifetime", self.update_lifetime)
+        self.systems.add("pickups", self.update_pickups)
+
+        # Render systems (painter's order, individually timed). They are called with
+        # the frame to draw: the game itself, or a snapshot of it on the render thread.
+        self.render_systems = SystemSchedule()
+        self.render_systems.add("background", Game.render_background)
+        self.render_systems.add("entities", Game.render_entities)
+        self.render_systems.add("particles", Game.render_particles)
+        self.render_systems.add("effects", Game.render_effects)
+        self.render_systems.add("player", Game.render_player)
+        self.render_systems.add("present", Game.render_present)
+        self.render_systems.add("hud", Game.render_hud)
+
+        # Profiler output (GAME_PROFILE=1 logs system timings periodically)
+        self.profiling = os.getenv("GAME_PROFILE", "0") == "1"
+        self.profile_timer = 0.0
+
+        # Visual effects (fixed-capacity pools, updated in place)
+        self._damage_popups = EffectPool(DamagePopup, self.ui_config.max_damage_popups)
+        self._kill_flashes = EffectPool(KillFlash, self.ui_config.max_kill_flashes)
+        self._pickup_flashes = EffectPool(PickupFlash, self.ui_config.max_pickup_flashes)
+        self._popup_text_cache: dict[str, pygame.Surface] = {}  # Rendered popup text
+        self.particles = ParticleSystem(particle_config)  # Blood, sparks, pickup bursts
+
+        # Dynamic render resolution: world systems draw to self.canvas, which is the
+        # screen at full scale or a smaller world surface upscaled by render_present
+        self.render_scale = 1.0
+        self.canvas = self.screen
+        self._canvas_tile: pygame.Surface | None = self.background_tile
+
+        # Adaptive quality: lowers effect detail when frames run over the FPS budget
+        self.quality = QualityGovernor(quality_config, self.FPS)
+        self.quality_tier: dict = {}
+        self.rotation_step = self.config.rotation_cache_step  # This game's sprite rotations
+        self.apply_quality(self.quality.tier)
+
+        # Pause screen optimization
+        self.pause_surface: pygame.Surface | None = None  # Captured screen for pause overlay
 
-        # Power-up management
-        self.powerups = []
+        # Idle screens (menu, pause, game over): rendered once, re-presented on demand
+        self._idle_frame: pygame.Surface | None = None
+        self._idle_key: tuple | None = None  # What the cached frame shows
+        self._idle_redraw = True  # Re-present the cached frame (input, window expose)
 
-        # Projectile management
-        self.projectiles = []
+        # Pipelined mode: draw frame N on a render thread while simulating frame N+1
+        self.pipeline: RenderPipeline | None = None
+        if self.config.render_thread or os.getenv("GAME_RENDER_THREAD", "0") == "1":
+            self.pipeline = RenderPipeline(self)
 
-        # Visual effects
-        self.damage_popups = []  # List of DamagePopup dataclasses
-        self.kill_flashes = []  # List of KillFlash dataclasses
-        self.pickup_flashes = []  # List of PickupFlash dataclasses
+        # Server mode: a separate process simulates; this one forwards input and draws
+        self.sim_client: SimulationClient | None = None
+        if self.config.sim_process or os.getenv("GAME_SIM_PROCESS", "0") == "1":
+            self.sim_client = SimulationClient(self.config, self.LEADERBOARD_FILE)
 
-        # Pause screen optimization
-        self.pause_surface = None  # Captured screen for pause overlay
+        # Spectator stream: viewers watch this game over TCP (spectator.py watch HOST)
+        self.spectators: SpectatorServer | None = None
+        if self.config.spectate or os.getenv("GAME_SPECTATE", "0") == "1":
+            self.spectators = SpectatorServer()
 
-        # Background tile loading (fallback to solid color if fails)
-        self.background_tile = None
-        try:
-            self.background_tile = pygame.image.load("assets/sprites/tile_background.png").convert()
+        # Per-run event telemetry, written when a run ends (telemetry.py analyze)
+        self.telemetry: TelemetryRecorder | None = None
+        if self.config.telemetry or os.getenv("GAME_TELEMETRY", "0") == "1":
+            self.telemetry = TelemetryRecorder()
+
+        self.startup.mark("game ready")
+
+    def load_assets(self) -> None:
+        """Load sprites and fonts, preferring the baked asset pack.
+
+        Assets found in the pack (assets/assets.pack) are used in place with no
+        decoding. Anything else, or everything when GAME_LOOSE_ASSETS=1, is decoded
+        from loose files on a thread pool while a loading screen is drawn.
+
+        Sets the UI fonts and background tile and fills the shared sprite cache.
+        Display-dependent conversion runs here on the main thread. Sounds are
+        loaded later by ensure_sounds().
+        """
+        pack = None
+        if os.getenv("GAME_LOOSE_ASSETS", "0") != "1":
+            pack = AssetPack.open(self.config.asset_pack_path)
+        self.asset_pack = pack  # Keep mapped: packed sprites point into it
+        baked: dict[str, Any] = {}
+
+        loader = AssetLoader(self.config.asset_workers)
+        sprites = sprite_manifest()
+        loose_sprites = []
+        for path, size in sprites:
+            sprite = pack.sprite(path, size) if pack else None
+            if sprite is not None:
+                cache_sprite(path, size, sprite, prepared=True)
+            else:
+                loose_sprites.append((path, size))
+        for path in {path for path, _ in loose_sprites}:
+            loader.add(f"sprite:{path}", decode_image, path)
+
+        tile = pack.image(BACKGROUND_TILE_PATH) if pack else None
+        if tile is not None:
+            baked["sprite:background"] = tile
+        else:
+            loader.add("sprite:background", decode_image, BACKGROUND_TILE_PATH)
+
+        loader.add("font:ui", pygame.font.Font, None, self.ui_config.font_size)
+        loader.add("font:wave", pygame.font.Font, None, self.ui_config.wave_font_size)
+        loader.add("font:small", pygame.font.Font, None, self.ui_config.small_font_size)
+        loader.start()
+
+        # Keep the window responsive and show progress until decoding finishes
+        loading_font = pygame.font.Font(None, self.ui_config.font_size)
+        while not loader.done:
+            pygame.event.pump()
+            self.render_loading(loading_font, loader.progress)
+            self.clock.tick(self.FPS)
+        results = {**baked, **loader.results()}
+
+        # Fonts
+        self.font = results["font:ui"]
+        self.wave_font = results["font:wave"]
+        self.small_font = results["font:small"]
+
+        # Loose sprites: convert once on the main thread, then share via the sprite cache
+        for path, size in loose_sprites:
+            cache_sprite(path, size, results[f"sprite:{path}"])
+
+        # Background tile (fallback to solid color if missing)
+        self.background_tile: pygame.Surface | None = None
+        tile = results["sprite:background"]
+        if tile is not None:
+            self.background_tile = tile.convert()
             logger.debug("Background tile loaded successfully")
-        except (pygame.error, FileNotFoundError):
+        else:
             logger.warning("Background tile not found, using solid color fallback")
 
-    def load_high_score(self):
-        """Load high score from file. Defaults to 0 if file doesn't exist or is invalid."""
-        try:
-            if self.HIGHSCORE_FILE.exists():
-                score_text = self.HIGHSCORE_FILE.read_text().strip()
-                self.high_score = int(score_text)
-                logger.info(f"High score loaded: {self.high_score}")
-            else:
-                logger.info("No high score file found, starting fresh")
-        except (ValueError, OSError) as e:
-            logger.warning(f"Failed to load high score: {e}, defaulting to 0")
+        logger.info(
+            "Assets loaded: %d from pack, %s",
+            len(baked) + len(sprites) - len(loose_sprites),
+            loader.report(),
+        )
+        for name, ms in sorted(loader.timings.items()):
+            logger.debug("Asset %s decoded in %.1fms", name, ms)
+
+    def ensure_sounds(self) -> None:
+        """Bring up the mixer and load sounds the first time a state needs audio.
+
+        Sounds come from the asset pack when possible, otherwise they are decoded
+        in parallel on the asset loader.
+        """
+        if self.sounds_ready:
+            return
+        self.sounds_ready = True
+
+        with self.startup.step("audio"):
+            if not init_mixer():
+                return
+            sounds: dict[str, pygame.mixer.Sound | None] = {}
+            loader = AssetLoader(self.config.asset_workers)
+            for name in SOUND_FILES:
+                sound = self.asset_pack.sound(name) if self.asset_pack else None
+                if sound is not None:
+                    sounds[name] = sound
+                else:
+                    loader.add(name, decode_sound, name)
+            loader.start()
+            sounds.update(loader.results())
+            register_sounds(sounds)
+        logger.info(
+            "Audio initialized: %d from pack, %s", len(sounds) - loader.total, loader.report()
+        )
+
+    def render_loading(self, font: pygame.font.Font, progress: float) -> None:
+        """Render the loading screen with a progress bar.
+
+        Args:
+            font: Font for the label
+            progress: Fraction of assets loaded (0.0 to 1.0)
+        """
+        self.screen.fill(self.BACKGROUND_COLOR)
+
+        bar_width, bar_height = 300, 20
+        bar_x = (self.SCREEN_WIDTH - bar_width) // 2
+        bar_y = self.SCREEN_HEIGHT // 2
+        pygame.draw.rect(self.screen, (80, 80, 80), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(
+            self.screen, (0, 200, 0), (bar_x, bar_y, int(bar_width * progress), bar_height)
+        )
+
+        label = font.render(f"Loading... {int(progress * 100)}%", True, self.ui_config.text_color)
+        self.screen.blit(label, label.get_rect(center=(self.SCREEN_WIDTH // 2, bar_y - 30)))
+        pygame.display.flip()
+
+    @property
+    def players(self) -> list[Player]:
+        """The player followed by any co-op allies."""
+        return [self.player, *self.allies] if self.allies else [self.player]
+
+    def spawn_player(self, slot: int) -> Player:
+        """Create the player for a co-op slot (0: host, at the center; others beside it).
+
+        Args:
+            slot: Player number minus one
+        """
+        offset = 50 * ((slot + 1) // 2) * (-1 if slot % 2 else 1)
+        player = Player(
+            self.SCREEN_WIDTH // 2 + offset,
+            self.SCREEN_HEIGHT // 2,
+            self.SCREEN_WIDTH,
+            self.SCREEN_HEIGHT,
+        )
+        if slot:
+            colors = net_config.ally_colors
+            player.color = colors[(slot - 1) % len(colors)]
+        return player
 
-    def save_high_score(self):
-        """Save high score to file."""
+    def add_ally(self, controller: Controller) -> Player:
+        """Add a co-op player driven by controller (joins the current run).
+
+        Returns:
+            The new player
+        """
+        self.ally_controllers.append(controller)
+        ally = self.spawn_player(len(self.ally_controllers))
+        self.allies.append(ally)
+        logger.info("Player %d joined", len(self.allies) + 1)
+        return ally
+
+    def remove_ally(self, controller: Controller) -> None:
+        """Remove the co-op player driven by controller."""
+        index = self.ally_controllers.index(controller)
+        del self.ally_controllers[index]
+        del self.allies[index]
+        logger.info("Player %d left", index + 2)
+        self.end_run_if_all_dead()  # The last living player may just have left
+
+    @property
+    def zombies(self) -> list:
+        """Rows of the zombie table (all zombie variants share one archetype)."""
+        return self._zombie_table.rows
+
+    @zombies.setter
+    def zombies(self, zombies) -> None:
+        self._zombie_table.replace(zombies)
+
+    @property
+    def powerups(self) -> list:
+        """Rows of the power-up table."""
+        return self._powerup_table.rows
+
+    @powerups.setter
+    def powerups(self, powerups) -> None:
+        self._powerup_table.replace(powerups)
+
+    @property
+    def projectiles(self) -> list:
+        """Rows of the projectile table."""
+        return self._projectile_table.rows
+
+    @projectiles.setter
+    def projectiles(self, projectiles) -> None:
+        self._projectile_table.replace(projectiles)
+
+    @property
+    def kill_flashes(self) -> EffectPool:
+        """Live kill flash records."""
+        return self._kill_flashes
+
+    @kill_flashes.setter
+    def kill_flashes(self, flashes) -> None:
+        self._kill_flashes.reset(flashes)
+
+    @property
+    def damage_popups(self) -> EffectPool:
+        """Live damage popup records."""
+        return self._damage_popups
+
+    @damage_popups.setter
+    def damage_popups(self, popups) -> None:
+        self._damage_popups.reset(popups)
+
+    @property
+    def pickup_flashes(self) -> EffectPool:
+        """Live pickup flash records."""
+        return self._pickup_flashes
+
+    @pickup_flashes.setter
+    def pickup_flashes(self, flashes) -> None:
+        self._pickup_flashes.reset(flashes)
+
+    def open_leaderboard(self) -> None:
+        """Open the run leaderboard and load the menu's board from it.
+
+        Does nothing when LEADERBOARD_FILE is None. A database that cannot be opened
+        disables recording for this session.
+        """
+        if self.leaderboard is not None or self.LEADERBOARD_FILE is None:
+            return
+        try:
+            self.leaderboard = Leaderboard(self.LEADERBOARD_FILE)
+        except sqlite3.Error as e:
+            logger.warning("Leaderboard unavailable, runs will not be recorded: %s", e)
+            return
+        self.leaderboard.import_high_score(self.HIGHSCORE_FILE)
+        self.load_high_scores()
+
+    def load_high_scores(self) -> None:
+        """Read the menu's board: the best runs of the fixed seed, or overall."""
+        if self.leaderboard is None:
+            return
+        limit = leaderboard_config.top_count
+        seed = self.fixed_seed()
         try:
-            self.HIGHSCORE_FILE.write_text(str(self.high_score))
-            logger.info(f"High score saved: {self.high_score}")
-        except OSError as e:
-            logger.warning(f"Failed to save high score: {e}")
+            if seed is None:
+                self.top_runs = self.leaderboard.top(limit)
+            else:
+                self.top_runs = self.leaderboard.top_for_seed(seed, limit)
+        except sqlite3.Error as e:
+            logger.warning("Failed to read the leaderboard: %s", e)
+            return
+        self.high_score = self.top_runs[0].score if self.top_runs else 0
+        logger.info("High score loaded: %s", self.high_score)
+
+    def record_run(self) -> None:
+        """Queue the finished run for the leaderboard and add it to the menu's board.
+
+        The leaderboard and telemetry files are written on their own threads; nothing
+        here touches disk.
+        """
+        if self.score > self.high_score:
+            self.high_score = self.score
+        if self.telemetry is not None:
+            self.telemetry.finish(self)
+        if self.leaderboard is None:
+            return
+        run = RunRecord(self.score, self.current_wave, self.stats.time, self.stats.kills, self.seed)
+        self.leaderboard.record(run)
+        # Stable sort: an earlier run with the same score stays ahead, as in the database
+        runs = sorted([*self.top_runs, run], key=lambda entry: -entry.score)
+        self.top_runs = runs[: leaderboard_config.top_count]
+
+    def fixed_seed(self) -> int | None:
+        """Run seed fixed by GAME_SEED or GameConfig.seed (None: a new seed every run)."""
+        seed = os.getenv("GAME_SEED")
+        if seed:
+            return int(seed)
+        return self.config.seed
 
     def handle_events(self):
         """Process game events during PLAYING state"""
@@ -141,7 +517,9 @@ class Game:
                 self.running = False
             elif event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_p):
                 # Capture current screen for pause overlay (optimization)
+                self.finish_rendering()
                 self.pause_surface = self.screen.copy()
+                self._idle_key = None  # New pause: rebuild the cached overlay
                 # Toggle pause
                 self.state = GameState.PAUSED
 
@@ -204,7 +582,9 @@ class Game:
         chosen_zombie_class = random.choices(zombie_types, weights=spawn_weights, k=1)[0]
         zombie = chosen_zombie_class(x, y)
 
-        self.zombies.append(zombie)
+        self.world.spawn(zombie)
+        if self.telemetry is not None:
+            self.telemetry.spawn(self, zombie)
 
     def calculate_wave_zombies(self, wave_number):
         """Calculate how many zombies to spawn for a given wave.
@@ -227,37 +607,148 @@ class Game:
         self.spawn_timer = 0.0
         self.wave_notification_timer = self.ui_config.wave_notification_duration
         play_sound("wave_start")
+        if self.telemetry is not None:
+            self.telemetry.wave(self)
 
     def start_new_game(self):
         """Reset game state for a new game."""
-        # Reset player
-        self.player = Player(
-            self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2, self.SCREEN_WIDTH, self.SCREEN_HEIGHT
-        )
+        self.ensure_sounds()
 
-        # Reset wave system
+        # Reset player (and co-op allies)
+        self.player = self.spawn_player(0)
+        self.allies = [self.spawn_player(slot) for slot in range(1, len(self.ally_controllers) + 1)]
+
+        # Reset wave system and clear all entities
         self.current_wave = 0
-        self.zombies = []
+        self.world.clear()
         self.zombies_to_spawn = 0
         self.wave_delay_timer = 0.0
         self.wave_notification_timer = 0.0
 
-        # Reset score
+        # Reset score and run counters
         self.score = 0
+        self.stats = RunStats()
+
+        # Seed the run: it replays from its seed and ranks on that seed's board
+        seed = self.fixed_seed()
+        self.seed = random.getrandbits(32) if seed is None else seed
+        random.seed(self.seed)
+        if self.telemetry is not None:
+            self.telemetry.begin()
 
         # Reset visual effects
-        self.damage_popups = []
-        self.kill_flashes = []
+        self.damage_popups.clear()
+        self.kill_flashes.clear()
+        self.pickup_flashes.clear()
+        self.particles.clear()
 
         # Start first wave immediately
         self.start_wave()
 
+        # Server mode: the simulation process starts its own run
+        if self.sim_client is not None:
+            self.sim_client.restart()
+
+    def snapshot(self) -> bytes:
+        """Save the simulation state (see savestate.py)."""
+        return snapshot(self)
+
+    def restore(self, data: bytes) -> None:
+        """Return to a state saved by snapshot().
+
+        Raises:
+            ValueError: Not a save state, or from another format version
+        """
+        restore(self, data)
+
     def update(self, delta_time):
-        """Update game state
+        """Update game state by running the update systems in order
+
+        Args:
+            delta_time: Time elapsed since last frame in seconds
+        """
+        self.systems.run(delta_time)
+
+        # Periodic profiler output
+        if self.profiling:
+            self.profile_timer += delta_time
+            if self.profile_timer >= self.config.profile_report_interval:
+                self.profile_timer = 0.0
+                logger.info("Quality: %s", self.quality.report())
+                logger.info("Update systems: %s", self.systems.report())
+                logger.info("Render systems: %s", self.render_systems.report())
+                if self.pipeline is not None:
+                    logger.info(
+                        "Render thread: draw=%.2fms wait=%.2fms",
+                        self.pipeline.draw_ms,
+                        self.pipeline.wait_ms,
+                    )
+
+    def apply_quality(self, tier: dict) -> None:
+        """Apply a quality tier's effect budgets and render detail.
+
+        Args:
+            tier: Tier settings from QualityConfig.tiers
+        """
+        self.quality_tier = tier
+        self.rotation_step = tier["rotation_step"]
+        self.set_render_scale(min(self.config.render_scale, tier["render_scale"]))
+        self.particles.limit = max(1, int(self.particles.capacity * tier["particle_scale"]))
+        for pool in (self._damage_popups, self._kill_flashes, self._pickup_flashes):
+            pool.limit = max(1, int(pool.capacity * tier["effect_scale"]))
+
+    def set_screen(self, surface: pygame.Surface) -> None:
+        """Draw frames into another surface (e.g. off-screen, one per headless game).
+
+        Args:
+            surface: Target with the window's size
+        """
+        self.screen = surface
+        if self.render_scale == 1.0:
+            self.canvas = surface
+
+    def set_render_scale(self, scale: float) -> None:
+        """Set the world render resolution as a fraction of the window.
+
+        The scale is clamped to [min_render_scale, 1.0] and quantized to
+        render_scale_step. At 1.0 the world draws straight to the screen.
+
+        Args:
+            scale: Requested scale (e.g. 0.5 renders the world at half resolution)
+        """
+        step = self.config.render_scale_step
+        scale = max(self.config.min_render_scale, min(1.0, round(scale / step) * step))
+        if scale == self.render_scale:
+            return
+
+        self.render_scale = scale
+        if scale == 1.0:
+            self.canvas = self.screen
+            self._canvas_tile = self.background_tile
+        else:
+            size = (round(self.SCREEN_WIDTH * scale), round(self.SCREEN_HEIGHT * scale))
+            self.canvas = pygame.Surface(size).convert()
+            self._canvas_tile = None
+            if self.background_tile:
+                tile_size = (
+                    max(1, round(self.background_tile.get_width() * scale)),
+                    max(1, round(self.background_tile.get_height() * scale)),
+                )
+                self._canvas_tile = pygame.transform.smoothscale(self.background_tile, tile_size)
+        logger.info("Render scale %.0f%% (%dx%d)", scale * 100, *self.canvas.get_size())
+
+    def update_quality(self, frame_ms: float, delta_time: float) -> None:
+        """Feed the governor one frame's work time and apply any tier change.
 
         Args:
+            frame_ms: Milliseconds spent on the previous frame, excluding the FPS wait
             delta_time: Time elapsed since last frame in seconds
         """
+        if self.quality.observe(frame_ms, delta_time):
+            self.apply_quality(self.quality.tier)
+
+    def update_waves(self, delta_time):
+        """Wave system: delay countdown, gradual spawning and wave completion."""
         # Handle wave delay countdown (don't block other updates)
         if self.wave_delay_timer > 0:
             self.wave_delay_timer -= delta_time
@@ -273,7 +764,11 @@ class Game:
                 self.spawn_timer = self.wave_config.spawn_interval
 
         # Check if wave complete (only if not already in delay)
-        if self.wave_delay_timer <= 0 and len(self.zombies) == 0 and self.zombies_to_spawn == 0:
+        if (
+            self.wave_delay_timer <= 0
+            and self.world.count("chase") == 0
+            and self.zombies_to_spawn == 0
+        ):
             self.wave_delay_timer = self.wave_config.wave_delay
             play_sound("wave_complete")
 
@@ -281,259 +776,343 @@ class Game:
         if self.wave_notification_timer > 0:
             self.wave_notification_timer -= delta_time
 
-        # Update player
-        self.player.update(delta_time)
-
-        # Handle shooting (F key) and reload (R key)
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_f]:
-            projectile = self.player.fire()
+    def update_player(self, delta_time):
+        """Player system: movement, cooldowns, shooting (F key) and reload (R key)."""
+        self.stats.time += delta_time
+        self.control_player(self.player, self.controller, delta_time)
+        for ally, controller in zip(self.allies, self.ally_controllers, strict=True):
+            self.control_player(ally, controller, delta_time)
+
+    def control_player(self, player: Player, controller: Controller, delta_time: float) -> None:
+        """Apply one player's controls (dead co-op players sit out)."""
+        if not player.is_alive():
+            return
+        controls = controller.read(self)
+        reloading = player.is_reloading
+        player.update(delta_time, controls)
+
+        if controls.fire:
+            projectile = player.fire()
             if projectile:
-                self.projectiles.append(projectile)
+                self.world.spawn(projectile)
+                self.stats.shots += 1
                 play_sound("fire")
-        if keys[pygame.K_r]:
-            self.player.reload()
-
-        # Update all projectiles
-        for projectile in self.projectiles[:]:  # Iterate over copy
-            projectile.update(delta_time)
-            if not projectile.is_alive():
-                self.projectiles.remove(projectile)
-
-        # Update all zombies
-        for zombie in self.zombies:
-            zombie.update(delta_time, self.player.x, self.player.y)
-
-        # Check projectile-zombie collisions
-        for projectile in self.projectiles[:]:  # Iterate over copy
-            if not projectile.is_alive():
-                continue
+                if self.telemetry is not None:
+                    self.telemetry.shot(self, player)
+        if controls.reload:
+            player.reload()
+        if self.telemetry is not None and player.is_reloading and not reloading:
+            self.telemetry.reload(self, player)
+
+    def update_movement(self, delta_time):
+        """Movement system: chasers steer toward the nearest player, bodies fly straight."""
+        player_x = self.player.x
+        player_y = self.player.y
+        others: list[tuple[float, float]] = []
+        if self.allies:
+            # Co-op: each zombie picks the nearest living player
+            targets = [(p.x, p.y) for p in self.players if p.is_alive()]
+            (player_x, player_y), *others = targets
+
+        for table in self.world.query("chase"):
+            self.entity_workers.update_chasers(table.rows, delta_time, player_x, player_y, others)
+
+        for table in self.world.query("velocity"):
+            for body in table.rows:
+                body.update(delta_time)
+
+        for table in self.world.query("animation"):
+            for animated in table.rows:
+                animated.update(delta_time)
+
+    def update_collisions(self, delta_time):
+        """Collision system: record hits, melee strikes, contacts and pickups as events."""
+        self._hits.clear()
+        self._health_left.clear()
+        self._contacts.clear()
+        self._pickups.clear()
+
+        hurtboxes = self.world.query("hurtbox")
+        zombies = [zombie for table in hurtboxes for zombie in table.rows]
+
+        # Projectile-zombie hits (a projectile only hits the first zombie it touches that
+        # is not already dead this frame; if all of them are, it flies on)
+        for table in self.world.query("hitbox"):
+            for projectile, targets in self.entity_workers.find_hits(table.rows, zombies):
+                damage = projectile.config.damage
+                for target in targets:
+                    if self._claim_hit(target, damage):
+                        projectile.mark_for_removal()
+                        self.stats.hits += 1
+                        if self.telemetry is not None:
+                            self.telemetry.hit(self, target, damage)
+                        break
+
+        players = [player for player in self.players if player.is_alive()]
+        for player in players:
+            # Melee attack hits everything within range (10 damage, same as projectile)
+            if player.is_attacking:
+                for zombie_table in hurtboxes:
+                    for zombie in zombie_table.rows:
+                        if self.get_distance(player, zombie) > player.attack_range:
+                            continue
+                        if self._claim_hit(zombie, 10) and self.telemetry is not None:
+                            self.telemetry.hit(self, zombie, 10, melee=True)
+
+            # Player contact - push zombies out to the collision boundary
+            for table in self.world.query("contact_damage"):
+                for zombie in self.entity_workers.find_contacts(table.rows, player):
+                    self._contacts.append((player, zombie))
+
+        # Power-up pickups (first player touching it takes it)
+        for table in self.world.query("pickup"):
+            for powerup in table.rows:
+                for player in players:
+                    if self.check_collision(player, powerup):
+                        self._pickups.append((player, powerup))
+                        break
+
+    def _claim_hit(self, zombie: BaseZombie, amount: float) -> bool:
+        """Record a hit unless earlier hits this frame already kill the zombie.
 
-            for zombie in self.zombies[:]:  # Iterate over copy
-                if projectile.check_collision(zombie.x, zombie.y, zombie.radius):
-                    # Projectile hit zombie - deal damage
-                    projectile.mark_for_removal()
-                    zombie_died = False
-
-                    # Check if zombie has health (variant) or dies instantly (normal)
-                    if hasattr(zombie, "take_damage"):
-                        # Zombie variant with health - call take_damage()
-                        zombie_died = not zombie.take_damage(projectile.config.damage)
-                    else:
-                        # Normal zombie - dies in one hit
-                        zombie_died = True
-
-                    # Only award points and spawn effects if zombie died
-                    if zombie_died:
-                        self.score += self.score_config.points_per_kill
-                        play_sound("zombie_death")
-
-                        # Add visual effects
-                        self.kill_flashes.append(
-                            KillFlash(
-                                x=zombie.x,
-                                y=zombie.y,
-                                radius=zombie.radius,
-                                timer=self.ui_config.kill_flash_duration,
-                            )
-                        )
-                        self.damage_popups.append(
-                            DamagePopup(
-                                x=zombie.x,
-                                y=zombie.y - 20,
-                                text=f"+{self.score_config.points_per_kill}",
-                                timer=self.ui_config.damage_popup_duration,
-                            )
-                        )
-
-                        # Spawn power-up with drop_chance
-                        if random.random() < self.powerup_config.drop_chance:
-                            self.powerups.append(Powerup(zombie.x, zombie.y))
-
-                        # Remove zombie
-                        self.zombies.remove(zombie)
-
-                    break  # Projectile can only hit one zombie
-
-        # Check player attacks
-        if self.player.is_attacking:
-            # Attack zombies within range - deal damage
-            survivors = []
-            for zombie in self.zombies:
-                if self.get_distance(self.player, zombie) <= self.player.attack_range:
-                    # Zombie hit by melee attack
-                    zombie_died = False
-
-                    # Check if zombie has health (variant) or dies instantly (normal)
-                    if hasattr(zombie, "take_damage"):
-                        # Zombie variant with health - call take_damage()
-                        # Melee does 10 damage (same as projectile)
-                        zombie_died = not zombie.take_damage(10)
-                    else:
-                        # Normal zombie - dies in one hit
-                        zombie_died = True
-
-                    # Only award points and spawn effects if zombie died
-                    if zombie_died:
-                        self.score += self.score_config.points_per_kill
-                        play_sound("zombie_death")
-
-                        # Add visual effects
-                        self.kill_flashes.append(
-                            KillFlash(
-                                x=zombie.x,
-                                y=zombie.y,
-                                radius=zombie.radius,
-                                timer=self.ui_config.kill_flash_duration,
-                            )
-                        )
-                        self.damage_popups.append(
-                            DamagePopup(
-                                x=zombie.x,
-                                y=zombie.y - 20,
-                                text=f"+{self.score_config.points_per_kill}",
-                                timer=self.ui_config.damage_popup_duration,
-                            )
-                        )
-
-                        # Spawn power-up with drop_chance probability
-                        if random.random() < self.powerup_config.drop_chance:
-                            self.powerups.append(Powerup(zombie.x, zombie.y))
-                        # Zombie died - don't add to survivors
-                    else:
-                        # Zombie survived hit - keep it
-                        survivors.append(zombie)
-                else:
-                    survivors.append(zombie)
-            self.zombies = survivors
+        Returns:
+            False if the zombie is already doomed (the hit is not recorded)
+        """
+        left = self._health_left.get(id(zombie), zombie.health)
+        if left is not None and left <= 0:
+            return False
+        # One-hit zombies (no health) are doomed by their first hit
+        self._health_left[id(zombie)] = 0 if left is None else left - amount
+        self._hits.append((zombie, amount))
+        return True
 
-        # Check collisions with all zombies
-        for zombie in self.zombies:
-            if not self.check_collision(self.player, zombie):
-                continue
+    def update_damage(self, delta_time):
+        """Damage system: apply recorded hits to zombies and contact damage to the player.
 
-            # Apply knockback - push zombie to collision boundary
-            distance = self.get_distance(self.player, zombie)
-            if distance > 0:  # Avoid division by zero
-                # Calculate direction from player to zombie
-                dx = zombie.x - self.player.x
-                dy = zombie.y - self.player.y
-                # Normalize direction
-                dx /= distance
-                dy /= distance
-                # Push zombie to collision boundary (sum of radii)
-                collision_dist = self.player.radius + zombie.radius
-                zombie.x = self.player.x + dx * collision_dist
-                zombie.y = self.player.y + dy * collision_dist
-
-            # Apply damage to player
-            if not self.player.take_damage(zombie.damage):
+        Returns:
+            False if the player died (halts the remaining systems this frame)
+        """
+        # Apply hits - take_damage() handles one-hit zombies (no health) uniformly
+        killed = []
+        killed_ids = set()
+        for zombie, amount in self._hits:
+            if id(zombie) in killed_ids:
+                continue  # Already killed earlier this frame
+            if not zombie.take_damage(amount):
+                killed.append(zombie)
+                killed_ids.add(id(zombie))
+            else:
+                self.particles.emit_burst(zombie.x, zombie.y, "spark")
+
+        if killed:
+            for zombie in killed:
+                self.on_zombie_killed(zombie)
+            for table in self.world.query("hurtbox"):
+                table.discard_many(killed)
+
+        # Contact damage to players (take_damage handles the cooldown)
+        for player, zombie in self._contacts:
+            if id(zombie) in killed_ids or not player.is_alive():
+                continue
+            health = player.health
+            if not player.take_damage(zombie.damage):
                 continue  # Damage on cooldown
+            self.stats.damage_taken += health - player.health
+            if self.telemetry is not None:
+                if player.health < health:
+                    self.telemetry.damage(self, player, health - player.health)
+                if not player.is_alive():
+                    self.telemetry.death(self, player)
 
-            # Check if player died
-            if not self.player.is_alive():
-                # Update high score
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                    self.save_high_score()  # Persist to file immediately
-                play_sound("game_over")
-                self.state = GameState.GAME_OVER
-                return
+            # Check if the last player standing died
+            if not player.is_alive() and self.end_run_if_all_dead():
+                return False
+        return True
 
-        # Update visual effects
-        # Update kill flashes
-        self.kill_flashes = [
-            dataclasses.replace(flash, timer=flash.timer - delta_time)
-            for flash in self.kill_flashes
-            if flash.timer > 0
-        ]
+    def end_run_if_all_dead(self) -> bool:
+        """Switch a playing run to GAME_OVER once no player is left alive.
 
-        # Update damage popups (move up and fade)
-        self.damage_popups = [
-            dataclasses.replace(popup, timer=popup.timer - delta_time, y=popup.y - 30 * delta_time)
-            for popup in self.damage_popups
-            if popup.timer > 0
-        ]
+        Returns:
+            True if the run ended
+        """
+        if self.state != GameState.PLAYING or any(p.is_alive() for p in self.players):
+            return False
+        self.record_run()  # Queued: the leaderboard writes on its own thread
+        play_sound("game_over")
+        self.state = GameState.GAME_OVER
+        return True
 
-        # Update pickup flashes
-        self.pickup_flashes = [
-            dataclasses.replace(flash, timer=flash.timer - delta_time)
-            for flash in self.pickup_flashes
-            if flash.timer > 0
-        ]
+    def on_zombie_killed(self, zombie):
+        """Award points, spawn kill effects and roll a power-up drop.
 
-        # Update all powerups (remove expired ones)
-        self.powerups = [powerup for powerup in self.powerups if powerup.update(delta_time)]
-
-        # Check powerup collection
-        collected = []
-        for powerup in self.powerups:
-            if self.check_collision(self.player, powerup):
-                # Apply power-up effect
-                effect_data = powerup.apply_effect(self.player)
-                play_sound("powerup_collect")
-
-                # Create pickup flash visual effect
-                self.pickup_flashes.append(
-                    PickupFlash(
-                        x=powerup.x,
-                        y=powerup.y,
-                        radius=powerup.radius * 2,  # Larger flash
-                        color=effect_data["color"],
-                        timer=self.powerup_config.pickup_flash_duration,
-                    )
-                )
+        Args:
+            zombie: The zombie that just died
+        """
+        self.score += self.score_config.points_per_kill
+        self.stats.kills += 1
+        if self.telemetry is not None:
+            self.telemetry.kill(self, zombie)
+        play_sound("zombie_death")
+
+        # Add visual effects
+        self.particles.emit_burst(zombie.x, zombie.y, "blood")
+        if self.quality_tier["flashes"]:
+            self.kill_flashes.spawn(
+                x=zombie.x,
+                y=zombie.y,
+                radius=zombie.radius,
+                timer=self.ui_config.kill_flash_duration,
+            )
+        if self.quality_tier["popups"]:
+            self.damage_popups.spawn(
+                x=zombie.x,
+                y=zombie.y - 20,
+                text=f"+{self.score_config.points_per_kill}",
+                timer=self.ui_config.damage_popup_duration,
+            )
 
-                collected.append(powerup)
+        # Spawn power-up with drop_chance probability
+        if random.random() < self.powerup_config.drop_chance:
+            self.world.spawn(Powerup(zombie.x, zombie.y))
+
+    def update_effects(self, delta_time):
+        """Effects system: tick kill flashes, damage popups and pickup flashes in place."""
+        self.kill_flashes.update(delta_time)
+        self.damage_popups.update(delta_time, rise=self.ui_config.damage_popup_rise_speed)
+        self.pickup_flashes.update(delta_time)
+
+    def update_particles(self, delta_time):
+        """Particle system: integrate all particles in one vectorized step."""
+        self.particles.update(delta_time)
+
+    def update_lifetime(self, delta_time):
+        """Lifetime system: drop expired or spent entities (projectiles, power-ups)."""
+        for table in self.world.query("lifetime"):
+            table.retain(lambda entity: entity.is_alive())
+
+    def update_pickups(self, delta_time):
+        """Pickup system: apply collected power-ups and spawn pickup flashes."""
+        if not self._pickups:
+            return
+
+        for player, powerup in self._pickups:
+            if not powerup.is_alive():
+                continue  # Expired this frame
+
+            # Apply power-up effect
+            effect_data = powerup.apply_effect(player)
+            play_sound("powerup_collect")
+            if self.telemetry is not None:
+                self.telemetry.pickup(self, player, powerup)
+
+            # Create pickup flash and particle burst in the power-up color
+            self.particles.emit_burst(powerup.x, powerup.y, "pickup", color=effect_data["color"])
+            if self.quality_tier["flashes"]:
+                self.pickup_flashes.spawn(
+                    x=powerup.x,
+                    y=powerup.y,
+                    radius=powerup.radius * 2,  # Larger flash
+                    color=effect_data["color"],
+                    timer=self.powerup_config.pickup_flash_duration,
+                )
 
         # Remove collected powerups
-        self.powerups = [p for p in self.powerups if p not in collected]
-
-    def render_background(self):
-        """Draw the background - either tiled or solid color"""
-        if self.background_tile:
-            # Draw tiled background
-            tile_width = self.background_tile.get_width()
-            tile_height = self.background_tile.get_height()
-            for x in range(0, self.SCREEN_WIDTH, tile_width):
-                for y in range(0, self.SCREEN_HEIGHT, tile_height):
-                    self.screen.blit(self.background_tile, (x, y))
+        for table in self.world.query("pickup"):
+            table.discard_many([powerup for _, powerup in self._pickups])
+
+    def render_background(self, surface=None, tile=None):
+        """Draw the background - either tiled or solid color (low quality tiers)
+
+        Args:
+            surface: Target surface (default: the world canvas, with its pre-scaled tile)
+            tile: Tile for surface (None: solid color)
+        """
+        if surface is None:
+            surface, tile = self.canvas, self._canvas_tile
+        if tile and self.quality_tier["tiled_background"]:
+            # Draw tiled background (tile sized for the target surface)
+            width, height = surface.get_size()
+            tile_width = tile.get_width()
+            tile_height = tile.get_height()
+            for x in range(0, width, tile_width):
+                for y in range(0, height, tile_height):
+                    surface.blit(tile, (x, y))
         else:
             # Fallback to solid color
-            self.screen.fill(self.BACKGROUND_COLOR)
+            surface.fill(self.BACKGROUND_COLOR)
 
     def render(self):
-        """Render the game"""
-        # Draw background
-        self.render_background()
+        """Render the game by running the render systems in painter's order"""
+        self.draw_frame()
 
-        # Render all zombies
-        for zombie in self.zombies:
-            zombie.draw(self.screen)
+        # Update display
+        pygame.display.flip()
 
-        # Render all powerups
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
+    def draw_frame(self):
+        """Run the render systems on this frame (also called on render-thread snapshots)."""
+        self.render_systems.run(self)
 
-        # Render all projectiles
-        for projectile in self.projectiles:
-            projectile.render(self.screen)
+    def render_pipelined(self):
+        """Hand this frame to the render thread and present the previous one.
 
+        The snapshot is taken before waiting, so simulating this frame overlapped
+        with drawing the last one. Nothing is submitted once the game leaves PLAYING.
+        """
+        assert self.pipeline is not None
+        frame = self.pipeline.capture()
+        self.pipeline.wait()
+        pygame.display.flip()
+        if self.state == GameState.PLAYING:
+            self.pipeline.submit(frame)
+
+    def finish_rendering(self):
+        """Wait for any in-flight render-thread frame (before touching the screen)."""
+        if self.pipeline is not None:
+            self.pipeline.wait()
+
+    def render_entities(self):
+        """Draw every entity with a sprite component (zombies, power-ups, projectiles)."""
+        canvas, scale, step = self.canvas, self.render_scale, self.rotation_step
+        for table in self.world.query("sprite"):
+            for entity in table.rows:
+                entity.draw(canvas, scale, step)
+
+    def render_particles(self):
+        """Draw particles (blood, sparks, pickup bursts) over entities."""
+        self.particles.draw(self.canvas, self.render_scale)
+
+    def render_effects(self):
+        """Draw flash effects on top of entities."""
         # Render kill flash effects (on top of zombies)
         self.render_kill_flashes()
 
         # Render pickup flash effects
         self.render_pickup_flashes()
 
+    def render_player(self):
+        """Draw the player with attack range and cooldown bar."""
         # Render attack range (under player)
         self.render_attack_range()
 
-        # Render player (on top of zombies)
-        self.player.render(self.screen)
+        # Render co-op allies (ringed in their color), then the player on top of zombies
+        for ally in self.allies:
+            if ally.is_alive():
+                ally.render(self.canvas, self.render_scale, self.rotation_step)
+                center = (int(ally.x * self.render_scale), int(ally.y * self.render_scale))
+                radius = round((ally.radius + 4) * self.render_scale)
+                pygame.draw.circle(self.canvas, ally.color, center, radius, 2)
+        self.player.render(self.canvas, self.render_scale, self.rotation_step)
 
         # Render attack cooldown (above player)
         self.render_attack_cooldown()
 
+    def render_present(self):
+        """Upscale the world canvas to the window (no-op at full render scale)."""
+        if self.canvas is not self.screen:
+            pygame.transform.scale(self.canvas, self.screen.get_size(), self.screen)
+
+    def render_hud(self):
+        """Draw power-up indicators, floating text and the HUD at native resolution."""
         # Render active power-up effects (shield, speed boost indicators)
         self.render_player_effects()
 
@@ -546,9 +1125,6 @@ class Game:
         self.render_ammo()
         self.render_wave_notification()
 
-        # Update display
-        pygame.display.flip()
-
     def render_health_bar(self):
         """Draw the player's health bar (responsive to screen size)"""
         # Calculate position based on screen dimensions
@@ -633,72 +1209,62 @@ class Game:
     def render_attack_range(self):
         """Show attack range circle when player is attacking."""
         if self.player.is_attacking:
+            scale = self.render_scale
             # Draw semi-transparent attack range circle
-            attack_surface = pygame.Surface(
-                (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA
-            )
+            attack_surface = pygame.Surface(self.canvas.get_size(), pygame.SRCALPHA)
             # Yellow circle with 30% opacity
             pygame.draw.circle(
                 attack_surface,
                 (255, 255, 0, 76),  # RGBA - 76 is ~30% of 255
-                (int(self.player.x), int(self.player.y)),
-                self.player.attack_range,
+                (int(self.player.x * scale), int(self.player.y * scale)),
+                round(self.player.attack_range * scale),
                 2,  # 2 pixel border width
             )
-            self.screen.blit(attack_surface, (0, 0))
+            self.canvas.blit(attack_surface, (0, 0))
 
     def render_attack_cooldown(self):
         """Show attack cooldown bar below player."""
         if self.player.attack_cooldown > 0:
+            scale = self.render_scale
             # Bar position: centered below player
-            bar_width = 40
-            bar_height = 4
-            bar_x = int(self.player.x - bar_width // 2)
-            bar_y = int(self.player.y + self.player.radius + 5)
+            bar_width = round(40 * scale)
+            bar_height = max(1, round(4 * scale))
+            bar_x = int(self.player.x * scale - bar_width // 2)
+            bar_y = int((self.player.y + self.player.radius + 5) * scale)
 
             # Background (gray)
-            pygame.draw.rect(self.screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
+            pygame.draw.rect(self.canvas, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
 
             # Foreground (cooldown progress - orange)
             cooldown_ratio = self.player.attack_cooldown / self.player.attack_cooldown_time
             cooldown_width = int(bar_width * cooldown_ratio)
-            pygame.draw.rect(self.screen, (255, 165, 0), (bar_x, bar_y, cooldown_width, bar_height))
+            pygame.draw.rect(self.canvas, (255, 165, 0), (bar_x, bar_y, cooldown_width, bar_height))
 
     def render_kill_flashes(self):
         """Render white flash effects where zombies were killed."""
         for flash in self.kill_flashes:
             # Flash intensity based on remaining timer
             alpha = int(255 * (flash.timer / self.ui_config.kill_flash_duration))
-            # Clamp alpha to valid range [0, 255]
-            alpha = max(0, min(255, alpha))
+            # Clamp alpha to valid range [0, 255], quantized so stamps stay cached
+            alpha = max(0, min(255, alpha)) & ~0xF
             # Draw white circle with fading alpha
-            flash_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(
-                flash_surface,
-                (255, 255, 255, alpha),
-                (int(flash.x), int(flash.y)),
-                int(flash.radius),
-            )
-            self.screen.blit(flash_surface, (0, 0))
+            scale = self.render_scale
+            radius = int(flash.radius * scale)
+            stamp = circle_stamp(radius, (255, 255, 255, alpha))
+            self.canvas.blit(stamp, (int(flash.x * scale) - radius, int(flash.y * scale) - radius))
 
     def render_pickup_flashes(self):
         """Render colored flash effects where powerups were collected."""
         for flash in self.pickup_flashes:
             # Flash intensity based on remaining timer
             alpha = int(255 * (flash.timer / self.powerup_config.pickup_flash_duration))
-            # Clamp alpha to valid range [0, 255]
-            alpha = max(0, min(255, alpha))
-            # Draw colored circle with fading alpha
-            flash_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
-            # flash.color is RGB, add alpha channel
-            color_with_alpha = (*flash.color, alpha)
-            pygame.draw.circle(
-                flash_surface,
-                color_with_alpha,
-                (int(flash.x), int(flash.y)),
-                int(flash.radius),
-            )
-            self.screen.blit(flash_surface, (0, 0))
+            # Clamp alpha to valid range [0, 255], quantized so stamps stay cached
+            alpha = max(0, min(255, alpha)) & ~0xF
+            # Draw colored circle with fading alpha (flash.color is RGB, add alpha channel)
+            scale = self.render_scale
+            radius = int(flash.radius * scale)
+            stamp = circle_stamp(radius, (*flash.color, alpha))
+            self.canvas.blit(stamp, (int(flash.x * scale) - radius, int(flash.y * scale) - radius))
 
     def render_damage_popups(self):
         """Render floating damage numbers."""
@@ -707,8 +1273,11 @@ class Game:
             alpha_ratio = popup.timer / self.ui_config.damage_popup_duration
             color = (255, 255, 0)  # Yellow
 
-            # Render text with fade
-            text = self.font.render(popup.text, True, color)
+            # Render text once per distinct string, then fade the cached surface
+            text = self._popup_text_cache.get(popup.text)
+            if text is None:
+                text = self.font.render(popup.text, True, color)
+                self._popup_text_cache[popup.text] = text
             text_rect = text.get_rect(center=(int(popup.x), int(popup.y)))
 
             # Apply alpha to surface
@@ -775,9 +1344,13 @@ class Game:
                 1,  # Border width
             )
 
-    def handle_menu_events(self):
-        """Handle events in MENU state."""
-        for event in pygame.event.get():
+    def handle_menu_events(self, events: list | None = None):
+        """Handle events in MENU state.
+
+        Args:
+            events: Events to handle (defaults to pygame.event.get())
+        """
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -791,8 +1364,11 @@ class Game:
                     self.running = False
 
     def render_menu(self):
-        """Render the main menu screen."""
-        self.render_background()
+        """Render the main menu screen (cached until the leaderboard changes)."""
+        if self._present_idle_frame(("menu", self.high_score, tuple(self.top_runs))):
+            return
+        # Idle screens draw at native resolution, whatever the world render scale
+        self.render_background(self.screen, self.background_tile)
 
         # Title
         title_text = self.wave_font.render("ZOMBIE SURVIVAL", True, (255, 0, 0))
@@ -824,11 +1400,32 @@ class Game:
             self.screen.blit(text, text_rect)
             y_offset += 40
 
+        # Leaderboard (the fixed seed's board when GAME_SEED is set)
+        if self.top_runs:
+            seed = self.fixed_seed()
+            lines = ["Top Runs" if seed is None else f"Top Runs (seed {seed})"]
+            for rank, run in enumerate(self.top_runs, 1):
+                lines.append(
+                    f"{rank}. {run.score}  -  wave {run.wave}, {run.kills} kills,"
+                    f" {run.duration:.0f}s"
+                )
+            y_offset += 10
+            for line in lines:
+                text = self.small_font.render(line, True, self.ui_config.text_color)
+                text_rect = text.get_rect(center=(self.SCREEN_WIDTH // 2, y_offset))
+                self.screen.blit(text, text_rect)
+                y_offset += 22
+
+        self._idle_frame = self.screen.copy()
         pygame.display.flip()
 
-    def handle_game_over_events(self):
-        """Handle events in GAME_OVER state."""
-        for event in pygame.event.get():
+    def handle_game_over_events(self, events: list | None = None):
+        """Handle events in GAME_OVER state.
+
+        Args:
+            events: Events to handle (defaults to pygame.event.get())
+        """
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -843,8 +1440,11 @@ class Game:
                     self.state = GameState.MENU
 
     def render_game_over(self):
-        """Render the game over screen."""
-        self.render_background()
+        """Render the game over screen (cached until the results change)."""
+        if self._present_idle_frame(("game_over", self.score, self.high_score, self.current_wave)):
+            return
+        # Idle screens draw at native resolution, whatever the world render scale
+        self.render_background(self.screen, self.background_tile)
 
         # Game Over title
         title_text = self.wave_font.render("GAME OVER", True, (255, 0, 0))
@@ -896,11 +1496,16 @@ class Game:
             self.screen.blit(text, text_rect)
             y_offset += 35
 
+        self._idle_frame = self.screen.copy()
         pygame.display.flip()
 
-    def handle_pause_events(self):
-        """Handle events in PAUSED state."""
-        for event in pygame.event.get():
+    def handle_pause_events(self, events: list | None = None):
+        """Handle events in PAUSED state.
+
+        Args:
+            events: Events to handle (defaults to pygame.event.get())
+        """
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -911,7 +1516,10 @@ class Game:
                     self.running = False
 
     def render_paused(self):
-        """Render the pause overlay."""
+        """Render the pause overlay (cached for the current pause)."""
+        if self._present_idle_frame(("paused",)):
+            return
+
         # Blit the captured pause surface (performance optimization)
         if self.pause_surface:
             self.screen.blit(self.pause_surface, (0, 0))
@@ -943,28 +1551,104 @@ class Game:
             self.screen.blit(text, text_rect)
             y_offset += 40
 
+        self._idle_frame = self.screen.copy()
         pygame.display.flip()
 
+    def _present_idle_frame(self, key: tuple) -> bool:
+        """Show the cached idle frame if it still matches key.
+
+        Returns:
+            True if the cached frame is current (presented again only when a
+            redraw was requested), False if the caller must render a new frame
+        """
+        if self._idle_frame is None or key != self._idle_key:
+            self._idle_key = key
+            self._idle_redraw = False
+            return False
+
+        if self._idle_redraw:
+            self.screen.blit(self._idle_frame, (0, 0))
+            pygame.display.flip()
+            self._idle_redraw = False
+        return True
+
+    def wait_for_events(self) -> list:
+        """Block until input arrives or idle_wait_ms passes (idle states).
+
+        Returns:
+            All pending events (empty on timeout)
+        """
+        first = pygame.event.wait(self.config.idle_wait_ms)
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events.extend(pygame.event.get())
+        if events:
+            self._idle_redraw = True  # Input or window events: re-present the frame
+        self.clock.tick()  # Idle time must not leak into the next PLAYING delta
+        return events
+
     def run(self):
-        """Main game loop with state machine"""
+        """Main game loop with state machine
+
+        PLAYING runs at FPS. MENU, PAUSED and GAME_OVER show a cached frame and
+        block on input instead of re-rendering, so they use almost no CPU.
+        """
+        self.open_leaderboard()
+        previous_state = None
         while self.running:
-            # Get delta time in seconds
-            delta_time = self.clock.tick(self.FPS) / 1000.0
+            if self.state != previous_state:
+                self._idle_redraw = True  # Screen shows another state's frame
+                self.finish_rendering()
+                if self.sim_client is not None:
+                    self.sim_client.set_paused(self.state != GameState.PLAYING)
+                if self.spectators is not None:
+                    self.spectators.publish(self, force=True)
+                if self.state == GameState.MENU and self.sim_client is not None:
+                    self.load_high_scores()  # Runs are recorded by the simulation process
+                previous_state = self.state
 
             # State-based event handling and rendering
-            if self.state == GameState.MENU:
-                self.handle_menu_events()
-                self.render_menu()
-            elif self.state == GameState.PLAYING:
+            if self.state == GameState.PLAYING:
+                # Get delta time in seconds
+                delta_time = self.clock.tick(self.FPS) / 1000.0
+                self.update_quality(self.clock.get_rawtime(), delta_time)
                 self.handle_events()
-                self.update(delta_time)
-                self.render()
+                if self.sim_client is None:
+                    self.update(delta_time)
+                else:
+                    self.sim_client.sync(self)
+                if self.spectators is not None:
+                    self.spectators.publish(self, delta_time)
+                if self.pipeline is None:
+                    self.render()
+                else:
+                    self.render_pipelined()
+            elif self.state == GameState.MENU:
+                self.render_menu()
+                if "first menu frame" not in self.startup.milestones:
+                    self.startup.mark("first menu frame")
+                    log = logger.info if self.startup.enabled else logger.debug
+                    log("%s", self.startup.report())
+                self.handle_menu_events(self.wait_for_events())
             elif self.state == GameState.PAUSED:
-                self.handle_pause_events()
                 self.render_paused()
+                self.handle_pause_events(self.wait_for_events())
             elif self.state == GameState.GAME_OVER:
-                self.handle_game_over_events()
                 self.render_game_over()
+                self.handle_game_over_events(self.wait_for_events())
+
+            # Play this frame's coalesced sound triggers
+            flush_sounds()
 
         # Cleanup
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        if self.sim_client is not None:
+            self.sim_client.stop()
+        if self.spectators is not None:
+            self.spectators.close()
+        if self.leaderboard is not None:
+            self.leaderboard.close()  # Commits runs still queued
+        if self.telemetry is not None:
+            self.telemetry.close()  # Finishes files still being written
+        self.entity_workers.close()
         pygame.quit()
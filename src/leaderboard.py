@@ -0,0 +1,211 @@
+"""
+Run leaderboard for Zombie Survival
+Every finished run (score, wave, duration, kills, seed) is stored in a SQLite database
+in WAL mode. Recording only queues the run: a background writer thread commits queued
+runs in batches, one transaction each, so the game loop never waits on disk. Reads
+(top-N overall or per seed) are index scans on the caller's connection; WAL lets them
+run while the writer commits, from this process or another (the simulation process).
+
+List: uv run python src/leaderboard.py [--seed 1234] [--limit 10]
+"""
+
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import astuple, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from config import LeaderboardConfig, leaderboard_config
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    wave INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    kills INTEGER NOT NULL,
+    seed INTEGER,
+    ended_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_seed ON runs (seed, score DESC);
+"""
+COLUMNS = "score, wave, duration, kills, seed, ended_at"
+INSERT = f"INSERT INTO runs ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+# Check and insert in one statement: two processes opening an empty board import once
+INSERT_IF_EMPTY = (
+    f"INSERT INTO runs ({COLUMNS}) SELECT ?, ?, ?, ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM runs)"
+)
+# Ties keep the earlier run first (id order within an index entry)
+TOP = f"SELECT {COLUMNS} FROM runs ORDER BY score DESC, id LIMIT ?"
+TOP_FOR_SEED = f"SELECT {COLUMNS} FROM runs WHERE seed = ? ORDER BY score DESC, id LIMIT ?"
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    """One finished run (a leaderboard row)"""
+
+    score: int
+    wave: int
+    duration: float  # Seconds survived
+    kills: int
+    seed: int | None = None  # None: imported high score of unknown origin
+    ended_at: float = field(default_factory=time.time)  # Unix time
+
+
+class Leaderboard:
+    """SQLite run store: queued writes on a background thread, indexed reads."""
+
+    def __init__(self, path: Path | str, config: LeaderboardConfig = leaderboard_config):
+        """Open (creating if needed) the database and start the writer thread.
+
+        Args:
+            path: Database file
+            config: Queue size and lock timeout
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        self.path = Path(path)
+        self.config = config
+        self._connection = self._connect()  # Reads (calling thread)
+        self._connection.execute("PRAGMA journal_mode=WAL")  # Persistent in the file
+        self._connection.executescript(SCHEMA)
+
+        self._queue: queue.Queue[RunRecord | None] = queue.Queue(config.queue_size)
+        self.written = 0  # Runs committed by the writer
+        self.dropped = 0  # Runs lost to a full queue or a failed commit
+        self._thread = threading.Thread(target=self._write_loop, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """A connection that waits busy_timeout for another connection's write lock."""
+        return sqlite3.connect(self.path, timeout=self.config.busy_timeout)
+
+    def record(self, run: RunRecord) -> bool:
+        """Queue a run for the writer thread (never blocks).
+
+        Returns:
+            False if the queue was full and the run was dropped
+        """
+        try:
+            self._queue.put_nowait(run)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("Leaderboard queue full, run dropped (score %d)", run.score)
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Wait until every queued run has been committed (or failed)."""
+        self._queue.join()
+
+    def top(self, limit: int = 10) -> list[RunRecord]:
+        """Best runs overall, highest score first."""
+        rows = self._connection.execute(TOP, (limit,)).fetchall()
+        return [RunRecord(*row) for row in rows]
+
+    def top_for_seed(self, seed: int, limit: int = 10) -> list[RunRecord]:
+        """Best runs of one seed, highest score first."""
+        rows = self._connection.execute(TOP_FOR_SEED, (seed, limit)).fetchall()
+        return [RunRecord(*row) for row in rows]
+
+    def count(self) -> int:
+        """Committed runs."""
+        (count,) = self._connection.execute("SELECT count(*) FROM runs").fetchone()
+        return int(count)
+
+    def import_high_score(self, path: Path) -> bool:
+        """Carry a pre-leaderboard high score file over into an empty leaderboard.
+
+        Returns:
+            True if a score was imported
+        """
+        try:
+            if self.count() or not path.is_file():
+                return False
+            score = int(path.read_text().strip())
+            # Write-locked from the start, so the emptiness check cannot go stale
+            self._connection.execute("BEGIN IMMEDIATE")
+            with self._connection:
+                cursor = self._connection.execute(
+                    INSERT_IF_EMPTY, astuple(RunRecord(score, 0, 0.0, 0))
+                )
+        except (ValueError, OSError, sqlite3.Error) as e:
+            logger.warning("Failed to import high score from %s: %s", path, e)
+            return False
+        if cursor.rowcount != 1:
+            return False  # Another connection imported (or recorded) first
+        logger.info("Imported high score %d from %s", score, path)
+        return True
+
+    def close(self) -> None:
+        """Commit queued runs, stop the writer and close the database."""
+        self._queue.put(None)
+        self._thread.join()
+        self._connection.close()
+        logger.info("Leaderboard closed (%d runs written, %d dropped)", self.written, self.dropped)
+
+    def _write_loop(self) -> None:
+        """Commit queued runs until close(): everything waiting goes in one transaction."""
+        connection = self._connect()
+        connection.execute("PRAGMA synchronous=NORMAL")  # WAL: durable at checkpoints
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                runs = [run for run in batch if run is not None]
+                stopping = len(runs) < len(batch)
+                if runs:
+                    try:
+                        with connection:  # Commit all of the batch or none of it
+                            connection.executemany(INSERT, [astuple(run) for run in runs])
+                        self.written += len(runs)
+                    except sqlite3.Error as e:
+                        self.dropped += len(runs)
+                        logger.warning("Failed to record %d runs: %s", len(runs), e)
+                for _ in batch:
+                    self._queue.task_done()
+        finally:
+            connection.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the best runs overall or for one seed."""
+    parser = argparse.ArgumentParser(description="List leaderboard runs")
+    parser.add_argument("--path", default=leaderboard_config.path)
+    parser.add_argument("--seed", type=int, default=None, help="Only runs of this seed")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    board = Leaderboard(args.path)
+    try:
+        if args.seed is None:
+            runs = board.top(args.limit)
+        else:
+            runs = board.top_for_seed(args.seed, args.limit)
+        print(f"{'#':>3} {'score':>7} {'wave':>5} {'kills':>6} {'time':>7} {'seed':>11}  ended")
+        for rank, run in enumerate(runs, 1):
+            seed = "-" if run.seed is None else str(run.seed)
+            ended = datetime.fromtimestamp(run.ended_at).strftime("%Y-%m-%d %H:%M")
+            print(
+                f"{rank:>3} {run.score:>7} {run.wave:>5} {run.kills:>6}"
+                f" {run.duration:>6.0f}s {seed:>11}  {ended}"
+            )
+    finally:
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,140 @@
 """
 Logging configuration for Zombie Survival game
-Provides dual output: console (WARNING+ or DEBUG+) and file (DEBUG+ always)
+Provides dual output: console (WARNING+ or DEBUG+) and file (DEBUG+ by default)
+
+The game thread only enqueues records (messages stay unformatted until written).
+A background QueueListener formats them and writes to a size-rotated log file,
+gzip-compressing rotated backups. Call shutdown_logging() on exit to flush.
 """
 
+import atexit
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
+from config import LoggingConfig, logging_config
+
+# Active background listener (None until setup_logging runs)
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: "NonBlockingQueueHandler | None" = None
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never formats or blocks on the calling thread.
+
+    The base class formats the message in prepare(); here the record is queued
+    as-is so %-style arguments are only formatted by the listener thread.
+    Records are dropped (and counted) when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RateLimitFilter(logging.Filter):
+    """Limit repeated DEBUG records per (logger, format string) and time window.
+
+    INFO and above always pass. When a window ends with suppressed records, the
+    next passing record for that key notes how many were skipped.
+    """
+
+    def __init__(self, max_records: int, window: float):
+        """Initialize the filter.
+
+        Args:
+            max_records: Records allowed per key within one window
+            window: Window length in seconds
+        """
+        super().__init__()
+        self.max_records = max_records
+        self.window = window
+        # (logger name, msg) -> [window start, passed count, suppressed count]
+        self._counters: dict[tuple[str, object], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        counter = self._counters.get(key)
+        if counter is None:
+            self._counters[key] = [now, 1, 0]
+            return True
+
+        if now - counter[0] >= self.window:
+            suppressed = counter[2]
+            counter[0], counter[1], counter[2] = now, 1, 0
+            if suppressed:
+                record.msg = f"{record.getMessage()} [{suppressed} similar suppressed]"
+                record.args = None
+            return True
+
+        if counter[1] < self.max_records:
+            counter[1] += 1
+            return True
+
+        counter[2] += 1
+        return False
+
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated backups game_X.log.1.gz, game_X.log.2.gz, ..."""
+    return name + ".gz"
 
-def setup_logging() -> None:
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress the just-closed log file into its backup slot."""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+def _level(name: str) -> int:
+    """Convert a level name (e.g. "DEBUG") to its logging constant."""
+    return logging.getLevelNamesMapping().get(name.upper(), logging.DEBUG)
+
+
+def setup_logging(config: LoggingConfig = logging_config) -> Path:
     """Initialize the logging system.
 
-    - Creates timestamped log file in logs/ directory
+    - Creates timestamped log file in the configured directory (logs/ by default)
     - Console shows WARNING+ by default, DEBUG+ if GAME_DEBUG=1
-    - File always captures DEBUG+ for full playtest history
+    - File captures DEBUG+ by default (GAME_LOG_LEVEL=INFO etc. to reduce);
+      when neither output wants DEBUG, debug calls return before building a record
+    - Writes happen on a background thread; rotated files are gzip-compressed
+
+    Args:
+        config: Logging settings
+
+    Returns:
+        Path of the active log file
     """
+    global _listener, _queue_handler
+
+    # Restart cleanly if called twice
+    shutdown_logging()
+
     # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    log_dir = Path(config.log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
 
     # Create timestamped log file
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
@@ -27,10 +142,12 @@ def setup_logging() -> None:
 
     # Check if debug mode is enabled
     debug_mode = os.getenv("GAME_DEBUG", "0") == "1"
+    console_level = logging.DEBUG if debug_mode else _level(config.console_level)
+    file_level = _level(os.getenv("GAME_LOG_LEVEL", config.file_level))
 
-    # Root logger configuration
+    # Root logger configuration (lowest level any output needs)
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)  # Capture everything
+    root_logger.setLevel(min(console_level, file_level))
 
     # Remove any existing handlers (avoid duplicates)
     for handler in root_logger.handlers[:]:
@@ -38,22 +155,67 @@ def setup_logging() -> None:
 
     # Console handler - WARNING+ by default, DEBUG+ in debug mode
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG if debug_mode else logging.WARNING)
+    console_handler.setLevel(console_level)
     console_format = logging.Formatter("[%(levelname)s] %(name)s: %(message)s")
     console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
 
-    # File handler - always DEBUG+ for full playtest history
-    file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
-    file_handler.setLevel(logging.DEBUG)
+    # File handler - size-based rotation with compressed backups
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        mode="w",
+        maxBytes=config.max_bytes,
+        backupCount=config.backup_count,
+        encoding="utf-8",
+    )
+    if config.compress_backups:
+        file_handler.namer = _gzip_namer
+        file_handler.rotator = _gzip_rotator
+    file_handler.setLevel(file_level)
     file_format = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     file_handler.setFormatter(file_format)
-    root_logger.addHandler(file_handler)
+
+    # Game thread: rate-limited, non-blocking enqueue only
+    log_queue: queue.Queue = queue.Queue(maxsize=config.queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(RateLimitFilter(config.rate_limit_count, config.rate_limit_window))
+    root_logger.addHandler(_queue_handler)
+
+    # Background thread: format and write
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     # Log the logging configuration
     logger = get_logger("logger")
-    logger.info(f"Logging initialized - log file: {log_file}")
-    logger.info(f"Debug mode: {'ON' if debug_mode else 'OFF'}")
+    logger.info("Logging initialized - log file: %s", log_file)
+    logger.info("Debug mode: %s", "ON" if debug_mode else "OFF")
+    return log_file
+
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the background writer and close log files.
+
+    Safe to call more than once (also registered with atexit).
+    """
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        if _queue_handler.dropped:
+            logging.getLogger("logger").warning(
+                "Log queue full, dropped %d records", _queue_handler.dropped
+            )
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()  # Drains the queue before returning
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
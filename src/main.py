@@ -2,29 +2,43 @@
 Entry point for Zombie Survival game
 Run with: uv run python src/main.py
 Debug mode: GAME_DEBUG=1 uv run python src/main.py
+Startup profile: GAME_PROFILE_STARTUP=1 uv run python src/main.py
 """
 
-from game import Game
-from logger import get_logger, setup_logging
+# Imported first so its launch timestamp precedes every other import
+from startup import LAUNCH_TIME, StartupProfiler  # isort: skip
+
+from logger import get_logger, setup_logging, shutdown_logging
 
 logger = get_logger(__name__)
 
 
 def main():
     """Start the game"""
+    profiler = StartupProfiler(origin=LAUNCH_TIME)
+
     # Initialize logging system
-    setup_logging()
+    with profiler.step("logging"):
+        setup_logging()
 
     try:
+        # Heavy imports are timed individually (game pulls in entities, sound, numpy)
+        profiler.import_module("pygame")
+        profiler.import_module("numpy")
+        game_module = profiler.import_module("game")
+
         logger.info("Game started")
-        game = Game()
+        game = game_module.Game(profiler)
         game.run()
         logger.info("Game ended normally")
     except KeyboardInterrupt:
         logger.info("Game interrupted by user (Ctrl+C)")
     except Exception as e:
-        logger.error(f"Unhandled exception: {e}", exc_info=True)
+        logger.error("Unhandled exception: %s", e, exc_info=True)
         raise
+    finally:
+        # Flush queued records to disk before exit
+        shutdown_logging()
 
 
 if __name__ == "__main__":
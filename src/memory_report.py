@@ -0,0 +1,172 @@
+"""
+Memory budget report for Zombie Survival entities
+Prints bytes per entity type and totals at given population sizes
+
+Run with: uv run python src/memory_report.py
+Custom sizes: uv run python src/memory_report.py --counts 100 1000 10000 --sprites
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+import pygame
+
+from config import game_config, player_config
+from entities.player import Player
+from entities.powerup import Powerup, PowerupType
+from entities.projectile import Projectile
+from entities.zombie import Zombie
+from entities.zombie_fast import FastZombie
+from entities.zombie_tank import TankZombie
+from utils import get_rotated_sprite, sprite_cache_bytes
+
+# Bytes per row in an archetype table (one list slot holding a pointer)
+TABLE_SLOT_BYTES = 8
+
+# Share of each entity type in a "typical" late-wave world
+WORLD_MIX = {
+    "Zombie": 0.56,
+    "FastZombie": 0.16,
+    "TankZombie": 0.08,
+    "Projectile": 0.15,
+    "Powerup": 0.05,
+}
+
+
+def _advance(entity):
+    """Run one update so position/angle floats are per-instance, as in play."""
+    if isinstance(entity, Projectile | Powerup):
+        entity.update(0.016)
+    else:
+        entity.update(0.016, 400.0, 300.0)
+    return entity
+
+
+# Entity type name -> factory(index) producing a live-looking instance
+ENTITY_FACTORIES: dict[str, Callable[[int], object]] = {
+    "Zombie": lambda i: _advance(Zombie(i + 0.5, i + 0.25)),
+    "FastZombie": lambda i: _advance(FastZombie(i + 0.5, i + 0.25)),
+    "TankZombie": lambda i: _advance(TankZombie(i + 0.5, i + 0.25)),
+    "Projectile": lambda i: _advance(Projectile(i + 0.5, i + 0.25, i % 360)),
+    "Powerup": lambda i: _advance(Powerup(i + 0.5, i + 0.25, PowerupType.AMMO)),
+}
+
+
+def measure_entity_bytes(factory: Callable[[int], object], samples: int = 1000) -> float:
+    """Measure average heap bytes per entity, including its unique attribute values.
+
+    Args:
+        factory: Callable creating one entity from an index
+        samples: Number of entities to allocate for the average
+
+    Returns:
+        Average bytes per entity (plus one archetype table slot)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [factory(i) for i in range(samples)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    container = sys.getsizeof(entities)
+    return (after - before - container) / samples + TABLE_SLOT_BYTES
+
+
+def measure_sprite_bytes() -> int:
+    """Load every shared sprite and warm all cached rotations.
+
+    Returns:
+        Bytes of pixel data held by the shared sprite caches
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+    step = game_config.rotation_cache_step
+    angles = [i * step for i in range(int(360 / step))]
+    sprites = [(player_config.sprite_path, player_config.radius * 2)]
+    sprites += [
+        (cls.config.sprite_path, cls.config.radius * 2) for cls in (Zombie, FastZombie, TankZombie)
+    ]
+    for powerup_type in PowerupType:
+        sample = Powerup(0, 0, powerup_type)
+        sprites.append((sample._get_sprite_path(), sample.radius * 2))
+
+    for path, size in sprites:
+        for angle in angles:
+            get_rotated_sprite(path, size, angle)
+    return sprite_cache_bytes()
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024 or unit == "MiB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} MiB"
+
+
+def build_report(counts: list[int], samples: int = 1000, sprites: bool = False) -> str:
+    """Build the memory budget table.
+
+    Args:
+        counts: Population sizes to total
+        samples: Entities allocated per type when measuring
+        sprites: Also load sprites and report shared sprite/rotation cache size
+
+    Returns:
+        Report text
+    """
+    per_entity = {
+        name: measure_entity_bytes(factory, samples) for name, factory in ENTITY_FACTORIES.items()
+    }
+    player_size = measure_entity_bytes(lambda i: Player(400, 300, 800, 600), 10)
+
+    header = f"{'Entity':<12}{'bytes/entity':>14}" + "".join(f"{n:>14,}" for n in counts)
+    lines = ["Entity memory budget (per-instance heap, shared data excluded)", header]
+    lines.append("-" * len(header))
+    for name, size in per_entity.items():
+        totals = "".join(f"{_format_bytes(size * n):>14}" for n in counts)
+        lines.append(f"{name:<12}{size:>14,.0f}{totals}")
+
+    mix_size = sum(per_entity[name] * share for name, share in WORLD_MIX.items())
+    totals = "".join(f"{_format_bytes(mix_size * n):>14}" for n in counts)
+    lines.append("-" * len(header))
+    lines.append(f"{'World mix':<12}{mix_size:>14,.0f}{totals}")
+    lines.append("")
+    lines.append(f"Player (single instance): {_format_bytes(player_size)}")
+
+    if sprites:
+        lines.append("")
+        lines.append(f"Shared sprites + rotation cache: {_format_bytes(measure_sprite_bytes())}")
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the memory report."""
+    parser = argparse.ArgumentParser(description="Report entity memory footprint")
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=[100, 1000, 10000], help="Population sizes"
+    )
+    parser.add_argument("--samples", type=int, default=1000, help="Entities measured per type")
+    parser.add_argument(
+        "--sprites", action="store_true", help="Include shared sprite/rotation cache size"
+    )
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    print(build_report(args.counts, args.samples, args.sprites))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Vectorized particle system for Zombie Survival
+Particles live in preallocated NumPy arrays and are integrated with array math
+
+Usage:
+    particles = ParticleSystem(particle_config)
+    particles.emit_burst(x, y, "blood")  # On kill/hit/pickup events
+    particles.update(delta_time)          # Once per frame
+    particles.draw(screen)                # Blits cached stamps in one call
+    particles.snapshot().draw(screen)     # Same, from a copy (render thread)
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+from config import ParticleConfig
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as parallel NumPy arrays.
+
+    Live particles are packed into the first ``count`` rows. Expired particles
+    are compacted out with one boolean gather per frame, so there is no per-particle
+    Python work in update(). Drawing reuses small pre-rendered stamps keyed by
+    (palette color, size, alpha level).
+    """
+
+    def __init__(self, config: ParticleConfig, seed: int | None = None):
+        """Preallocate particle storage.
+
+        Args:
+            config: Particle settings (capacity, presets, stamp quantization)
+            seed: Optional RNG seed for deterministic emission
+        """
+        self.config = config
+        self.capacity = config.max_particles
+        self.limit = self.capacity  # Live-particle cap (lowered by the quality governor)
+        self.rng = np.random.default_rng(seed)
+
+        # Parallel particle arrays (rows [0, count) are live)
+        self.position = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.lifetime = np.zeros(self.capacity, dtype=np.float32)  # Seconds remaining
+        self.max_lifetime = np.ones(self.capacity, dtype=np.float32)  # Seconds at spawn
+        self.color = np.zeros(self.capacity, dtype=np.uint8)  # Palette index
+        self.size = np.zeros(self.capacity, dtype=np.uint8)  # Diameter in pixels
+        self.count = 0
+
+        # Palette: color tuple -> index (stamps are cached per palette entry)
+        self.palette: list[tuple] = []
+        self._palette_index: dict[tuple, int] = {}
+
+        # Stamp cache: object array indexed by flattened (color, size, alpha level) key,
+        # so a whole frame's stamps are gathered with one fancy-index
+        self.alpha_levels = config.alpha_levels
+        self.max_size = config.max_size
+        self._stamps = np.empty(0, dtype=object)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def stamp_count(self) -> int:
+        """Number of stamps rendered so far."""
+        return sum(stamp is not None for stamp in self._stamps)
+
+    def _color_index(self, color: tuple) -> int:
+        """Get (or register) the palette index for a color."""
+        color = tuple(color[:3])
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        count: int,
+        color: tuple,
+        speed: tuple[float, float],
+        lifetime: tuple[float, float],
+        size: tuple[int, int],
+    ) -> int:
+        """Emit a radial burst of particles.
+
+        Args:
+            x: Burst center x
+            y: Burst center y
+            count: Number of particles requested
+            color: RGB color
+            speed: (min, max) initial speed in pixels per second
+            lifetime: (min, max) lifetime in seconds
+            size: (min, max) diameter in pixels
+
+        Returns:
+            Number of particles actually emitted (capped by the live-particle limit)
+        """
+        count = min(count, self.limit - self.count)
+        if count <= 0:
+            return 0
+
+        start = self.count
+        end = start + count
+        rng = self.rng
+
+        angles = rng.uniform(0.0, 2.0 * math.pi, count)
+        speeds = rng.uniform(speed[0], speed[1], count)
+        self.position[start:end, 0] = x
+        self.position[start:end, 1] = y
+        self.velocity[start:end, 0] = np.cos(angles) * speeds
+        self.velocity[start:end, 1] = np.sin(angles) * speeds
+
+        lifetimes = rng.uniform(lifetime[0], lifetime[1], count)
+        self.lifetime[start:end] = lifetimes
+        self.max_lifetime[start:end] = lifetimes
+
+        self.color[start:end] = self._color_index(color)
+        max_size = min(size[1], self.max_size)
+        self.size[start:end] = rng.integers(max(1, size[0]), max_size + 1, count)
+
+        self.count = end
+        return count
+
+    def emit_burst(self, x: float, y: float, preset: str, color: tuple | None = None) -> int:
+        """Emit a burst using a named preset from ParticleConfig.
+
+        Args:
+            x: Burst center x
+            y: Burst center y
+            preset: Preset name ("blood", "spark" or "pickup")
+            color: Override the preset color (e.g. power-up type color)
+
+        Returns:
+            Number of particles emitted
+        """
+        settings = self.config.presets[preset]
+        return self.emit(
+            x,
+            y,
+            count=settings["count"],
+            color=color if color is not None else settings["color"],
+            speed=settings["speed"],
+            lifetime=settings["lifetime"],
+            size=settings["size"],
+        )
+
+    def update(self, delta_time: float) -> None:
+        """Integrate all live particles and compact out expired ones.
+
+        Args:
+            delta_time: Time since last frame in seconds
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        # Integrate (exponential drag keeps motion frame-rate independent)
+        damping = self.config.drag**delta_time
+        velocity = self.velocity[:n]
+        velocity *= damping
+        self.position[:n] += velocity * delta_time
+        self.lifetime[:n] -= delta_time
+
+        # Compact live particles to the front
+        alive = self.lifetime[:n] > 0
+        live_count = int(np.count_nonzero(alive))
+        if live_count == n:
+            return
+        keep = np.flatnonzero(alive)
+        for array in (
+            self.position,
+            self.velocity,
+            self.lifetime,
+            self.max_lifetime,
+            self.color,
+            self.size,
+        ):
+            array[:live_count] = array[keep]
+        self.count = live_count
+
+    def clear(self) -> None:
+        """Remove all particles."""
+        self.count = 0
+
+    def _build_stamp(self, key: int) -> pygame.Surface:
+        """Render the stamp for a flattened (color, size, alpha level) key."""
+        levels = self.alpha_levels
+        color_index, rest = divmod(key, (self.max_size + 1) * levels)
+        size, level = divmod(rest, levels)
+        alpha = int(255 * (level + 1) / levels)
+        size = max(1, size)
+
+        stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+        color = (*self.palette[color_index], alpha)
+        if size <= 2:
+            stamp.fill(color)
+        else:
+            radius = size / 2
+            pygame.draw.circle(stamp, color, (radius, radius), radius)
+        return stamp
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        """Draw all live particles with a single blits() call.
+
+        Args:
+            screen: Pygame surface to draw on
+            scale: World-to-surface scale (dynamic render resolution)
+        """
+        n = self.count
+        if n == 0:
+            return
+        ratio = self.lifetime[:n] / self.max_lifetime[:n]
+        self._draw(screen, scale, self.position[:n], ratio, self.color[:n], self.size[:n])
+
+    def snapshot(self) -> "ParticleSnapshot":
+        """Copy the live particles for drawing while the system keeps updating.
+
+        Only the rows [0, count) are copied; stamps and palette stay shared.
+        """
+        n = self.count
+        ratio = self.lifetime[:n] / self.max_lifetime[:n]
+        return ParticleSnapshot(
+            self, self.position[:n].copy(), ratio, self.color[:n].copy(), self.size[:n].copy()
+        )
+
+    def _draw(
+        self,
+        screen: pygame.Surface,
+        scale: float,
+        position: np.ndarray,
+        ratio: np.ndarray,
+        color: np.ndarray,
+        size: np.ndarray,
+    ) -> None:
+        """Blit particles given their live rows (remaining lifetime ratio per particle)."""
+        # Quantize fade to alpha levels and build flattened stamp keys
+        levels = self.alpha_levels
+        level = np.clip((ratio * levels).astype(np.int32), 0, levels - 1)
+        size = size.astype(np.int32)
+        if scale != 1.0:
+            size = np.maximum(1, np.rint(size * scale).astype(np.int32))
+        keys = (color.astype(np.int32) * (self.max_size + 1) + size) * levels + level
+
+        # Grow the stamp table when new palette colors appear
+        table_size = len(self.palette) * (self.max_size + 1) * levels
+        if len(self._stamps) < table_size:
+            grown = np.empty(table_size, dtype=object)
+            grown[: len(self._stamps)] = self._stamps
+            self._stamps = grown
+
+        # Render any stamps seen for the first time
+        stamps = self._stamps
+        for key in np.unique(keys).tolist():
+            if stamps[key] is None:
+                stamps[key] = self._build_stamp(key)
+
+        # Top-left corner of each stamp, then blit everything at once
+        corners = (position * scale - (size[:, None] * 0.5)).astype(np.int32)
+        blit_sequence = list(zip(stamps[keys].tolist(), corners.tolist(), strict=True))
+        screen.blits(blit_sequence, doreturn=False)
+
+
+class ParticleSnapshot:
+    """Frozen copy of a particle system's live rows, drawn with its stamp cache."""
+
+    __slots__ = ("system", "position", "ratio", "color", "size")
+
+    def __init__(
+        self,
+        system: ParticleSystem,
+        position: np.ndarray,
+        ratio: np.ndarray,
+        color: np.ndarray,
+        size: np.ndarray,
+    ):
+        self.system = system
+        self.position = position
+        self.ratio = ratio  # Remaining lifetime / max lifetime
+        self.color = color
+        self.size = size
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def draw(self, screen: pygame.Surface, scale: float = 1.0) -> None:
+        """Draw the copied particles (same output as ParticleSystem.draw)."""
+        if len(self.position):
+            self.system._draw(screen, scale, self.position, self.ratio, self.color, self.size)
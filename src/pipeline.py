@@ -0,0 +1,169 @@
+"""
+Pipelined rendering for Zombie Survival
+Draws frame N on a render thread while the main thread simulates frame N+1
+
+Enable with: GAME_RENDER_THREAD=1 uv run python src/main.py (or GameConfig.render_thread)
+
+Each frame the main thread copies everything the render systems read into one of two
+snapshot buffers and hands it to the render thread. A snapshot is a shallow copy of
+the Game (fonts, sprites, configs and surfaces are shared) whose per-frame state is
+copied: the player, sprite entities, effect records and live particles. Events and
+pygame.display.flip() stay on the main thread. Output lags simulation by one frame.
+
+Usage:
+    pipeline = RenderPipeline(game)
+    frame = pipeline.capture()  # After update(): snapshot into the back buffer
+    pipeline.wait()             # Previous frame fully drawn
+    pygame.display.flip()
+    pipeline.submit(frame)      # Draw this frame while the next one simulates
+"""
+
+import copy
+import threading
+import time
+from typing import Any
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# World components the render systems query
+SNAPSHOT_COMPONENTS = ("sprite",)
+
+
+class SnapshotTable:
+    """Copied rows of one archetype table."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: list):
+        self.rows = rows
+
+
+class SnapshotWorld:
+    """Read-only stand-in for World.query() over copied entities."""
+
+    def __init__(self) -> None:
+        self._tables: dict[str, list[SnapshotTable]] = {}
+
+    def capture(self, world: Any) -> None:
+        """Copy every entity the render systems draw."""
+        for component in SNAPSHOT_COMPONENTS:
+            self._tables[component] = [
+                SnapshotTable([copy.copy(entity) for entity in table.rows])
+                for table in world.query(component)
+            ]
+
+    def query(self, component: str) -> list[SnapshotTable]:
+        return self._tables[component]
+
+
+class RenderPipeline:
+    """Double-buffered game snapshots drawn on a background render thread.
+
+    capture() always writes the buffer the render thread is not reading, and
+    submit() only follows wait(), so the two threads never share a snapshot.
+    """
+
+    def __init__(self, game: Any):
+        """Start the render thread.
+
+        Args:
+            game: Game whose render systems draw each snapshot
+        """
+        self.game = game
+        # Uninitialized Game instances: render methods work on them once capture() fills them
+        self._buffers = [object.__new__(type(game)), object.__new__(type(game))]
+        self._back = 0  # Buffer the next capture() writes
+        self._pending: Any = None  # Snapshot waiting for the render thread
+        self._busy = False  # A submitted frame is not finished yet
+        self._stopping = False
+        self._error: BaseException | None = None
+        self._condition = threading.Condition()
+
+        self.frames = 0
+        self.draw_ms = 0.0  # Last frame's draw time on the render thread
+        self.wait_ms = 0.0  # Last time the main thread waited for it
+
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+        self._thread.start()
+        logger.info("Render thread started")
+
+    def capture(self) -> Any:
+        """Snapshot the game's render state into the back buffer.
+
+        Returns:
+            Game-like frame for submit()
+        """
+        game = self.game
+        frame = self._buffers[self._back]
+        frame.__dict__.update(game.__dict__)
+
+        frame.player = copy.copy(game.player)
+        frame.allies = [copy.copy(ally) for ally in game.allies]
+        world = frame.__dict__.get("_snapshot_world")
+        if world is None:
+            world = SnapshotWorld()
+            frame._snapshot_world = world
+        world.capture(game.world)
+        frame.world = world
+
+        frame._kill_flashes = [copy.copy(record) for record in game.kill_flashes]
+        frame._damage_popups = [copy.copy(record) for record in game.damage_popups]
+        frame._pickup_flashes = [copy.copy(record) for record in game.pickup_flashes]
+        frame.particles = game.particles.snapshot()
+        return frame
+
+    def submit(self, frame: Any) -> None:
+        """Hand a captured frame to the render thread and swap buffers."""
+        with self._condition:
+            self._pending = frame
+            self._busy = True
+            self._condition.notify_all()
+        self._back ^= 1
+
+    def wait(self) -> None:
+        """Block until the submitted frame is drawn.
+
+        Raises:
+            RuntimeError: If drawing the frame failed on the render thread
+        """
+        start = time.perf_counter()
+        with self._condition:
+            while self._busy:
+                self._condition.wait()
+            error, self._error = self._error, None
+        self.wait_ms = (time.perf_counter() - start) * 1000
+        if error is not None:
+            raise RuntimeError("Render thread failed") from error
+
+    def stop(self) -> None:
+        """Finish the in-flight frame and join the render thread."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+        logger.info("Render thread stopped after %d frames", self.frames)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                frame, self._pending = self._pending, None
+
+            start = time.perf_counter()
+            error: BaseException | None = None
+            try:
+                frame.draw_frame()
+            except Exception as e:  # Re-raised on the main thread by wait()
+                error = e
+            self.draw_ms = (time.perf_counter() - start) * 1000
+
+            with self._condition:
+                self.frames += 1
+                self._error = error
+                self._busy = False
+                self._condition.notify_all()
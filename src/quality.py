@@ -0,0 +1,108 @@
+"""
+Adaptive quality governor for Zombie Survival
+Steps quality tiers down when frames run over budget and back up when there is headroom
+
+Usage:
+    governor = QualityGovernor(quality_config, target_fps=60)
+    if governor.observe(frame_ms, delta_time):  # Once per PLAYING frame
+        apply(governor.tier)                    # Tier settings changed
+"""
+
+from config import QualityConfig
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class QualityGovernor:
+    """Picks a quality tier from a smoothed frame time.
+
+    Hysteresis keeps the tier stable: the smoothed time must stay over budget
+    for ``downgrade_after`` seconds (or under budget * ``upgrade_ratio`` for the
+    longer ``upgrade_after``) before a step, and each step starts a cooldown.
+    Frame times between the two thresholds never change the tier.
+    """
+
+    def __init__(self, config: QualityConfig, target_fps: int):
+        """Start at the best tier.
+
+        Args:
+            config: Governor thresholds and tier definitions
+            target_fps: Frame rate whose frame time is the budget
+        """
+        self.config = config
+        self.budget_ms = 1000.0 / target_fps
+        self.tier_index = 0
+        self.smoothed_ms: float | None = None
+        self._over = 0.0  # Seconds continuously over budget
+        self._under = 0.0  # Seconds continuously with headroom
+        self._cooldown = 0.0
+        self.changes = 0
+
+    @property
+    def tier(self) -> dict:
+        tier: dict = self.config.tiers[self.tier_index]
+        return tier
+
+    @property
+    def tier_name(self) -> str:
+        return str(self.tier["name"])
+
+    def observe(self, frame_ms: float, delta_time: float) -> bool:
+        """Feed one frame's work time.
+
+        Args:
+            frame_ms: Time spent updating and rendering the frame (excludes vsync/sleep)
+            delta_time: Seconds since the previous frame (drives the hysteresis timers)
+
+        Returns:
+            True if the tier changed
+        """
+        if not self.config.enabled:
+            return False
+
+        if self.smoothed_ms is None:
+            self.smoothed_ms = frame_ms
+        else:
+            self.smoothed_ms += (frame_ms - self.smoothed_ms) * self.config.smoothing
+
+        if self.smoothed_ms > self.budget_ms * self.config.downgrade_ratio:
+            self._over += delta_time
+            self._under = 0.0
+        elif self.smoothed_ms < self.budget_ms * self.config.upgrade_ratio:
+            self._under += delta_time
+            self._over = 0.0
+        else:
+            self._over = self._under = 0.0
+
+        if self._cooldown > 0:
+            self._cooldown -= delta_time
+            return False
+
+        if (
+            self._over >= self.config.downgrade_after
+            and self.tier_index < len(self.config.tiers) - 1
+        ):
+            return self._step(+1)
+        if self._under >= self.config.upgrade_after and self.tier_index > 0:
+            return self._step(-1)
+        return False
+
+    def _step(self, direction: int) -> bool:
+        self.tier_index += direction
+        self._over = self._under = 0.0
+        self._cooldown = self.config.cooldown
+        self.changes += 1
+        logger.info(
+            "Quality %s to %s (smoothed frame %.1fms, budget %.1fms)",
+            "lowered" if direction > 0 else "raised",
+            self.tier_name,
+            self.smoothed_ms,
+            self.budget_ms,
+        )
+        return True
+
+    def report(self) -> str:
+        """Current tier and smoothed frame time for the profiler output."""
+        smoothed = self.smoothed_ms or 0.0
+        return f"quality={self.tier_name} frame={smoothed:.1f}ms/{self.budget_ms:.1f}ms"
@@ -0,0 +1,415 @@
+"""
+Binary save states for Zombie Survival
+snapshot(game) packs the full simulation state into one compact bytes object and
+restore(game, data) puts it back, for save-anywhere, rewind and branch-and-compare tests.
+
+Format (little-endian, VERSION 3): a HEADER record, the GAME and PLAYER records, the
+RNG states, then one fixed-layout structured array per section, each sized by its
+count in the header. Bump VERSION whenever a layout changes; restore() rejects others.
+
+Covered: game scalars and run stats, the player and co-op allies, zombies (variant,
+position, angle, health), projectiles, power-ups, kill/pickup flashes, damage popups,
+live particles, and the RNG states (the `random` module the game logic draws from, and
+the particle generator).
+Not covered: configs, caches, sounds and quality settings (not simulation state).
+"""
+
+import random
+
+import numpy as np
+
+from entities.player import Player
+from entities.powerup import Powerup, PowerupType
+from entities.projectile import Projectile
+from entities.zombie import Zombie
+from entities.zombie_fast import FastZombie
+from entities.zombie_tank import TankZombie
+from game_state import GameState
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"ZSAV"
+VERSION = 3  # 2: co-op allies section, 3: run seed
+
+SECTIONS = (
+    "allies",
+    "zombies",
+    "projectiles",
+    "powerups",
+    "kill_flashes",
+    "pickup_flashes",
+    "damage_popups",
+    "particles",
+    "palette",
+)
+HEADER = np.dtype([("magic", "S4"), ("version", "<u2")] + [(name, "<u4") for name in SECTIONS])
+
+GAME = np.dtype(
+    [
+        ("state", "u1"),
+        ("score", "<i8"),
+        ("current_wave", "<i4"),
+        ("zombies_to_spawn", "<i4"),
+        ("spawn_timer", "<f8"),
+        ("wave_delay_timer", "<f8"),
+        ("wave_notification_timer", "<f8"),
+        ("seed", "<u8"),
+        # RunStats
+        ("time", "<f8"),
+        ("kills", "<i4"),
+        ("shots", "<i4"),
+        ("hits", "<i4"),
+        ("damage_taken", "<f8"),
+    ]
+)
+SCALAR_FIELDS = (
+    "score",
+    "current_wave",
+    "zombies_to_spawn",
+    "spawn_timer",
+    "wave_delay_timer",
+    "wave_notification_timer",
+    "seed",
+)
+STATS_FIELDS = ("time", "kills", "shots", "hits", "damage_taken")
+
+# Player slots except color (taken from config)
+PLAYER = np.dtype(
+    [
+        ("radius", "<i4"),
+        ("speed", "<i4"),
+        ("x", "<f8"),
+        ("y", "<f8"),
+        ("screen_width", "<i4"),
+        ("screen_height", "<i4"),
+        ("max_health", "<i4"),
+        ("health", "<f8"),
+        ("damage_cooldown", "<f8"),
+        ("damage_cooldown_time", "<f8"),
+        ("attack_range", "<i4"),
+        ("attack_cooldown", "<f8"),
+        ("attack_cooldown_time", "<f8"),
+        ("is_attacking", "?"),
+        ("fire_cooldown", "<f8"),
+        ("magazine", "<i4"),
+        ("magazine_size", "<i4"),
+        ("stash", "<i4"),
+        ("max_stash", "<i4"),
+        ("is_reloading", "?"),
+        ("reload_timer", "<f8"),
+        ("speed_multiplier", "<f8"),
+        ("speed_boost_timer", "<f8"),
+        ("shield_hits_remaining", "<i4"),
+        ("angle", "<f8"),
+    ]
+)
+PLAYER_FIELDS = tuple(PLAYER.fields or ())
+
+# Python `random` state (Mersenne Twister) and the particle PCG64 generator
+RNG = np.dtype(
+    [
+        ("mt", "<u4", 625),
+        ("gauss", "<f8"),  # NaN when no cached gaussian
+        ("pcg_state", "<u8", 2),  # 128-bit (high, low)
+        ("pcg_inc", "<u8", 2),
+        ("pcg_has_uint32", "<i4"),
+        ("pcg_uinteger", "<u4"),
+    ]
+)
+
+ZOMBIE_KINDS = (Zombie, FastZombie, TankZombie)
+ZOMBIE = np.dtype(
+    [("kind", "u1"), ("x", "<f8"), ("y", "<f8"), ("angle", "<f8"), ("health", "<i4")]
+)  # health -1: one-hit variant (no health)
+PROJECTILE = np.dtype(
+    [(name, "<f8") for name in ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "age")]
+    + [("alive", "?")]
+)
+POWERUP_TYPES = tuple(PowerupType)
+POWERUP = np.dtype(
+    [
+        ("type", "u1"),
+        ("x", "<f8"),
+        ("y", "<f8"),
+        ("rotation_angle", "<f8"),
+        ("bob_timer", "<f8"),
+        ("lifetime", "<f8"),
+        ("is_visible", "?"),
+        ("blink_timer", "<f8"),
+    ]
+)
+KILL_FLASH = np.dtype([("x", "<f8"), ("y", "<f8"), ("radius", "<i4"), ("timer", "<f8")])
+PICKUP_FLASH = np.dtype(
+    [("x", "<f8"), ("y", "<f8"), ("radius", "<i4"), ("color", "u1", 3), ("timer", "<f8")]
+)
+DAMAGE_POPUP = np.dtype([("x", "<f8"), ("y", "<f8"), ("text", "S16"), ("timer", "<f8")])
+PARTICLE = np.dtype(
+    [
+        ("position", "<f4", 2),
+        ("velocity", "<f4", 2),
+        ("lifetime", "<f4"),
+        ("max_lifetime", "<f4"),
+        ("color", "u1"),  # Index into the palette section
+        ("size", "u1"),
+    ]
+)
+PALETTE = np.dtype([("rgb", "u1", 3)])
+
+SECTION_DTYPES = {
+    "allies": PLAYER,
+    "zombies": ZOMBIE,
+    "projectiles": PROJECTILE,
+    "powerups": POWERUP,
+    "kill_flashes": KILL_FLASH,
+    "pickup_flashes": PICKUP_FLASH,
+    "damage_popups": DAMAGE_POPUP,
+    "particles": PARTICLE,
+    "palette": PALETTE,
+}
+
+_STATES = tuple(GameState)
+_KIND_INDEX = {cls: index for index, cls in enumerate(ZOMBIE_KINDS)}
+_POWERUP_INDEX = {powerup_type: index for index, powerup_type in enumerate(POWERUP_TYPES)}
+_MASK64 = (1 << 64) - 1
+
+
+def snapshot(game) -> bytes:
+    """Pack the game's simulation state.
+
+    Returns:
+        Versioned binary save state
+    """
+    sections = {
+        "allies": np.array(
+            [tuple(getattr(ally, name) for name in PLAYER_FIELDS) for ally in game.allies],
+            PLAYER,
+        ),
+        "zombies": np.array(
+            [
+                (
+                    _KIND_INDEX[type(z)],
+                    z.x,
+                    z.y,
+                    z.angle,
+                    -1 if z.health is None else z.health,
+                )
+                for z in game.zombies
+            ],
+            ZOMBIE,
+        ),
+        "projectiles": np.array(
+            [
+                (p.x, p.y, p.prev_x, p.prev_y, p.velocity_x, p.velocity_y, p.age, p.alive)
+                for p in game.projectiles
+            ],
+            PROJECTILE,
+        ),
+        "powerups": np.array(
+            [
+                (
+                    _POWERUP_INDEX[p.powerup_type],
+                    p.x,
+                    p.y,
+                    p.rotation_angle,
+                    p.bob_timer,
+                    p.lifetime,
+                    p.is_visible,
+                    p.blink_timer,
+                )
+                for p in game.powerups
+            ],
+            POWERUP,
+        ),
+        "kill_flashes": np.array(
+            [(f.x, f.y, f.radius, f.timer) for f in game.kill_flashes], KILL_FLASH
+        ),
+        "pickup_flashes": np.array(
+            [(f.x, f.y, f.radius, f.color[:3], f.timer) for f in game.pickup_flashes],
+            PICKUP_FLASH,
+        ),
+        "damage_popups": np.array(
+            [(p.x, p.y, p.text.encode(), p.timer) for p in game.damage_popups], DAMAGE_POPUP
+        ),
+    }
+
+    particles = game.particles
+    count = particles.count
+    rows = np.empty(count, PARTICLE)
+    rows["position"] = particles.position[:count]
+    rows["velocity"] = particles.velocity[:count]
+    rows["lifetime"] = particles.lifetime[:count]
+    rows["max_lifetime"] = particles.max_lifetime[:count]
+    rows["color"] = particles.color[:count]
+    rows["size"] = particles.size[:count]
+    sections["particles"] = rows
+    sections["palette"] = np.array([(color,) for color in particles.palette], PALETTE)
+
+    header = np.zeros((), HEADER)
+    header["magic"] = MAGIC
+    header["version"] = VERSION
+    for name in SECTIONS:
+        header[name] = len(sections[name])
+
+    record = np.zeros((), GAME)
+    record["state"] = _STATES.index(game.state)
+    for name in SCALAR_FIELDS:
+        record[name] = getattr(game, name)
+    for name in STATS_FIELDS:
+        record[name] = getattr(game.stats, name)
+
+    player = np.zeros((), PLAYER)
+    for name in PLAYER_FIELDS:
+        player[name] = getattr(game.player, name)
+
+    parts = [header.tobytes(), record.tobytes(), player.tobytes(), _pack_rng(particles).tobytes()]
+    parts += [sections[name].tobytes() for name in SECTIONS]
+    return b"".join(parts)
+
+
+def restore(game, data: bytes) -> None:
+    """Replace the game's simulation state with a snapshot.
+
+    Raises:
+        ValueError: Not a save state, or a different format version
+    """
+    header = np.frombuffer(data, HEADER, count=1)[0]
+    if header["magic"] != MAGIC:
+        raise ValueError("Not a save state")
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported save state version {header['version']} (need {VERSION})")
+
+    offset = HEADER.itemsize
+    record = np.frombuffer(data, GAME, count=1, offset=offset)[0]
+    offset += GAME.itemsize
+    saved_player = np.frombuffer(data, PLAYER, count=1, offset=offset)[0]
+    offset += PLAYER.itemsize
+    rng = np.frombuffer(data, RNG, count=1, offset=offset)[0]
+    offset += RNG.itemsize
+    sections = {}
+    for name in SECTIONS:
+        dtype = SECTION_DTYPES[name]
+        count = int(header[name])
+        sections[name] = np.frombuffer(data, dtype, count=count, offset=offset)
+        offset += dtype.itemsize * count
+
+    # Game scalars and run stats
+    game.state = _STATES[record["state"]]
+    for name in SCALAR_FIELDS:
+        setattr(game, name, record[name].item())
+    for name in STATS_FIELDS:
+        setattr(game.stats, name, record[name].item())
+
+    # Players (fresh objects: render snapshots may still hold the old ones). Allies are
+    # matched to the game's co-op controllers by slot; unmatched slots start fresh.
+    game.player = _restore_player(game, 0, saved_player)
+    saved_allies = sections["allies"]
+    game.allies = [
+        _restore_player(game, slot, saved_allies[slot - 1])
+        if slot <= len(saved_allies)
+        else game.spawn_player(slot)
+        for slot in range(1, len(game.ally_controllers) + 1)
+    ]
+
+    # Entities (respawned in saved order, so table order matches)
+    game.world.clear()
+    for kind, x, y, angle, health in sections["zombies"].tolist():
+        zombie = object.__new__(ZOMBIE_KINDS[kind])
+        zombie.x = x
+        zombie.y = y
+        zombie.angle = angle
+        zombie.health = None if health < 0 else health
+        game.world.spawn(zombie)
+    for x, y, prev_x, prev_y, vx, vy, age, alive in sections["projectiles"].tolist():
+        projectile = object.__new__(Projectile)
+        projectile.x = x
+        projectile.y = y
+        projectile.prev_x = prev_x
+        projectile.prev_y = prev_y
+        projectile.velocity_x = vx
+        projectile.velocity_y = vy
+        projectile.age = age
+        projectile.alive = alive
+        game.world.spawn(projectile)
+    for row in sections["powerups"].tolist():
+        kind, x, y, rotation_angle, bob_timer, lifetime, is_visible, blink_timer = row
+        powerup = object.__new__(Powerup)
+        powerup.powerup_type = POWERUP_TYPES[kind]
+        powerup.x = x
+        powerup.y = y
+        powerup.rotation_angle = rotation_angle
+        powerup.bob_timer = bob_timer
+        powerup.lifetime = lifetime
+        powerup.is_visible = is_visible
+        powerup.blink_timer = blink_timer
+        game.world.spawn(powerup)
+
+    # Effects (pooled records are overwritten in place)
+    game.kill_flashes.clear()
+    for x, y, radius, timer in sections["kill_flashes"].tolist():
+        game.kill_flashes.spawn(x=x, y=y, radius=radius, timer=timer)
+    game.pickup_flashes.clear()
+    for x, y, radius, color, timer in sections["pickup_flashes"].tolist():
+        game.pickup_flashes.spawn(x=x, y=y, radius=radius, color=tuple(color), timer=timer)
+    game.damage_popups.clear()
+    for x, y, text, timer in sections["damage_popups"].tolist():
+        game.damage_popups.spawn(x=x, y=y, text=text.decode(), timer=timer)
+
+    # Particles: saved palette indices are remapped onto this system's palette
+    particles = game.particles
+    rows = sections["particles"][: particles.capacity]
+    count = len(rows)
+    remap = np.array(
+        [particles._color_index(tuple(rgb)) for rgb in sections["palette"]["rgb"].tolist()] or [0],
+        np.uint8,
+    )
+    particles.position[:count] = rows["position"]
+    particles.velocity[:count] = rows["velocity"]
+    particles.lifetime[:count] = rows["lifetime"]
+    particles.max_lifetime[:count] = rows["max_lifetime"]
+    particles.color[:count] = remap[rows["color"]]
+    particles.size[:count] = rows["size"]
+    particles.count = count
+
+    _unpack_rng(rng, particles)
+
+
+def _restore_player(game, slot: int, saved: np.void) -> Player:
+    """A player for a co-op slot with the saved slot values."""
+    player: Player = game.spawn_player(slot)
+    for name in PLAYER_FIELDS:
+        setattr(player, name, saved[name].item())
+    return player
+
+
+def _pack_rng(particles) -> np.ndarray:
+    """Current `random` and particle generator states as an RNG record."""
+    record = np.zeros((), RNG)
+    _, mt, gauss = random.getstate()
+    record["mt"] = mt
+    record["gauss"] = np.nan if gauss is None else gauss
+
+    state = particles.rng.bit_generator.state
+    if state["bit_generator"] != "PCG64":
+        raise ValueError(f"Unsupported particle generator {state['bit_generator']}")
+    pcg = state["state"]
+    record["pcg_state"] = (pcg["state"] >> 64, pcg["state"] & _MASK64)
+    record["pcg_inc"] = (pcg["inc"] >> 64, pcg["inc"] & _MASK64)
+    record["pcg_has_uint32"] = state["has_uint32"]
+    record["pcg_uinteger"] = state["uinteger"]
+    return record
+
+
+def _unpack_rng(record: np.void, particles) -> None:
+    """Restore `random` and the particle generator from an RNG record."""
+    gauss = float(record["gauss"])
+    random.setstate((3, tuple(record["mt"].tolist()), None if np.isnan(gauss) else gauss))
+
+    high, low = record["pcg_state"].tolist()
+    inc_high, inc_low = record["pcg_inc"].tolist()
+    particles.rng.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": high << 64 | low, "inc": inc_high << 64 | inc_low},
+        "has_uint32": int(record["pcg_has_uint32"]),
+        "uinteger": int(record["pcg_uinteger"]),
+    }
@@ -0,0 +1,397 @@
+"""
+Multi-process simulation server for Zombie Survival
+The simulation runs in its own process at a fixed tick rate and publishes each tick's
+state into a multiprocessing.shared_memory ring of fixed-layout arrays. The window
+process only forwards input, reads the newest complete slot and draws it, so a
+rendering stall never slows the simulation (and neither contends for one GIL).
+
+Enable with: GAME_SIM_PROCESS=1 uv run python src/main.py (or GameConfig.sim_process)
+
+Shared block layout (one segment, NumPy views):
+    control   int64[CONTROL_FIELDS]                 latest seq, input bits, run, paused, stop
+    headers   float64[ring_slots, HEADER_FIELDS]    per-slot game and player scalars
+    entities  ENTITY_DTYPE[ring_slots, max_entities]
+
+Each slot is guarded by its sequence number (seqlock): the writer marks the slot -1,
+writes it, then stores the tick's sequence in the slot and in control. A reader copies
+the newest slot and retries if its sequence changed while copying.
+
+Not replicated: sounds (played by the simulation process's dummy mixer) and the
+presentation-only effects (particles, flashes, damage popups).
+"""
+
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from config import GameConfig
+from controls import Controls
+from entities.player import Player
+from entities.powerup import Powerup, PowerupType
+from entities.projectile import Projectile
+from entities.zombie import Zombie
+from entities.zombie_fast import FastZombie
+from entities.zombie_tank import TankZombie
+from game_state import GameState
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Control block (int64), written by both sides
+CONTROL_FIELDS = ("latest", "input", "run", "paused", "stop")
+C = {name: index for index, name in enumerate(CONTROL_FIELDS)}
+
+# Player attributes replicated each tick (all numeric slots)
+PLAYER_FIELDS = tuple(name for name in Player.__slots__ if name != "color")
+GAME_FIELDS = ("score", "high_score", "current_wave", "wave_notification_timer")
+HEADER_FIELDS = ("seq", "run", "tick", "state", "count", "tick_ms", *GAME_FIELDS, *PLAYER_FIELDS)
+H = {name: index for index, name in enumerate(HEADER_FIELDS)}
+
+# One row per drawn entity
+ENTITY_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),  # Index into KINDS
+        ("variant", "u1"),  # Power-up type index
+        ("visible", "u1"),  # Power-up blink state
+        ("x", "f4"),
+        ("y", "f4"),
+        ("angle", "f4"),  # Zombie facing / power-up spin
+        ("aux", "f4"),  # Power-up bob timer
+    ]
+)
+KINDS: tuple[type, ...] = (Zombie, FastZombie, TankZombie, Projectile, Powerup)
+KIND_INDEX = {cls: index for index, cls in enumerate(KINDS)}
+PROJECTILE_KIND = KIND_INDEX[Projectile]
+POWERUP_KIND = KIND_INDEX[Powerup]
+POWERUP_TYPES = list(PowerupType)
+POWERUP_INDEX = {powerup_type: index for index, powerup_type in enumerate(POWERUP_TYPES)}
+STATES = list(GameState)
+
+
+class SharedState:
+    """NumPy views over the shared segment (same layout in both processes)."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, max_entities: int, slots: int):
+        self.shm = shm
+        self.max_entities = max_entities
+        self.slots = slots
+
+        offset = 0
+        self.control: np.ndarray = np.ndarray(
+            (len(CONTROL_FIELDS),), dtype=np.int64, buffer=shm.buf, offset=offset
+        )
+        offset += self.control.nbytes
+        self.headers: np.ndarray = np.ndarray(
+            (slots, len(HEADER_FIELDS)), dtype=np.float64, buffer=shm.buf, offset=offset
+        )
+        offset += self.headers.nbytes
+        self.entities: np.ndarray = np.ndarray(
+            (slots, max_entities), dtype=ENTITY_DTYPE, buffer=shm.buf, offset=offset
+        )
+
+    @staticmethod
+    def nbytes(max_entities: int, slots: int) -> int:
+        """Segment size for a layout."""
+        return (
+            len(CONTROL_FIELDS) * 8
+            + slots * len(HEADER_FIELDS) * 8
+            + slots * max_entities * ENTITY_DTYPE.itemsize
+        )
+
+    @classmethod
+    def create(cls, max_entities: int, slots: int) -> "SharedState":
+        """Allocate a zeroed segment (window process)."""
+        shm = shared_memory.SharedMemory(create=True, size=cls.nbytes(max_entities, slots))
+        state = cls(shm, max_entities, slots)
+        state.control[:] = 0
+        state.control[C["latest"]] = -1
+        state.headers[:, H["seq"]] = -1
+        return state
+
+    @classmethod
+    def attach(cls, name: str, max_entities: int, slots: int) -> "SharedState":
+        """Map an existing segment (simulation process)."""
+        return cls(shared_memory.SharedMemory(name=name), max_entities, slots)
+
+    def publish(self, game: Any, seq: int, run: int, tick: int, tick_ms: float) -> int:
+        """Write a game's drawable state into the slot for seq.
+
+        Returns:
+            Number of entities written (extra entities beyond max_entities are dropped)
+        """
+        slot = seq % self.slots
+        header = self.headers[slot]
+        header[H["seq"]] = -1  # Slot is being written
+
+        records = []
+        for table in game.world.query("sprite"):
+            for entity in table.rows:
+                kind = KIND_INDEX[type(entity)]
+                if kind == POWERUP_KIND:
+                    variant = POWERUP_INDEX[entity.powerup_type]
+                    records.append(
+                        (
+                            kind,
+                            variant,
+                            entity.is_visible,
+                            entity.x,
+                            entity.y,
+                            entity.rotation_angle,
+                            entity.bob_timer,
+                        )
+                    )
+                elif kind == PROJECTILE_KIND:
+                    records.append((kind, 0, 1, entity.x, entity.y, 0.0, 0.0))
+                else:
+                    records.append((kind, 0, 1, entity.x, entity.y, entity.angle, 0.0))
+        count = min(len(records), self.max_entities)
+        self.entities[slot, :count] = records[:count]
+
+        header[H["run"]] = run
+        header[H["tick"]] = tick
+        header[H["state"]] = STATES.index(game.state)
+        header[H["count"]] = count
+        header[H["tick_ms"]] = tick_ms
+        for name in GAME_FIELDS:
+            header[H[name]] = getattr(game, name)
+        player = game.player
+        for name in PLAYER_FIELDS:
+            header[H[name]] = getattr(player, name)
+
+        header[H["seq"]] = seq
+        self.control[C["latest"]] = seq
+        return count
+
+    def read_latest(self, retries: int = 3) -> tuple[np.ndarray, np.ndarray] | None:
+        """Copy the newest complete slot.
+
+        Returns:
+            (header, entities) copies, or None if nothing consistent was published
+        """
+        for _ in range(retries):
+            seq = int(self.control[C["latest"]])
+            if seq < 0:
+                return None
+            slot = seq % self.slots
+            header = self.headers[slot].copy()
+            if header[H["seq"]] != seq:
+                continue  # Overwritten before we started
+            entities = self.entities[slot, : int(header[H["count"]])].copy()
+            if self.headers[slot, H["seq"]] == seq:
+                return header, entities
+        return None
+
+    def close(self) -> None:
+        # Drop the views before closing the mapping they point into
+        del self.control, self.headers, self.entities
+        self.shm.close()
+
+
+class SharedInputController:
+    """Controller for the simulation process: input forwarded by the window process."""
+
+    def __init__(self, state: SharedState):
+        self.state = state
+
+    def read(self, game: object) -> Controls:
+        return Controls.unpack(int(self.state.control[C["input"]]))
+
+
+def simulation_main(
+    name: str, max_entities: int, slots: int, tick_rate: int, leaderboard: str | None = None
+) -> None:
+    """Simulation process entry point: fixed-rate updates published to shared memory.
+
+    A new run starts whenever the window process bumps the control "run" counter.
+    Ticks pause while "paused" is set or the run is over, and the loop ends on "stop".
+    Runs end here, so this process records them in the leaderboard file (if given).
+    """
+    # Headless: no window, no audio device, never nest another server or render thread
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["GAME_SIM_PROCESS"] = "0"
+    os.environ["GAME_RENDER_THREAD"] = "0"
+    from game import Game
+
+    state = SharedState.attach(name, max_entities, slots)
+    game = Game()
+    game.LEADERBOARD_FILE = None if leaderboard is None else Path(leaderboard)
+    game.open_leaderboard()
+    game.controller = SharedInputController(state)
+    control = state.control
+
+    dt = 1.0 / tick_rate
+    run = 0
+    seq = 0
+    tick = 0
+    next_tick = time.perf_counter()
+    try:
+        while not control[C["stop"]]:
+            if control[C["run"]] != run:
+                run = int(control[C["run"]])
+                game.start_new_game()
+                game.state = GameState.PLAYING
+                tick = 0
+                state.publish(game, seq, run, tick, 0.0)
+                seq += 1
+
+            if game.state == GameState.PLAYING and not control[C["paused"]]:
+                start = time.perf_counter()
+                game.update(dt)
+                tick += 1
+                state.publish(game, seq, run, tick, (time.perf_counter() - start) * 1000)
+                seq += 1
+
+            # Fixed rate; after a long stall, resume from now instead of bursting
+            next_tick += dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -0.25:
+                next_tick = time.perf_counter()
+    finally:
+        if game.leaderboard is not None:
+            game.leaderboard.close()
+        if game.telemetry is not None:
+            game.telemetry.close()
+        state.close()
+
+
+class StateMirror:
+    """Copies published ticks into a local Game that only renders."""
+
+    def __init__(self) -> None:
+        self.applied = 0
+        self.tick_ms = 0.0  # Simulation time of the last applied tick
+
+        # Reused entity objects per kind (filled from rows, never constructed per frame)
+        self._pools: dict[type, list] = {cls: [] for cls in KINDS}
+
+    def apply(self, header: np.ndarray, rows: np.ndarray, game: Any) -> None:
+        """Copy one published tick into the local game."""
+        for name in GAME_FIELDS:
+            setattr(game, name, type(getattr(game, name))(header[H[name]]))
+        player = game.player
+        for name in PLAYER_FIELDS:
+            setattr(player, name, type(getattr(player, name))(header[H[name]]))
+        self.tick_ms = float(header[H["tick_ms"]])
+
+        game.world.clear()
+        used = dict.fromkeys(KINDS, 0)
+        for kind, variant, visible, x, y, angle, aux in rows.tolist():
+            cls = KINDS[kind]
+            pool = self._pools[cls]
+            index = used[cls]
+            used[cls] += 1
+            if index == len(pool):
+                pool.append(object.__new__(cls))
+            entity = pool[index]
+            entity.x = x
+            entity.y = y
+            if cls is Powerup:
+                entity.powerup_type = POWERUP_TYPES[variant]
+                entity.is_visible = bool(visible)
+                entity.rotation_angle = angle
+                entity.bob_timer = aux
+            elif cls is Projectile:
+                entity.prev_x = x
+                entity.prev_y = y
+                entity.age = 0.0
+                entity.alive = True
+            else:
+                entity.angle = angle
+            game.world.spawn(entity)
+
+        state = STATES[int(header[H["state"]])]
+        if state == GameState.GAME_OVER:
+            game.state = GameState.GAME_OVER
+        self.applied += 1
+
+
+class SimulationClient:
+    """Window-process side: starts the simulation process and mirrors its state.
+
+    sync() copies the newest published tick into a local Game (player, entities,
+    score, wave, state), which then renders with its normal render systems.
+    """
+
+    def __init__(self, config: GameConfig, leaderboard: Path | None = None):
+        """Allocate shared memory and start the simulation process.
+
+        Args:
+            config: Tick rate and ring layout (sim_tick_rate, sim_max_entities, sim_ring_slots)
+            leaderboard: Database the simulation process records finished runs in
+        """
+        self.state = SharedState.create(config.sim_max_entities, config.sim_ring_slots)
+        self.run = 0
+        self.last_seq = -1
+        self.mirror = StateMirror()
+
+        context = multiprocessing.get_context("spawn")  # Fresh interpreter, no pygame state
+        self.process = context.Process(
+            target=simulation_main,
+            args=(
+                self.state.shm.name,
+                config.sim_max_entities,
+                config.sim_ring_slots,
+                config.sim_tick_rate,
+                None if leaderboard is None else str(leaderboard),
+            ),
+            name="simulation",
+            daemon=True,
+        )
+        self.process.start()
+        logger.info(
+            "Simulation process %s started (%d Hz, %d bytes shared)",
+            self.process.pid,
+            config.sim_tick_rate,
+            self.state.shm.size,
+        )
+
+    def restart(self) -> None:
+        """Start a new run in the simulation process."""
+        self.run += 1
+        self.state.control[C["run"]] = self.run
+
+    def set_paused(self, paused: bool) -> None:
+        self.state.control[C["paused"]] = int(paused)
+
+    def send_input(self, controls: Controls) -> None:
+        self.state.control[C["input"]] = controls.pack()
+
+    def sync(self, game: Any) -> bool:
+        """Forward this frame's input, then apply the newest tick of the current run.
+
+        Args:
+            game: Local Game that renders the mirrored state
+
+        Returns:
+            True if a new tick was applied
+        """
+        self.send_input(game.controller.read(game))
+
+        latest = self.state.read_latest()
+        if latest is None:
+            return False
+        header, rows = latest
+        seq = int(header[H["seq"]])
+        if seq == self.last_seq or int(header[H["run"]]) != self.run:
+            return False  # Nothing new, or a tick from a previous run
+        self.last_seq = seq
+        self.mirror.apply(header, rows, game)
+        return True
+
+    def stop(self) -> None:
+        """Stop the simulation process and release the shared segment."""
+        self.state.control[C["stop"]] = 1
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.state.close()
+        self.state.shm.unlink()
+        logger.info("Simulation process stopped after %d applied ticks", self.mirror.applied)
@@ -2,112 +2,310 @@
 Sound effects system for Zombie Survival game.
 Handles loading and playing retro/8-bit sound effects from Kenney audio assets.
 
+play_sound() only queues a trigger. Once per frame, flush_sounds() hands the
+queued triggers to the VoiceManager, which coalesces repeats, applies per-sound
+throttling and plays them on reserved channel groups (stealing low-priority
+voices so critical cues stay audible).
+
 Usage:
-    from sound import init_sounds, play_sound
+    from sound import flush_sounds, init_sounds, play_sound
 
     # In Game.__init__():
     init_sounds()
 
     # When event occurs:
     play_sound("fire")
+
+    # Once per frame:
+    flush_sounds()
 """
 
 import os
+import time
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
 import pygame
 
-from config import sound_config
+from config import SoundConfig, sound_config
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Settings for sounds missing from SoundConfig.voices
+DEFAULT_VOICE = {"group": "combat", "priority": 0, "max_instances": 1, "retrigger": 0.0}
+
+
+class VoiceManager:
+    """Allocates mixer channels to sound triggers.
+
+    Each category owns a reserved block of channels. Triggers are queued and
+    resolved once per frame in priority order:
+
+    - Repeats of a sound within a frame are coalesced into one voice
+    - A sound is skipped if it started less than ``retrigger`` seconds ago or
+      already has ``max_instances`` voices playing
+    - When its group is full, a sound steals the lowest-priority (then oldest)
+      voice of lower or equal priority in its group; sounds at or above
+      ``steal_priority`` may also steal lower-priority voices from other groups
+    """
+
+    def __init__(self, channels: Sequence[Any], config: SoundConfig = sound_config):
+        """Split channels into category groups.
+
+        Args:
+            channels: Mixer channels (pygame.mixer.Channel or compatible)
+            config: Sound settings (channel_groups, voices, steal_priority)
+        """
+        self.config = config
+        self.channels = list(channels)
+        self.groups: dict[str, list[int]] = {}
+        index = 0
+        for group, size in config.channel_groups.items():
+            self.groups[group] = list(range(index, min(index + size, len(self.channels))))
+            index += size
+
+        # Per-channel voice: (sound name, priority, start time) or None
+        self._voices: list[tuple[str, int, float] | None] = [None] * len(self.channels)
+        self._last_start: dict[str, float] = {}
+        self._pending: dict[str, int] = {}
+
+        # Stats
+        self.played = 0
+        self.coalesced = 0  # Extra triggers merged into an existing request
+        self.throttled = 0  # Skipped by retrigger interval or instance cap
+        self.stolen = 0  # Voices cut off for a higher-priority sound
+        self.dropped = 0  # No channel available
+
+    def _settings(self, name: str) -> dict:
+        settings: dict = self.config.voices.get(name, DEFAULT_VOICE)
+        return settings
+
+    def trigger(self, name: str) -> None:
+        """Queue a sound for the next flush (repeats are coalesced)."""
+        if name in self._pending:
+            self._pending[name] += 1
+            self.coalesced += 1
+        else:
+            self._pending[name] = 1
+
+    def _active(self, index: int) -> tuple[str, int, float] | None:
+        """Voice on a channel, or None once the channel has finished playing."""
+        voice = self._voices[index]
+        if voice is not None and not self.channels[index].get_busy():
+            voice = self._voices[index] = None
+        return voice
+
+    def flush(self, sounds: dict[str, Any], now: float | None = None) -> int:
+        """Play queued triggers.
+
+        Args:
+            sounds: Loaded sounds by name
+            now: Current time in seconds (defaults to time.monotonic())
+
+        Returns:
+            Number of voices started
+        """
+        if not self._pending:
+            return 0
+        if now is None:
+            now = time.monotonic()
+
+        pending = sorted(self._pending, key=lambda n: self._settings(n)["priority"], reverse=True)
+        self._pending.clear()
+
+        started = 0
+        for name in pending:
+            sound = sounds.get(name)
+            if sound is None:
+                continue
+            if self._start(name, sound, now):
+                started += 1
+        self.played += started
+        return started
+
+    def _start(self, name: str, sound: Any, now: float) -> bool:
+        settings = self._settings(name)
+        priority = settings["priority"]
+
+        # Throttle: minimum retrigger interval and concurrent instance cap
+        last = self._last_start.get(name)
+        if last is not None and now - last < settings["retrigger"]:
+            self.throttled += 1
+            return False
+        active = [self._active(i) for i in range(len(self.channels))]
+        instances = sum(1 for voice in active if voice is not None and voice[0] == name)
+        if instances >= settings["max_instances"]:
+            self.throttled += 1
+            return False
+
+        # Free channel in the sound's own group
+        group = self.groups.get(settings["group"], [])
+        index = next((i for i in group if active[i] is None), None)
+
+        # Otherwise steal: own group (<= priority), plus other groups for critical cues
+        if index is None:
+            may_cross = priority >= self.config.steal_priority
+            index = self._pick_victim(group, priority, may_cross)
+            if index is None:
+                self.dropped += 1
+                return False
+            self.channels[index].stop()
+            self.stolen += 1
+
+        self.channels[index].play(sound)
+        self._voices[index] = (name, priority, now)
+        self._last_start[name] = now
+        return True
+
+    def _pick_victim(self, group: Sequence[int], priority: int, may_cross: bool) -> int | None:
+        """Lowest-priority, then oldest, voice that may be cut for ``priority``.
+
+        Voices in ``group`` may be cut if their priority is <= ``priority``; with
+        ``may_cross``, voices in other groups may be cut if strictly lower.
+        """
+        best: int | None = None
+        best_key: tuple[int, float] | None = None
+        for i, voice in enumerate(self._voices):
+            if voice is None:
+                continue
+            _, voice_priority, start = voice
+            if i in group:
+                if voice_priority > priority:
+                    continue
+            elif not may_cross or voice_priority >= priority:
+                continue
+            key = (voice_priority, start)
+            if best_key is None or key < best_key:
+                best, best_key = i, key
+        return best
+
+    def reset(self) -> None:
+        """Forget queued triggers and voice bookkeeping (channels keep playing)."""
+        self._pending.clear()
+        self._voices = [None] * len(self.channels)
+        self._last_start.clear()
+
+
 # Module-level sound cache
 _sounds: dict[str, pygame.mixer.Sound] = {}
 _initialized: bool = False
+_voices: VoiceManager | None = None
 
 
-def init_sounds() -> None:
-    """Initialize the sound system and preload all sounds.
+# Sound file mappings: event_name -> filename
+SOUND_FILES = {
+    "fire": "fire.ogg",
+    "reload_start": "reload_start.ogg",
+    "reload_complete": "reload_complete.ogg",
+    "zombie_death": "zombie_death.ogg",
+    "player_damage": "player_damage.ogg",
+    "shield_block": "shield_block.ogg",
+    "powerup_collect": "powerup_collect.ogg",
+    "wave_start": "wave_start.ogg",
+    "wave_complete": "wave_complete.ogg",
+    "game_over": "game_over.ogg",
+}
 
-    Must be called AFTER pygame.init().
-    Gracefully handles missing files - game continues without sound.
-    """
-    global _initialized
 
+def _volume(name: str) -> float:
+    """Master volume * individual volume (from config) for a sound."""
+    return sound_config.master_volume * getattr(sound_config, f"{name}_volume", 1.0)
+
+
+def init_mixer() -> bool:
+    """Initialize pygame.mixer (falls back to the SDL dummy driver).
+
+    Returns:
+        True if the mixer is ready and sounds can be decoded
+    """
     if not sound_config.enabled:
         logger.info("Sound system disabled by config")
-        return
+        return False
 
-    if _initialized:
-        logger.debug("Sound system already initialized")
-        return
+    if pygame.mixer.get_init():
+        return True
 
-    # Initialize pygame mixer
     try:
         pygame.mixer.init()
         logger.debug("pygame.mixer initialized")
     except pygame.error as e:
         # Try dummy audio driver as fallback (for testing/headless environments)
-        logger.warning(f"Failed to initialize pygame.mixer with default driver: {e}")
+        logger.warning("Failed to initialize pygame.mixer with default driver: %s", e)
         logger.info("Trying SDL dummy audio driver for testing...")
         os.environ["SDL_AUDIODRIVER"] = "dummy"
         try:
             pygame.mixer.init()
             logger.info("pygame.mixer initialized with dummy audio driver (no sound output)")
         except pygame.error as e2:
-            logger.warning(f"Failed to initialize pygame.mixer with dummy driver: {e2}")
-            return
-
-    # Sound file mappings: event_name -> filename
-    sound_files = {
-        "fire": "fire.ogg",
-        "reload_start": "reload_start.ogg",
-        "reload_complete": "reload_complete.ogg",
-        "zombie_death": "zombie_death.ogg",
-        "player_damage": "player_damage.ogg",
-        "shield_block": "shield_block.ogg",
-        "powerup_collect": "powerup_collect.ogg",
-        "wave_start": "wave_start.ogg",
-        "wave_complete": "wave_complete.ogg",
-        "game_over": "game_over.ogg",
-    }
-
-    # Volume mappings (from config)
-    volumes = {
-        "fire": sound_config.fire_volume,
-        "reload_start": sound_config.reload_start_volume,
-        "reload_complete": sound_config.reload_complete_volume,
-        "zombie_death": sound_config.zombie_death_volume,
-        "player_damage": sound_config.player_damage_volume,
-        "shield_block": sound_config.shield_block_volume,
-        "powerup_collect": sound_config.powerup_collect_volume,
-        "wave_start": sound_config.wave_start_volume,
-        "wave_complete": sound_config.wave_complete_volume,
-        "game_over": sound_config.game_over_volume,
-    }
-
-    sounds_dir = Path(sound_config.sounds_dir)
-    loaded_count = 0
-
-    for name, filename in sound_files.items():
-        sound_path = sounds_dir / filename
-        try:
-            sound = pygame.mixer.Sound(str(sound_path))
+            logger.warning("Failed to initialize pygame.mixer with dummy driver: %s", e2)
+            return False
+    return True
+
+
+def decode_sound(name: str) -> pygame.mixer.Sound | None:
+    """Decode one sound file (safe to call from a loader thread).
+
+    Args:
+        name: Sound identifier from SOUND_FILES
+
+    Returns:
+        Decoded sound, or None if the file is missing or invalid
+    """
+    sound_path = Path(sound_config.sounds_dir) / SOUND_FILES[name]
+    try:
+        sound = pygame.mixer.Sound(str(sound_path))
+        logger.debug("Loaded sound: %s from %s", name, sound_path)
+        return sound
+    except (pygame.error, FileNotFoundError) as e:
+        logger.warning("Failed to load sound '%s' from %s: %s", name, sound_path, e)
+        return None
+
+
+def register_sounds(sounds: dict[str, pygame.mixer.Sound | None]) -> None:
+    """Install decoded sounds and set up the voice manager.
+
+    Args:
+        sounds: Sound name -> decoded sound (None entries are skipped)
+    """
+    global _initialized, _voices
+
+    for name, sound in sounds.items():
+        if sound is not None:
             # Apply master volume * individual volume
-            sound.set_volume(sound_config.master_volume * volumes.get(name, 1.0))
+            sound.set_volume(_volume(name))
             _sounds[name] = sound
-            loaded_count += 1
-            logger.debug(f"Loaded sound: {name} from {sound_path}")
-        except (pygame.error, FileNotFoundError) as e:
-            logger.warning(f"Failed to load sound '{name}' from {sound_path}: {e}")
+
+    # Reserve every channel for the voice manager (Sound.play() won't auto-pick them)
+    total_channels = sum(sound_config.channel_groups.values())
+    pygame.mixer.set_num_channels(total_channels)
+    pygame.mixer.set_reserved(total_channels)
+    _voices = VoiceManager([pygame.mixer.Channel(i) for i in range(total_channels)])
 
     _initialized = True
-    logger.info(f"Sound system initialized: {loaded_count}/{len(sound_files)} sounds loaded")
+    logger.info("Sound system initialized: %s/%s sounds loaded", len(_sounds), len(SOUND_FILES))
+
+
+def init_sounds() -> None:
+    """Initialize the sound system and preload all sounds synchronously.
+
+    Must be called AFTER pygame.init(). The game itself preloads sounds in
+    parallel (see assets.py); this is the simple blocking path.
+    Gracefully handles missing files - game continues without sound.
+    """
+    if _initialized:
+        logger.debug("Sound system already initialized")
+        return
+
+    if not init_mixer():
+        return
+
+    register_sounds({name: decode_sound(name) for name in SOUND_FILES})
 
 
 def play_sound(name: str) -> None:
-    """Play a sound effect by name.
+    """Queue a sound effect by name (played on the next flush_sounds()).
 
     Args:
         name: Sound identifier (e.g., "fire", "zombie_death")
@@ -117,16 +315,26 @@ def play_sound(name: str) -> None:
     if not sound_config.enabled:
         return
 
-    if not _initialized:
-        logger.debug(f"Sound system not initialized, skipping: {name}")
+    if not _initialized or _voices is None:
+        logger.debug("Sound system not initialized, skipping: %s", name)
         return
 
-    sound = _sounds.get(name)
-    if sound:
-        sound.play()
-        logger.debug(f"Playing sound: {name}")
+    if name in _sounds:
+        _voices.trigger(name)
     else:
-        logger.debug(f"Sound not loaded, skipping: {name}")
+        logger.debug("Sound not loaded, skipping: %s", name)
+
+
+def flush_sounds() -> None:
+    """Play this frame's queued sounds through the voice manager.
+
+    Call once per frame, after update.
+    """
+    if _voices is None:
+        return
+    started = _voices.flush(_sounds)
+    if started:
+        logger.debug("Started %d voices", started)
 
 
 def set_master_volume(volume: float) -> None:
@@ -137,25 +345,11 @@ def set_master_volume(volume: float) -> None:
     """
     sound_config.master_volume = max(0.0, min(1.0, volume))
 
-    # Volume mappings (from config)
-    volumes = {
-        "fire": sound_config.fire_volume,
-        "reload_start": sound_config.reload_start_volume,
-        "reload_complete": sound_config.reload_complete_volume,
-        "zombie_death": sound_config.zombie_death_volume,
-        "player_damage": sound_config.player_damage_volume,
-        "shield_block": sound_config.shield_block_volume,
-        "powerup_collect": sound_config.powerup_collect_volume,
-        "wave_start": sound_config.wave_start_volume,
-        "wave_complete": sound_config.wave_complete_volume,
-        "game_over": sound_config.game_over_volume,
-    }
-
     # Update all loaded sounds
     for name, sound in _sounds.items():
-        sound.set_volume(sound_config.master_volume * volumes.get(name, 1.0))
+        sound.set_volume(_volume(name))
 
-    logger.debug(f"Master volume set to: {volume}")
+    logger.debug("Master volume set to: %s", volume)
 
 
 def toggle_sound(enabled: bool | None = None) -> bool:
@@ -172,5 +366,5 @@ def toggle_sound(enabled: bool | None = None) -> bool:
     else:
         sound_config.enabled = enabled
 
-    logger.info(f"Sound {'enabled' if sound_config.enabled else 'disabled'}")
+    logger.info("Sound %s", "enabled" if sound_config.enabled else "disabled")
     return sound_config.enabled
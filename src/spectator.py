@@ -0,0 +1,617 @@
+"""
+Spectator streaming for Zombie Survival
+Streams a live game's entity state to any number of viewers over TCP. The game thread
+encodes each published frame once; an asyncio event loop on a background thread fans
+the same bytes out to every connected viewer.
+
+Serve:  GAME_SPECTATE=1 uv run python src/main.py     (or: src/spectator.py serve)
+Watch:  uv run python src/spectator.py watch 192.168.1.20[:47801]
+Bench:  uv run python src/spectator.py bench --viewers 200 --slow 20
+
+Stream (TCP, little-endian): MAGIC once, then length-prefixed frames:
+    u4 length | FRAME header | PLAYER_STATE rows | ENTITY rows   (row layouts from coop.py)
+
+Backpressure: every viewer has a single pending-frame slot. Publishing overwrites it, so
+a viewer whose socket is still draining skips straight to the newest frame instead of
+queueing old ones. publish() never waits on a viewer: it encodes, hands the bytes to the
+event loop with call_soon_threadsafe and returns, so encode cost depends on the game
+state, not on how many viewers there are or how slow they read.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import socket
+import threading
+import time
+from typing import Any
+
+import numpy as np
+import pygame
+
+from config import (
+    NetConfig,
+    fast_zombie_config,
+    game_config,
+    net_config,
+    player_config,
+    powerup_config,
+    projectile_config,
+    tank_zombie_config,
+    ui_config,
+    zombie_config,
+)
+from coop import (
+    ENTITY,
+    PLAYER_STATE,
+    STATES,
+    EntityIds,
+    capture_entities,
+    capture_players,
+    dequantize_position,
+)
+from game_state import GameState
+from logger import get_logger
+from sim_server import POWERUP_KIND, POWERUP_TYPES
+
+logger = get_logger(__name__)
+
+MAGIC = b"ZSPC\x01"  # Stream tag + format version, sent once per connection
+LENGTH = np.dtype("<u4")
+FRAME = np.dtype(
+    [
+        ("tick", "<u4"),  # Published frame number
+        ("time_ms", "<u4"),  # Server clock
+        ("state", "u1"),  # Index into STATES
+        ("wave", "<u2"),
+        ("score", "<u4"),
+        ("players", "u1"),
+        ("entities", "<u2"),
+    ]
+)
+
+# Viewer drawing: (color, radius) per sim_server.KINDS index (power-ups colored by type)
+KIND_STYLES = (
+    (zombie_config.color, zombie_config.radius),
+    (fast_zombie_config.color, fast_zombie_config.radius),
+    (tank_zombie_config.color, tank_zombie_config.radius),
+    (projectile_config.color, projectile_config.radius),
+    ((255, 255, 255), powerup_config.radius),
+)
+POWERUP_COLORS = tuple(
+    getattr(powerup_config, f"{powerup_type.name.lower()}_color") for powerup_type in POWERUP_TYPES
+)
+
+
+def encode_frame(game: Any, ids: EntityIds, tick: int, time_ms: int) -> bytes:
+    """One length-prefixed frame of the game's players and drawn entities."""
+    players = capture_players(game)
+    entities = capture_entities(game, ids)
+    header = np.zeros(1, FRAME)
+    header[0] = (
+        tick & 0xFFFFFFFF,
+        time_ms & 0xFFFFFFFF,
+        STATES.index(game.state),
+        min(0xFFFF, game.current_wave),
+        min(0xFFFFFFFF, game.score),
+        len(players),
+        len(entities),
+    )
+    size = FRAME.itemsize + players.nbytes + entities.nbytes
+    return b"".join(
+        (np.array(size, LENGTH).tobytes(), header.tobytes(), players.tobytes(), entities.tobytes())
+    )
+
+
+def decode_frame(payload: bytes) -> tuple[np.void, np.ndarray, np.ndarray]:
+    """Split a frame payload (after the length prefix) into header, players and entities.
+
+    Raises:
+        ValueError: If the payload is shorter than its header says
+    """
+    header = np.frombuffer(payload, FRAME, count=1)[0]
+    offset = FRAME.itemsize
+    players = np.frombuffer(payload, PLAYER_STATE, int(header["players"]), offset)
+    offset += players.nbytes
+    entities = np.frombuffer(payload, ENTITY, int(header["entities"]), offset)
+    return header, players, entities
+
+
+class Subscriber:
+    """One connected viewer (event loop thread only)."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.address = writer.get_extra_info("peername")
+        self.pending: bytes | None = None  # Newest frame not yet written
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0  # Frames overwritten before this viewer could take them
+        self.bytes = 0
+
+    def offer(self, frame: bytes) -> None:
+        """Make frame the next one written, replacing any frame still waiting."""
+        if self.pending is not None:
+            self.dropped += 1
+        self.pending = frame
+        self.ready.set()
+
+
+class SpectatorServer:
+    """Asyncio TCP fan-out of published frames to viewers, on a background thread."""
+
+    def __init__(
+        self,
+        port: int | None = None,
+        host: str | None = None,
+        config: NetConfig = net_config,
+    ):
+        """Start serving (port 0 picks a free port; see self.address).
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        self.config = config
+        self.subscribers: set[Subscriber] = set()  # Event loop thread only
+        self._handlers: set[asyncio.Task] = set()
+        self.viewers = 0  # Subscriber count, readable from the game thread
+        self.frames = 0  # Frames encoded (once each, whatever the viewer count)
+        self.encode_time = 0.0  # Seconds spent encoding, total
+        self._ids = EntityIds()
+        self._interval = 1.0 / config.spectator_rate
+        self._accumulator = self._interval  # Publish the first frame right away
+        self._state: GameState | None = None
+        self._start = time.perf_counter()
+        self._reported = (self._start, 0, 0.0)  # (time, frames, encode_time) at last log
+
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.address: tuple[str, int] = ("", 0)
+        self._stopping: asyncio.Event | None = None
+        self._error: OSError | None = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(
+                self._serve(
+                    config.spectator_host if host is None else host,
+                    config.spectator_port if port is None else port,
+                ),
+            ),
+            name="spectator",
+            daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait(5.0)
+        if self._error is not None:
+            raise self._error
+        logger.info("Spectator server listening on %s:%d", *self.address)
+
+    def publish(self, game: Any, delta_time: float = 0.0, force: bool = False) -> bool:
+        """Encode the game's state once and queue it for every viewer (game thread).
+
+        Frames go out at most spectator_rate times per second; nothing is encoded while
+        no one watches. Never blocks on viewers.
+
+        Args:
+            game: Game to capture
+            delta_time: Seconds since the previous call (paces the rate)
+            force: Publish now regardless of the rate (also done on state changes)
+
+        Returns:
+            True if a frame was published
+        """
+        self._accumulator += delta_time
+        if game.state != self._state:
+            force = True
+        if self.viewers == 0 or self.loop is None:
+            return False
+        if not force and self._accumulator < self._interval:
+            return False
+        self._accumulator = min(self._accumulator - self._interval, self._interval)
+        self._state = game.state
+
+        start = time.perf_counter()
+        frame = encode_frame(game, self._ids, self.frames, round((start - self._start) * 1000))
+        self.encode_time += time.perf_counter() - start
+        self.frames += 1
+        with contextlib.suppress(RuntimeError):  # Loop already closed (stopping)
+            self.loop.call_soon_threadsafe(self._fan_out, frame)
+
+        if start - self._reported[0] >= self.config.report_interval:
+            self.log_report(start)
+        return True
+
+    def report(self) -> dict:
+        """Encode totals and per-viewer delivery counts."""
+        rows = [
+            {
+                "address": subscriber.address,
+                "sent": subscriber.sent,
+                "dropped": subscriber.dropped,
+                "bytes": subscriber.bytes,
+            }
+            for subscriber in list(self.subscribers)
+        ]
+        return {
+            "viewers": len(rows),
+            "frames": self.frames,
+            "encode_ms": self.encode_time * 1000 / max(1, self.frames),
+            "subscribers": rows,
+        }
+
+    def log_report(self, now: float) -> None:
+        """Log frames, encode cost and drops since the previous report."""
+        then, frames, encode_time = self._reported
+        self._reported = (now, self.frames, self.encode_time)
+        published = self.frames - frames
+        report = self.report()
+        logger.info(
+            "Spectators: %d viewers, %.1f frames/s, %.3f ms encode, %d dropped",
+            report["viewers"],
+            published / max(1e-9, now - then),
+            (self.encode_time - encode_time) * 1000 / max(1, published),
+            sum(row["dropped"] for row in report["subscribers"]),
+        )
+
+    def close(self) -> None:
+        """Disconnect every viewer and stop the event loop thread."""
+        if self.loop is not None and self._stopping is not None:
+            with contextlib.suppress(RuntimeError):
+                self.loop.call_soon_threadsafe(self._stopping.set)
+        self._thread.join(timeout=5.0)
+
+    def _fan_out(self, frame: bytes) -> None:
+        """Offer the same frame object to every viewer (event loop thread)."""
+        for subscriber in self.subscribers:
+            subscriber.offer(frame)
+
+    async def _serve(self, host: str, port: int) -> None:
+        """Accept viewers until close()."""
+        self.loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        try:
+            server = await asyncio.start_server(self._handle, host, port)
+        except OSError as error:
+            self._error = error
+            self._ready.set()
+            return
+        self.address = server.sockets[0].getsockname()[:2]
+        self._ready.set()
+
+        await self._stopping.wait()
+        server.close()
+        for subscriber in list(self.subscribers):
+            subscriber.writer.close()  # Its handler sees EOF and returns normally
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Write each viewer's newest pending frame, one at a time, until it leaves."""
+        subscriber = Subscriber(writer)
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+        # drain() waits until the kernel took everything, so only its buffer holds backlog
+        writer.transport.set_write_buffer_limits(high=0)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.config.spectator_buffer)
+        self.subscribers.add(subscriber)
+        self.viewers = len(self.subscribers)
+        logger.info("Spectator connected from %s (%d watching)", subscriber.address, self.viewers)
+
+        # Viewers never send anything: EOF (or any data) means it left
+        left = asyncio.ensure_future(reader.read())
+        try:
+            writer.write(MAGIC)
+            while True:
+                ready = asyncio.ensure_future(subscriber.ready.wait())
+                await asyncio.wait((ready, left), return_when=asyncio.FIRST_COMPLETED)
+                if left.done():
+                    ready.cancel()
+                    break
+                subscriber.ready.clear()
+                frame, subscriber.pending = subscriber.pending, None
+                if frame is None:
+                    continue
+                writer.write(frame)
+                subscriber.sent += 1
+                subscriber.bytes += len(frame)
+                # Frames published meanwhile overwrite each other in subscriber.pending
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            left.cancel()
+            self._handlers.discard(handler)
+            self.subscribers.discard(subscriber)
+            self.viewers = len(self.subscribers)
+            writer.close()
+            logger.info(
+                "Spectator %s left (%d sent, %d dropped)",
+                subscriber.address,
+                subscriber.sent,
+                subscriber.dropped,
+            )
+
+
+def _receive(sock: socket.socket, size: int) -> bytes:
+    """Exactly size bytes from a blocking socket.
+
+    Raises:
+        ConnectionError: If the stream ends first
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Spectator stream closed")
+        data += chunk
+    return bytes(data)
+
+
+class Viewer:
+    """Minimal spectator client: a reader thread keeps the newest frame for render()."""
+
+    def __init__(self, address: tuple[str, int], timeout: float = 5.0):
+        """Connect to a spectator server.
+
+        Raises:
+            OSError: If the connection fails
+            ValueError: If the server does not speak the spectator stream
+        """
+        self.sock = socket.create_connection(address, timeout)
+        if _receive(self.sock, len(MAGIC)) != MAGIC:
+            self.sock.close()
+            raise ValueError("Not a spectator stream")
+        self.sock.settimeout(None)
+        self.latest: tuple[np.void, np.ndarray, np.ndarray] | None = None
+        self.frames = 0
+        self.connected = True
+        self._font: pygame.font.Font | None = None
+        self._thread = threading.Thread(target=self._read, name="viewer", daemon=True)
+        self._thread.start()
+
+    def _read(self) -> None:
+        """Replace self.latest with each frame as it arrives."""
+        try:
+            while True:
+                (size,) = np.frombuffer(_receive(self.sock, LENGTH.itemsize), LENGTH)
+                self.latest = decode_frame(_receive(self.sock, int(size)))
+                self.frames += 1
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.connected = False
+
+    def render(self, surface: pygame.Surface) -> None:
+        """Draw the newest frame as circles plus a one-line HUD."""
+        surface.fill((30, 30, 30))
+        if self.latest is None:
+            return
+        header, players, entities = self.latest
+
+        xs = dequantize_position(entities["x"]).round().astype(int).tolist()
+        ys = dequantize_position(entities["y"]).round().astype(int).tolist()
+        for kind, aux, x, y in zip(
+            entities["kind"].tolist(), entities["aux"].tolist(), xs, ys, strict=True
+        ):
+            color, radius = KIND_STYLES[kind]
+            if kind == POWERUP_KIND:
+                if not aux >> 7:
+                    continue  # Blinking out
+                color = POWERUP_COLORS[aux & 0x7F]
+            pygame.draw.circle(surface, color, (x, y), radius)
+
+        colors = (player_config.color, *net_config.ally_colors)
+        for slot, row in enumerate(players):
+            if row["health"] == 0:
+                continue
+            center = (
+                round(float(dequantize_position(row["x"]))),
+                round(float(dequantize_position(row["y"]))),
+            )
+            pygame.draw.circle(surface, colors[slot % len(colors)], center, player_config.radius)
+
+        if self._font is None:
+            self._font = pygame.font.Font(None, ui_config.font_size)
+        text = (
+            f"{STATES[header['state']].name}  Wave {header['wave']}  Score {header['score']}"
+            f"  Frame {header['tick']}"
+        )
+        surface.blit(self._font.render(text, True, ui_config.text_color), (10, 10))
+
+    def close(self) -> None:
+        """Disconnect and stop the reader thread."""
+        with contextlib.suppress(OSError):
+            self.sock.shutdown(socket.SHUT_RDWR)
+        self.sock.close()
+        self._thread.join(timeout=1.0)
+
+
+def watch(address: tuple[str, int]) -> None:
+    """Watch a spectator stream in a window until it ends or the window closes."""
+    pygame.init()
+    screen = pygame.display.set_mode((game_config.screen_width, game_config.screen_height))
+    pygame.display.set_caption(f"Spectating {address[0]}:{address[1]}")
+    viewer = Viewer(address)
+    clock = pygame.time.Clock()
+    try:
+        while viewer.connected:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                    event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_q)
+                ):
+                    return
+            viewer.render(screen)
+            pygame.display.flip()
+            clock.tick(60)
+    finally:
+        viewer.close()
+        pygame.quit()
+
+
+def _headless_game(policy: str) -> Any:
+    """A bot-driven Game without window or audio that never records runs."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["GAME_SIM_PROCESS"] = "0"
+    os.environ["GAME_RENDER_THREAD"] = "0"
+    from bot import make_bot
+    from game import Game
+
+    game = Game()
+    game.LEADERBOARD_FILE = None
+    game.controller = make_bot(policy)
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    return game
+
+
+def serve(port: int, policy: str = "kite", seconds: float = 0.0) -> None:
+    """Serve a headless bot game in real time (restarting on game over)."""
+    game = _headless_game(policy)
+    server = SpectatorServer(port)
+    dt = 1 / game.FPS
+    next_frame = time.perf_counter()
+    end = next_frame + seconds if seconds else float("inf")
+    try:
+        while time.perf_counter() < end:
+            if game.state != GameState.PLAYING:
+                game.start_new_game()
+                game.state = GameState.PLAYING
+            game.update(dt)
+            server.publish(game, dt)
+            next_frame += dt
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        server.close()
+        game.entity_workers.close()
+
+
+async def _bench_viewers(
+    address: tuple[str, int], viewers: int, slow: int, stop: asyncio.Event, counts: list[int]
+) -> None:
+    """Connect viewers; the last `slow` ones read one frame every 200 ms."""
+
+    async def view(index: int) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if index >= viewers - slow:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        sock.setblocking(False)
+        await asyncio.get_running_loop().sock_connect(sock, address)
+        reader, writer = await asyncio.open_connection(sock=sock)
+        await reader.readexactly(len(MAGIC))
+        try:
+            while not stop.is_set():
+                (size,) = np.frombuffer(await reader.readexactly(LENGTH.itemsize), LENGTH)
+                await reader.readexactly(int(size))
+                counts[index] += 1
+                if index >= viewers - slow:
+                    await asyncio.sleep(0.2)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(view(index) for index in range(viewers)))
+
+
+def bench(viewers: int, slow: int, seconds: float, zombies: int, policy: str = "kite") -> dict:
+    """Publish a bot game to many local viewers and measure what it costs the game thread.
+
+    Returns:
+        SpectatorServer.report() plus publish_ms (mean publish() time), max_publish_ms,
+        and per-viewer frames received (fast and slow viewers)
+    """
+    game = _headless_game(policy)
+    for _ in range(zombies):
+        game.spawn_zombie()
+    server = SpectatorServer(port=0, host="127.0.0.1")
+    counts = [0] * viewers
+    loop = asyncio.new_event_loop()
+    stop = asyncio.Event()
+    clients = threading.Thread(
+        target=loop.run_until_complete,
+        args=(_bench_viewers(server.address, viewers, slow, stop, counts),),
+        daemon=True,
+    )
+    clients.start()
+    deadline = time.perf_counter() + 10.0
+    while server.viewers < viewers and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    dt = 1 / game.FPS
+    publish_times = []
+    next_frame = time.perf_counter()
+    end = next_frame + seconds
+    try:
+        while time.perf_counter() < end:
+            if game.state == GameState.PLAYING:
+                game.update(dt)
+            start = time.perf_counter()
+            server.publish(game, dt)
+            publish_times.append(time.perf_counter() - start)
+            next_frame += dt
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        report = server.report()
+    finally:
+        loop.call_soon_threadsafe(stop.set)
+        server.close()
+        clients.join(timeout=5.0)
+        game.entity_workers.close()
+
+    report["publish_ms"] = 1000 * float(np.mean(publish_times))
+    report["max_publish_ms"] = 1000 * max(publish_times)
+    report["fast_received"] = counts[: viewers - slow]
+    report["slow_received"] = counts[viewers - slow :]
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve, watch, or benchmark a spectator stream."""
+    parser = argparse.ArgumentParser(description="Spectator streaming over TCP")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Stream a headless bot game")
+    serve_parser.add_argument("--port", type=int, default=net_config.spectator_port)
+    serve_parser.add_argument("--policy", default="kite")
+    serve_parser.add_argument("--seconds", type=float, default=0.0, help="0: until Ctrl+C")
+    watch_parser = commands.add_parser("watch", help="Watch a stream in a window")
+    watch_parser.add_argument("address", help="HOST[:PORT]")
+    bench_parser = commands.add_parser("bench", help="Many local viewers, some slow")
+    bench_parser.add_argument("--viewers", type=int, default=100)
+    bench_parser.add_argument("--slow", type=int, default=10, help="Viewers reading at 5 fps")
+    bench_parser.add_argument("--seconds", type=float, default=10.0)
+    bench_parser.add_argument("--zombies", type=int, default=100, help="Extra zombies")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        with contextlib.suppress(KeyboardInterrupt):
+            serve(args.port, args.policy, args.seconds)
+    elif args.command == "watch":
+        name, _, port = args.address.partition(":")
+        watch((name, int(port) if port else net_config.spectator_port))
+    else:
+        report = bench(args.viewers, min(args.slow, args.viewers), args.seconds, args.zombies)
+        fast = report["fast_received"] or [0]
+        slow = report["slow_received"] or [0]
+        print(f"viewers:        {report['viewers']} ({len(report['slow_received'])} slow)")
+        print(f"frames:         {report['frames']} encoded once each")
+        print(f"encode:         {report['encode_ms']:.3f} ms/frame")
+        print(
+            f"publish():      {report['publish_ms']:.3f} ms mean,"
+            f" {report['max_publish_ms']:.3f} ms max"
+        )
+        print(f"fast received:  {min(fast)}-{max(fast)} frames")
+        print(f"slow received:  {min(slow)}-{max(slow)} frames")
+        dropped = sum(row["dropped"] for row in report["subscribers"])
+        print(f"dropped:        {dropped} frames (superseded before a slow viewer took them)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Startup profiler for Zombie Survival
+Times module imports and each init step from launch until the first menu frame
+
+Profile mode: GAME_PROFILE_STARTUP=1 uv run python src/main.py
+(logs the full step report at INFO; otherwise it is logged at DEBUG)
+"""
+
+import importlib
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import ModuleType
+
+# Process-relative origin: set when this module is first imported (main.py imports it first)
+LAUNCH_TIME = time.perf_counter()
+
+
+class StartupProfiler:
+    """Records named startup steps and milestones in milliseconds."""
+
+    def __init__(self, origin: float | None = None):
+        """Create a profiler.
+
+        Args:
+            origin: perf_counter() value treated as launch (defaults to now)
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self.enabled = os.getenv("GAME_PROFILE_STARTUP", "0") == "1"
+        self.steps: list[tuple[str, float]] = []  # (step name, duration ms)
+        self.milestones: dict[str, float] = {}  # Milestone -> ms since origin
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time a block as one startup step."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, (time.perf_counter() - start) * 1000))
+
+    def import_module(self, name: str) -> ModuleType:
+        """Import a module, timing it as step "import <name>"."""
+        with self.step(f"import {name}"):
+            return importlib.import_module(name)
+
+    def mark(self, name: str) -> float:
+        """Record a milestone (first time only).
+
+        Returns:
+            Milliseconds from origin to the milestone
+        """
+        if name not in self.milestones:
+            self.milestones[name] = (time.perf_counter() - self.origin) * 1000
+        return self.milestones[name]
+
+    def report(self) -> str:
+        """Format steps (in order) and milestones."""
+        lines = [f"  {name:<24}{ms:>9.1f}ms" for name, ms in self.steps]
+        lines += [f"  @{name:<23}{ms:>9.1f}ms" for name, ms in self.milestones.items()]
+        return "Startup profile:\n" + "\n".join(lines)
@@ -0,0 +1,503 @@
+"""
+Per-run gameplay telemetry for Zombie Survival
+TelemetryRecorder appends one row per gameplay event (spawns, shots, hits, kills,
+damage, deaths, pickups, reloads, wave starts) into a preallocated NumPy structured
+array while the run plays, and writes the used rows as one compressed columnar .npz
+(one array per field, plus a RUN summary row) on a background thread when it ends.
+Recording is a single row assignment per event, a few microseconds per frame.
+
+Record: GAME_TELEMETRY=1 uv run python src/main.py       (or: src/telemetry.py record)
+Analyze: uv run python src/telemetry.py analyze [telemetry/run-*.npz ...]
+
+The analyzer concatenates any number of runs and aggregates them without Python-level
+loops over events: per-wave accuracy, damage per second dealt and taken, time-to-kill
+per zombie type (first hit to kill) and kill/death heatmaps.
+"""
+
+import argparse
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from config import TelemetryConfig, game_config, telemetry_config
+from entities.base_zombie import BaseZombie
+from logger import get_logger
+from sim_server import KIND_INDEX, KINDS, POWERUP_INDEX
+
+logger = get_logger(__name__)
+
+VERSION = 1
+
+# Event kinds
+SPAWN = 0  # Zombie spawned (variant: zombie kind)
+SHOT = 1  # Projectile fired
+HIT = 2  # Zombie hit (value: damage, aux: 1 for melee)
+KILL = 3  # Zombie killed
+DAMAGE = 4  # Player lost health (value: amount)
+DEATH = 5  # Player died
+PICKUP = 6  # Power-up collected (variant: power-up type index)
+RELOAD = 7  # Reload started
+WAVE = 8  # Wave started (value: zombies to spawn)
+EVENT_NAMES = ("spawn", "shot", "hit", "kill", "damage", "death", "pickup", "reload", "wave")
+
+EVENT = np.dtype(
+    [
+        ("time", "<f4"),  # Run seconds (RunStats.time)
+        ("kind", "u1"),
+        ("wave", "<u2"),
+        ("slot", "u1"),  # Player (index into Game.players)
+        ("target", "<u4"),  # Zombie serial within the run (0: none or unknown)
+        ("variant", "u1"),  # Zombie kind (sim_server.KINDS) or power-up type
+        ("aux", "u1"),
+        ("x", "<f4"),
+        ("y", "<f4"),
+        ("value", "<f4"),
+    ]
+)
+RUN = np.dtype(
+    [
+        ("version", "<u2"),
+        ("seed", "<u8"),
+        ("score", "<i8"),
+        ("wave", "<i4"),
+        ("duration", "<f8"),
+        ("kills", "<i4"),
+        ("shots", "<i4"),
+        ("hits", "<i4"),
+        ("width", "<u2"),
+        ("height", "<u2"),
+        ("events", "<u4"),
+    ]
+)
+COLUMNS = tuple(EVENT.names or ())  # One array per column in the file
+# Loaded events carry the index of the run they came from
+LOADED = np.dtype(EVENT.descr + [("run", "<u4")])
+ZOMBIE_KINDS = tuple(index for index, cls in enumerate(KINDS) if issubclass(cls, BaseZombie))
+
+
+class TelemetryRecorder:
+    """Append-only event rows for the current run, written when it ends."""
+
+    def __init__(
+        self, directory: Path | str | None = None, config: TelemetryConfig = telemetry_config
+    ):
+        """Preallocate the event rows.
+
+        Args:
+            directory: Output directory (defaults to config.directory)
+            config: Capacity and output settings
+        """
+        self.directory = Path(config.directory if directory is None else directory)
+        self.events = np.zeros(config.capacity, EVENT)
+        self.count = 0
+        self._targets: dict[int, int] = {}  # id(zombie) -> serial, while alive
+        self._next_target = 1
+        self._writers: list[threading.Thread] = []
+        self.last_path: Path | None = None  # File of the last finished run
+
+    def begin(self) -> None:
+        """Start a new run (unfinished rows of the previous one are discarded)."""
+        self.count = 0
+        self._targets.clear()
+        self._next_target = 1
+
+    def _append(
+        self,
+        game: Any,
+        kind: int,
+        x: float,
+        y: float,
+        slot: int = 0,
+        target: int = 0,
+        variant: int = 0,
+        aux: int = 0,
+        value: float = 0.0,
+    ) -> None:
+        """Write one row (the array doubles in the rare run that outgrows it)."""
+        if self.count == len(self.events):
+            self.events = np.concatenate((self.events, np.zeros(len(self.events), EVENT)))
+            logger.debug("Telemetry grown to %d rows", len(self.events))
+        self.events[self.count] = (
+            game.stats.time,
+            kind,
+            game.current_wave,
+            slot,
+            target,
+            variant,
+            aux,
+            x,
+            y,
+            value,
+        )
+        self.count += 1
+
+    def spawn(self, game: Any, zombie: Any) -> None:
+        """A zombie entered the run (assigns its serial)."""
+        target = self._next_target
+        self._next_target += 1
+        self._targets[id(zombie)] = target
+        self._append(
+            game, SPAWN, zombie.x, zombie.y, target=target, variant=KIND_INDEX[type(zombie)]
+        )
+
+    def shot(self, game: Any, player: Any) -> None:
+        """A player fired a projectile."""
+        self._append(game, SHOT, player.x, player.y, slot=game.players.index(player))
+
+    def hit(self, game: Any, zombie: Any, amount: float, melee: bool = False) -> None:
+        """A projectile or melee strike hit a zombie."""
+        self._append(
+            game,
+            HIT,
+            zombie.x,
+            zombie.y,
+            target=self._targets.get(id(zombie), 0),
+            variant=KIND_INDEX[type(zombie)],
+            aux=melee,
+            value=amount,
+        )
+
+    def kill(self, game: Any, zombie: Any) -> None:
+        """A zombie died (its serial is released)."""
+        self._append(
+            game,
+            KILL,
+            zombie.x,
+            zombie.y,
+            target=self._targets.pop(id(zombie), 0),
+            variant=KIND_INDEX[type(zombie)],
+        )
+
+    def damage(self, game: Any, player: Any, amount: float) -> None:
+        """A player lost health."""
+        self._append(game, DAMAGE, player.x, player.y, game.players.index(player), value=amount)
+
+    def death(self, game: Any, player: Any) -> None:
+        """A player died."""
+        self._append(game, DEATH, player.x, player.y, game.players.index(player))
+
+    def pickup(self, game: Any, player: Any, powerup: Any) -> None:
+        """A player collected a power-up."""
+        slot = game.players.index(player)
+        variant = POWERUP_INDEX[powerup.powerup_type]
+        self._append(game, PICKUP, powerup.x, powerup.y, slot, variant=variant)
+
+    def reload(self, game: Any, player: Any) -> None:
+        """A player started reloading."""
+        self._append(game, RELOAD, player.x, player.y, game.players.index(player))
+
+    def wave(self, game: Any) -> None:
+        """A wave started."""
+        self._append(game, WAVE, 0.0, 0.0, value=game.zombies_to_spawn)
+
+    def finish(self, game: Any) -> Path:
+        """Write the run on a background thread and start over.
+
+        Returns:
+            The file being written
+        """
+        events = self.events[: self.count].copy()
+        stats = game.stats
+        run = np.array(
+            [
+                (
+                    VERSION,
+                    game.seed,
+                    game.score,
+                    game.current_wave,
+                    stats.time,
+                    stats.kills,
+                    stats.shots,
+                    stats.hits,
+                    game.SCREEN_WIDTH,
+                    game.SCREEN_HEIGHT,
+                    len(events),
+                )
+            ],
+            RUN,
+        )
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = self.directory / f"run-{stamp}-{game.seed}.npz"
+        self._writers = [writer for writer in self._writers if writer.is_alive()]
+        writer = threading.Thread(target=self._write, args=(path, run, events), name="telemetry")
+        writer.start()
+        self._writers.append(writer)
+        self.last_path = path
+        self.begin()
+        return path
+
+    def _write(self, path: Path, run: np.ndarray, events: np.ndarray) -> None:
+        """One compressed array per column plus the RUN row (writer thread)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            columns: dict[str, Any] = {name: events[name] for name in COLUMNS}
+            np.savez_compressed(path, run=run, **columns)
+            logger.info("Telemetry: %d events written to %s", len(events), path)
+        except OSError as e:
+            logger.warning("Failed to write telemetry %s: %s", path, e)
+
+    def close(self) -> None:
+        """Wait for runs still being written."""
+        for writer in self._writers:
+            writer.join()
+        self._writers.clear()
+
+
+def load(paths: list[Path]) -> tuple[np.ndarray, np.ndarray]:
+    """Read telemetry files into one event array (with a run column) and their RUN rows.
+
+    Raises:
+        ValueError: If a file has another format version
+    """
+    runs = []
+    parts = []
+    for index, path in enumerate(paths):
+        with np.load(path) as data:
+            run = data["run"]
+            if int(run["version"][0]) != VERSION:
+                raise ValueError(f"{path}: telemetry version {run['version'][0]} (need {VERSION})")
+            part = np.zeros(int(run["events"][0]), LOADED)
+            for name in COLUMNS:
+                part[name] = data[name]
+        part["run"] = index
+        runs.append(run)
+        parts.append(part)
+    if not runs:
+        return np.zeros(0, LOADED), np.zeros(0, RUN)
+    return np.concatenate(parts), np.concatenate(runs)
+
+
+def wave_stats(events: np.ndarray, runs: np.ndarray) -> np.ndarray:
+    """Per-wave totals over all runs.
+
+    Returns:
+        One row per wave reached: wave, runs (that reached it), seconds played, shots,
+        hits (projectiles), accuracy, damage dealt, dps (dealt), taken_dps, kills
+    """
+    kind = events["kind"]
+    wave = events["wave"].astype(np.intp)
+    size = int(wave.max()) + 1 if len(wave) else 1
+
+    # Wave durations: from each WAVE event to the next one in the same run, or its end
+    starts = events[kind == WAVE]
+    begin = starts["time"].astype(np.float64)
+    end = np.empty_like(begin)
+    if len(begin):
+        end[:-1] = begin[1:]
+        last = np.append(starts["run"][1:] != starts["run"][:-1], True)
+        end[last] = runs["duration"][starts["run"][last]]
+    seconds = np.bincount(starts["wave"], weights=end - begin, minlength=size)
+    reached = np.bincount(starts["wave"], minlength=size)
+
+    def per_wave(mask: np.ndarray, weights: np.ndarray | None = None) -> np.ndarray:
+        return np.bincount(wave[mask], weights=weights, minlength=size)[:size]
+
+    hits = kind == HIT
+    shots = per_wave(kind == SHOT)
+    projectile_hits = per_wave(hits & (events["aux"] == 0))
+    damage = per_wave(hits, events["value"][hits])
+    taken_mask = kind == DAMAGE
+    taken = per_wave(taken_mask, events["value"][taken_mask])
+    kills = per_wave(kind == KILL)
+
+    table = np.zeros(
+        size,
+        [
+            ("wave", "<i4"),
+            ("runs", "<i4"),
+            ("seconds", "<f8"),
+            ("shots", "<i4"),
+            ("hits", "<i4"),
+            ("accuracy", "<f8"),
+            ("damage", "<f8"),
+            ("dps", "<f8"),
+            ("taken_dps", "<f8"),
+            ("kills", "<i4"),
+        ],
+    )
+    table["wave"] = np.arange(size)
+    table["runs"] = reached[:size]
+    table["seconds"] = seconds[:size]
+    table["shots"] = shots
+    table["hits"] = projectile_hits
+    table["damage"] = damage
+    table["kills"] = kills
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table["accuracy"] = np.where(shots > 0, projectile_hits / shots, np.nan)
+        table["dps"] = np.where(table["seconds"] > 0, damage / table["seconds"], np.nan)
+        table["taken_dps"] = np.where(table["seconds"] > 0, taken / table["seconds"], np.nan)
+    reached_rows: np.ndarray = table[table["runs"] > 0]
+    return reached_rows
+
+
+def _first_times(events: np.ndarray, keys: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+    """Time of the first event with each wanted key (NaN where there is none)."""
+    unique, first = np.unique(keys, return_index=True)
+    if not len(unique):
+        return np.full(len(wanted), np.nan)
+    position = np.minimum(np.searchsorted(unique, wanted), len(unique) - 1)
+    found = unique[position] == wanted
+    return np.where(found, events["time"][first[position]], np.nan)
+
+
+def time_to_kill(events: np.ndarray) -> list[dict]:
+    """Kill timing per zombie kind over all runs.
+
+    Returns:
+        One dict per zombie kind with kills: kind (name), kills, ttk_mean and ttk_median
+        (first hit to kill, seconds), alive_mean (spawn to kill, seconds)
+    """
+
+    def keys(rows: np.ndarray) -> np.ndarray:
+        key: np.ndarray = (rows["run"].astype(np.int64) << 32) | rows["target"]
+        return key
+
+    tracked = events["target"] > 0
+    kills = events[(events["kind"] == KILL) & tracked]
+    hits = events[(events["kind"] == HIT) & tracked]
+    spawns = events[(events["kind"] == SPAWN) & tracked]
+    kill_keys = keys(kills)
+    kill_times = kills["time"].astype(np.float64)
+    ttk = kill_times - _first_times(hits, keys(hits), kill_keys)
+    alive = kill_times - _first_times(spawns, keys(spawns), kill_keys)
+
+    rows = []
+    for kind in ZOMBIE_KINDS:
+        mask = kills["variant"] == kind
+        if not mask.any():
+            continue
+        kind_ttk = ttk[mask][~np.isnan(ttk[mask])]
+        kind_alive = alive[mask][~np.isnan(alive[mask])]
+        rows.append(
+            {
+                "kind": KINDS[kind].__name__,
+                "kills": int(mask.sum()),
+                "ttk_mean": float(kind_ttk.mean()) if len(kind_ttk) else float("nan"),
+                "ttk_median": float(np.median(kind_ttk)) if len(kind_ttk) else float("nan"),
+                "alive_mean": float(kind_alive.mean()) if len(kind_alive) else float("nan"),
+            }
+        )
+    return rows
+
+
+def heatmap(events: np.ndarray, kind: int, width: int, height: int, cell: int) -> np.ndarray:
+    """Event counts per cell (rows = y) of one event kind over a width x height field."""
+    rows = events[events["kind"] == kind]
+    counts, _, _ = np.histogram2d(
+        rows["y"],
+        rows["x"],
+        bins=(max(1, -(-height // cell)), max(1, -(-width // cell))),
+        range=((0, height), (0, width)),
+    )
+    grid: np.ndarray = counts.astype(np.int64)
+    return grid
+
+
+def render_heatmap(counts: np.ndarray) -> str:
+    """Counts as text, one character per cell (blank to dense)."""
+    shades = np.array(list(" .:-=+*#%@"))
+    peak = counts.max() if counts.size else 0
+    if peak == 0:
+        return "\n".join(" " * counts.shape[1] for _ in range(counts.shape[0]))
+    levels = np.ceil(counts / peak * (len(shades) - 1)).astype(np.intp)
+    return "\n".join("".join(row) for row in shades[levels])
+
+
+def record_runs(
+    runs: int, policy: str, directory: Path, max_minutes: float, dt: float = 1 / 60
+) -> list[Path]:
+    """Play headless bot runs with telemetry on (a run still alive at max_minutes ends there).
+
+    Returns:
+        The written files
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["GAME_SIM_PROCESS"] = "0"
+    os.environ["GAME_RENDER_THREAD"] = "0"
+    from bot import make_bot
+    from game import Game
+    from game_state import GameState
+
+    game = Game()
+    game.LEADERBOARD_FILE = None
+    recorder = TelemetryRecorder(directory)
+    game.telemetry = recorder
+    game.controller = make_bot(policy)
+    paths: list[Path | None] = []
+    try:
+        for _ in range(runs):
+            game.start_new_game()
+            game.state = GameState.PLAYING
+            while game.state == GameState.PLAYING and game.stats.time < max_minutes * 60:
+                game.update(dt)
+            if game.state == GameState.PLAYING:
+                paths.append(recorder.finish(game))
+            else:
+                paths.append(recorder.last_path)
+    finally:
+        recorder.close()
+        game.entity_workers.close()
+    return [path for path in paths if path is not None]
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Record bot runs or analyze telemetry files."""
+    parser = argparse.ArgumentParser(description="Per-run gameplay telemetry")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="Play headless bot runs with telemetry on")
+    record.add_argument("--runs", type=int, default=3)
+    record.add_argument("--policy", default="kite")
+    record.add_argument("--max-minutes", type=float, default=10.0)
+    record.add_argument("--dir", type=Path, default=Path(telemetry_config.directory))
+    analyze = commands.add_parser("analyze", help="Aggregate telemetry files")
+    analyze.add_argument("paths", nargs="*", type=Path, help="Files (default: all in --dir)")
+    analyze.add_argument("--dir", type=Path, default=Path(telemetry_config.directory))
+    analyze.add_argument("--cell", type=int, default=telemetry_config.heatmap_cell)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        for path in record_runs(args.runs, args.policy, args.dir, args.max_minutes):
+            print(path)
+        return
+
+    paths = args.paths or sorted(args.dir.glob("run-*.npz"))
+    events, runs = load(paths)
+    print(f"{len(runs)} runs, {len(events)} events")
+    if not len(runs):
+        return
+
+    print(
+        f"\n{'wave':>4} {'runs':>5} {'secs':>7} {'shots':>6} {'acc':>6} {'dps':>7} {'taken/s':>8}"
+    )
+    for row in wave_stats(events, runs):
+        print(
+            f"{row['wave']:>4} {row['runs']:>5} {row['seconds']:>7.1f} {row['shots']:>6}"
+            f" {row['accuracy']:>6.1%} {row['dps']:>7.1f} {row['taken_dps']:>8.2f}"
+        )
+
+    print(f"\n{'zombie':>11} {'kills':>6} {'ttk':>7} {'median':>7} {'alive':>7}")
+    for row in time_to_kill(events):
+        print(
+            f"{row['kind']:>11} {row['kills']:>6} {row['ttk_mean']:>6.2f}s"
+            f" {row['ttk_median']:>6.2f}s {row['alive_mean']:>6.1f}s"
+        )
+
+    width = int(runs["width"].max()) or game_config.screen_width
+    height = int(runs["height"].max()) or game_config.screen_height
+    for title, kind in (("Kills", KILL), ("Deaths", DEATH)):
+        counts = heatmap(events, kind, width, height, args.cell)
+        print(f"\n{title} ({counts.sum()}, {args.cell}px cells)")
+        border = "+" + "-" * counts.shape[1] + "+"
+        print(border)
+        for line in render_heatmap(counts).splitlines():
+            print(f"|{line}|")
+        print(border)
+
+
+if __name__ == "__main__":
+    main()
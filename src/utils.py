@@ -1,11 +1,19 @@
 """Utility functions for the Zombie Survival game."""
 
+from pathlib import Path
+
 import pygame
 
+from config import game_config
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared sprite caches: one surface per (path, size), one rotation per quantized angle.
+# Entities reference these instead of keeping per-instance copies.
+_sprite_cache: dict[tuple[str, int], pygame.Surface | None] = {}
+_rotation_cache: dict[tuple[str, int, float], pygame.Surface] = {}
+
 
 def load_sprite(path: str, size: int) -> pygame.Surface | None:
     """Load and scale a sprite image with error handling.
@@ -20,8 +28,113 @@ def load_sprite(path: str, size: int) -> pygame.Surface | None:
     try:
         sprite = pygame.image.load(path).convert_alpha()
         scaled = pygame.transform.scale(sprite, (int(size), int(size)))
-        logger.debug(f"Loaded sprite: {path}")
+        logger.debug("Loaded sprite: %s", path)
         return scaled
     except (pygame.error, FileNotFoundError):
-        logger.warning(f"Sprite not found: {path}, using fallback")
+        logger.warning("Sprite not found: %s, using fallback", path)
+        return None
+
+
+def get_sprite(path: str, size: int) -> pygame.Surface | None:
+    """Get a shared, scaled sprite (loaded once per path and size).
+
+    Missing files are cached as None. Load failures caused by pygame state
+    (e.g. no display yet) are not cached, so a later call can still succeed.
+
+    Args:
+        path: Path to the sprite image file
+        size: Target size (width and height) for the sprite
+
+    Returns:
+        Shared pygame Surface, or None if unavailable
+    """
+    key = (path, int(size))
+    if key in _sprite_cache:
+        return _sprite_cache[key]
+
+    # New size of a cached sprite (dynamic render scale): rescale the largest copy
+    # instead of decoding the file again
+    cached = [s for (p, _), s in _sprite_cache.items() if p == path and s is not None]
+    if cached:
+        source = max(cached, key=lambda s: s.get_width())
+        rescaled = pygame.transform.smoothscale(source, (int(size), int(size)))
+        _sprite_cache[key] = rescaled
+        return rescaled
+
+    if not Path(path).exists():
+        logger.warning("Sprite not found: %s, using fallback", path)
+        _sprite_cache[key] = None
         return None
+
+    if pygame.display.get_surface() is None:
+        return None  # convert_alpha() needs a display; retry once one exists
+
+    sprite = load_sprite(path, size)
+    if sprite is not None:
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def cache_sprite(
+    path: str, size: int, image: pygame.Surface | None, prepared: bool = False
+) -> pygame.Surface | None:
+    """Convert, scale and cache an already-decoded sprite (see assets.py preloading).
+
+    Requires a display surface (convert_alpha). None marks the sprite as missing.
+
+    Args:
+        path: Path the image was decoded from (cache key)
+        size: Target size (width and height) for the sprite
+        image: Decoded image, or None if it could not be loaded
+        prepared: Image is already scaled and in display format (asset pack)
+
+    Returns:
+        Cached sprite, or None
+    """
+    key = (path, int(size))
+    if image is not None and not prepared:
+        image = pygame.transform.scale(image.convert_alpha(), (int(size), int(size)))
+    _sprite_cache[key] = image
+    return image
+
+
+def get_rotated_sprite(
+    path: str, size: int, angle: float, step: float | None = None
+) -> pygame.Surface | None:
+    """Get a shared rotated sprite, quantized to the rotation cache step.
+
+    Args:
+        path: Path to the sprite image file
+        size: Target size (width and height) for the sprite
+        angle: Rotation in degrees (counter-clockwise, pygame convention)
+        step: Degrees between cached rotations (defaults to GameConfig.rotation_cache_step)
+
+    Returns:
+        Rotated shared Surface, or None if the sprite is unavailable
+    """
+    if step is None:
+        step = game_config.rotation_cache_step
+    quantized = (round(angle / step) * step) % 360
+    key = (path, int(size), quantized)
+    rotated = _rotation_cache.get(key)
+    if rotated is None:
+        sprite = get_sprite(path, size)
+        if sprite is None:
+            return None
+        # Rotate from the original (avoid degradation)
+        rotated = pygame.transform.rotate(sprite, quantized)
+        _rotation_cache[key] = rotated
+    return rotated
+
+
+def sprite_cache_bytes() -> int:
+    """Estimate pixel memory held by the shared sprite and rotation caches."""
+    surfaces = [s for s in _sprite_cache.values() if s is not None]
+    surfaces.extend(_rotation_cache.values())
+    return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces)
+
+
+def clear_sprite_cache() -> None:
+    """Drop all shared sprites and rotations (e.g. after the display changes)."""
+    _sprite_cache.clear()
+    _rotation_cache.clear()
@@ -0,0 +1,290 @@
+"""
+Chunked entity updates for Zombie Survival, parallel on free-threaded CPython
+Zombies are partitioned into spatial chunks (vertical strips) that are updated and
+collision-tested independently, then results are merged in table order, so output is
+identical to a serial pass whatever the worker count or scheduling.
+
+Threads only pay off without a GIL (3.13t+ free-threaded builds). On GIL builds the
+same chunks run inline on the calling thread.
+
+Benchmark: uv run python src/workers.py
+Custom run: uv run python src/workers.py --zombies 4000 --workers 1 2 4 8 --force-threads
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def free_threaded() -> bool:
+    """True when running on a free-threaded build with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class SpatialGrid:
+    """Uniform grid bucketing entities by cell for neighborhood queries.
+
+    Each bucket keeps (order, entity) pairs so callers can pick the first match in
+    the original iteration order. Built once per frame, then read-only (thread-safe).
+    """
+
+    def __init__(self, cell_size: float):
+        """Create an empty grid.
+
+        Args:
+            cell_size: Cell width and height in pixels (about the largest query diameter)
+        """
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[tuple[int, Any]]] = {}
+        self.max_radius = 0.0  # Largest entity radius inserted since the last build
+
+    def build(self, entities: Sequence[Any]) -> None:
+        """Rebuild the grid from entities with x, y and radius (order = index)."""
+        cells: dict[tuple[int, int], list[tuple[int, Any]]] = {}
+        size = self.cell_size
+        max_radius = 0.0
+        for order, entity in enumerate(entities):
+            key = (int(entity.x // size), int(entity.y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(order, entity)]
+            else:
+                bucket.append((order, entity))
+            max_radius = max(max_radius, entity.radius)
+        self.cells = cells
+        self.max_radius = max_radius
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> list[tuple[int, Any]]:
+        """Entities whose cells overlap a bounding box (padded by the largest radius).
+
+        Returns:
+            (order, entity) pairs, unsorted
+        """
+        size = self.cell_size
+        pad = self.max_radius
+        cells = self.cells
+        found: list[tuple[int, Any]] = []
+        for cx in range(int((x0 - pad) // size), int((x1 + pad) // size) + 1):
+            for cy in range(int((y0 - pad) // size), int((y1 + pad) // size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
+class ChunkedUpdater:
+    """Runs per-entity work in spatial chunks on a thread pool (or inline).
+
+    Every chunk only mutates its own entities and returns results tagged with the
+    entity's index, so merging by index reproduces the serial order exactly.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        world_width: float = 800,
+        cell_size: float = 64.0,
+        force_threads: bool = False,
+    ):
+        """Create the updater.
+
+        Args:
+            workers: Worker threads (1 = serial)
+            world_width: Width split into chunk strips
+            cell_size: Spatial grid cell size for collision queries
+            force_threads: Use threads even with the GIL (benchmarking only)
+        """
+        self.workers = max(1, workers)
+        self.parallel = self.workers > 1 and (force_threads or free_threaded())
+        self.chunk_count = self.workers * 2 if self.parallel else 1  # Slack for uneven strips
+        self.world_width = world_width
+        self.grid = SpatialGrid(cell_size)
+        self._executor: ThreadPoolExecutor | None = None
+        if self.parallel:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="entity-worker"
+            )
+        elif self.workers > 1:
+            logger.info("GIL enabled: running %d-worker entity updates serially", self.workers)
+
+    def chunks(self, entities: Sequence[Any]) -> list[list[tuple[int, Any]]]:
+        """Split entities into vertical strips of (index, entity) pairs."""
+        count = self.chunk_count
+        if count == 1:
+            return [list(enumerate(entities))]
+        strip = self.world_width / count
+        strips: list[list[tuple[int, Any]]] = [[] for _ in range(count)]
+        for index, entity in enumerate(entities):
+            strips[min(count - 1, max(0, int(entity.x // strip)))].append((index, entity))
+        return [chunk for chunk in strips if chunk]
+
+    def _map(self, fn: Callable[[list], list], chunks: list[list]) -> list:
+        """Run fn per chunk and concatenate the results (chunk order)."""
+        if self._executor is None or len(chunks) == 1:
+            results = [fn(chunk) for chunk in chunks]
+        else:
+            results = list(self._executor.map(fn, chunks))
+        return [item for result in results for item in result]
+
+    def update_chasers(
+        self,
+        zombies: Sequence[Any],
+        delta_time: float,
+        player_x: float,
+        player_y: float,
+        others: Sequence[tuple[float, float]] = (),
+    ) -> None:
+        """Steer every zombie toward the player (independent per zombie).
+
+        Args:
+            others: Further (x, y) targets (co-op players); each zombie chases the nearest
+        """
+
+        def run(chunk: list[tuple[int, Any]]) -> list:
+            if not others:
+                for _, zombie in chunk:
+                    zombie.update(delta_time, player_x, player_y)
+                return []
+            for _, zombie in chunk:
+                x, y = zombie.x, zombie.y
+                target_x, target_y = player_x, player_y
+                best = (player_x - x) ** 2 + (player_y - y) ** 2
+                for other_x, other_y in others:
+                    distance = (other_x - x) ** 2 + (other_y - y) ** 2
+                    if distance < best:
+                        target_x, target_y, best = other_x, other_y, distance
+                zombie.update(delta_time, target_x, target_y)
+            return []
+
+        self._map(run, self.chunks(zombies))
+
+    def find_hits(self, projectiles: Sequence[Any], zombies: Sequence[Any]) -> list[tuple]:
+        """Find the zombies each live projectile's move this frame touched, first contact first.
+
+        Moves are swept (segment vs circle), so candidates come from the grid cells
+        along the whole segment; ties go to the earlier zombie in table order.
+
+        Returns:
+            (projectile, zombies) pairs in projectile order, for projectiles that touched any
+        """
+        self.grid.build(zombies)
+        grid = self.grid
+
+        def run(chunk: list[tuple[int, Any]]) -> list:
+            hits = []
+            for index, projectile in chunk:
+                if not projectile.alive:
+                    continue  # Already hit (one that expired this frame still sweeps its move)
+                x0, x1 = sorted((projectile.prev_x, projectile.x))
+                y0, y1 = sorted((projectile.prev_y, projectile.y))
+                r = projectile.radius
+                touched = []
+                for order, zombie in grid.query(x0 - r, y0 - r, x1 + r, y1 + r):
+                    t = projectile.sweep(zombie.x, zombie.y, zombie.radius)
+                    if t is not None:
+                        touched.append((t, order, zombie))
+                if touched:
+                    touched.sort(key=lambda hit: hit[:2])
+                    hits.append((index, projectile, [zombie for _, _, zombie in touched]))
+            return hits
+
+        merged = self._map(run, self.chunks(projectiles))
+        merged.sort(key=_order)
+        return [(projectile, zombies) for _, projectile, zombies in merged]
+
+    def find_contacts(self, zombies: Sequence[Any], player: Any) -> list:
+        """Find zombies touching the player and push them out to the contact boundary.
+
+        Returns:
+            Touching zombies in table order
+        """
+        px, py, player_radius = player.x, player.y, player.radius
+
+        def run(chunk: list[tuple[int, Any]]) -> list:
+            contacts = []
+            for index, zombie in chunk:
+                dx = zombie.x - px
+                dy = zombie.y - py
+                distance = math.hypot(dx, dy)
+                collision_dist = player_radius + zombie.radius
+                if distance >= collision_dist:
+                    continue
+                if distance > 0:  # Avoid division by zero
+                    zombie.x = px + dx / distance * collision_dist
+                    zombie.y = py + dy / distance * collision_dist
+                contacts.append((index, zombie))
+            return contacts
+
+        merged = self._map(run, self.chunks(zombies))
+        merged.sort(key=_order)
+        return [zombie for _, zombie in merged]
+
+    def close(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _order(item: tuple) -> int:
+    return int(item[0])
+
+
+def benchmark(zombie_count: int, frames: int, worker_counts: list[int], force: bool) -> str:
+    """Time chase updates plus contact tests for each worker count.
+
+    Returns:
+        Report table (ms per frame and speedup over 1 worker)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from entities.zombie import Zombie
+
+    lines = [
+        f"{zombie_count} zombies, {frames} frames, "
+        f"{'free-threaded' if free_threaded() else 'GIL build'}",
+        f"{'workers':>8} {'ms/frame':>10} {'speedup':>8} {'mode':>9}",
+    ]
+    baseline = None
+    player = type("Target", (), {"x": 400.0, "y": 300.0, "radius": 15})()
+    for workers in worker_counts:
+        rng = random.Random(1)
+        zombies = [Zombie(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(zombie_count)]
+        updater = ChunkedUpdater(workers, force_threads=force)
+        start = time.perf_counter()
+        for _ in range(frames):
+            updater.update_chasers(zombies, 1 / 60, player.x, player.y)
+            updater.find_contacts(zombies, player)
+        ms = (time.perf_counter() - start) * 1000 / frames
+        updater.close()
+        baseline = baseline or ms
+        mode = "threads" if updater.parallel else "serial"
+        lines.append(f"{workers:>8} {ms:>10.3f} {baseline / ms:>7.2f}x {mode:>9}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the worker scaling benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark chunked zombie updates")
+    parser.add_argument("--zombies", type=int, default=2000, help="Zombie population")
+    parser.add_argument("--frames", type=int, default=100, help="Frames per measurement")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--force-threads", action="store_true", help="Use threads even on GIL builds"
+    )
+    args = parser.parse_args(argv)
+    print(benchmark(args.zombies, args.frames, args.workers, args.force_threads))
+
+
+if __name__ == "__main__":
+    main()
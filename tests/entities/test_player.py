@@ -37,3 +37,8 @@ class TestPlayer:
         player.attack()
         assert player.is_attacking is True
         assert player.attack_cooldown > 0
+
+    def test_player_is_slotted(self):
+        """Test player keeps no per-instance __dict__"""
+        player = Player(400, 300, 800, 600)
+        assert not hasattr(player, "__dict__")
@@ -0,0 +1,52 @@
+"""Tests for projectile entity (src/entities/projectile.py)"""
+
+import pytest
+
+from entities.projectile import Projectile
+
+
+class TestProjectileSweep:
+    """Test swept-circle collision over the last move"""
+
+    def test_update_records_move_start(self):
+        """Test update() keeps the previous position as the sweep start"""
+        projectile = Projectile(100, 100, 0)
+        projectile.update(0.1)
+        assert (projectile.prev_x, projectile.prev_y) == (100, 100)
+        assert projectile.x == pytest.approx(100 + projectile.config.speed * 0.1)
+
+    def test_sweep_hits_target_passed_over(self):
+        """Test a long move hits a small target it jumped past"""
+        projectile = Projectile(0, 100, 0)
+        projectile.update(0.5)  # 250 px in one step
+        assert not projectile.check_collision(120, 100, 10)
+        t = projectile.sweep(120, 100, 10)
+        assert t is not None
+        # First contact where the circles touch: 120 - (10 + radius) px along the move
+        reach = 10 + projectile.radius
+        assert t == pytest.approx((120 - reach) / (projectile.x - projectile.prev_x))
+
+    def test_sweep_misses_target_off_path(self):
+        """Test a target beside the path is not hit"""
+        projectile = Projectile(0, 100, 0)
+        projectile.update(0.5)
+        assert projectile.sweep(120, 140, 10) is None
+
+    def test_sweep_misses_target_behind(self):
+        """Test a target behind the start of the move is not hit"""
+        projectile = Projectile(100, 100, 0)
+        projectile.update(0.1)
+        assert projectile.sweep(50, 100, 10) is None
+
+    def test_sweep_overlap_at_start(self):
+        """Test a target overlapping the start of the move is hit immediately"""
+        projectile = Projectile(100, 100, 0)
+        assert projectile.sweep(105, 100, 10) == 0.0
+
+    def test_expiring_move_is_still_swept(self):
+        """Test the move that ends a projectile's lifetime can still hit"""
+        projectile = Projectile(0, 100, 0)
+        projectile.age = projectile.config.lifetime - 0.01
+        projectile.update(0.5)
+        assert not projectile.is_alive()
+        assert projectile.sweep(120, 100, 10) is not None
@@ -25,3 +25,10 @@ class TestZombie:
 
         assert zombie.x > initial_x  # Moved right
         assert zombie.y > initial_y  # Moved down
+
+    def test_zombie_is_slotted(self):
+        """Test zombies keep no per-instance __dict__ and share config"""
+        first = Zombie(0, 0)
+        second = Zombie(10, 10)
+        assert not hasattr(first, "__dict__")
+        assert first.config is second.config
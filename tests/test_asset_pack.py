@@ -0,0 +1,99 @@
+"""Tests for the baked asset pack (src/asset_pack.py)"""
+
+import os
+import wave
+from pathlib import Path
+
+import pygame
+import pytest
+
+from asset_pack import AssetPack, bake_pack
+
+ZOMBIE_SPRITE = "assets/sprites/zombie.png"
+
+
+@pytest.fixture
+def display():
+    """Hidden display (sprite conversion needs one)."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+@pytest.fixture
+def sprite_source(tmp_path):
+    """Copy of a real sprite that tests may modify."""
+    path = tmp_path / "zombie.png"
+    path.write_bytes(Path(ZOMBIE_SPRITE).read_bytes())
+    return str(path)
+
+
+class TestAssetPack:
+    """Test baking and loading sprites/sounds from a pack."""
+
+    def test_sprite_round_trip(self, tmp_path, display, sprite_source):
+        """Test a packed sprite has the same pixels as the loose-file path"""
+        pack_path = tmp_path / "assets.pack"
+        stats = bake_pack(pack_path, [(sprite_source, 24)], [], {})
+        assert stats["entries"] == 1
+
+        pack = AssetPack(pack_path)
+        sprite = pack.sprite(sprite_source, 24)
+        loose = pygame.transform.scale(pygame.image.load(sprite_source).convert_alpha(), (24, 24))
+        assert sprite.get_size() == (24, 24)
+        assert all(sprite.get_at((x, 12)) == loose.get_at((x, 12)) for x in range(24))
+        del sprite
+        pack.close()
+
+    def test_missing_entries_return_none(self, tmp_path, display, sprite_source):
+        """Test assets absent from the pack fall back to loose files (None)"""
+        pack_path = tmp_path / "assets.pack"
+        bake_pack(pack_path, [(sprite_source, 24)], [], {})
+        pack = AssetPack(pack_path)
+        assert pack.sprite(sprite_source, 48) is None
+        assert pack.image(sprite_source) is None
+        pack.close()
+
+    def test_changed_source_is_stale(self, tmp_path, display, sprite_source):
+        """Test editing a loose asset after baking bypasses the packed copy"""
+        pack_path = tmp_path / "assets.pack"
+        bake_pack(pack_path, [(sprite_source, 24)], [], {})
+        stat = os.stat(sprite_source)
+        os.utime(sprite_source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        pack = AssetPack(pack_path)
+        assert pack.sprite(sprite_source, 24) is None
+        pack.close()
+
+    def test_invalid_pack_is_ignored(self, tmp_path):
+        """Test a corrupt or missing pack means loose files are used"""
+        bad = tmp_path / "bad.pack"
+        bad.write_bytes(b"not a pack at all")
+        assert AssetPack.open(bad) is None
+        assert AssetPack.open(tmp_path / "missing.pack") is None
+
+    def test_sound_round_trip(self, tmp_path, monkeypatch):
+        """Test a packed sound is rebuilt from raw PCM"""
+        monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            pytest.skip("No audio driver available")
+
+        wav_path = tmp_path / "beep.wav"
+        frequency, _, channels = pygame.mixer.get_init()
+        with wave.open(str(wav_path), "wb") as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(2)
+            wav.setframerate(frequency)
+            wav.writeframes(bytes(range(256)) * 16)
+
+        pack_path = tmp_path / "assets.pack"
+        bake_pack(pack_path, [], [], {"fire": str(wav_path)})
+        pack = AssetPack(pack_path)
+        sound = pack.sound("fire")
+        assert sound is not None
+        assert sound.get_raw() == pygame.mixer.Sound(str(wav_path)).get_raw()
+        pack.close()
+        pygame.mixer.quit()
@@ -0,0 +1,73 @@
+"""Tests for parallel asset preloading (src/assets.py)"""
+
+import time
+
+import pygame
+
+from assets import AssetLoader, decode_image, sprite_manifest
+from entities.powerup import SPRITE_PATHS
+
+
+def _slow_square(value: int) -> int:
+    time.sleep(0.01)
+    return value * value
+
+
+def _fail(path: str) -> None:
+    raise pygame.error(f"cannot decode {path}")
+
+
+class TestAssetLoader:
+    """Test the thread-pool loader."""
+
+    def test_loads_all_assets(self):
+        """Test every job's result is returned by name"""
+        loader = AssetLoader(max_workers=4)
+        for i in range(8):
+            loader.add(f"job:{i}", _slow_square, i)
+        loader.start()
+        results = loader.results()
+
+        assert loader.done
+        assert loader.progress == 1.0
+        assert results == {f"job:{i}": i * i for i in range(8)}
+
+    def test_records_per_asset_timings(self):
+        """Test each asset gets a decode time and the report lists them"""
+        loader = AssetLoader(max_workers=2)
+        loader.add("sound:slow", _slow_square, 3)
+        loader.start()
+        loader.results()
+
+        assert loader.timings["sound:slow"] >= 5.0
+        assert "sound:slow=" in loader.report()
+
+    def test_jobs_run_in_parallel(self):
+        """Test wall-clock time is well below the summed decode time"""
+        loader = AssetLoader(max_workers=8)
+        for i in range(8):
+            loader.add(f"job:{i}", _slow_square, i)
+        loader.start()
+        loader.results()
+
+        assert loader.elapsed * 1000 < sum(loader.timings.values())
+
+    def test_failed_asset_is_none(self):
+        """Test a decode error yields None instead of aborting startup"""
+        loader = AssetLoader()
+        loader.add("sprite:broken", _fail, "broken.png")
+        loader.start()
+        assert loader.results() == {"sprite:broken": None}
+
+    def test_missing_image_is_none(self):
+        """Test decode_image returns None for missing files"""
+        assert decode_image("assets/sprites/does_not_exist.png") is None
+
+
+class TestSpriteManifest:
+    """Test the preload list covers every drawn sprite."""
+
+    def test_includes_all_powerup_sprites(self):
+        """Test each power-up type's sprite is preloaded"""
+        paths = {path for path, _ in sprite_manifest()}
+        assert set(SPRITE_PATHS.values()) <= paths
@@ -0,0 +1,87 @@
+"""Tests for Monte Carlo balance sweeps (src/balance.py)"""
+
+import pytest
+
+from balance import aggregate, applied, format_table, parse_override, play_game, sweep_grid
+from config import weapon_config
+
+
+class TestOverrides:
+    """Test override parsing, grids and temporary application."""
+
+    def test_parse_typed_values(self):
+        """Test values are converted to the field's type"""
+        assert parse_override("wave.spawn_interval=0.5,1") == ("wave.spawn_interval", [0.5, 1.0])
+        assert parse_override("weapon.magazine_size=6,12") == ("weapon.magazine_size", [6, 12])
+
+    @pytest.mark.parametrize("text", ["wave.nope=1", "nope.speed=1", "wave.spawn_interval"])
+    def test_parse_rejects_unknown(self, text):
+        """Test unknown configs/fields and missing values raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_override(text)
+
+    def test_grid_is_cartesian_product(self):
+        """Test every combination appears once"""
+        grid = sweep_grid([("a.x", [1, 2]), ("b.y", [3, 4, 5])])
+        assert len(grid) == 6
+        assert {"a.x": 2, "b.y": 5} in grid
+
+    def test_no_overrides_gives_one_baseline(self):
+        """Test an empty sweep still plays the default config"""
+        assert sweep_grid([]) == [{}]
+
+    def test_applied_restores_config(self):
+        """Test overrides only last for the block"""
+        original = weapon_config.fire_rate
+        with applied({"weapon.fire_rate": 0.05}):
+            assert weapon_config.fire_rate == 0.05
+        assert weapon_config.fire_rate == original
+
+
+class TestPlayGame:
+    """Test headless bot games."""
+
+    def test_same_seed_replays_same_game(self):
+        """Test a (combination, seed) pair is deterministic"""
+        first = play_game({}, 3, 1 / 30, 20.0)
+        second = play_game({}, 3, 1 / 30, 20.0)
+        assert first == second
+        assert first["kills"] > 0
+        assert first["time"] == pytest.approx(20.0, abs=1 / 30)
+
+    def test_overrides_change_the_game(self):
+        """Test overrides reach the game and are undone afterwards"""
+        original = weapon_config.magazine_size
+        assert play_game({}, 3, 1 / 30, 20.0)["shots"] > 0
+        result = play_game({"weapon.magazine_size": 0}, 3, 1 / 30, 20.0)
+        assert weapon_config.magazine_size == original
+        assert result["shots"] == 0
+        assert result["overrides"] == {"weapon.magazine_size": 0}
+
+    def test_policy_selects_bot(self):
+        """Test the policy name picks the bot that plays"""
+        result = play_game({}, 3, 1 / 30, 20.0, policy="melee")
+        assert result["shots"] == 0
+        assert result["kills"] > 0
+
+
+class TestAggregate:
+    """Test result summaries."""
+
+    def test_summary_per_combination(self):
+        """Test means, accuracy and death rate per combination"""
+        base = {"shots": 10, "hits": 5, "damage_taken": 10.0, "time": 1.0}
+        rows = [
+            {**base, "overrides": {"w.x": 1}, "seed": 0, "wave": 2, "kills": 4, "died": True},
+            {**base, "overrides": {"w.x": 1}, "seed": 1, "wave": 4, "kills": 6, "died": False},
+            {**base, "overrides": {"w.x": 2}, "seed": 0, "wave": 9, "kills": 1, "died": False},
+        ]
+        summary = aggregate(rows)
+        assert len(summary) == 2
+        assert summary[0]["wave"] == 3
+        assert summary[0]["max_wave"] == 4
+        assert summary[0]["accuracy"] == 0.5
+        assert summary[0]["deaths"] == 0.5
+        table = format_table(summary).splitlines()
+        assert len(table) == 3
+        assert "w.x" in table[0]
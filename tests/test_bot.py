@@ -0,0 +1,158 @@
+"""Tests for scripted bot players (src/bot.py)"""
+
+import pygame
+import pytest
+
+from bot import (
+    BOT_POLICIES,
+    IdleBot,
+    KiteBot,
+    MeleeBot,
+    angle_diff,
+    angle_to,
+    make_bot,
+    press_toward,
+    soak,
+)
+from controls import Controls
+from entities.zombie import Zombie
+from game import Game
+from game_state import GameState
+
+
+@pytest.fixture
+def game():
+    """Create a Game in PLAYING state with an empty arena."""
+    pygame.init()
+    game = Game()
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    game.zombies_to_spawn = 0
+    game.world.clear()
+    yield game
+    pygame.quit()
+
+
+class TestSteering:
+    """Test direction and angle helpers."""
+
+    def test_press_toward_diagonal(self):
+        """Test a diagonal direction presses both axis keys"""
+        controls = Controls()
+        press_toward(controls, 1, -1)
+        assert (controls.right, controls.up, controls.left, controls.down) == (
+            True,
+            True,
+            False,
+            False,
+        )
+
+    def test_press_toward_axis(self):
+        """Test a mostly horizontal direction presses one key"""
+        controls = Controls()
+        press_toward(controls, -1, 0.2)
+        assert controls.left
+        assert not (controls.up or controls.down or controls.right)
+
+    def test_angles_use_player_convention(self):
+        """Test 90° is up on screen and diffs take the short way round"""
+        assert angle_to(0, 0, 0, -10) == pytest.approx(90)
+        assert angle_diff(10, 350) == pytest.approx(20)
+        assert angle_diff(350, 10) == pytest.approx(-20)
+
+
+class TestKiteBot:
+    """Test kite-and-shoot decisions."""
+
+    def test_fires_when_facing_target(self, game):
+        """Test the bot shoots a distant zombie it is already facing"""
+        player = game.player
+        player.angle = 0.0
+        game.world.spawn(Zombie(player.x + 250, player.y))
+        controls = KiteBot().read(game)
+        assert controls.fire
+        assert not (controls.up or controls.down or controls.left or controls.right)
+
+    def test_turns_toward_target(self, game):
+        """Test the bot steers toward a zombie it is not facing"""
+        player = game.player
+        player.angle = 0.0
+        game.world.spawn(Zombie(player.x, player.y - 250))
+        controls = KiteBot().read(game)
+        assert not controls.fire
+        assert controls.up
+
+    def test_melee_when_in_reach(self, game):
+        """Test the bot attacks a zombie inside melee range"""
+        player = game.player
+        game.world.spawn(Zombie(player.x + 40, player.y))
+        assert KiteBot().read(game).attack
+
+    def test_retreats_on_cooldown(self, game):
+        """Test the bot backs away from a close zombie while melee recovers"""
+        player = game.player
+        player.attack_cooldown = 0.3
+        game.world.spawn(Zombie(player.x + 60, player.y))
+        controls = KiteBot().read(game)
+        assert controls.left
+        assert not controls.right
+
+    def test_survives_early_waves(self, game):
+        """Test a bot game reaches later waves without input"""
+        game.start_new_game()
+        game.controller = KiteBot()
+        while game.state == GameState.PLAYING and game.stats.time < 60:
+            game.update(1 / 30)
+        assert game.state == GameState.PLAYING
+        assert game.current_wave >= 3
+        assert game.stats.kills > 0
+
+
+class TestPolicies:
+    """Test the built-in policies and how the game picks one."""
+
+    def test_make_bot_by_name(self):
+        """Test every registered policy builds a controller"""
+        assert isinstance(make_bot("kite"), KiteBot)
+        assert isinstance(make_bot("melee"), MeleeBot)
+        assert isinstance(make_bot("idle"), IdleBot)
+        assert set(BOT_POLICIES) == {"kite", "melee", "idle"}
+
+    def test_unknown_policy_rejected(self):
+        """Test an unknown policy name raises ValueError"""
+        with pytest.raises(ValueError, match="Unknown bot policy"):
+            make_bot("turret")
+
+    def test_melee_bot_closes_in_without_shooting(self, game):
+        """Test the melee bot walks toward a distant zombie instead of firing"""
+        player = game.player
+        player.angle = 0.0
+        game.world.spawn(Zombie(player.x + 250, player.y))
+        controls = MeleeBot().read(game)
+        assert controls.right
+        assert not controls.fire
+
+    def test_idle_bot_presses_nothing(self, game):
+        """Test the idle bot leaves every control released"""
+        game.world.spawn(Zombie(game.player.x + 20, game.player.y))
+        assert IdleBot().read(game) == Controls()
+
+    def test_game_uses_bot_from_env(self, monkeypatch):
+        """Test GAME_BOT replaces the keyboard as the player's controller"""
+        monkeypatch.setenv("GAME_BOT", "melee")
+        pygame.init()
+        game = Game()
+        assert isinstance(game.controller, MeleeBot)
+        pygame.quit()
+
+
+class TestSoak:
+    """Test the headless soak run."""
+
+    def test_reports_each_wave(self):
+        """Test the soak run summarizes frame costs per wave"""
+        waves = soak("kite", 30.0, 1 / 30, render=True)
+        assert [row["wave"] for row in waves] == sorted({row["wave"] for row in waves})
+        assert len(waves) >= 2
+        assert all(row["frames"] > 0 and row["render_ms"] > 0 for row in waves)
+        pygame.quit()
@@ -0,0 +1,36 @@
+"""Tests for the player input layer (src/controls.py)"""
+
+import pygame
+
+from controls import Controls, KeyboardController
+from entities.player import Player
+
+
+class TestControls:
+    """Test Controls encoding and use by the player."""
+
+    def test_pack_round_trip(self):
+        """Test a bitmask decodes to the same controls"""
+        controls = Controls(up=True, right=True, fire=True)
+        assert Controls.unpack(controls.pack()) == controls
+        assert Controls().pack() == 0
+
+    def test_player_moves_from_controls(self):
+        """Test Player.update follows the supplied controls instead of the keyboard"""
+        player = Player(100, 100, 800, 600)
+        player.update(0.1, Controls(right=True))
+        assert player.x > 100
+        assert player.y == 100
+
+    def test_attack_from_controls(self):
+        """Test the attack control triggers a melee attack"""
+        player = Player(100, 100, 800, 600)
+        player.update(0.1, Controls(attack=True))
+        assert player.is_attacking
+
+    def test_keyboard_controller_idle(self):
+        """Test the keyboard controller reports nothing pressed without input"""
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        assert KeyboardController().read(None) == Controls()
+        pygame.quit()
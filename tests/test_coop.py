@@ -0,0 +1,293 @@
+"""Tests for UDP co-op replication (src/coop.py)"""
+
+import socket
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+from config import NetConfig
+from controls import Controls
+from coop import (
+    ENTITY,
+    MSG_SNAPSHOT,
+    MSG_WELCOME,
+    NO_TICK,
+    SNAPSHOT,
+    CoopClient,
+    CoopHost,
+    LinkSimulator,
+    decode_delta,
+    dequantize_position,
+    encode_delta,
+    interpolate,
+    quantize_angle,
+    quantize_position,
+)
+from game import Game
+from game_state import GameState
+
+
+def rows(*entries):
+    """ENTITY rows from (id, kind, x, y, angle, aux) tuples, sorted by id."""
+    data = np.array(list(entries), ENTITY)
+    return data[np.argsort(data["id"])]
+
+
+def pump(host, clients, rounds=20):
+    """Exchange datagrams over loopback until nothing is in flight."""
+    for _ in range(rounds):
+        time.sleep(0.002)
+        host.poll()
+        for client in clients:
+            client.poll()
+
+
+@pytest.fixture
+def host():
+    """Host a started game on a free loopback port."""
+    pygame.init()
+    game = Game()
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    host = CoopHost(game, port=0, config=NetConfig(max_players=3), bind="127.0.0.1")
+    yield host
+    host.close()
+    game.entity_workers.close()
+    pygame.quit()
+
+
+class TestQuantization:
+    """Test the wire precision of positions and angles."""
+
+    def test_position_round_trip(self):
+        """Test positions survive within 1/16 px, including off-screen spawns"""
+        values = np.array([-50.0, 0.0, 123.456, 799.9])
+        restored = dequantize_position(quantize_position(values))
+        assert np.abs(restored - values).max() <= 1 / 16
+
+    def test_angle_wraps(self):
+        """Test angles are taken modulo a full turn"""
+        assert quantize_angle(np.array([0.0, 360.0, 180.0, -90.0])).tolist() == [0, 0, 128, 192]
+
+
+class TestDelta:
+    """Test delta encoding against a baseline."""
+
+    def test_round_trip(self):
+        """Test removals, additions, small and large moves all decode exactly"""
+        base = rows((1, 0, 1000, 1000, 0, 0), (2, 0, 2000, 2000, 5, 3), (3, 4, 500, 500, 0, 1))
+        current = rows(
+            (1, 0, 1010, 990, 0, 0),  # Small move
+            (3, 4, 500, 500, 0, 1),  # Unchanged
+            (2, 0, 5000, 2000, 9, 2),  # Large move, turned, damaged
+            (7, 3, 100, 100, 0, 0),  # New
+        )
+        counts, body = encode_delta(current, base)
+        assert counts == (0, 1)
+        np.testing.assert_array_equal(decode_delta(body, 0, counts, base), current)
+
+        gone = current[current["id"] != 3]
+        counts, body = encode_delta(gone, base)
+        assert counts == (1, 1)
+        np.testing.assert_array_equal(decode_delta(body, 0, counts, base), gone)
+
+    def test_without_baseline(self):
+        """Test a missing baseline sends every row whole"""
+        current = rows((4, 1, 10, 20, 30, 40), (5, 2, 50, 60, 70, 80))
+        counts, body = encode_delta(current, None)
+        assert counts == (0, 2)
+        assert len(body) == current.nbytes
+        np.testing.assert_array_equal(decode_delta(body, 0, counts, None), current)
+
+    def test_moving_horde_is_smaller(self):
+        """Test a horde that moved a little costs a fraction of the whole state"""
+        rng = np.random.default_rng(0)
+        base = np.zeros(500, ENTITY)
+        base["id"] = np.arange(500)
+        base["x"] = rng.integers(1000, 6000, 500)
+        base["y"] = rng.integers(1000, 6000, 500)
+        current = base.copy()
+        current["x"] += rng.integers(-20, 20, 500).astype(np.uint16)
+        current["y"] += rng.integers(-20, 20, 500).astype(np.uint16)
+        counts, body = encode_delta(current, base)
+        assert len(body) < current.nbytes * 0.4
+        np.testing.assert_array_equal(decode_delta(body, 0, counts, base), current)
+
+
+class TestInterpolation:
+    """Test client-side interpolation between snapshots."""
+
+    def test_halfway(self):
+        """Test positions move linearly and angles the short way round"""
+        a = rows((1, 0, 1000, 1000, 250, 0), (2, 0, 0, 0, 0, 0))
+        b = rows((1, 0, 1080, 1000, 6, 0))
+        x, y, angle = interpolate(a, b, 0.5)
+        assert x[0] == pytest.approx(dequantize_position(1040))
+        assert y[0] == pytest.approx(dequantize_position(1000))
+        assert angle[0] == pytest.approx(0.0)  # 250 -> 6 steps passes through 0
+        assert x[1] == pytest.approx(dequantize_position(0))  # Gone from b: stays put
+
+
+class TestLinkSimulator:
+    """Test simulated loss and latency."""
+
+    def test_loss_and_latency(self):
+        """Test dropped datagrams never arrive and kept ones wait for the latency"""
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.setblocking(False)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            lossy = LinkSimulator(loss=1.0)
+            lossy.send(sender, b"x", receiver.getsockname())
+            assert lossy.dropped == 1
+
+            slow = LinkSimulator(latency=0.05)
+            slow.send(sender, b"late", receiver.getsockname())
+            time.sleep(0.01)
+            with pytest.raises(BlockingIOError):
+                receiver.recvfrom(16)
+            time.sleep(0.05)
+            slow.flush(sender)
+            time.sleep(0.01)
+            assert receiver.recvfrom(16)[0] == b"late"
+        finally:
+            receiver.close()
+            sender.close()
+
+    def test_seeded(self):
+        """Test a seed replays the same drops"""
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            drops = []
+            for _ in range(2):
+                link = LinkSimulator(latency=1.0, loss=0.5, seed=3)
+                for _ in range(50):
+                    link.send(sender, b"x", ("127.0.0.1", 9))
+                drops.append(link.dropped)
+            assert drops[0] == drops[1]
+            assert 0 < drops[0] < 50
+        finally:
+            sender.close()
+
+
+class TestHostClient:
+    """Test joining, input and replication over loopback."""
+
+    def test_join_adds_ally(self, host):
+        """Test a client joins as player 2 and its input drives that player"""
+        client = CoopClient(("127.0.0.1", host.address[1]))
+        try:
+            pump(host, [client])
+            assert client.slot == 1
+            assert len(host.game.allies) == 1
+
+            client.send_input(Controls(right=True))
+            pump(host, [client])
+            ally = host.game.allies[0]
+            start = ally.x
+            host.game.update(0.1)
+            assert ally.x > start
+        finally:
+            client.close()
+
+    def test_full_game_refuses(self, host):
+        """Test joins beyond max_players are refused"""
+        clients = [CoopClient(("127.0.0.1", host.address[1])) for _ in range(3)]
+        try:
+            pump(host, clients)
+            assert [client.full for client in clients].count(True) == 1
+            assert len(host.game.allies) == 2
+        finally:
+            for client in clients:
+                client.close()
+
+    def test_snapshots_decode_exactly_despite_loss(self, host):
+        """Test every received snapshot matches what the host captured for that tick"""
+        host.link = LinkSimulator(loss=0.3, seed=1)
+        client = CoopClient(("127.0.0.1", host.address[1]), link=LinkSimulator(loss=0.3, seed=2))
+        try:
+            while client.slot is None:
+                pump(host, [client])
+            for _ in range(10):
+                host.game.spawn_zombie()
+            for _ in range(40):
+                host.game.update(1 / 30)
+                host.broadcast()
+                pump(host, [client], rounds=2)
+                client.send_input(Controls())
+
+            assert client.snapshots > 10
+            for tick, snapshot in client.states.items():
+                np.testing.assert_array_equal(snapshot.entities, host.history[tick])
+            assert any(int(s.header["base"]) != 0xFFFFFFFF for s in client.states.values())
+        finally:
+            client.close()
+
+    def test_malformed_datagrams_ignored(self, host):
+        """Test stray senders, short welcomes and truncated snapshots do not crash the client"""
+        client = CoopClient(("127.0.0.1", host.address[1]))
+        stray = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            target = ("127.0.0.1", client.port)
+            host.sock.sendto(bytes((MSG_WELCOME,)), target)  # Too short
+            stray.sendto(bytes((MSG_WELCOME, 2)), target)  # Not the host
+            pump(host, [client], rounds=1)
+            assert client.ignored >= 2
+
+            while client.slot is None:
+                pump(host, [client])
+            assert client.slot == 1
+            for _ in range(5):
+                host.game.spawn_zombie()
+            host.game.update(1 / 30)
+            host.broadcast()
+            pump(host, [client])
+            assert client.newest is not None
+
+            header = np.zeros((), SNAPSHOT)
+            header["type"] = MSG_SNAPSHOT
+            header["tick"] = 999
+            header["base"] = NO_TICK
+            header["added"] = 3  # Rows the datagram does not carry
+            host.sock.sendto(header.tobytes(), target)
+            header["base"] = client.newest
+            header["added"] = 0  # Fits, but the baseline's delta mask is missing
+            host.sock.sendto(header.tobytes(), target)
+            undecodable = client.undecodable
+            pump(host, [client])
+            assert client.undecodable == undecodable + 1
+            assert 999 not in client.states
+        finally:
+            stray.close()
+            client.close()
+
+    def test_mirror_and_report(self, host):
+        """Test the client's game mirrors the host and bandwidth is reported"""
+        client = CoopClient(("127.0.0.1", host.address[1]))
+        mirror = Game()
+        try:
+            pump(host, [client])
+            for _ in range(5):
+                host.game.spawn_zombie()
+            for _ in range(5):
+                host.game.update(1 / 30)
+                host.broadcast()
+                pump(host, [client], rounds=2)
+                client.send_input(Controls())
+
+            assert client.apply(mirror)
+            assert mirror.world.count("chase") == host.game.world.count("chase")
+            assert mirror.player.x == pytest.approx(host.game.allies[0].x, abs=0.1)
+            assert [ally.x for ally in mirror.allies] == pytest.approx([host.game.player.x])
+            mirror.draw_frame()
+
+            (row,) = host.report()
+            assert row["slot"] == 1
+            assert row["snapshots"] == 5
+            assert 0 < row["bytes"] < row["full_bytes"]
+        finally:
+            client.close()
+            mirror.entity_workers.close()
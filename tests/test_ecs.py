@@ -0,0 +1,142 @@
+"""Tests for entity-component storage (src/ecs.py)"""
+
+import pytest
+
+from ecs import Archetype, SystemSchedule, World
+
+
+class Body:
+    """Minimal entity with position and velocity components."""
+
+    COMPONENTS = frozenset({"position", "velocity"})
+
+    def __init__(self, x=0.0):
+        self.x = x
+
+
+class Marker:
+    """Minimal entity with only a position component."""
+
+    COMPONENTS = frozenset({"position"})
+
+
+class TestArchetype:
+    """Test archetype table storage."""
+
+    def test_swap_remove_moves_last_row(self):
+        """Test swap-remove fills the hole with the last row"""
+        table = Archetype(frozenset({"position"}))
+        a, b, c = Body(), Body(), Body()
+        for entity in (a, b, c):
+            table.add(entity)
+
+        table.swap_remove(0)
+
+        assert table.rows == [c, b]
+
+    def test_discard_many_uses_identity(self):
+        """Test bulk removal removes exactly the given objects"""
+        table = Archetype(frozenset({"position"}))
+        a, b, c = Body(), Body(), Body()
+        table.replace([a, b, c])
+
+        table.discard_many([a, c])
+
+        assert table.rows == [b]
+
+    def test_replace_keeps_list_identity(self):
+        """Test replace() updates rows in place so references stay valid"""
+        table = Archetype(frozenset({"position"}))
+        rows = table.rows
+        table.replace([Body()])
+        assert rows is table.rows
+        assert len(rows) == 1
+
+
+class TestWorld:
+    """Test world spawning and queries."""
+
+    def test_spawn_groups_by_component_set(self):
+        """Test entities with the same COMPONENTS share a table"""
+        world = World()
+        world.spawn(Body())
+        world.spawn(Body())
+        world.spawn(Marker())
+
+        assert len(world.archetype(Body.COMPONENTS)) == 2
+        assert len(world.archetype(Marker.COMPONENTS)) == 1
+
+    def test_query_matches_supersets(self):
+        """Test queries return every table providing the components"""
+        world = World()
+        world.spawn(Body())
+        world.spawn(Marker())
+
+        assert world.count("position") == 2
+        assert world.count("velocity") == 1
+        assert world.count("health") == 0
+
+    def test_query_cache_sees_new_archetypes(self):
+        """Test cached queries are refreshed when a table is created"""
+        world = World()
+        world.spawn(Marker())
+        assert world.count("position") == 1
+
+        world.spawn(Body())
+        assert world.count("position") == 2
+
+    def test_clear_keeps_tables(self):
+        """Test clear() empties tables without dropping them"""
+        world = World()
+        table = world.archetype(Body.COMPONENTS)
+        world.spawn(Body())
+        world.clear()
+        assert len(table) == 0
+        assert world.archetype(Body.COMPONENTS) is table
+
+
+class TestSystemSchedule:
+    """Test system ordering and timing."""
+
+    def test_run_order_and_timings(self):
+        """Test systems run in order and each gets a timing entry"""
+        calls = []
+        schedule = SystemSchedule()
+        schedule.add("a", lambda dt: calls.append("a"))
+        schedule.add("b", lambda dt: calls.append("b"))
+        schedule.add("first", lambda dt: calls.append("first"), before="a")
+
+        schedule.run(0.016)
+
+        assert calls == ["first", "a", "b"]
+        assert list(schedule.timings()) == ["first", "a", "b"]
+
+    def test_reorder(self):
+        """Test reorder() changes execution order"""
+        calls = []
+        schedule = SystemSchedule()
+        schedule.add("a", lambda: calls.append("a"))
+        schedule.add("b", lambda: calls.append("b"))
+
+        schedule.reorder(["b", "a"])
+        schedule.run()
+
+        assert calls == ["b", "a"]
+
+    def test_reorder_requires_all_names(self):
+        """Test reorder() rejects incomplete orders"""
+        schedule = SystemSchedule()
+        schedule.add("a", lambda: None)
+        schedule.add("b", lambda: None)
+        with pytest.raises(ValueError):
+            schedule.reorder(["a"])
+
+    def test_false_halts_schedule(self):
+        """Test a system returning False stops later systems"""
+        calls = []
+        schedule = SystemSchedule()
+        schedule.add("stop", lambda: False)
+        schedule.add("after", lambda: calls.append("after"))
+
+        assert schedule.run() is False
+        assert calls == []
@@ -0,0 +1,90 @@
+"""Tests for pooled visual effects (src/effects.py)"""
+
+import pygame
+
+from config import DamagePopup, KillFlash
+from effects import EffectPool, circle_stamp
+
+
+class TestEffectPool:
+    """Test fixed-capacity effect pool behavior."""
+
+    def test_spawn_and_iterate(self):
+        """Test spawned effects are live and iterable"""
+        pool = EffectPool(KillFlash, capacity=4)
+        pool.spawn(x=1, y=2, radius=3, timer=0.5)
+
+        flashes = list(pool)
+        assert len(pool) == 1
+        assert flashes[0].x == 1
+        assert flashes[0].timer == 0.5
+
+    def test_spawn_capped(self):
+        """Test spawns beyond capacity are dropped and counted"""
+        pool = EffectPool(KillFlash, capacity=2)
+        for _ in range(3):
+            pool.spawn(timer=1.0)
+        assert len(pool) == 2
+        assert pool.dropped == 1
+
+    def test_spawn_capped_at_limit(self):
+        """Test a lowered limit caps live effects below capacity"""
+        pool = EffectPool(KillFlash, capacity=4)
+        pool.limit = 1
+        assert pool.spawn(timer=1.0) is not None
+        assert pool.spawn(timer=1.0) is None
+        assert len(pool) == 1
+
+    def test_update_in_place(self):
+        """Test update mutates records instead of replacing them"""
+        pool = EffectPool(DamagePopup, capacity=2)
+        record = pool.spawn(x=0, y=100, text="+10", timer=1.0)
+
+        pool.update(0.5, rise=30)
+
+        assert next(iter(pool)) is record
+        assert record.timer == 0.5
+        assert record.y == 85
+
+    def test_expired_swap_removed_and_reused(self):
+        """Test expired records move to the free tail and are reused"""
+        pool = EffectPool(KillFlash, capacity=3)
+        expired = pool.spawn(x=1, timer=0.0)
+        live = pool.spawn(x=2, timer=1.0)
+
+        pool.update(0.1)
+
+        assert list(pool) == [live]
+        assert pool.spawn(x=3, timer=1.0) is expired
+
+    def test_final_frame_kept_once(self):
+        """Test an effect that crosses zero survives one more update"""
+        pool = EffectPool(KillFlash, capacity=1)
+        pool.spawn(timer=0.05)
+        pool.update(0.1)
+        assert len(pool) == 1
+        pool.update(0.1)
+        assert len(pool) == 0
+
+    def test_reset_copies_fields(self):
+        """Test reset() loads records without keeping the originals"""
+        pool = EffectPool(KillFlash, capacity=4)
+        source = KillFlash(x=5, y=6, radius=7, timer=0.1)
+
+        pool.reset([source])
+
+        (record,) = list(pool)
+        assert record is not source
+        assert (record.x, record.y, record.radius, record.timer) == (5, 6, 7, 0.1)
+
+
+class TestCircleStamp:
+    """Test cached circle stamps."""
+
+    def test_stamp_cached(self):
+        """Test identical requests return the same surface"""
+        pygame.init()
+        first = circle_stamp(10, (255, 255, 255, 128))
+        assert circle_stamp(10, (255, 255, 255, 128)) is first
+        assert first.get_size() == (20, 20)
+        pygame.quit()
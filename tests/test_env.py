@@ -0,0 +1,122 @@
+"""Tests for the vectorized environment API (src/env.py)"""
+
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from controls import Controls
+from entities.zombie import Zombie
+from env import ACTION_FIELDS, NUM_ACTIONS, PLAYER_OBS, VectorEnv
+
+
+@pytest.fixture
+def env():
+    """Create a small batch of headless games."""
+    env = VectorEnv(num_envs=3, max_zombies=4)
+    yield env
+    env.close()
+    pygame.quit()
+
+
+class TestVectorEnv:
+    """Test reset/step over a batch of real games."""
+
+    def test_reset_shapes(self, env):
+        """Test observations carry a leading batch dimension"""
+        obs = env.reset(seed=0)
+        assert obs["player"].shape == (3, len(PLAYER_OBS))
+        assert obs["zombies"].shape == (3, 4, 5)
+        assert obs["zombie_mask"].shape == (3, 4)
+        assert (obs["player"][:, PLAYER_OBS.index("health")] == 100).all()
+
+    def test_same_seed_replays_same_games(self, env):
+        """Test a seed and action sequence reproduce identical observations"""
+        actions = np.random.default_rng(1).integers(0, NUM_ACTIONS, (60, 3))
+
+        def rollout():
+            env.reset(seed=5)
+            for step_actions in actions:
+                obs, *_ = env.step(step_actions)
+            return {name: array.copy() for name, array in obs.items()}
+
+        first = rollout()
+        second = rollout()
+        for name, array in first.items():
+            np.testing.assert_array_equal(array, second[name])
+        assert first["zombie_mask"].any()
+
+    def test_instances_are_independent(self, env):
+        """Test different seeds per instance give different games"""
+        env.reset(seed=0)
+        for _ in range(60):
+            obs, *_ = env.step(np.zeros(3, int))
+        assert not np.array_equal(obs["zombies"][0], obs["zombies"][1])
+
+    def test_global_random_untouched(self, env):
+        """Test stepping does not consume the caller's random stream"""
+        random.seed(42)
+        expected = random.random()
+        random.seed(42)
+        env.reset(seed=0)
+        env.step(np.zeros(3, int))
+        assert random.random() == expected
+
+    def test_boolean_actions_move_player(self, env):
+        """Test (N, 7) boolean actions map onto Controls fields"""
+        obs = env.reset(seed=0)
+        x = obs["player"][:, 0].copy()
+        actions = np.zeros((3, len(ACTION_FIELDS)), bool)
+        actions[:, ACTION_FIELDS.index("right")] = True
+        obs, *_ = env.step(actions)
+        assert (obs["player"][:, 0] > x).all()
+
+    def test_bitmask_actions_fire(self, env):
+        """Test packed Controls bits reach the player"""
+        env.reset(seed=0)
+        env.step(np.full(3, Controls(fire=True).pack()))
+        assert all(game.stats.shots == 1 for game in env.games)
+
+    def test_rejects_wrong_action_shape(self, env):
+        """Test a batch of the wrong size raises ValueError"""
+        env.reset(seed=0)
+        with pytest.raises(ValueError):
+            env.step(np.zeros(2, int))
+
+    def test_zombies_observed_nearest_first(self, env):
+        """Test zombie rows are sorted by distance and masked"""
+        env.reset(seed=0)
+        game = env.games[0]
+        game.world.clear()
+        game.zombies_to_spawn = 0
+        player = game.player
+        game.world.spawn(Zombie(player.x + 200, player.y))
+        game.world.spawn(Zombie(player.x + 100, player.y))
+        obs, *_ = env.step(np.zeros(3, int))
+        assert obs["zombie_mask"][0].tolist() == [True, True, False, False]
+        assert obs["zombies"][0, 0, 0] < obs["zombies"][0, 1, 0]
+
+    def test_death_terminates_and_resets(self, env):
+        """Test a dead player ends the episode and the game restarts"""
+        env.reset(seed=0)
+        game = env.games[1]
+        game.player.health = 1
+        game.world.spawn(Zombie(game.player.x, game.player.y))
+        obs, reward, terminated, truncated, info = env.step(np.zeros(3, int))
+        assert terminated.tolist() == [False, True, False]
+        assert not truncated.any()
+        assert info["final_wave"][1] == 1
+        assert reward[1] < 0
+        assert obs["player"][1, PLAYER_OBS.index("health")] == 100
+
+    def test_time_limit_truncates(self):
+        """Test episodes are truncated at max_time"""
+        env = VectorEnv(num_envs=1, dt=0.5, max_time=1.0)
+        env.reset(seed=0)
+        env.step(np.zeros(1, int))
+        _, _, terminated, truncated, _ = env.step(np.zeros(1, int))
+        assert truncated.tolist() == [True]
+        assert not terminated.any()
+        env.close()
+        pygame.quit()
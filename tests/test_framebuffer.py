@@ -0,0 +1,81 @@
+"""Tests for zero-copy framebuffer export (src/framebuffer.py)"""
+
+import numpy as np
+import pygame
+import pytest
+
+from env import VectorEnv
+from framebuffer import FrameExporter
+
+
+@pytest.fixture
+def surface():
+    """Create a 32-bit surface with a red left half and a blue right half."""
+    pygame.init()
+    surface = pygame.Surface((64, 48), 0, 32)
+    surface.fill((255, 0, 0), pygame.Rect(0, 0, 32, 48))
+    surface.fill((0, 0, 255), pygame.Rect(32, 0, 32, 48))
+    yield surface
+    pygame.quit()
+
+
+class TestFrameExporter:
+    """Test frame views, resizing and grayscale."""
+
+    def test_full_frame_matches_surface(self, surface):
+        """Test the view is (height, width, 3) RGB and matches tobytes"""
+        exporter = FrameExporter(surface)
+        expected = np.frombuffer(pygame.image.tobytes(surface, "RGB"), np.uint8).reshape(48, 64, 3)
+        with exporter.frame() as pixels:
+            assert pixels.shape == exporter.shape == (48, 64, 3)
+            np.testing.assert_array_equal(pixels, expected)
+
+    def test_view_aliases_surface(self, surface):
+        """Test writes through the view land in the surface (no copy)"""
+        with FrameExporter(surface).frame() as pixels:
+            pixels[5, 10] = (1, 2, 3)
+        assert surface.get_at((10, 5))[:3] == (1, 2, 3)
+
+    def test_surface_unlocked_after_block(self, surface):
+        """Test the surface can be drawn to again once the block exits"""
+        with FrameExporter(surface).frame():
+            assert surface.get_locked()
+        assert not surface.get_locked()
+        surface.fill((0, 0, 0))
+
+    def test_resize(self, surface):
+        """Test resized frames keep the layout at the requested size"""
+        exporter = FrameExporter(surface, size=(16, 12))
+        with exporter.frame() as pixels:
+            assert pixels.shape == (12, 16, 3)
+            assert tuple(pixels[6, 2]) == (255, 0, 0)
+            assert tuple(pixels[6, 13]) == (0, 0, 255)
+
+    def test_grayscale_resize(self, surface):
+        """Test grayscale frames are one channel with red brighter than blue"""
+        exporter = FrameExporter(surface, size=(16, 12), grayscale=True)
+        with exporter.frame() as pixels:
+            assert pixels.shape == exporter.shape == (12, 16)
+            assert pixels[6, 2] > pixels[6, 13] > 0
+
+    def test_copy_to_batch_row(self, surface):
+        """Test copy_to fills a preallocated array"""
+        exporter = FrameExporter(surface, size=(8, 6), grayscale=True, smooth=False)
+        batch = np.zeros((2, *exporter.shape), np.uint8)
+        exporter.copy_to(batch[1])
+        assert batch[1].any()
+        assert not batch[0].any()
+
+
+class TestPixelObservations:
+    """Test rendered observations in the vectorized environment."""
+
+    def test_env_pixels(self):
+        """Test each game renders to its own target and fills obs["pixels"]"""
+        env = VectorEnv(num_envs=2, pixels=(32, 24), grayscale=True)
+        obs = env.reset(seed=0)
+        assert obs["pixels"].shape == (2, 24, 32)
+        assert obs["pixels"].any()
+        assert env.games[0].screen is not env.games[1].screen
+        env.close()
+        pygame.quit()
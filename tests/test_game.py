@@ -3,7 +3,9 @@
 import pygame
 import pytest
 
+from bot import IdleBot
 from config import DamagePopup, KillFlash
+from entities.zombie import Zombie
 from game import Game
 from game_state import GameState
 
@@ -82,6 +84,192 @@ class TestWaveSystem:
         assert game.zombies_to_spawn == 6
 
 
+class TestSystems:
+    """Test the update/render system pipeline."""
+
+    def test_update_systems_registered(self, game):
+        """Test update runs the expected systems in order"""
+        assert game.systems.names == [
+            "waves",
+            "player",
+            "movement",
+            "collision",
+            "damage",
+            "effects",
+            "particles",
+            "lifetime",
+            "pickups",
+        ]
+
+    def test_systems_are_timed(self, game):
+        """Test each system reports a timing after an update"""
+        game.start_new_game()
+        game.update(0.016)
+        game.render()
+        assert set(game.systems.timings()) == set(game.systems.names)
+        assert set(game.render_systems.timings()) == set(game.render_systems.names)
+
+    def test_projectile_kills_zombie(self, game):
+        """Test projectile hit flows through collision and damage systems"""
+        from entities.projectile import Projectile
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        zombie = game.world.spawn(Zombie(100, 100))
+        game.world.spawn(Projectile(100, 100, 0))
+
+        game.update(0.001)
+
+        assert zombie not in game.zombies
+        assert len(game.projectiles) == 0
+        assert game.score == game.score_config.points_per_kill
+
+    def test_fast_projectile_does_not_tunnel(self, game):
+        """Test a long frame still hits a small zombie the projectile jumped past"""
+        from entities.projectile import Projectile
+        from entities.zombie_fast import FastZombie
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.player.x, game.player.y = 700, 100  # Zombie chases along the bullet's path
+        zombie = game.world.spawn(FastZombie(300, 100))
+        game.world.spawn(Projectile(200, 100, 0))
+
+        game.update(0.5)  # Bullet moves 250 px, ending well past the zombie
+
+        assert zombie not in game.zombies
+        assert len(game.projectiles) == 0
+
+    def test_expiring_projectile_hits_on_last_move(self, game):
+        """Test a zombie on a projectile's final stretch is hit before it expires"""
+        from entities.projectile import Projectile
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.player.x, game.player.y = 700, 100
+        zombie = game.world.spawn(Zombie(300, 100))
+        projectile = game.world.spawn(Projectile(200, 100, 0))
+        projectile.age = projectile.config.lifetime - 0.01
+
+        game.update(0.5)
+
+        assert zombie not in game.zombies
+        assert len(game.projectiles) == 0
+
+    def test_projectile_hits_nearest_zombie_on_path(self, game):
+        """Test a swept projectile hits the first zombie along its path"""
+        from entities.projectile import Projectile
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.player.x, game.player.y = 700, 100
+        far = game.world.spawn(Zombie(400, 100))
+        near = game.world.spawn(Zombie(300, 100))
+        game.world.spawn(Projectile(200, 100, 0))
+
+        game.update(0.5)
+
+        assert near not in game.zombies
+        assert far in game.zombies
+
+    def test_run_stats_count_shots_hits_and_kills(self, game):
+        """Test the per-run counters follow a shot that kills a zombie"""
+        from controls import Controls
+
+        class Trigger:
+            def read(self, game):
+                return Controls(fire=True)
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.world.clear()
+        game.player.angle = 0.0
+        game.controller = Trigger()
+        game.world.spawn(Zombie(game.player.x + 60, game.player.y))
+
+        game.update(0.1)
+
+        assert (game.stats.shots, game.stats.hits, game.stats.kills) == (1, 1, 1)
+        assert game.stats.time == pytest.approx(0.1)
+
+    def test_dead_zombie_does_not_consume_projectiles(self, game):
+        """Test shots that reach a zombie already killed this frame fly on uncounted"""
+        from entities.projectile import Projectile
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.world.clear()
+        zombie = game.world.spawn(Zombie(100, 100))
+        for _ in range(3):
+            game.world.spawn(Projectile(100, 100, 0))
+
+        game.update(0.001)
+
+        assert zombie not in game.zombies
+        assert (game.stats.hits, game.stats.kills) == (1, 1)
+        assert len(game.projectiles) == 2
+
+    def test_shot_falls_through_to_next_zombie(self, game):
+        """Test a shot whose first target is already dead this frame hits the next one"""
+        from entities.projectile import Projectile
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.world.clear()
+        first = game.world.spawn(Zombie(100, 100))
+        second = game.world.spawn(Zombie(105, 100))
+        for _ in range(2):
+            game.world.spawn(Projectile(100, 100, 0))
+
+        game.update(0.001)
+
+        assert first not in game.zombies
+        assert second not in game.zombies
+        assert (game.stats.hits, game.stats.kills) == (2, 2)
+        assert len(game.projectiles) == 0
+
+    def test_hits_stop_once_tank_is_doomed(self, game):
+        """Test only the hits needed to kill a tank this frame are consumed"""
+        from entities.projectile import Projectile
+        from entities.zombie_tank import TankZombie
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        game.world.clear()
+        tank = game.world.spawn(TankZombie(100, 100))
+        tank.health = 15  # Two 10-damage hits kill it
+        for _ in range(4):
+            game.world.spawn(Projectile(100, 100, 0))
+
+        game.update(0.001)
+
+        assert tank not in game.zombies
+        assert game.stats.hits == 2
+        assert len(game.projectiles) == 2
+
+    def test_new_game_resets_stats(self, game):
+        """Test start_new_game() clears the run counters"""
+        game.stats.kills = 5
+        game.start_new_game()
+        assert game.stats.kills == 0
+
+    def test_tank_zombie_survives_one_hit(self, game):
+        """Test zombies with health take damage without dying"""
+        from entities.projectile import Projectile
+        from entities.zombie_tank import TankZombie
+
+        game.start_new_game()
+        game.zombies_to_spawn = 0
+        tank = game.world.spawn(TankZombie(100, 100))
+        game.world.spawn(Projectile(100, 100, 0))
+
+        game.update(0.001)
+
+        assert tank in game.zombies
+        assert tank.health == tank.max_health - 10
+        assert game.score == 0
+
+
 class TestGameStates:
     """Test game state transitions."""
 
@@ -172,6 +360,16 @@ class TestVisualEffects:
         # Should not raise any errors
         game.render_damage_popups()
 
+    def test_effects_updated_in_place(self, game):
+        """Test effect timers tick without replacing records"""
+        game.kill_flashes = [KillFlash(x=100, y=100, radius=15, timer=0.15)]
+        record = next(iter(game.kill_flashes))
+
+        game.update_effects(0.05)
+
+        assert next(iter(game.kill_flashes)) is record
+        assert record.timer < 0.15
+
     def test_render_damage_popups_empty_list(self, game):
         """Test rendering with no damage popups."""
         game.damage_popups = []
@@ -278,3 +476,180 @@ class TestPowerupSystem:
         # Add speed boost
         game.player.apply_speed_boost(1.5, 5.0)
         game.render_player_effects()  # Should not raise errors
+
+
+class TestIdleScreens:
+    """Test cached menu/pause/game-over frames and event blocking."""
+
+    def test_menu_rendered_once(self, game):
+        """Test the menu is not re-rendered while nothing changes"""
+        game.render_menu()
+        game.screen.fill((0, 0, 0))
+        game.render_menu()  # Cached and no redraw requested: screen untouched
+        assert game.screen.get_at((5, 5))[:3] == (0, 0, 0)
+
+    def test_redraw_presents_cached_frame(self, game):
+        """Test a redraw request blits the cached frame instead of re-rendering"""
+        game.render_menu()
+        expected = game.screen.get_at((game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 3))
+        game.screen.fill((0, 0, 0))
+        game._idle_redraw = True
+        game.render_menu()
+        assert game.screen.get_at((game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 3)) == expected
+
+    def test_content_change_rebuilds_frame(self, game):
+        """Test the game over screen is rebuilt when the score changes"""
+        game.render_game_over()
+        first = game._idle_frame
+        game.render_game_over()
+        assert game._idle_frame is first
+
+        game.score = 500
+        game.render_game_over()
+        assert game._idle_frame is not first
+
+    def test_wait_for_events_times_out(self, game):
+        """Test idle waiting returns no events after the timeout"""
+        game.config.idle_wait_ms = 10
+        pygame.event.clear()
+        assert game.wait_for_events() == []
+
+    def test_wait_for_events_returns_input(self, game):
+        """Test idle waiting wakes on input and requests a redraw"""
+        pygame.event.clear()
+        game._idle_redraw = False
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+        events = game.wait_for_events()
+        assert pygame.KEYDOWN in [event.type for event in events]
+        assert game._idle_redraw
+
+    def test_run_blocks_in_menu_until_quit(self, game, tmp_path):
+        """Test the menu loop exits on QUIT without busy-looping"""
+        game.LEADERBOARD_FILE = tmp_path / "leaderboard.db"
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        game.run()
+        assert not game.running
+        assert game.LEADERBOARD_FILE.exists()  # Opened by run(), closed on exit
+
+
+class TestRenderScale:
+    """Test dynamic world render resolution with a native-resolution HUD."""
+
+    def test_full_scale_draws_to_screen(self, game):
+        """Test the world draws straight to the screen at 100%"""
+        assert game.render_scale == 1.0
+        assert game.canvas is game.screen
+
+    def test_lower_scale_uses_smaller_canvas(self, game):
+        """Test a lower scale renders the world into a smaller surface"""
+        game.set_render_scale(0.5)
+        assert game.canvas is not game.screen
+        assert game.canvas.get_size() == (game.SCREEN_WIDTH // 2, game.SCREEN_HEIGHT // 2)
+
+        game.set_render_scale(1.0)
+        assert game.canvas is game.screen
+
+    def test_scale_clamped_and_quantized(self, game):
+        """Test requested scales snap to the step and stay within limits"""
+        game.set_render_scale(0.6)
+        assert game.render_scale == 0.625
+        game.set_render_scale(0.1)
+        assert game.render_scale == game.config.min_render_scale
+        game.set_render_scale(2.0)
+        assert game.render_scale == 1.0
+
+    def test_world_upscaled_hud_native(self, game):
+        """Test a scaled frame fills the window and entities land at world positions"""
+        game.start_new_game()
+        game.world.clear()
+        game.player.x, game.player.y = 100, 100
+        game.set_render_scale(0.5)
+        game.draw_frame()
+
+        # Player drawn at half resolution, upscaled back to its world position
+        background = game.canvas.get_at((10, 10))
+        assert game.screen.get_at((100, 100)) != background
+        assert game.canvas.get_at((50, 50)) == game.screen.get_at((100, 100))
+
+    def test_idle_screens_cover_last_frame(self, game):
+        """Test the menu and game over repaint the whole window at a lower scale"""
+        game.set_render_scale(0.5)
+        stale = (255, 0, 255)
+        for render in (game.render_game_over, game.render_menu):
+            game.screen.fill(stale)  # Last gameplay frame
+            game._idle_key = None
+            render()
+            corner = (game.SCREEN_WIDTH - 1, game.SCREEN_HEIGHT - 1)
+            assert game.screen.get_at(corner)[:3] != stale
+
+
+class TestCoop:
+    """Test co-op allies (extra players with their own controllers)."""
+
+    @pytest.fixture
+    def coop(self, game):
+        """Start a two-player game with an idle ally and no zombies."""
+        game.controller = IdleBot()
+        game.add_ally(IdleBot())
+        game.start_new_game()
+        game.state = GameState.PLAYING
+        game.world.clear()
+        game.zombies_to_spawn = 0
+        return game
+
+    def test_ally_spawns_beside_player(self, coop):
+        """Test allies get their own player, beside the host and in an ally color"""
+        (ally,) = coop.allies
+        assert coop.players == [coop.player, ally]
+        assert ally.x != coop.player.x
+        assert ally.color == coop.spawn_player(1).color != coop.player.color
+
+    def test_allies_survive_restart(self, coop):
+        """Test a new game respawns every ally at full health"""
+        coop.allies[0].health = 0
+        coop.start_new_game()
+        assert len(coop.allies) == 1
+        assert coop.allies[0].is_alive()
+
+    def test_zombies_chase_nearest_player(self, coop):
+        """Test each zombie steers toward the closest living player"""
+        coop.player.x, coop.player.y = 100, 300
+        coop.allies[0].x, coop.allies[0].y = 700, 300
+        left, right = Zombie(200, 300), Zombie(600, 300)
+        coop.world.spawn(left)
+        coop.world.spawn(right)
+        coop.update_movement(0.1)
+        assert left.x < 200
+        assert right.x > 600
+
+    def test_game_continues_until_all_dead(self, coop):
+        """Test the run only ends when the last player dies"""
+        ally = coop.allies[0]
+        ally.health = 1
+        coop.world.spawn(Zombie(ally.x, ally.y))
+        coop.update(1 / 60)
+        assert not ally.is_alive()
+        assert coop.state == GameState.PLAYING
+
+        coop.player.health = 1
+        coop.world.spawn(Zombie(coop.player.x, coop.player.y))
+        coop.update(1 / 60)
+        assert coop.state == GameState.GAME_OVER
+
+    def test_last_living_player_leaving_ends_run(self, coop, monkeypatch):
+        """Test the run ends when the only living player is an ally who leaves"""
+        recorded = []
+        monkeypatch.setattr(coop, "record_run", lambda: recorded.append(coop.score))
+        coop.player.health = 0
+        coop.update(1 / 60)
+        assert coop.state == GameState.PLAYING  # The ally still plays on
+
+        coop.remove_ally(coop.ally_controllers[0])
+        assert coop.state == GameState.GAME_OVER
+        assert recorded == [coop.score]  # Recorded like any other ending
+
+    def test_remove_ally(self, coop):
+        """Test removing an ally's controller removes its player"""
+        coop.remove_ally(coop.ally_controllers[0])
+        assert coop.allies == []
+        assert coop.players == [coop.player]
@@ -0,0 +1,155 @@
+"""Tests for the run leaderboard (src/leaderboard.py)"""
+
+import sqlite3
+import time
+
+import pygame
+import pytest
+
+from config import LeaderboardConfig
+from game import Game
+from leaderboard import TOP, TOP_FOR_SEED, Leaderboard, RunRecord
+
+
+@pytest.fixture
+def board(tmp_path):
+    """An empty leaderboard in a temporary directory."""
+    board = Leaderboard(tmp_path / "leaderboard.db")
+    yield board
+    board.close()
+
+
+def run(score, seed=1, wave=3):
+    """A finished run with the given score."""
+    return RunRecord(score, wave, 60.0, score // 10, seed)
+
+
+class TestStore:
+    """Test recording and querying runs."""
+
+    def test_top_runs(self, board):
+        """Test committed runs come back best first, ties in recording order"""
+        for score in (300, 900, 500, 900):
+            assert board.record(run(score, seed=score))
+        board.flush()
+        assert board.written == 4
+        assert [(entry.score, entry.seed) for entry in board.top(3)] == [
+            (900, 900),
+            (900, 900),
+            (500, 500),
+        ]
+
+    def test_per_seed(self, board):
+        """Test a seed's board only holds that seed's runs"""
+        for score, seed in ((100, 1), (700, 2), (400, 1), (200, 2)):
+            board.record(run(score, seed))
+        board.flush()
+        assert [entry.score for entry in board.top_for_seed(1)] == [400, 100]
+        assert board.top_for_seed(3) == []
+
+    def test_wal_and_indexes(self, board):
+        """Test the database is in WAL mode and top-N queries are index scans"""
+        connection = sqlite3.connect(board.path)
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            plan = str(connection.execute(f"EXPLAIN QUERY PLAN {TOP}", (5,)).fetchall())
+            assert "runs_by_score" in plan
+            plan = str(connection.execute(f"EXPLAIN QUERY PLAN {TOP_FOR_SEED}", (1, 5)).fetchall())
+            assert "runs_by_seed" in plan
+        finally:
+            connection.close()
+
+    def test_record_never_blocks(self, tmp_path):
+        """Test recording returns at once while the database is locked, dropping overflow"""
+        board = Leaderboard(tmp_path / "leaderboard.db", LeaderboardConfig(queue_size=2))
+        lock = sqlite3.connect(board.path, isolation_level=None)
+        try:
+            lock.execute("BEGIN EXCLUSIVE")
+            board.record(run(1))
+            time.sleep(0.05)  # Writer takes it and waits for the lock
+            start = time.perf_counter()
+            results = [board.record(run(score)) for score in (2, 3, 4)]
+            assert time.perf_counter() - start < 0.01
+            assert results == [True, True, False]
+            assert board.dropped == 1
+        finally:
+            lock.execute("ROLLBACK")
+            lock.close()
+        board.flush()
+        assert board.count() == 3
+        board.close()
+
+    def test_imports_old_high_score(self, board, tmp_path):
+        """Test a highscore.txt is carried over once, into an empty board only"""
+        old = tmp_path / "highscore.txt"
+        old.write_text("1234\n")
+        assert board.import_high_score(old)
+        assert not board.import_high_score(old)
+        (entry,) = board.top()
+        assert (entry.score, entry.seed) == (1234, None)
+
+    def test_concurrent_import_happens_once(self, board, tmp_path):
+        """Test two processes that both saw an empty board import the old score once"""
+        old = tmp_path / "highscore.txt"
+        old.write_text("1234\n")
+        other = Leaderboard(board.path)
+        try:
+            other.count = lambda: 0  # Read before board's import committed
+            assert board.import_high_score(old)
+            assert not other.import_high_score(old)
+            assert board.count() == 1
+        finally:
+            other.close()
+
+
+class TestGameRecording:
+    """Test the game records runs and seeds them."""
+
+    @pytest.fixture
+    def game(self, tmp_path):
+        """A game with a leaderboard in a temporary directory."""
+        pygame.init()
+        game = Game()
+        game.LEADERBOARD_FILE = tmp_path / "leaderboard.db"
+        game.open_leaderboard()
+        yield game
+        game.leaderboard.close()
+        game.entity_workers.close()
+        pygame.quit()
+
+    def test_run_recorded(self, game):
+        """Test a finished run reaches the menu board at once and the database after"""
+        game.start_new_game()
+        game.score = 250
+        game.stats.kills = 12
+        game.stats.time = 42.0
+        game.record_run()
+        assert game.high_score == 250
+        assert [entry.score for entry in game.top_runs] == [250]
+
+        game.leaderboard.flush()
+        (entry,) = game.leaderboard.top()
+        assert (entry.score, entry.wave, entry.kills, entry.duration, entry.seed) == (
+            250,
+            game.current_wave,
+            12,
+            42.0,
+            game.seed,
+        )
+        game.render_menu()
+
+    def test_fixed_seed_replays_spawns(self, game, monkeypatch):
+        """Test GAME_SEED fixes the run seed, and with it the spawn sequence"""
+        monkeypatch.setenv("GAME_SEED", "1234")
+        spawns = []
+        for _ in range(2):
+            game.start_new_game()
+            game.spawn_zombie()
+            spawns.append([(zombie.x, zombie.y) for zombie in game.zombies])
+        assert game.seed == 1234
+        assert spawns[0] == spawns[1]
+
+        game.record_run()
+        game.leaderboard.flush()
+        game.load_high_scores()
+        assert [entry.seed for entry in game.top_runs] == [1234]
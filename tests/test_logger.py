@@ -0,0 +1,82 @@
+"""Tests for the logging pipeline (src/logger.py)"""
+
+import gzip
+import logging
+
+import pytest
+
+from config import LoggingConfig
+from logger import RateLimitFilter, setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def root_handlers():
+    """Restore the root logger's handlers and level after a test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    shutdown_logging()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def _record(msg: str, *args, level: int = logging.DEBUG) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestRateLimitFilter:
+    """Test suppression of repeated debug records."""
+
+    def test_limits_repeated_debug_records(self):
+        """Test only max_records pass per key within a window"""
+        rate_filter = RateLimitFilter(max_records=3, window=60.0)
+        passed = [rate_filter.filter(_record("hit %d", i)) for i in range(10)]
+        assert passed.count(True) == 3
+
+    def test_other_keys_and_warnings_pass(self):
+        """Test the limit is per format string and never applies to warnings"""
+        rate_filter = RateLimitFilter(max_records=1, window=60.0)
+        assert rate_filter.filter(_record("spawn"))
+        assert not rate_filter.filter(_record("spawn"))
+        assert rate_filter.filter(_record("reload"))
+        assert rate_filter.filter(_record("spawn", level=logging.WARNING))
+
+    def test_reports_suppressed_count_after_window(self):
+        """Test the first record of a new window notes suppressed records"""
+        rate_filter = RateLimitFilter(max_records=1, window=60.0)
+        assert rate_filter.filter(_record("shot %d", 1))
+        assert not rate_filter.filter(_record("shot %d", 2))
+        rate_filter.window = 0.0  # Next record starts a new window
+        record = _record("shot %d", 3)
+        assert rate_filter.filter(record)
+        assert record.getMessage() == "shot 3 [1 similar suppressed]"
+
+
+class TestLoggingPipeline:
+    """Test the queued, rotating file pipeline."""
+
+    def test_records_written_after_shutdown(self, tmp_path, root_handlers):
+        """Test records reach the log file once the background writer is flushed"""
+        log_file = setup_logging(LoggingConfig(log_dir=str(tmp_path)))
+        logging.getLogger("test").debug("zombie %s at (%d, %d)", "Tank", 10.7, 20.2)
+        shutdown_logging()
+
+        text = log_file.read_text(encoding="utf-8")
+        assert "zombie Tank at (10, 20)" in text
+
+    def test_rotated_files_are_compressed(self, tmp_path, root_handlers):
+        """Test size-based rotation produces gzip backups"""
+        config = LoggingConfig(log_dir=str(tmp_path), max_bytes=2000, rate_limit_count=1000)
+        log_file = setup_logging(config)
+        for i in range(200):
+            logging.getLogger("test").info("line %d padded to grow the file quickly", i)
+        shutdown_logging()
+
+        backups = sorted(tmp_path.glob("*.log.*.gz"))
+        assert backups
+        with gzip.open(backups[0], "rt", encoding="utf-8") as f:
+            assert "padded to grow" in f.read()
+        assert log_file.exists()
@@ -0,0 +1,21 @@
+"""Tests for the entity memory budget report (src/memory_report.py)"""
+
+from entities.zombie import Zombie
+from memory_report import ENTITY_FACTORIES, build_report, measure_entity_bytes
+
+
+class TestMemoryReport:
+    """Test memory measurement and report output."""
+
+    def test_measure_entity_bytes_is_compact(self):
+        """Test slotted zombies stay within a small fixed budget"""
+        size = measure_entity_bytes(lambda i: Zombie(i + 0.5, i + 0.25), samples=200)
+        assert 0 < size < 256
+
+    def test_report_lists_every_type(self):
+        """Test the report has a row per entity type and per population size"""
+        report = build_report([10, 10000], samples=50)
+        for name in ENTITY_FACTORIES:
+            assert name in report
+        assert "World mix" in report
+        assert "10,000" in report
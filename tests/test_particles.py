@@ -0,0 +1,108 @@
+"""Tests for the vectorized particle system (src/particles.py)"""
+
+import pygame
+import pytest
+
+from config import ParticleConfig
+from particles import ParticleSystem
+
+
+@pytest.fixture
+def particles():
+    """Create a small, seeded particle system."""
+    pygame.init()
+    config = ParticleConfig(max_particles=100)
+    system = ParticleSystem(config, seed=1)
+    yield system
+    pygame.quit()
+
+
+class TestEmission:
+    """Test particle emission."""
+
+    def test_emit_burst_uses_preset_count(self, particles):
+        """Test presets emit their configured particle count"""
+        emitted = particles.emit_burst(100, 100, "blood")
+        assert emitted == particles.config.presets["blood"]["count"]
+        assert len(particles) == emitted
+
+    def test_emit_capped_at_capacity(self, particles):
+        """Test emission never exceeds preallocated capacity"""
+        particles.emit(0, 0, 80, (255, 0, 0), (10, 20), (1, 1), (2, 2))
+        emitted = particles.emit(0, 0, 80, (255, 0, 0), (10, 20), (1, 1), (2, 2))
+        assert emitted == 20
+        assert len(particles) == 100
+
+    def test_emit_capped_at_limit(self, particles):
+        """Test a lowered limit (quality governor) caps live particles"""
+        particles.limit = 30
+        emitted = particles.emit(0, 0, 80, (255, 0, 0), (10, 20), (1, 1), (2, 2))
+        assert emitted == 30
+        assert particles.emit(0, 0, 5, (255, 0, 0), (10, 20), (1, 1), (2, 2)) == 0
+
+    def test_color_override_registers_palette(self, particles):
+        """Test color overrides add a palette entry"""
+        particles.emit_burst(0, 0, "pickup", color=(0, 255, 255))
+        assert (0, 255, 255) in particles.palette
+
+
+class TestUpdate:
+    """Test particle integration and expiry."""
+
+    def test_particles_move(self, particles):
+        """Test particles move away from the emitter"""
+        particles.emit(50, 50, 10, (255, 0, 0), (100, 100), (1, 1), (2, 2))
+        particles.update(0.1)
+        offsets = particles.position[:10] - 50
+        assert (abs(offsets).sum(axis=1) > 0).all()
+
+    def test_expired_particles_compacted(self, particles):
+        """Test expired particles are removed and live ones packed to the front"""
+        particles.emit(0, 0, 5, (255, 0, 0), (0, 0), (0.1, 0.1), (2, 2))
+        particles.emit(0, 0, 5, (0, 255, 0), (0, 0), (1.0, 1.0), (2, 2))
+
+        particles.update(0.2)
+
+        assert len(particles) == 5
+        green = particles.palette.index((0, 255, 0))
+        assert (particles.color[:5] == green).all()
+
+    def test_clear(self, particles):
+        """Test clear() removes all particles"""
+        particles.emit_burst(0, 0, "spark")
+        particles.clear()
+        assert len(particles) == 0
+
+
+class TestDraw:
+    """Test stamp-based rendering."""
+
+    def test_draw_caches_stamps(self, particles):
+        """Test drawing builds stamps once and reuses them"""
+        surface = pygame.Surface((200, 200))
+        particles.emit(100, 100, 20, (255, 0, 0), (0, 0), (1, 1), (3, 3))
+
+        particles.draw(surface)
+        stamp_count = particles.stamp_count
+        particles.draw(surface)
+
+        assert stamp_count == 1
+        assert particles.stamp_count == stamp_count
+
+    def test_snapshot_draws_same_pixels(self, particles):
+        """Test a snapshot draws like the live system and ignores later updates"""
+        particles.emit_burst(20, 20, "spark")
+        live = pygame.Surface((40, 40))
+        particles.draw(live)
+
+        snapshot = particles.snapshot()
+        particles.update(10.0)  # Expire everything
+        copied = pygame.Surface((40, 40))
+        snapshot.draw(copied)
+
+        assert len(particles) == 0
+        assert pygame.image.tobytes(copied, "RGB") == pygame.image.tobytes(live, "RGB")
+
+    def test_draw_empty(self, particles):
+        """Test drawing with no particles is a no-op"""
+        particles.draw(pygame.Surface((10, 10)))
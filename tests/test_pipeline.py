@@ -0,0 +1,82 @@
+"""Tests for pipelined rendering on a render thread (src/pipeline.py)"""
+
+import pygame
+import pytest
+
+from game import Game
+from game_state import GameState
+from pipeline import RenderPipeline
+
+
+@pytest.fixture
+def game():
+    """Create a Game in PLAYING state with a render pipeline."""
+    pygame.init()
+    game = Game()
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    for _ in range(20):
+        game.spawn_zombie()
+    game.particles.emit_burst(200, 200, "blood")
+    game.pipeline = RenderPipeline(game)
+    yield game
+    game.pipeline.stop()
+    pygame.quit()
+
+
+class TestRenderPipeline:
+    """Test snapshot capture and threaded drawing."""
+
+    def test_threaded_frame_matches_serial(self, game):
+        """Test a frame drawn on the render thread matches a serial draw"""
+        game.draw_frame()
+        expected = pygame.image.tobytes(game.screen, "RGB")
+
+        game.screen.fill((0, 0, 0))
+        game.pipeline.submit(game.pipeline.capture())
+        game.pipeline.wait()
+        assert pygame.image.tobytes(game.screen, "RGB") == expected
+
+    def test_snapshot_isolated_from_simulation(self, game):
+        """Test updating the game after capture does not change the snapshot"""
+        frame = game.pipeline.capture()
+        zombie = game.zombies[0]
+        x = zombie.x
+
+        game.update(0.1)
+        game.player.x += 50
+        game.particles.clear()
+
+        assert frame.world.query("sprite")[0].rows[0].x == x
+        assert frame.player.x == game.player.x - 50
+        assert len(frame.particles) > 0
+
+    def test_buffers_alternate(self, game):
+        """Test consecutive captures write different buffers"""
+        first = game.pipeline.capture()
+        game.pipeline.submit(first)
+        game.pipeline.wait()
+        second = game.pipeline.capture()
+        assert second is not first
+        assert second is not game
+
+    def test_render_error_raised_on_main_thread(self, game):
+        """Test a failure while drawing surfaces from wait()"""
+        frame = game.pipeline.capture()
+        frame.player = None  # render_player will fail
+        game.pipeline.submit(frame)
+        with pytest.raises(RuntimeError):
+            game.pipeline.wait()
+
+    def test_pipelined_frames_present(self, game):
+        """Test the pipelined loop step draws frames and stops submitting outside PLAYING"""
+        for _ in range(3):
+            game.update(1 / 60)
+            game.render_pipelined()
+        game.finish_rendering()
+        assert game.pipeline.frames == 3
+
+        game.state = GameState.PAUSED
+        game.render_pipelined()
+        game.finish_rendering()
+        assert game.pipeline.frames == 3
@@ -0,0 +1,128 @@
+"""Tests for the adaptive quality governor (src/quality.py)"""
+
+import pygame
+import pytest
+
+from config import QualityConfig, game_config
+from game import Game
+from quality import QualityGovernor
+
+FRAME = 1 / 60  # Seconds per frame at the 60 FPS target (16.7ms budget)
+
+
+def run_frames(governor, frame_ms, seconds):
+    """Feed a constant frame time for a number of seconds; return tier changes."""
+    changes = 0
+    for _ in range(round(seconds / FRAME)):
+        changes += governor.observe(frame_ms, FRAME)
+    return changes
+
+
+@pytest.fixture
+def governor():
+    """Governor with default thresholds targeting 60 FPS."""
+    return QualityGovernor(QualityConfig(), target_fps=60)
+
+
+class TestQualityGovernor:
+    """Test tier stepping and hysteresis."""
+
+    def test_starts_at_best_tier(self, governor):
+        """Test the governor starts at the highest quality tier"""
+        assert governor.tier_name == "high"
+        assert governor.budget_ms == pytest.approx(1000 / 60)
+
+    def test_downgrades_under_sustained_load(self, governor):
+        """Test frames over budget step quality down one tier at a time"""
+        assert run_frames(governor, 30.0, 1.0) == 1
+        assert governor.tier_name == "medium"
+
+    def test_brief_spike_keeps_tier(self, governor):
+        """Test a short spike does not outlast the downgrade hold time"""
+        run_frames(governor, 8.0, 1.0)
+        run_frames(governor, 40.0, 0.1)
+        run_frames(governor, 8.0, 1.0)
+        assert governor.tier_name == "high"
+
+    def test_upgrades_after_hold_time(self, governor):
+        """Test headroom raises quality only after upgrade_after seconds"""
+        run_frames(governor, 30.0, 1.0)
+        assert governor.tier_name == "medium"
+
+        run_frames(governor, 5.0, 2.0)
+        assert governor.tier_name == "medium"
+        run_frames(governor, 5.0, 3.0)
+        assert governor.tier_name == "high"
+
+    def test_no_oscillation_inside_band(self, governor):
+        """Test frame times between the thresholds never change the tier"""
+        run_frames(governor, 30.0, 1.0)
+        assert run_frames(governor, 14.0, 30.0) == 0
+        assert governor.tier_name == "medium"
+
+    def test_stops_at_lowest_tier(self, governor):
+        """Test sustained overload settles on the cheapest tier"""
+        run_frames(governor, 50.0, 20.0)
+        assert governor.tier_index == len(governor.config.tiers) - 1
+
+    def test_disabled_governor_holds_tier(self):
+        """Test a disabled governor never changes tier"""
+        governor = QualityGovernor(QualityConfig(enabled=False), target_fps=60)
+        assert run_frames(governor, 50.0, 5.0) == 0
+
+    def test_report_names_tier(self, governor):
+        """Test the profiler line shows the tier and smoothed frame time"""
+        run_frames(governor, 10.0, 0.5)
+        assert governor.report().startswith("quality=high frame=10.0ms")
+
+
+@pytest.fixture
+def game():
+    """Create a Game instance for testing."""
+    pygame.init()
+    game = Game()
+    yield game
+    pygame.quit()
+
+
+class TestApplyQuality:
+    """Test tier settings applied to the game."""
+
+    def test_lowest_tier_limits_effects(self, game):
+        """Test the cheapest tier lowers caps, coarsens rotation and drops extras"""
+        game.apply_quality(game.quality.config.tiers[-1])
+
+        assert game.rotation_step == 30.0
+        assert game.render_scale == 0.5
+        assert game.particles.limit < game.particles.capacity
+        assert game.kill_flashes.limit < game.kill_flashes.capacity
+
+        game.start_new_game()
+        game.spawn_zombie()
+        game.on_zombie_killed(game.zombies[0])
+        assert len(game.kill_flashes) == 0
+        assert len(game.damage_popups) == 0
+        assert len(game.particles) <= game.particles.limit
+
+    def test_governor_feeds_tier_changes(self, game):
+        """Test sustained slow frames switch the game to a lower tier"""
+        for _ in range(60):
+            game.update_quality(40.0, FRAME)
+        assert game.quality_tier["name"] == "medium"
+        assert game.rotation_step == 10.0
+
+    def test_tier_is_per_game(self, game):
+        """Test a tier change leaves the shared config and other games' rotations alone"""
+        from utils import get_rotated_sprite
+
+        other = Game()
+        game.apply_quality(game.quality.config.tiers[-1])
+
+        assert game_config.rotation_cache_step == 5.0
+        assert other.rotation_step == 5.0
+        path = game.player.config.sprite_path
+        coarse = get_rotated_sprite(path, 40, 12.0, game.rotation_step)
+        fine = get_rotated_sprite(path, 40, 12.0, other.rotation_step)
+        if coarse is not None:  # Sprites load (assets present)
+            assert coarse is get_rotated_sprite(path, 40, 0.0, game.rotation_step)
+            assert fine is get_rotated_sprite(path, 40, 10.0)
@@ -0,0 +1,129 @@
+"""Tests for binary save states (src/savestate.py)"""
+
+import random
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+from bot import make_bot
+from entities.zombie_tank import TankZombie
+from game import Game
+from game_state import GameState
+from savestate import HEADER, VERSION
+
+
+@pytest.fixture
+def game():
+    """Create a bot-driven game some way into a run (zombies, shots, effects live)."""
+    pygame.init()
+    random.seed(3)
+    game = Game()
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    game.controller = make_bot("kite")
+    game.spawn_zombie()
+    for _ in range(900):
+        game.update(1 / 60)
+    yield game
+    game.entity_workers.close()
+    pygame.quit()
+
+
+def state_of(game) -> tuple:
+    """Comparable summary of the simulation state."""
+    player = game.player
+    particles = game.particles
+    return (
+        game.state,
+        game.score,
+        game.current_wave,
+        game.zombies_to_spawn,
+        game.spawn_timer,
+        game.wave_delay_timer,
+        (game.stats.time, game.stats.kills, game.stats.shots, game.stats.damage_taken),
+        (player.x, player.y, player.angle, player.health, player.magazine, player.stash),
+        [(type(z), z.x, z.y, z.angle, z.health) for z in game.zombies],
+        [(p.x, p.y, p.velocity_x, p.velocity_y, p.age, p.alive) for p in game.projectiles],
+        [(p.powerup_type, p.x, p.y, p.lifetime) for p in game.powerups],
+        [(f.x, f.y, f.timer) for f in game.kill_flashes],
+        [(p.text, p.timer) for p in game.damage_popups],
+        particles.position[: particles.count].tobytes(),
+        particles.lifetime[: particles.count].tobytes(),
+    )
+
+
+class TestSaveState:
+    """Test snapshot/restore round trips."""
+
+    def test_round_trip(self, game):
+        """Test restoring a snapshot reproduces the saved state exactly"""
+        expected = state_of(game)
+        data = game.snapshot()
+        for _ in range(120):
+            game.update(1 / 60)
+        assert state_of(game) != expected
+
+        game.restore(data)
+        assert state_of(game) == expected
+
+    def test_branches_replay_identically(self, game):
+        """Test two runs from the same snapshot end in the same state (RNGs restored)"""
+        data = game.snapshot()
+        for _ in range(300):
+            game.update(1 / 60)
+        first = state_of(game)
+
+        game.restore(data)
+        random.random()  # Disturb the stream: restore must put it back
+        game.restore(data)
+        for _ in range(300):
+            game.update(1 / 60)
+        assert state_of(game) == first
+
+    def test_zombie_health_and_variant(self, game):
+        """Test damaged tanks keep their health and variant"""
+        tank = TankZombie(100, 200)
+        tank.health = 1
+        tank.angle = 33.0
+        game.world.spawn(tank)
+        game.restore(game.snapshot())
+        restored = game.zombies[-1]
+        assert type(restored) is TankZombie
+        assert (restored.x, restored.y, restored.angle, restored.health) == (100, 200, 33.0, 1)
+
+    def test_particle_colors_survive_new_palette(self, game):
+        """Test particle colors are remapped onto another system's palette"""
+        game.particles.clear()
+        game.particles.emit(50, 50, 5, (10, 20, 30), (10, 20), (1, 2), (2, 4))
+        data = game.snapshot()
+
+        other = Game()
+        # Different palette order
+        other.particles.emit(0, 0, 1, (200, 0, 0), (10, 20), (1, 2), (2, 4))
+        other.restore(data)
+        colors = other.particles.color[: other.particles.count]
+        assert {other.particles.palette[index] for index in colors} == {(10, 20, 30)}
+        other.entity_workers.close()
+
+    def test_rejects_other_versions(self, game):
+        """Test foreign data and other format versions raise ValueError"""
+        data = bytearray(game.snapshot())
+        with pytest.raises(ValueError, match="Not a save state"):
+            game.restore(b"PNG\0" + bytes(data[4:]))
+
+        header = np.frombuffer(data, HEADER, count=1).copy()
+        header["version"] = VERSION + 1
+        data[: HEADER.itemsize] = header.tobytes()
+        with pytest.raises(ValueError, match="version"):
+            game.restore(bytes(data))
+
+    def test_fast(self, game):
+        """Test snapshot and restore each take well under a millisecond"""
+        data = game.snapshot()
+        start = time.perf_counter()
+        for _ in range(100):
+            game.restore(game.snapshot())
+        assert (time.perf_counter() - start) / 100 < 0.001
+        assert len(data) < 64 * 1024
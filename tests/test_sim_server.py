@@ -0,0 +1,137 @@
+"""Tests for the multi-process simulation server (src/sim_server.py)"""
+
+import time
+
+import pygame
+import pytest
+
+from config import GameConfig
+from controls import Controls
+from entities.powerup import Powerup, PowerupType
+from entities.projectile import Projectile
+from entities.zombie_tank import TankZombie
+from game import Game
+from game_state import GameState
+from sim_server import H, SharedInputController, SharedState, SimulationClient, StateMirror
+
+
+@pytest.fixture
+def game():
+    """Create a Game with a few entities of every kind."""
+    pygame.init()
+    game = Game()
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    game.world.spawn(TankZombie(100, 120))
+    game.world.spawn(Projectile(200, 220, 45))
+    game.world.spawn(Powerup(300, 320, PowerupType.SHIELD))
+    yield game
+    pygame.quit()
+
+
+@pytest.fixture
+def shared():
+    """Allocate a small shared segment in this process."""
+    state = SharedState.create(max_entities=16, slots=3)
+    yield state
+    state.close()
+    state.shm.unlink()
+
+
+class TestSharedState:
+    """Test the shared-memory ring layout."""
+
+    def test_publish_and_read(self, game, shared):
+        """Test a published tick reads back with its entities and scalars"""
+        game.score = 42
+        count = shared.publish(game, seq=0, run=1, tick=5, tick_ms=1.5)
+
+        header, rows = shared.read_latest()
+        assert count == len(game.zombies) + 2
+        assert len(rows) == count
+        assert header[H["score"]] == 42
+        assert header[H["tick"]] == 5
+        assert header[H["x"]] == game.player.x
+
+    def test_ring_keeps_newest(self, game, shared):
+        """Test readers always get the latest sequence across ring wraparound"""
+        for seq in range(7):
+            game.score = seq
+            shared.publish(game, seq=seq, run=1, tick=seq, tick_ms=0.0)
+        header, _ = shared.read_latest()
+        assert header[H["seq"]] == 6
+        assert header[H["score"]] == 6
+
+    def test_slot_being_written_is_skipped(self, game, shared):
+        """Test a slot marked in-progress is never returned"""
+        assert shared.read_latest() is None
+        shared.publish(game, seq=0, run=1, tick=0, tick_ms=0.0)
+        shared.headers[0, H["seq"]] = -1  # Writer mid-update
+        assert shared.read_latest() is None
+
+    def test_entities_capped(self, game, shared):
+        """Test entities beyond the slot capacity are dropped"""
+        for _ in range(20):
+            game.spawn_zombie()
+        assert shared.publish(game, seq=0, run=1, tick=0, tick_ms=0.0) == 16
+
+    def test_input_forwarded(self, shared):
+        """Test the simulation-side controller decodes forwarded input"""
+        shared.control[1] = Controls(left=True, reload=True).pack()
+        assert SharedInputController(shared).read(None) == Controls(left=True, reload=True)
+
+
+class TestStateMirror:
+    """Test applying published ticks to a render-only game."""
+
+    def test_apply_rebuilds_world(self, game, shared):
+        """Test mirrored entities and player match the publishing game"""
+        game.player.x = 321.0
+        game.player.magazine = 3
+        shared.publish(game, seq=0, run=1, tick=0, tick_ms=0.0)
+        header, rows = shared.read_latest()
+
+        local = Game()
+        StateMirror().apply(header, rows, local)
+
+        assert local.player.x == 321.0
+        assert local.player.magazine == 3
+        assert isinstance(local.player.magazine, int)
+        kinds = sorted(type(e).__name__ for t in local.world.query("sprite") for e in t.rows)
+        expected = sorted(type(e).__name__ for t in game.world.query("sprite") for e in t.rows)
+        assert kinds == expected
+        local.draw_frame()  # Mirrored entities are drawable
+
+    def test_game_over_propagates(self, game, shared):
+        """Test the mirror switches to GAME_OVER when the simulation ends"""
+        game.state = GameState.GAME_OVER
+        shared.publish(game, seq=0, run=1, tick=0, tick_ms=0.0)
+        local = Game()
+        local.state = GameState.PLAYING
+        StateMirror().apply(*shared.read_latest(), local)
+        assert local.state == GameState.GAME_OVER
+
+
+class TestSimulationProcess:
+    """Test the real simulation process end to end."""
+
+    def test_process_publishes_ticks(self, game):
+        """Test a spawned simulation runs a game and the client mirrors it"""
+        client = SimulationClient(GameConfig(sim_max_entities=256, sim_ring_slots=3))
+        try:
+            client.restart()
+            deadline = time.monotonic() + 30
+            while client.mirror.applied < 5 and time.monotonic() < deadline:
+                client.sync(game)
+                time.sleep(0.01)
+            assert client.mirror.applied >= 5
+            assert game.current_wave == 1
+
+            # The simulation keeps its fixed rate while this (render) side stalls
+            before = client.state.read_latest()[0][H["tick"]]
+            time.sleep(0.5)
+            after = client.state.read_latest()[0][H["tick"]]
+            assert after - before >= 15
+        finally:
+            client.stop()
+        assert not client.process.is_alive()
@@ -0,0 +1,108 @@
+"""Tests for the sound voice manager (src/sound.py)"""
+
+from config import SoundConfig
+from sound import VoiceManager
+
+
+class FakeChannel:
+    """Stands in for pygame.mixer.Channel (no audio device needed)."""
+
+    def __init__(self):
+        self.sound = None
+        self.plays = 0
+
+    def play(self, sound):
+        self.sound = sound
+        self.plays += 1
+
+    def stop(self):
+        self.sound = None
+
+    def get_busy(self):
+        return self.sound is not None
+
+
+def _manager(groups: dict | None = None) -> tuple[VoiceManager, list[FakeChannel]]:
+    config = SoundConfig()
+    if groups is not None:
+        config.channel_groups = groups
+    channels = [FakeChannel() for _ in range(sum(config.channel_groups.values()))]
+    return VoiceManager(channels, config), channels
+
+
+SOUNDS = {name: name for name in SoundConfig().voices}
+
+
+class TestVoiceManager:
+    """Test coalescing, throttling and voice stealing."""
+
+    def test_triggers_coalesced_per_frame(self):
+        """Test 30 zombie deaths in one frame start a single voice"""
+        voices, channels = _manager()
+        for _ in range(30):
+            voices.trigger("zombie_death")
+        assert voices.flush(SOUNDS, now=0.0) == 1
+        assert voices.coalesced == 29
+        assert sum(channel.plays for channel in channels) == 1
+
+    def test_retrigger_interval(self):
+        """Test a sound is skipped until its retrigger interval has passed"""
+        voices, _ = _manager()
+        voices.trigger("fire")
+        assert voices.flush(SOUNDS, now=0.0) == 1
+        voices.trigger("fire")
+        assert voices.flush(SOUNDS, now=0.01) == 0
+        voices.trigger("fire")
+        assert voices.flush(SOUNDS, now=0.2) == 1
+        assert voices.throttled == 1
+
+    def test_max_instances(self):
+        """Test concurrent instances of one sound are capped"""
+        voices, channels = _manager()
+        for frame in range(10):
+            voices.trigger("zombie_death")
+            voices.flush(SOUNDS, now=frame * 1.0)
+        playing = [c for c in channels if c.sound == "zombie_death"]
+        assert len(playing) == SoundConfig().voices["zombie_death"]["max_instances"]
+
+    def test_sounds_use_their_channel_group(self):
+        """Test voices land on their category's reserved channels"""
+        voices, channels = _manager()
+        voices.trigger("zombie_death")
+        voices.flush(SOUNDS, now=0.0)
+        index = next(i for i, c in enumerate(channels) if c.sound == "zombie_death")
+        assert index in voices.groups["combat"]
+
+    def test_critical_cue_steals_from_other_group(self):
+        """Test game_over steals a low-priority voice when its own group is full"""
+        voices, channels = _manager({"critical": 1, "combat": 1})
+        voices.trigger("player_damage")
+        voices.trigger("zombie_death")
+        voices.flush(SOUNDS, now=0.0)
+
+        voices.trigger("game_over")
+        assert voices.flush(SOUNDS, now=0.5) == 1
+        assert [c.sound for c in channels] == ["player_damage", "game_over"]
+        assert voices.stolen == 1
+
+    def test_low_priority_never_steals_from_critical(self):
+        """Test zombie deaths are dropped rather than cutting off critical cues"""
+        voices, channels = _manager({"critical": 1, "combat": 0})
+        voices.trigger("player_damage")
+        voices.flush(SOUNDS, now=0.0)
+
+        voices.trigger("zombie_death")
+        assert voices.flush(SOUNDS, now=0.5) == 0
+        assert channels[0].sound == "player_damage"
+        assert voices.dropped == 1
+
+    def test_finished_channels_are_reused(self):
+        """Test a channel becomes free once its sound stops"""
+        voices, channels = _manager({"critical": 1})
+        voices.trigger("player_damage")
+        voices.flush(SOUNDS, now=0.0)
+        channels[0].stop()  # Sound finished
+
+        voices.trigger("game_over")
+        assert voices.flush(SOUNDS, now=1.0) == 1
+        assert voices.stolen == 0
@@ -0,0 +1,152 @@
+"""Tests for spectator streaming (src/spectator.py)"""
+
+import socket
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+from config import NetConfig
+from coop import STATES, dequantize_position
+from game import Game
+from game_state import GameState
+from spectator import LENGTH, MAGIC, SpectatorServer, Viewer, decode_frame
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() holds."""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "Timed out"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def game():
+    """A started game with a few zombies."""
+    pygame.init()
+    game = Game()
+    game.start_new_game()
+    game.state = GameState.PLAYING
+    for _ in range(5):
+        game.spawn_zombie()
+    yield game
+    game.entity_workers.close()
+    pygame.quit()
+
+
+@pytest.fixture
+def server():
+    """A spectator server on a free loopback port with a small send buffer."""
+    server = SpectatorServer(port=0, host="127.0.0.1", config=NetConfig(spectator_buffer=4096))
+    yield server
+    server.close()
+
+
+def stalled_viewer(server, receive_buffer=4096):
+    """A connected socket that never reads past the stream tag."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+    sock.connect(server.address)
+    return sock
+
+
+class TestStream:
+    """Test frames reach viewers intact."""
+
+    def test_viewer_receives_frames(self, game, server):
+        """Test a viewer decodes what the game published and can draw it"""
+        viewer = Viewer(server.address)
+        try:
+            wait_for(lambda: server.viewers == 1)
+            game.update(1 / 60)
+            assert server.publish(game, 1.0)
+            wait_for(lambda: viewer.frames == 1)
+
+            header, players, entities = viewer.latest
+            assert STATES[header["state"]] is GameState.PLAYING
+            assert int(header["entities"]) == len(entities) == game.world.count("sprite")
+            assert float(dequantize_position(players["x"][0])) == pytest.approx(
+                game.player.x, abs=1 / 16
+            )
+            viewer.render(pygame.Surface((800, 600)))
+        finally:
+            viewer.close()
+        wait_for(lambda: server.viewers == 0)
+
+    def test_rate_and_idle(self, game, server):
+        """Test nothing is encoded without viewers and frames are paced to spectator_rate"""
+        assert not server.publish(game, 1.0)
+        assert server.frames == 0
+
+        viewer = Viewer(server.address)
+        try:
+            wait_for(lambda: server.viewers == 1)
+            published = [server.publish(game, 1 / 120) for _ in range(120)]
+            assert sum(published) == pytest.approx(server.config.spectator_rate, abs=1)
+        finally:
+            viewer.close()
+
+    def test_frame_layout(self, game, server):
+        """Test the raw stream is the tag then length-prefixed frames"""
+        sock = socket.create_connection(server.address)
+        try:
+            assert sock.recv(len(MAGIC)) == MAGIC
+            wait_for(lambda: server.viewers == 1)
+            server.publish(game, force=True)
+            sock.settimeout(5.0)
+            (size,) = np.frombuffer(sock.recv(LENGTH.itemsize, socket.MSG_WAITALL), LENGTH)
+            header, _, _ = decode_frame(sock.recv(int(size), socket.MSG_WAITALL))
+            assert int(header["tick"]) == 0
+        finally:
+            sock.close()
+
+
+class TestBackpressure:
+    """Test slow viewers never hold up the game or other viewers."""
+
+    def test_slow_viewer_drops_frames(self, game, server):
+        """Test a stalled viewer skips frames while a fast one keeps up, encoded once"""
+        for _ in range(100):
+            game.spawn_zombie()  # ~1 KB frames fill the stalled socket quickly
+        stalled = stalled_viewer(server)
+        viewer = Viewer(server.address)
+        try:
+            wait_for(lambda: server.viewers == 2)
+            slowest = 0.0
+            for _ in range(400):
+                start = time.perf_counter()
+                server.publish(game, force=True)
+                slowest = max(slowest, time.perf_counter() - start)
+                time.sleep(0.001)
+
+            def rows():
+                return {row["address"][1]: row for row in server.report()["subscribers"]}
+
+            # The fast viewer may lose the odd frame to scheduling, never one it was sent
+            fast_port = viewer.sock.getsockname()[1]
+            wait_for(lambda: rows()[fast_port]["sent"] + rows()[fast_port]["dropped"] == 400)
+            wait_for(lambda: viewer.frames == rows()[fast_port]["sent"])
+
+            assert server.frames == 400  # One encode per frame, not per viewer
+            slow = rows()[stalled.getsockname()[1]]
+            assert slow["dropped"] > 100
+            assert rows()[fast_port]["dropped"] < slow["dropped"] / 4
+            assert slow["sent"] + slow["dropped"] <= 400
+            assert slowest < 0.05  # Never waited on the stalled viewer
+        finally:
+            viewer.close()
+            stalled.close()
+
+    def test_close_with_stalled_viewer(self, server):
+        """Test shutdown does not hang on a viewer that stopped reading"""
+        stalled = stalled_viewer(server)
+        try:
+            wait_for(lambda: server.viewers == 1)
+            start = time.perf_counter()
+            server.close()
+            assert time.perf_counter() - start < 1.0
+            assert not server._thread.is_alive()
+        finally:
+            stalled.close()
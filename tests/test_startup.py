@@ -0,0 +1,76 @@
+"""Tests for startup profiling and lazy initialization (src/startup.py)"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pygame
+
+from game import Game
+from startup import StartupProfiler
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Regression budget for a cold launch (imports + display + assets) to the first menu frame.
+# Typical is a few hundred ms; the margin absorbs slow CI machines.
+LAUNCH_TO_MENU_BUDGET_MS = 3000.0
+
+LAUNCH_SCRIPT = """
+from startup import LAUNCH_TIME, StartupProfiler
+profiler = StartupProfiler(origin=LAUNCH_TIME)
+game = profiler.import_module("game").Game(profiler)
+game.render_menu()
+import pygame
+print(profiler.mark("first menu frame"), bool(pygame.mixer.get_init()))
+"""
+
+
+class TestStartupProfiler:
+    """Test step and milestone recording."""
+
+    def test_steps_and_milestones(self):
+        """Test steps are recorded in order and milestones only once"""
+        profiler = StartupProfiler()
+        with profiler.step("first"):
+            pass
+        profiler.import_module("json")
+        first = profiler.mark("ready")
+
+        assert [name for name, _ in profiler.steps] == ["first", "import json"]
+        assert profiler.mark("ready") == first
+        assert "import json" in profiler.report()
+
+
+class TestLazyInit:
+    """Test subsystems are brought up only when needed."""
+
+    def test_mixer_deferred_until_game_starts(self):
+        """Test the menu comes up without the mixer; starting a game loads audio"""
+        pygame.quit()
+        game = Game()
+        assert not game.sounds_ready
+        assert not pygame.mixer.get_init()
+        assert [name for name, _ in game.startup.steps] == ["display", "font init", "assets"]
+
+        game.start_new_game()
+        assert game.sounds_ready
+        pygame.quit()
+
+    def test_launch_to_menu_budget(self):
+        """Test a cold launch reaches the first menu frame within budget"""
+        env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+        env.update(SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", GAME_LOOSE_ASSETS="1")
+        result = subprocess.run(
+            [sys.executable, "-c", LAUNCH_SCRIPT],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True,
+        )
+        launch_ms, mixer_started = result.stdout.split()[-2:]
+
+        assert float(launch_ms) < LAUNCH_TO_MENU_BUDGET_MS
+        assert mixer_started == "False"
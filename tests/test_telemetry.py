@@ -0,0 +1,194 @@
+"""Tests for per-run telemetry (src/telemetry.py)"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pygame
+import pytest
+
+from config import TelemetryConfig
+from entities.zombie import Zombie
+from entities.zombie_fast import FastZombie
+from game import Game
+from game_state import GameState
+from sim_server import KIND_INDEX
+from telemetry import (
+    DEATH,
+    HIT,
+    KILL,
+    LOADED,
+    RUN,
+    SHOT,
+    SPAWN,
+    WAVE,
+    TelemetryRecorder,
+    heatmap,
+    load,
+    render_heatmap,
+    time_to_kill,
+    wave_stats,
+)
+
+
+def fake_game(time=0.0, wave=1):
+    """The attributes the recorder reads from a Game."""
+    stats = SimpleNamespace(time=time, kills=0, shots=0, hits=0)
+    player = SimpleNamespace(x=100.0, y=200.0)
+    return SimpleNamespace(
+        stats=stats,
+        current_wave=wave,
+        players=[player],
+        player=player,
+        zombies_to_spawn=5,
+        seed=7,
+        score=0,
+        SCREEN_WIDTH=800,
+        SCREEN_HEIGHT=600,
+    )
+
+
+def events(*rows):
+    """LOADED rows from (time, kind, wave, target, variant, aux, x, y, value, run) tuples."""
+    data = np.zeros(len(rows), LOADED)
+    for index, (time, kind, wave, target, variant, aux, x, y, value, run) in enumerate(rows):
+        data[index] = (time, kind, wave, 0, target, variant, aux, x, y, value, run)
+    return data
+
+
+class TestRecorder:
+    """Test event rows and run files."""
+
+    def test_grows_past_capacity(self):
+        """Test a run longer than the preallocated rows keeps every event"""
+        recorder = TelemetryRecorder(config=TelemetryConfig(capacity=4))
+        game = fake_game()
+        for _ in range(10):
+            recorder.shot(game, game.player)
+        assert recorder.count == 10
+        assert len(recorder.events) >= 10
+        assert (recorder.events["kind"][:10] == SHOT).all()
+
+    def test_serials_follow_zombies(self):
+        """Test hits and the kill of a zombie carry the serial of its spawn"""
+        recorder = TelemetryRecorder()
+        game = fake_game()
+        first, second = Zombie(10, 20), FastZombie(30, 40)
+        recorder.spawn(game, first)
+        recorder.spawn(game, second)
+        recorder.hit(game, second, 10, melee=True)
+        recorder.kill(game, second)
+        rows = recorder.events[: recorder.count]
+        assert rows["target"].tolist() == [1, 2, 2, 2]
+        assert rows["variant"][1] == KIND_INDEX[FastZombie]
+        assert rows["aux"][2] == 1
+        assert rows["value"][2] == 10
+
+    def test_finish_round_trip(self, tmp_path):
+        """Test a finished run is written in the background and loads back"""
+        recorder = TelemetryRecorder(tmp_path)
+        game = fake_game(time=12.5, wave=2)
+        recorder.wave(game)
+        recorder.shot(game, game.player)
+        path = recorder.finish(game)
+        assert recorder.count == 0
+        recorder.close()
+
+        loaded, runs = load([path, path])
+        assert len(loaded) == 4
+        assert loaded["kind"].tolist() == [WAVE, SHOT, WAVE, SHOT]
+        assert loaded["run"].tolist() == [0, 0, 1, 1]
+        assert runs["seed"].tolist() == [7, 7]
+        assert runs["duration"][0] == pytest.approx(12.5)
+
+    def test_rejects_other_version(self, tmp_path):
+        """Test files of another format version are refused"""
+        path = tmp_path / "old.npz"
+        run = np.zeros(1, RUN)
+        run["version"] = 99
+        np.savez(path, run=run)
+        with pytest.raises(ValueError):
+            load([path])
+
+
+class TestAnalysis:
+    """Test the vectorized aggregates on hand-built events."""
+
+    def test_wave_stats(self):
+        """Test accuracy counts projectile hits only and dps divides by wave time"""
+        data = events(
+            (0.0, WAVE, 1, 0, 0, 0, 0, 0, 5, 0),
+            (1.0, SHOT, 1, 0, 0, 0, 0, 0, 0, 0),
+            (1.0, SHOT, 1, 0, 0, 0, 0, 0, 0, 0),
+            (1.5, HIT, 1, 1, 0, 0, 0, 0, 30, 0),
+            (2.0, HIT, 1, 1, 0, 1, 0, 0, 20, 0),  # Melee
+            (10.0, WAVE, 2, 0, 0, 0, 0, 0, 8, 0),
+        )
+        runs = np.zeros(1, RUN)
+        runs["duration"] = 15.0
+        first, second = wave_stats(data, runs)
+        assert first["wave"] == 1
+        assert first["seconds"] == pytest.approx(10.0)
+        assert first["accuracy"] == pytest.approx(0.5)
+        assert first["dps"] == pytest.approx(5.0)
+        assert second["seconds"] == pytest.approx(5.0)
+        assert np.isnan(second["accuracy"])
+
+    def test_time_to_kill(self):
+        """Test ttk runs from the first hit and serials do not mix across runs"""
+        zombie = KIND_INDEX[Zombie]
+        data = events(
+            (1.0, SPAWN, 1, 1, zombie, 0, 0, 0, 0, 0),
+            (2.0, HIT, 1, 1, zombie, 0, 0, 0, 10, 0),
+            (2.5, HIT, 1, 1, zombie, 0, 0, 0, 10, 0),
+            (3.0, KILL, 1, 1, zombie, 0, 0, 0, 0, 0),
+            (0.0, SPAWN, 1, 1, zombie, 0, 0, 0, 0, 1),  # Same serial, other run
+            (4.0, HIT, 1, 1, zombie, 0, 0, 0, 10, 1),
+            (5.0, KILL, 1, 1, zombie, 0, 0, 0, 0, 1),
+        )
+        (row,) = time_to_kill(data)
+        assert row["kind"] == "Zombie"
+        assert row["kills"] == 2
+        assert row["ttk_mean"] == pytest.approx(1.0)
+        assert row["alive_mean"] == pytest.approx(3.5)
+
+    def test_heatmap(self):
+        """Test events land in the cell under their position"""
+        data = events(
+            (0.0, KILL, 1, 0, 0, 0, 5, 5, 0, 0),
+            (0.0, KILL, 1, 0, 0, 0, 15, 5, 0, 0),
+            (0.0, KILL, 1, 0, 0, 0, 15, 6, 0, 0),
+            (0.0, DEATH, 1, 0, 0, 0, 5, 15, 0, 0),
+        )
+        counts = heatmap(data, KILL, 20, 20, 10)
+        assert counts.tolist() == [[1, 2], [0, 0]]
+        assert render_heatmap(counts).splitlines() == ["+@", "  "]
+
+
+class TestGameTelemetry:
+    """Test the game feeds the recorder."""
+
+    def test_run_is_recorded(self, tmp_path):
+        """Test a played and lost run writes its events"""
+        pygame.init()
+        game = Game()
+        game.telemetry = TelemetryRecorder(tmp_path)
+        try:
+            game.start_new_game()
+            game.state = GameState.PLAYING
+            for _ in range(5):
+                game.spawn_zombie()
+            game.update(1 / 60)
+            game.player.health = 1
+            game.world.spawn(Zombie(game.player.x, game.player.y))
+            game.update(1 / 60)
+            assert game.state == GameState.GAME_OVER
+            game.telemetry.close()
+
+            loaded, runs = load([game.telemetry.last_path])
+            kinds = loaded["kind"].tolist()
+            assert kinds.count(SPAWN) >= 5
+            assert WAVE in kinds and DEATH in kinds
+            assert runs["wave"][0] == game.current_wave
+        finally:
+            game.entity_workers.close()
+            pygame.quit()
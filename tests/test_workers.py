@@ -0,0 +1,142 @@
+"""Tests for chunked entity updates (src/workers.py)"""
+
+import copy
+import random
+
+import pygame
+import pytest
+
+from entities.projectile import Projectile
+from entities.zombie import Zombie
+from workers import ChunkedUpdater, SpatialGrid, benchmark
+
+
+class Target:
+    """Minimal player stand-in for contact tests."""
+
+    def __init__(self, x, y, radius=15):
+        self.x = x
+        self.y = y
+        self.radius = radius
+
+
+@pytest.fixture
+def zombies():
+    """Create a seeded zombie population spread over the screen."""
+    pygame.init()
+    rng = random.Random(7)
+    yield [Zombie(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(300)]
+    pygame.quit()
+
+
+@pytest.fixture
+def threaded():
+    """Create a 4-worker updater that uses threads even with the GIL."""
+    updater = ChunkedUpdater(4, force_threads=True)
+    yield updater
+    updater.close()
+
+
+class TestSpatialGrid:
+    """Test grid bucketing and queries."""
+
+    def test_query_finds_nearby_entities(self):
+        """Test a query returns entities whose radius reaches the box"""
+        grid = SpatialGrid(64)
+        near, far = Target(100, 100, radius=20), Target(700, 500)
+        grid.build([near, far])
+        found = [entity for _, entity in grid.query(110, 110, 110, 110)]
+        assert near in found
+        assert far not in found
+
+    def test_query_keeps_insertion_order(self):
+        """Test query results carry each entity's build index"""
+        grid = SpatialGrid(64)
+        entities = [Target(10, 10), Target(12, 12)]
+        grid.build(entities)
+        assert sorted(order for order, _ in grid.query(10, 10, 10, 10)) == [0, 1]
+
+
+class TestChunkedUpdater:
+    """Test chunked updates match a serial pass."""
+
+    def test_serial_on_gil_builds(self):
+        """Test workers fall back to serial execution without free threading"""
+        updater = ChunkedUpdater(4)
+        assert updater.parallel is ChunkedUpdater(4).parallel
+        if not updater.parallel:
+            assert updater.chunk_count == 1
+        updater.close()
+
+    def test_chunks_cover_every_entity_once(self, zombies, threaded):
+        """Test spatial chunks partition the population"""
+        chunks = threaded.chunks(zombies)
+        indices = sorted(index for chunk in chunks for index, _ in chunk)
+        assert indices == list(range(len(zombies)))
+        assert len(chunks) > 1
+
+    def test_threaded_chase_matches_serial(self, zombies, threaded):
+        """Test threaded chase updates leave zombies where a serial pass would"""
+        serial = copy.deepcopy(zombies)
+        for zombie in serial:
+            zombie.update(1 / 60, 400, 300)
+        threaded.update_chasers(zombies, 1 / 60, 400, 300)
+        assert [(z.x, z.y) for z in zombies] == [(z.x, z.y) for z in serial]
+
+    def test_hits_pick_first_zombie_in_table_order(self, threaded):
+        """Test a projectile overlapping two zombies lists the earlier one first"""
+        pygame.init()
+        first, second = Zombie(300, 300), Zombie(305, 300)
+        projectile = Projectile(302, 300, 0)
+        missed = Projectile(700, 100, 0)
+        hits = threaded.find_hits([missed, projectile], [first, second])
+        assert hits == [(projectile, [first, second])]
+        pygame.quit()
+
+    def test_hits_skip_dead_projectiles(self):
+        """Test projectiles already marked for removal hit nothing"""
+        pygame.init()
+        projectile = Projectile(300, 300, 0)
+        projectile.mark_for_removal()
+        assert ChunkedUpdater().find_hits([projectile], [Zombie(300, 300)]) == []
+        pygame.quit()
+
+    def test_threaded_hits_match_serial(self, zombies, threaded):
+        """Test threaded hit detection returns the serial result in projectile order"""
+        rng = random.Random(3)
+        projectiles = [Projectile(rng.uniform(0, 800), rng.uniform(0, 600), 0) for _ in range(200)]
+        serial = ChunkedUpdater().find_hits(projectiles, zombies)
+        assert serial
+        assert threaded.find_hits(projectiles, zombies) == serial
+
+    def test_contacts_push_zombies_out(self, threaded):
+        """Test touching zombies are pushed to the contact boundary in table order"""
+        pygame.init()
+        player = Target(400, 300)
+        touching = [Zombie(410, 300), Zombie(100, 300), Zombie(400, 290)]
+        contacts = threaded.find_contacts(touching, player)
+        assert contacts == [touching[0], touching[2]]
+        assert touching[0].x == pytest.approx(400 + player.radius + touching[0].radius)
+        assert touching[1].x == 100
+        pygame.quit()
+
+    def test_threaded_contacts_match_serial(self, zombies, threaded):
+        """Test threaded contact tests match a serial pass"""
+        serial_zombies = copy.deepcopy(zombies)
+        player = Target(400, 300, radius=120)
+        serial = ChunkedUpdater().find_contacts(serial_zombies, player)
+        contacts = threaded.find_contacts(zombies, player)
+        assert [zombies.index(z) for z in contacts] == [serial_zombies.index(z) for z in serial]
+        assert [(z.x, z.y) for z in zombies] == [(z.x, z.y) for z in serial_zombies]
+
+
+class TestBenchmark:
+    """Test the worker scaling benchmark."""
+
+    def test_report_lists_each_worker_count(self):
+        """Test the report has one row per worker count"""
+        report = benchmark(50, 2, [1, 2], force=True)
+        lines = report.splitlines()
+        assert len(lines) == 4
+        assert lines[-1].split()[0] == "2"
+        assert lines[-1].split()[-1] == "threads"